@@ -10,8 +10,9 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
+from rsf.dsl.graph import StateGraph
 from rsf.dsl.parser import load_definition
-from rsf.dsl.models import StateMachineDefinition
+from rsf.dsl.models import MapState, ParallelState, StateMachineDefinition, TaskState
 
 console = Console()
 
@@ -71,64 +72,31 @@ def _get_pricing(region: str) -> dict[str, float]:
     return pricing
 
 
-def _count_states_recursive(states: dict[str, Any]) -> dict[str, int]:
-    """Count state types in a state machine, recursing into Parallel/Map branches.
+def _count_states(definition: StateMachineDefinition) -> dict[str, int]:
+    """Count state types in a state machine, including nested Parallel/Map scopes.
 
-    Returns a dict mapping state types to counts, plus special keys:
+    Returns a dict with:
     - 'task_count': number of Task states (Lambda invocations per execution)
     - 'parallel_branches': total branches in Parallel states
     - 'map_states': number of Map states
+    - 'total_states': number of top-level states
     """
+    graph = StateGraph.of(definition)
     counts: dict[str, int] = {
         "task_count": 0,
         "parallel_branches": 0,
         "map_states": 0,
-        "total_states": 0,
+        "total_states": len(graph.names),
     }
 
-    for _name, state in states.items():
-        if not isinstance(state, dict):
-            # Pydantic model — get type from attribute
-            state_type = getattr(state, "type", None)
-            state_dict: dict[str, Any] = {}
-            if hasattr(state, "model_dump"):
-                state_dict = state.model_dump(by_alias=True)
-            else:
-                state_dict = {}
-        else:
-            state_type = state.get("Type")
-            state_dict = state
-
-        counts["total_states"] += 1
-
-        if state_type == "Task":
-            counts["task_count"] += 1
-
-        elif state_type == "Parallel":
-            branches = getattr(state, "branches", None) or state_dict.get("Branches", [])
-            counts["parallel_branches"] += len(branches) if branches else 0
-            for branch in branches or []:
-                if hasattr(branch, "states"):
-                    branch_states = branch.states
-                else:
-                    branch_states = branch.get("States", {})
-                sub_counts = _count_states_recursive(branch_states)
-                counts["task_count"] += sub_counts["task_count"]
-                counts["parallel_branches"] += sub_counts["parallel_branches"]
-                counts["map_states"] += sub_counts["map_states"]
-
-        elif state_type == "Map":
-            counts["map_states"] += 1
-            item_processor = getattr(state, "item_processor", None) or state_dict.get("ItemProcessor")
-            if item_processor:
-                if hasattr(item_processor, "states"):
-                    proc_states = item_processor.states
-                else:
-                    proc_states = item_processor.get("States", {})
-                sub_counts = _count_states_recursive(proc_states)
-                counts["task_count"] += sub_counts["task_count"]
-                counts["parallel_branches"] += sub_counts["parallel_branches"]
-                counts["map_states"] += sub_counts["map_states"]
+    for scope in graph.iter_scopes():
+        for state in scope.states.values():
+            if isinstance(state, TaskState):
+                counts["task_count"] += 1
+            elif isinstance(state, ParallelState):
+                counts["parallel_branches"] += len(state.branches)
+            elif isinstance(state, MapState):
+                counts["map_states"] += 1
 
     return counts
 
@@ -139,7 +107,7 @@ def _count_lambda_invocations(definition: StateMachineDefinition, pricing: dict[
     Walks the state machine counting Task states. For Map states,
     multiplies by the default item count assumption.
     """
-    counts = _count_states_recursive(definition.states)
+    counts = _count_states(definition)
     task_count = counts["task_count"]
     map_states = counts["map_states"]
 
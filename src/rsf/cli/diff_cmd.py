@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import typer
+from pydantic import ValidationError
 from rich.console import Console
 from rich.table import Table
 
@@ -85,9 +86,10 @@ def compute_diff(
             )
         )
 
-    # Compare states
-    local_names = set(local_def.states.keys())
-    deployed_names = set(deployed_def.states.keys())
+    # Compare states. Key views support set algebra without copying and, for
+    # lazily loaded definitions, without validating any state.
+    local_names = local_def.states.keys()
+    deployed_names = deployed_def.states.keys()
 
     # Added states
     for name in sorted(local_names - deployed_names):
@@ -139,6 +141,10 @@ def compute_diff(
 
     # Changed states (present in both)
     for name in sorted(local_names & deployed_names):
+        # Identical raw YAML (lazy mode) or identical models cannot differ;
+        # skipping them leaves unchanged lazy states unvalidated
+        if dict.__getitem__(local_def.states, name) == dict.__getitem__(deployed_def.states, name):
+            continue
         local_state = local_def.states[name]
         deployed_state = deployed_def.states[name]
 
@@ -204,7 +210,7 @@ def _load_deployed_definition(
     ]:
         if candidate.exists():
             try:
-                return load_definition(candidate)
+                return load_definition(candidate, lazy=True)
             except Exception:
                 continue
 
@@ -297,9 +303,10 @@ def diff(
     if stage:
         effective_tf_dir = tf_dir / stage
 
-    # Load local definition
+    # Load local definition. States are validated lazily: compute_diff only
+    # validates the states that differ from the deployed definition.
     try:
-        local_def = load_definition(workflow)
+        local_def = load_definition(workflow, lazy=True)
     except Exception as exc:
         console.print(f"[red]Error:[/red] Invalid local workflow: {exc}")
         raise typer.Exit(code=1)
@@ -344,7 +351,11 @@ def diff(
     deployed_def = _load_deployed_definition(effective_tf_dir)
 
     # Compute diff
-    diffs = compute_diff(local_def, deployed_def)
+    try:
+        diffs = compute_diff(local_def, deployed_def)
+    except ValidationError as exc:
+        console.print(f"[red]Error:[/red] Invalid workflow state: {exc}")
+        raise typer.Exit(code=1)
 
     if not diffs:
         console.print("[green]No differences found.[/green]")
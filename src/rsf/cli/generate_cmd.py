@@ -50,26 +50,30 @@ def generate(
         console.print(f"[red]Error:[/red] File not found: {workflow}")
         raise typer.Exit(code=1)
 
-    # 2. YAML parse check
-    try:
-        data = dsl_parser.load_yaml(workflow)
-    except yaml.YAMLError as exc:
-        console.print(f"[red]Error:[/red] Invalid YAML in {workflow}: {exc}")
-        raise typer.Exit(code=1)
-
-    if not isinstance(data, dict):
-        console.print(f"[red]Error:[/red] Workflow file must be a YAML mapping, got: {type(data).__name__}")
-        raise typer.Exit(code=1)
-
-    # 3. Pydantic structural validation
-    try:
-        definition = dsl_parser.parse_definition(data)
-    except ValidationError as exc:
-        console.print(f"[red]Validation errors in[/red] {workflow}:")
-        for error in exc.errors():
-            field_path = ".".join(str(loc) for loc in error["loc"])
-            console.print(f"  [yellow]{field_path}[/yellow]: {error['msg']}")
-        raise typer.Exit(code=1)
+    # 2-3. Parsed definition from the parse cache, or YAML parse + Pydantic validation
+    definition = dsl_parser.load_cached_definition(workflow)
+    if definition is None:
+        # 2. YAML parse check
+        try:
+            data = dsl_parser.load_yaml(workflow)
+        except yaml.YAMLError as exc:
+            console.print(f"[red]Error:[/red] Invalid YAML in {workflow}: {exc}")
+            raise typer.Exit(code=1)
+
+        if not isinstance(data, dict):
+            console.print(f"[red]Error:[/red] Workflow file must be a YAML mapping, got: {type(data).__name__}")
+            raise typer.Exit(code=1)
+
+        # 3. Pydantic structural validation
+        try:
+            definition = dsl_parser.parse_definition(data)
+        except ValidationError as exc:
+            console.print(f"[red]Validation errors in[/red] {workflow}:")
+            for error in exc.errors():
+                field_path = ".".join(str(loc) for loc in error["loc"])
+                console.print(f"  [yellow]{field_path}[/yellow]: {error['msg']}")
+            raise typer.Exit(code=1)
+        dsl_parser.cache_definition(workflow, definition)
 
     # 4. Semantic validation
     errors = validate_definition(definition)
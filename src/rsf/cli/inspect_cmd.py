@@ -1,31 +1,31 @@
-"""RSF CLI inspect subcommand — launches the execution inspector FastAPI server."""
+"""RSF CLI inspect subcommand — launches the execution inspector FastAPI server.
+
+``rsf inspect`` serves the inspector. From the command line,
+``rsf inspect redrive`` replays executions in bulk, ``rsf inspect stats``
+reports per-state latency analytics and ``rsf inspect export`` writes
+executions to JSON Lines or Parquet files.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import json
+import re
 import subprocess
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
 
 console = Console()
 
+inspect_app = typer.Typer()
 
-def inspect(
-    arn: str = typer.Option(None, "--arn", help="Lambda function ARN to inspect"),
-    port: int = typer.Option(8766, "--port", "-p", help="Port to serve on"),
-    no_browser: bool = typer.Option(False, "--no-browser", help="Don't auto-open browser"),
-    tf_dir: Path = typer.Option("terraform", "--tf-dir", help="Terraform directory for ARN discovery"),
-) -> None:
-    """Launch the RSF Execution Inspector in your browser.
-
-    Connects to a deployed Lambda Durable Function and shows live execution
-    history and state machine progress. Press Ctrl+C to stop the server.
-
-    If --arn is not provided, attempts to discover the ARN from Terraform output.
-    """
-    from rsf.inspect.server import launch
 
+def _resolve_arn(arn: str | None, tf_dir: Path) -> str:
+    """Function ARN from --arn or Terraform output; exits with an error if neither works."""
     resolved_arn = arn
 
     if resolved_arn is None:
@@ -52,11 +52,375 @@ def inspect(
             "Use --arn <function-arn>."
         )
         raise typer.Exit(code=1)
+    return resolved_arn
 
-    console.print(f"[blue]Starting RSF Inspector on port {port}...[/blue]")
-    console.print(f"[dim]Inspecting: {resolved_arn}[/dim]")
 
+@inspect_app.callback(invoke_without_command=True)
+def inspect(
+    ctx: typer.Context,
+    arn: str = typer.Option(None, "--arn", help="Lambda function ARN to inspect"),
+    port: int = typer.Option(8766, "--port", "-p", help="Port to serve on"),
+    no_browser: bool = typer.Option(False, "--no-browser", help="Don't auto-open browser"),
+    tf_dir: Path = typer.Option("terraform", "--tf-dir", help="Terraform directory for ARN discovery"),
+    cache: Path | None = typer.Option(
+        None, "--cache", help="SQLite file that keeps finished executions across restarts"
+    ),
+    index: Path | None = typer.Option(
+        None, "--index", help="SQLite file for a local, searchable index of all executions"
+    ),
+    index_inputs: bool = typer.Option(
+        False, "--index-inputs", help="Also index execution inputs and errors (one API call per execution)"
+    ),
+    all_functions: bool = typer.Option(
+        False, "--all", help="Inspect every workflow Lambda found in Terraform state under --tf-dir"
+    ),
+    stage: str | None = typer.Option(None, "--stage", help="With --all, only functions deployed to this stage"),
+    functions: list[str] = typer.Option([], "--function", "-f", help="Also inspect this function (repeatable)"),
+) -> None:
+    """Launch the RSF Execution Inspector in your browser.
+
+    Connects to a deployed Lambda Durable Function and shows live execution
+    history and state machine progress. Press Ctrl+C to stop the server.
+
+    If --arn is not provided, attempts to discover the ARN from Terraform output.
+    With --all (or several --function options) one server inspects many
+    functions, discovered from every terraform.tfstate under --tf-dir
+    (including the per-stage directories written by ``rsf deploy --stage``).
+    Use ``rsf inspect redrive`` to replay executions in bulk,
+    ``rsf inspect stats`` for per-state latency analytics and
+    ``rsf inspect export`` to export executions for offline analysis.
+    """
+    if ctx.invoked_subcommand is not None:
+        return
+
+    from rsf.inspect.server import launch
+
+    # Only pass cache_path when given so launch() keeps its own default
+    extra: dict[str, object] = {"cache_path": cache} if cache is not None else {}
+
+    if stage is not None and not all_functions:
+        console.print("[red]Error:[/red] --stage requires --all.")
+        raise typer.Exit(code=1)
+    if all_functions or functions:
+        discovered = _discover_functions(tf_dir, stage) if all_functions else []
+        names = list(dict.fromkeys([*([arn] if arn else []), *functions, *discovered]))
+        if not names:
+            where = f"stage {stage!r} under {tf_dir}" if stage else str(tf_dir)
+            console.print(f"[red]Error:[/red] No Lambda functions found in Terraform state in {where}.")
+            raise typer.Exit(code=1)
+        console.print(f"[blue]Starting RSF Inspector on port {port}...[/blue]")
+        for name in names:
+            console.print(f"[dim]Inspecting: {name}[/dim]")
+        resolved_arn: str | None = arn
+        extra["functions"] = names
+    else:
+        resolved_arn = _resolve_arn(arn, tf_dir)
+        console.print(f"[blue]Starting RSF Inspector on port {port}...[/blue]")
+        console.print(f"[dim]Inspecting: {resolved_arn}[/dim]")
+    if index is not None:
+        extra.update(index_path=index, index_details=index_inputs)
+    elif index_inputs:
+        console.print("[red]Error:[/red] --index-inputs requires --index <file>.")
+        raise typer.Exit(code=1)
     try:
-        launch(function_name=resolved_arn, port=port, open_browser=not no_browser)
+        launch(function_name=resolved_arn, port=port, open_browser=not no_browser, **extra)
     except KeyboardInterrupt:
         console.print("[dim]Server stopped[/dim]")
+
+
+def _discover_functions(tf_dir: Path, stage: str | None = None) -> list[str]:
+    """ARNs of the Lambda functions in every terraform.tfstate under ``tf_dir``.
+
+    ``rsf deploy --stage NAME`` keeps each stage's state in its own
+    ``NAME/`` directory; with ``stage``, only states in such a directory
+    are read.
+    """
+    arns: list[str] = []
+    for tfstate_path in sorted(tf_dir.rglob("terraform.tfstate")):
+        if ".terraform" in tfstate_path.parts or (stage is not None and tfstate_path.parent.name != stage):
+            continue
+        try:
+            state_data = json.loads(tfstate_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            continue
+        for resource in state_data.get("resources", []):
+            if resource.get("type") != "aws_lambda_function":
+                continue
+            for instance in resource.get("instances", []):
+                attributes = instance.get("attributes", {})
+                name = attributes.get("arn") or attributes.get("function_name")
+                if name and name not in arns:
+                    arns.append(name)
+    return arns
+
+
+def _parse_time(value: str, option: str) -> datetime:
+    """Parse a relative duration ("2h", "30m", "1d", "90s") or ISO datetime as a UTC datetime."""
+    match = re.fullmatch(r"(\d+)([smhd])", value.strip())
+    if match:
+        unit = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}[match.group(2)]
+        return datetime.now(timezone.utc) - timedelta(**{unit: int(match.group(1))})
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        console.print(f"[red]Error:[/red] Invalid {option} value {value!r}. Use e.g. 2h, 30m, 1d or an ISO datetime.")
+        raise typer.Exit(code=1)
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+@inspect_app.command("redrive")
+def redrive(
+    arn: str = typer.Option(None, "--arn", help="Lambda function ARN"),
+    tf_dir: Path = typer.Option("terraform", "--tf-dir", help="Terraform directory for ARN discovery"),
+    status: str = typer.Option("FAILED", "--status", help="Redrive executions in this status"),
+    since: str | None = typer.Option(None, "--since", help="Started since (e.g. 2h, 30m, 1d, or ISO date)"),
+    until: str | None = typer.Option(None, "--until", help="Started before (e.g. 1h, or ISO date)"),
+    execution_ids: list[str] = typer.Option([], "--execution-id", help="Redrive these executions (repeatable)"),
+    concurrency: int = typer.Option(5, "--concurrency", "-c", min=1, help="Redrives in flight at once"),
+    rate: str | None = typer.Option(None, "--rate", help="Maximum invocations, e.g. 3/s or 120/min"),
+    journal: Path | None = typer.Option(None, "--journal", help="JSON Lines journal; re-running resumes from it"),
+    patch: str | None = typer.Option(None, "--patch", help="JSON merge patch applied to each input payload"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="List the executions that would be redriven"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
+    region: str | None = typer.Option(None, "--region", help="AWS region"),
+) -> None:
+    """Replay executions in bulk with bounded concurrency and rate.
+
+    Selects executions by --status and start time (or --execution-id),
+    re-invokes each with its original input and reports progress. With
+    --journal, an interrupted redrive can be re-run and skips executions
+    already redriven.
+    """
+    from rsf.inspect.client import LambdaInspectClient
+    from rsf.inspect.models import ExecutionStatus
+    from rsf.inspect.redrive import Redriver, RedriveJournal, parse_rate
+
+    try:
+        status_filter = ExecutionStatus(status.upper())
+    except ValueError:
+        choices = ", ".join(s.value for s in ExecutionStatus)
+        console.print(f"[red]Error:[/red] Invalid --status {status!r}. Choose from: {choices}.")
+        raise typer.Exit(code=1)
+    try:
+        rate_per_second = parse_rate(rate) if rate is not None else None
+    except ValueError as exc:
+        console.print(f"[red]Error:[/red] {exc}")
+        raise typer.Exit(code=1)
+    patch_doc: dict[str, Any] | None = None
+    if patch is not None:
+        try:
+            patch_doc = json.loads(patch)
+        except ValueError as exc:
+            console.print(f"[red]Error:[/red] --patch is not valid JSON: {exc}")
+            raise typer.Exit(code=1)
+        if not isinstance(patch_doc, dict):
+            console.print("[red]Error:[/red] --patch must be a JSON object.")
+            raise typer.Exit(code=1)
+    since_at = _parse_time(since, "--since") if since is not None else None
+    until_at = _parse_time(until, "--until") if until is not None else None
+
+    resolved_arn = _resolve_arn(arn, tf_dir)
+    client = LambdaInspectClient(function_name=resolved_arn, region_name=region)
+    redriver = Redriver(
+        client,
+        concurrency=concurrency,
+        rate=rate_per_second,
+        journal=RedriveJournal(journal) if journal is not None else None,
+        patch=patch_doc,
+    )
+
+    targets = list(execution_ids) or asyncio.run(redriver.select(status_filter, since=since_at, until=until_at))
+    if not targets:
+        console.print("[yellow]No executions to redrive.[/yellow]")
+        return
+    if dry_run:
+        for execution_id in targets:
+            console.print(execution_id)
+        console.print(f"[dim]{len(targets)} execution(s) would be redriven[/dim]")
+        return
+    if not yes and not typer.confirm(f"Redrive {len(targets)} execution(s) of {resolved_arn}?"):
+        raise typer.Exit(code=1)
+
+    async def _run() -> dict[str, int]:
+        totals = {"succeeded": 0, "failed": 0, "skipped": 0}
+        async for progress in redriver.run(targets):
+            totals = {"succeeded": progress.succeeded, "failed": progress.failed, "skipped": progress.skipped}
+            outcome = progress.outcome
+            counter = f"[{progress.done}/{progress.total}]"
+            if outcome is None:
+                console.print(f"[dim]{counter} skipped {progress.skipped} already redriven (journal)[/dim]")
+            elif outcome.ok:
+                console.print(f"[green]{counter} {outcome.execution_id}[/green] -> {outcome.request_id}")
+            else:
+                console.print(f"[red]{counter} {outcome.execution_id}[/red] {outcome.error}")
+        return totals
+
+    try:
+        totals = asyncio.run(_run())
+    except KeyboardInterrupt:
+        console.print(
+            "[yellow]Interrupted.[/yellow]" + (" Re-run with the same --journal to resume." if journal else "")
+        )
+        raise typer.Exit(code=130)
+    except OSError as exc:
+        console.print(f"[red]Error:[/red] Could not write the journal, redrive stopped: {exc}")
+        raise typer.Exit(code=1)
+
+    console.print(
+        f"Redrive finished: [green]{totals['succeeded']} succeeded[/green], "
+        f"[red]{totals['failed']} failed[/red], {totals['skipped']} skipped"
+    )
+    if totals["failed"]:
+        raise typer.Exit(code=1)
+
+
+@inspect_app.command("stats")
+def stats(
+    arn: str = typer.Option(None, "--arn", help="Lambda function ARN"),
+    tf_dir: Path = typer.Option("terraform", "--tf-dir", help="Terraform directory for ARN discovery"),
+    limit: int = typer.Option(1000, "--limit", "-n", min=0, help="Most new executions to analyze in this run"),
+    index: Path | None = typer.Option(
+        None, "--index", help="SQLite execution index; analytics are kept in it and resume across runs"
+    ),
+    cache: Path | None = typer.Option(None, "--cache", help="SQLite file that keeps finished executions"),
+    output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    region: str | None = typer.Option(None, "--region", help="AWS region"),
+) -> None:
+    """Per-state latency percentiles, error rates and retries across executions.
+
+    Analyzes up to --limit finished executions not analyzed yet, newest
+    first. With --index, the index is synced first and the aggregate is
+    stored in it, so each run only fetches executions that are new.
+    """
+    from rich.table import Table
+
+    from rsf.inspect.analytics import AnalyticsEngine
+    from rsf.inspect.cache import ExecutionCache, ExecutionStore
+    from rsf.inspect.client import LambdaInspectClient
+    from rsf.inspect.index import ExecutionIndex, ExecutionIndexer
+
+    resolved_arn = _resolve_arn(arn, tf_dir)
+    client = LambdaInspectClient(function_name=resolved_arn, region_name=region)
+    execution_index = ExecutionIndex(index) if index is not None else None
+    execution_cache = ExecutionCache(store=ExecutionStore(cache) if cache is not None else None)
+    engine = AnalyticsEngine(client, cache=execution_cache, index=execution_index)
+
+    async def _run() -> int:
+        if execution_index is not None:
+            await ExecutionIndexer(client, execution_index).sync_once()
+        return await engine.refresh(limit)
+
+    try:
+        added = asyncio.run(_run())
+    except KeyboardInterrupt:
+        raise typer.Exit(code=130)
+    finally:
+        if execution_index is not None:
+            execution_index.close()
+
+    report = engine.analytics.report()
+    if output_json:
+        typer.echo(json.dumps(report, indent=2))
+        return
+
+    console.print(f"[bold]State analytics:[/bold] {resolved_arn}")
+    console.print(f"[dim]{report['executions']} execution(s) analyzed ({added} new)[/dim]")
+    if not report["states"]:
+        console.print("[yellow]No finished executions to analyze.[/yellow]")
+        return
+
+    table = Table(title="Per-State Latency")
+    table.add_column("State", style="bold")
+    for column in ("Visits", "Error rate", "Retries", "p50 ms", "p90 ms", "p99 ms", "Max ms"):
+        table.add_column(column, justify="right")
+
+    def _ms(value: float | None) -> str:
+        return f"{value:,.1f}" if value is not None else "-"
+
+    for name, state in report["states"].items():
+        durations = state["duration_ms"]
+        table.add_row(
+            name,
+            f"{state['visits']:,}",
+            f"{state['error_rate']:.1%}",
+            f"{state['retries']:,}",
+            _ms(durations["p50"]),
+            _ms(durations["p90"]),
+            _ms(durations["p99"]),
+            _ms(durations["max"]),
+        )
+    console.print(table)
+
+
+@inspect_app.command("export")
+def export(
+    out: Path = typer.Option(..., "--out", "-o", help="Output directory for part files and the checkpoint"),
+    arn: str = typer.Option(None, "--arn", help="Lambda function ARN"),
+    tf_dir: Path = typer.Option("terraform", "--tf-dir", help="Terraform directory for ARN discovery"),
+    status: str = typer.Option("ALL", "--status", help="Export executions in this status, or ALL"),
+    since: str | None = typer.Option(None, "--since", help="Started since (e.g. 7d, 2h, or ISO date)"),
+    fmt: str = typer.Option("jsonl", "--format", "-f", help="Output format: jsonl or parquet"),
+    concurrency: int = typer.Option(5, "--concurrency", "-c", min=1, help="Detail fetches in flight at once"),
+    part_size: int = typer.Option(1000, "--part-size", min=1, help="Executions per part file"),
+    region: str | None = typer.Option(None, "--region", help="AWS region"),
+) -> None:
+    """Export executions with their details and history to JSON Lines or Parquet.
+
+    Pages through executions newest first and fetches details concurrently
+    under the client's rate limit, writing rows as they arrive. Progress is
+    checkpointed in the output directory after every part file; re-running
+    the same command resumes where an interrupted export stopped.
+    """
+    from rsf.inspect.client import LambdaInspectClient
+    from rsf.inspect.export import EXPORT_FORMATS, Exporter
+    from rsf.inspect.models import ExecutionStatus
+
+    fmt = fmt.lower()
+    if fmt not in EXPORT_FORMATS:
+        console.print(f"[red]Error:[/red] Invalid --format {fmt!r}. Choose from: {', '.join(EXPORT_FORMATS)}.")
+        raise typer.Exit(code=1)
+    status_filter: ExecutionStatus | None = None
+    if status.upper() != "ALL":
+        try:
+            status_filter = ExecutionStatus(status.upper())
+        except ValueError:
+            choices = ", ".join(["ALL", *(s.value for s in ExecutionStatus)])
+            console.print(f"[red]Error:[/red] Invalid --status {status!r}. Choose from: {choices}.")
+            raise typer.Exit(code=1)
+    since_at = _parse_time(since, "--since") if since is not None else None
+
+    resolved_arn = _resolve_arn(arn, tf_dir)
+    client = LambdaInspectClient(function_name=resolved_arn, region_name=region)
+    try:
+        exporter = Exporter(
+            client,
+            out,
+            fmt=fmt,
+            status=status_filter,
+            since=since_at,
+            concurrency=concurrency,
+            part_size=part_size,
+        )
+    except (ValueError, ImportError) as exc:
+        console.print(f"[red]Error:[/red] {exc}")
+        raise typer.Exit(code=1)
+
+    if exporter.resumed:
+        console.print(f"[dim]Resuming: {exporter.checkpoint.exported} execution(s) already exported[/dim]")
+
+    async def _run() -> tuple[int, int]:
+        exported, skipped = exporter.checkpoint.exported, exporter.checkpoint.skipped
+        async for progress in exporter.run():
+            exported, skipped = progress.exported, progress.skipped
+            console.print(f"[dim]{progress.exported} exported, {progress.parts} part file(s)[/dim]")
+        return exported, skipped
+
+    try:
+        exported, skipped = asyncio.run(_run())
+    except KeyboardInterrupt:
+        console.print("[yellow]Interrupted.[/yellow] Re-run the same command to resume.")
+        raise typer.Exit(code=130)
+
+    console.print(f"[green]Exported {exported} execution(s)[/green] to {out}")
+    if skipped:
+        console.print(f"[yellow]Skipped {skipped} execution(s)[/yellow] whose details could not be fetched")
@@ -8,6 +8,7 @@ import typer
 from rich.console import Console
 
 from rsf import __version__
+from rsf.dsl.parser import set_parse_cache_enabled
 
 console = Console()
 
@@ -35,8 +36,15 @@ def main(
         is_eager=True,
         help="Show the RSF version and exit.",
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the on-disk parse cache (.rsf/cache/) for workflow definitions.",
+    ),
 ) -> None:
     """RSF — Replacement for Step Functions."""
+    if no_cache:
+        set_parse_cache_enabled(False)
 
 
 # Import and register subcommands
@@ -71,7 +79,7 @@ app.command(name="validate")(validate_cmd.validate)
 app.command(name="generate")(generate_cmd.generate)
 app.command(name="import")(import_cmd.import_asl)
 app.command(name="ui")(ui_cmd.ui)
-app.command(name="inspect")(inspect_cmd.inspect)
+app.add_typer(inspect_cmd.inspect_app, name="inspect")
 app.command(name="schema")(schema_cmd.schema_export)
 
 
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import copy
 import importlib.util
 import json
 import re
 import time
 import traceback
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
 import typer
 from rich.console import Console
@@ -25,6 +27,8 @@ from rsf.dsl.models import (
     WaitState,
 )
 from rsf.dsl.parser import load_definition
+from rsf.testing.clock import VirtualClock, declared_latency, parse_timestamp, retry_delay
+from rsf.testing.trace import JsonlTraceSink, PayloadLog, TraceSink
 
 console = Console()
 
@@ -37,10 +41,31 @@ class TransitionRecord:
     to_state: str | None  # None for terminal states
     state_type: str
     duration_ms: float
-    handler_result: Any = None
+    simulated_ms: float = 0.0  # wall time plus virtual time (waits, backoff, declared latency)
     error: str | None = None
-    input_data: Any = None
-    output_data: Any = None
+    # Verbose mode: indexes into a delta-encoded PayloadLog shared by the run
+    payloads: PayloadLog | None = field(default=None, repr=False, compare=False)
+    input_ref: int | None = None
+    output_ref: int | None = None
+
+    @property
+    def input_data(self) -> Any:
+        """Input payload of the state (verbose mode only)."""
+        if self.payloads is None or self.input_ref is None:
+            return None
+        return self.payloads.get(self.input_ref)
+
+    @property
+    def output_data(self) -> Any:
+        """Output payload of the state (verbose mode only)."""
+        if self.payloads is None or self.output_ref is None:
+            return None
+        return self.payloads.get(self.output_ref)
+
+    @property
+    def handler_result(self) -> Any:
+        """Result returned by a Task state's handler (verbose mode only)."""
+        return self.output_data if self.state_type == "Task" else None
 
 
 @dataclass
@@ -52,6 +77,7 @@ class ExecutionResult:
     error: str | None = None
     transitions: list[TransitionRecord] = field(default_factory=list)
     total_duration_ms: float = 0.0
+    total_simulated_ms: float = 0.0
 
 
 class _CatchRedirect(Exception):
@@ -141,6 +167,15 @@ def _load_handler(state_name: str, workflow_dir: Path) -> Any:
     if cache_key in _handler_cache:
         return _handler_cache[cache_key]
 
+    handler_fn = _import_handler(module_name, _find_handler_path(state_name, workflow_dir))
+    _handler_cache[cache_key] = handler_fn
+    return handler_fn
+
+
+def _find_handler_path(state_name: str, workflow_dir: Path) -> Path:
+    """Return the handler file for a Task state."""
+    module_name = _to_snake_case(state_name)
+
     # Check handlers/ first (examples and legacy layout), then src/handlers/ (new rsf init)
     # handlers/ takes priority so examples with real handlers are not shadowed
     # by rsf generate stubs in src/handlers/
@@ -148,17 +183,19 @@ def _load_handler(state_name: str, workflow_dir: Path) -> Any:
     src_handler_path = workflow_dir / "src" / "handlers" / f"{module_name}.py"
 
     if legacy_handler_path.exists():
-        handler_path = legacy_handler_path
-    elif src_handler_path.exists():
-        handler_path = src_handler_path
-    else:
-        raise FileNotFoundError(
-            f"Handler file not found in either:\n"
-            f"  {legacy_handler_path}\n"
-            f"  {src_handler_path}\n"
-            f"Run 'rsf generate' to create handler stubs."
-        )
+        return legacy_handler_path
+    if src_handler_path.exists():
+        return src_handler_path
+    raise FileNotFoundError(
+        f"Handler file not found in either:\n"
+        f"  {legacy_handler_path}\n"
+        f"  {src_handler_path}\n"
+        f"Run 'rsf generate' to create handler stubs."
+    )
 
+
+def _import_handler(module_name: str, handler_path: Path) -> Any:
+    """Execute a handler module and return its handler function."""
     spec = importlib.util.spec_from_file_location(f"handlers.{module_name}", handler_path)
     if spec is None or spec.loader is None:
         raise ImportError(f"Cannot load handler module: {handler_path}")
@@ -169,8 +206,6 @@ def _load_handler(state_name: str, workflow_dir: Path) -> Any:
     handler_fn = getattr(module, module_name, None)
     if handler_fn is None:
         raise AttributeError(f"Handler function '{module_name}' not found in {handler_path}")
-
-    _handler_cache[cache_key] = handler_fn
     return handler_fn
 
 
@@ -198,6 +233,10 @@ class LocalRunner:
         verbose: bool = False,
         console: Console | None = None,
         chaos_fixture: Any | None = None,
+        clock: VirtualClock | None = None,
+        profiler: Any | None = None,
+        trace_sink: TraceSink | None = None,
+        handler_loader: Callable[[str, Path], Any] | None = None,
     ):
         self.definition = definition
         self.workflow_dir = workflow_dir
@@ -207,76 +246,129 @@ class LocalRunner:
         self.console = console or Console()
         self.transitions: list[TransitionRecord] = []
         self.chaos_fixture = chaos_fixture
+        self.clock = clock or VirtualClock()
+        self.profiler = profiler
+        if trace_sink is None and json_output:
+            trace_sink = JsonlTraceSink(self.console.file)
+        self.trace_sink = trace_sink
+        self.payloads = PayloadLog() if verbose else None
+        self.handler_loader = handler_loader or _load_handler
 
     def run(self, input_data: Any) -> ExecutionResult:
         """Execute the workflow with the given input."""
         start_time = time.monotonic()
+        sim_start = self.clock.elapsed
         current_state = self.definition.start_at
         current_data = input_data
 
         while True:
             state = self.definition.states.get(current_state)
             if state is None:
-                return ExecutionResult(
+                return self._result(
+                    start_time,
+                    sim_start,
                     success=False,
                     error=f"State '{current_state}' not found",
-                    transitions=self.transitions,
-                    total_duration_ms=(time.monotonic() - start_time) * 1000,
                 )
 
             state_start = time.monotonic()
+            state_sim_start = self.clock.elapsed
             state_type = getattr(state, "type", "Unknown")
 
             try:
-                next_state, output_data, error = self._execute_state(current_state, state, current_data)
+                with self._profile(current_state, "engine"):
+                    next_state, output_data, error = self._execute_state(current_state, state, current_data)
             except Exception as exc:
                 duration_ms = (time.monotonic() - state_start) * 1000
+                simulated_ms = duration_ms + (self.clock.elapsed - state_sim_start) * 1000
                 self.transitions.append(
                     TransitionRecord(
                         from_state=current_state,
                         to_state=None,
                         state_type=state_type,
                         duration_ms=duration_ms,
+                        simulated_ms=simulated_ms,
                         error=str(exc),
-                        input_data=current_data if self.verbose else None,
+                        payloads=self.payloads,
+                        input_ref=self._store_payload(current_data),
                     )
                 )
-                self._emit_trace(current_state, None, state_type, duration_ms, error=str(exc))
-                return ExecutionResult(
+                self._emit_trace(
+                    current_state, None, state_type, duration_ms, simulated_ms, error=str(exc), input_data=current_data
+                )
+                return self._result(
+                    start_time,
+                    sim_start,
                     success=False,
                     error=f"Unhandled exception in {current_state}: {exc}\n{traceback.format_exc()}",
-                    transitions=self.transitions,
-                    total_duration_ms=(time.monotonic() - start_time) * 1000,
                 )
 
             duration_ms = (time.monotonic() - state_start) * 1000
+            simulated_ms = duration_ms + (self.clock.elapsed - state_sim_start) * 1000
 
             record = TransitionRecord(
                 from_state=current_state,
                 to_state=next_state,
                 state_type=state_type,
                 duration_ms=duration_ms,
-                handler_result=output_data if state_type == "Task" else None,
+                simulated_ms=simulated_ms,
                 error=error,
-                input_data=current_data if self.verbose else None,
-                output_data=output_data if self.verbose else None,
+                payloads=self.payloads,
+                input_ref=self._store_payload(current_data),
+                output_ref=self._store_payload(output_data),
             )
             self.transitions.append(record)
-            self._emit_trace(current_state, next_state, state_type, duration_ms, error=error)
+            with self._profile(current_state, "engine"):
+                self._emit_trace(
+                    current_state,
+                    next_state,
+                    state_type,
+                    duration_ms,
+                    simulated_ms,
+                    error=error,
+                    input_data=current_data,
+                    output_data=output_data,
+                )
+            if self.profiler is not None:
+                self.profiler.record_transition(current_state)
 
             if next_state is None:
                 # Terminal state
-                return ExecutionResult(
+                return self._result(
+                    start_time,
+                    sim_start,
                     success=error is None,
                     final_output=output_data,
                     error=error,
-                    transitions=self.transitions,
-                    total_duration_ms=(time.monotonic() - start_time) * 1000,
                 )
 
             current_data = output_data if output_data is not None else current_data
             current_state = next_state
 
+    def _profile(self, state: str, phase: str) -> AbstractContextManager[None]:
+        """Profile a region for a state when a StateProfiler is attached."""
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.region(state, phase)
+
+    def _store_payload(self, data: Any) -> int | None:
+        """Record a payload in the verbose-mode PayloadLog and return its index."""
+        if self.payloads is None:
+            return None
+        return self.payloads.append(data)
+
+    def _result(self, start_time: float, sim_start: float, **kwargs: Any) -> ExecutionResult:
+        """Build an ExecutionResult with wall and simulated totals."""
+        if self.trace_sink is not None:
+            self.trace_sink.flush()
+        total_ms = (time.monotonic() - start_time) * 1000
+        return ExecutionResult(
+            transitions=self.transitions,
+            total_duration_ms=total_ms,
+            total_simulated_ms=total_ms + (self.clock.elapsed - sim_start) * 1000,
+            **kwargs,
+        )
+
     def _execute_state(self, name: str, state: Any, data: Any) -> tuple[str | None, Any, str | None]:
         """Execute a single state and return (next_state, output, error)."""
         if isinstance(state, TaskState):
@@ -314,18 +406,20 @@ class LocalRunner:
         return next_state, result, None
 
     def _call_handler_with_retry(self, name: str, state: TaskState, data: Any) -> Any:
-        """Call a handler with retry logic."""
-        handler_fn = _load_handler(name, self.workflow_dir)
+        """Call a handler with retry logic.
+
+        Each call advances the virtual clock by the handler's declared
+        latency, and each retry by the policy's backoff delay (with jitter).
+        """
+        handler_fn = self.handler_loader(name, self.workflow_dir)
+        latency = declared_latency(handler_fn)
 
         # Wrap handler with chaos injection if active
         if self.chaos_fixture is not None:
             original_handler = handler_fn
 
             def chaos_wrapped_handler(d: Any) -> Any:
-                failure = self.chaos_fixture._should_trigger(name)
-                if failure is not None:
-                    return self.chaos_fixture._trigger_failure(failure, d)
-                return original_handler(d)
+                return self.chaos_fixture._call(name, lambda: original_handler(d), d)
 
             handler_fn = chaos_wrapped_handler
 
@@ -337,21 +431,27 @@ class LocalRunner:
         last_exception = None
         for attempt in range(max_total_attempts):
             try:
-                return handler_fn(data)
+                with self._profile(name, "handler"):
+                    result = handler_fn(data)
+                self.clock.advance(latency)
+                return result
             except Exception as exc:
+                self.clock.advance(latency)
                 last_exception = exc
                 error_type = type(exc).__name__
 
                 # Check retry policies
-                should_retry = False
+                retry_policy = None
                 if attempt < max_total_attempts - 1:
                     for policy in retry_policies:
                         if _matches_error(policy.error_equals, error_type):
                             if attempt < policy.max_attempts:
-                                should_retry = True
+                                retry_policy = policy
                                 break
 
-                if not should_retry:
+                if retry_policy is not None:
+                    self.clock.sleep(retry_delay(retry_policy, attempt, self.clock.random))
+                else:
                     # Check catch policies
                     if state.catch:
                         for catcher in state.catch:
@@ -393,10 +493,25 @@ class LocalRunner:
         return None, None, "No choice rule matched and no Default specified"
 
     def _execute_wait(self, state: WaitState, data: Any) -> tuple[str | None, Any, str | None]:
-        """Execute a Wait state (skip actual delay in local mode)."""
+        """Execute a Wait state by advancing the virtual clock (no real delay)."""
         next_state = state.next if state.next else None
         if state.end:
             next_state = None
+
+        if state.seconds is not None:
+            self.clock.sleep(state.seconds)
+        elif state.seconds_path is not None:
+            seconds = _resolve_path(data, state.seconds_path)
+            if not isinstance(seconds, (int, float)) or isinstance(seconds, bool) or seconds < 0:
+                return None, None, f"States.Runtime: SecondsPath '{state.seconds_path}' is not a non-negative number"
+            self.clock.sleep(seconds)
+        else:
+            raw = state.timestamp if state.timestamp is not None else _resolve_path(data, state.timestamp_path)
+            try:
+                self.clock.sleep_until(parse_timestamp(raw))
+            except ValueError as exc:
+                return None, None, f"States.Runtime: Invalid Wait timestamp {raw!r}: {exc}"
+
         return next_state, data, None
 
     def _emit_trace(
@@ -405,33 +520,53 @@ class LocalRunner:
         to_state: str | None,
         state_type: str,
         duration_ms: float,
+        simulated_ms: float,
         error: str | None = None,
+        input_data: Any = None,
+        output_data: Any = None,
     ) -> None:
-        """Emit a trace line for a state transition."""
-        if self.json_output:
+        """Emit a trace record to the sink and/or a trace line to the console."""
+        if self.trace_sink is not None:
             record: dict[str, Any] = {
                 "from": from_state,
                 "to": to_state,
                 "type": state_type,
                 "duration_ms": round(duration_ms, 2),
+                "simulated_ms": round(simulated_ms, 2),
             }
             if error:
                 record["error"] = error
-            self.console.print_json(json.dumps(record))
-        else:
+            self.trace_sink.emit(record)
+        if not self.json_output and not self.console.quiet:
             arrow = f" -> {to_state}" if to_state else " [END]"
-            timing = f"({state_type}: {duration_ms:.0f}ms)"
+            timing = f"({state_type}: {duration_ms:.0f}ms"
+            if simulated_ms - duration_ms >= 1:
+                timing += f", simulated {_format_ms(simulated_ms)}"
+            timing += ")"
             if error:
                 self.console.print(f"  [red]{from_state}{arrow} {timing} ERROR: {error}[/red]")
             else:
                 self.console.print(f"  {from_state}{arrow} {timing}")
 
-            if self.verbose and self.transitions:
-                latest = self.transitions[-1]
-                if latest.input_data is not None:
-                    self.console.print(f"    [dim]Input:  {json.dumps(latest.input_data, default=str)}[/dim]")
-                if latest.output_data is not None:
-                    self.console.print(f"    [dim]Output: {json.dumps(latest.output_data, default=str)}[/dim]")
+            if self.verbose:
+                if input_data is not None:
+                    self.console.print(f"    [dim]Input:  {json.dumps(input_data, default=str)}[/dim]")
+                if output_data is not None:
+                    self.console.print(f"    [dim]Output: {json.dumps(output_data, default=str)}[/dim]")
+
+
+def _format_ms(ms: float) -> str:
+    """Format a duration in milliseconds for humans (e.g. 850ms, 12.5s, 1h02m03s)."""
+    if ms < 1000:
+        return f"{ms:.0f}ms"
+    seconds = ms / 1000
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m{secs:02d}s"
+    return f"{minutes}m{secs:02d}s"
 
 
 def _render_summary(result: ExecutionResult) -> Table:
@@ -440,6 +575,7 @@ def _render_summary(result: ExecutionResult) -> Table:
     table.add_column("State", style="bold")
     table.add_column("Type")
     table.add_column("Duration")
+    table.add_column("Simulated")
     table.add_column("Result")
 
     for tr in result.transitions:
@@ -448,12 +584,120 @@ def _render_summary(result: ExecutionResult) -> Table:
             tr.from_state,
             tr.state_type,
             f"{tr.duration_ms:.0f}ms",
+            _format_ms(tr.simulated_ms),
             status,
         )
 
     return table
 
 
+def _run_many(
+    definition: StateMachineDefinition,
+    workflow_dir: Path,
+    parsed_input: Any,
+    runs: int,
+    mock_handlers: bool,
+    json_output: bool,
+    chaos_fixture: Any | None,
+    clock: VirtualClock,
+    profiler: Any | None = None,
+    trace_sink: TraceSink | None = None,
+) -> int:
+    """Run the workflow repeatedly, report latency percentiles and return the failure count."""
+    from rsf.testing.chaos import latency_percentiles
+
+    simulated: list[float] = []
+    wall: list[float] = []
+    failures = 0
+    quiet = Console(quiet=True)
+    for _ in range(runs):
+        runner = LocalRunner(
+            definition=definition,
+            workflow_dir=workflow_dir,
+            mock_handlers=mock_handlers,
+            chaos_fixture=chaos_fixture,
+            clock=clock,
+            console=quiet,
+            profiler=profiler,
+            trace_sink=trace_sink,
+        )
+        result = runner.run(copy.deepcopy(parsed_input))
+        simulated.append(result.total_simulated_ms)
+        wall.append(result.total_duration_ms)
+        if not result.success:
+            failures += 1
+
+    sim_stats = latency_percentiles(simulated)
+    wall_stats = latency_percentiles(wall)
+    if json_output:
+        summary = {
+            "runs": runs,
+            "failures": failures,
+            "simulated_ms": {k: round(v, 2) for k, v in sim_stats.items()},
+            "wall_ms": {k: round(v, 2) for k, v in wall_stats.items()},
+        }
+        console.print_json(json.dumps(summary))
+    else:
+        table = Table(title=f"Workflow latency over {runs} runs")
+        table.add_column("Statistic", style="bold")
+        table.add_column("Simulated")
+        table.add_column("Wall")
+        for key in sim_stats:
+            table.add_row(key, _format_ms(sim_stats[key]), _format_ms(wall_stats[key]))
+        console.print(table)
+        console.print(f"[bold]Failed runs:[/bold] {failures}/{runs}")
+    return failures
+
+
+def _report_profile(profiler: Any, profile_out: Path, json_output: bool) -> None:
+    """Write collapsed-stack files and print the per-state profile."""
+    written = profiler.write_collapsed(profile_out)
+    if json_output:
+        summary = {
+            name: {
+                "transitions": stats.transitions,
+                "engine_cpu_ms": round(stats.engine_cpu_ms, 3),
+                "handler_cpu_ms": round(stats.handler_cpu_ms, 3),
+                "peak_bytes": stats.peak_bytes,
+                "net_live_blocks_per_transition": round(stats.net_live_blocks_per_transition, 2),
+            }
+            for name, stats in profiler.states.items()
+        }
+        console.print_json(json.dumps({"profile": summary, "files": [str(p) for p in written]}))
+        return
+    console.print()
+    console.print(_render_profile(profiler))
+    for path in written:
+        console.print(f"[bold]Collapsed stacks:[/bold] {path}")
+
+
+def _render_profile(profiler: Any, top: int = 3) -> Table:
+    """Render the per-state profile table (engine vs handler CPU, memory, hot functions)."""
+    table = Table(title=f"Per-State Profile ({profiler.mode})")
+    table.add_column("State", style="bold")
+    table.add_column("Transitions", justify="right")
+    if profiler.cpu:
+        table.add_column("Engine CPU", justify="right")
+        table.add_column("Handler CPU", justify="right")
+    if profiler.mem:
+        table.add_column("Peak Alloc", justify="right")
+        table.add_column("Net Live Blocks/Transition", justify="right")
+    if profiler.cpu:
+        table.add_column("Top Functions (self time)")
+
+    for name, stats in profiler.states.items():
+        row = [name, str(stats.transitions)]
+        if profiler.cpu:
+            row += [f"{stats.engine_cpu_ms:.2f}ms", f"{stats.handler_cpu_ms:.2f}ms"]
+        if profiler.mem:
+            row += [f"{stats.peak_bytes:,} B", f"{stats.net_live_blocks_per_transition:+.1f}"]
+        if profiler.cpu:
+            row.append("\n".join(f"{label} ({ms:.2f}ms)" for label, ms in profiler.top_functions(name, top)))
+        table.add_row(*row)
+
+    return table
+
+
 def test_workflow(
     workflow: Path = typer.Argument("workflow.yaml", help="Path to workflow YAML file"),
     input_data: str = typer.Option("{}", "--input", "-i", help="JSON input payload"),
@@ -463,7 +707,29 @@ def test_workflow(
     chaos_specs: list[str] = typer.Option(
         [],
         "--chaos",
-        help="Inject chaos failure: STATE_NAME:FAILURE_TYPE (timeout|exception|throttle). Repeatable.",
+        help=(
+            "Inject chaos failure: STATE_NAME:FAILURE_TYPE (timeout|exception|throttle), "
+            "or STATE_NAME:latency:SPEC (e.g. p99=2s, uniform=100ms..1s, fixed=500ms,prob=0.1). Repeatable."
+        ),
+    ),
+    seed: Optional[int] = typer.Option(None, "--seed", help="Random seed for simulated retry jitter and chaos"),
+    runs: int = typer.Option(1, "--runs", min=1, help="Run the workflow N times and report latency percentiles"),
+    profile: Optional[str] = typer.Option(
+        None, "--profile", help="Profile each state's engine and handler time: cpu, mem or both"
+    ),
+    profile_out: Path = typer.Option(
+        Path("rsf-profile"),
+        "--profile-out",
+        help="Path prefix for collapsed-stack profile files (<prefix>.cpu.collapsed, <prefix>.mem.collapsed)",
+    ),
+    trace_out: Optional[Path] = typer.Option(
+        None, "--trace-out", help="Write the per-transition trace as JSON lines to this file"
+    ),
+    serve: bool = typer.Option(
+        False, "--serve", help="Keep a warm worker running and accept JSON-line run requests (stdin or --socket)"
+    ),
+    socket_path: Optional[Path] = typer.Option(
+        None, "--socket", help="With --serve, listen on this Unix domain socket instead of stdin/stdout"
     ),
 ) -> None:
     """Execute a workflow locally with trace output.
@@ -474,6 +740,30 @@ def test_workflow(
     Use --chaos to inject failures into specific states for testing error handling:
 
         rsf test workflow.yaml --chaos ValidateOrder:timeout --chaos ProcessPayment:exception
+
+    Use --chaos STATE:latency:SPEC with --runs to see how a slow dependency
+    moves workflow-level latency percentiles:
+
+        rsf test workflow.yaml --chaos ChargeCard:latency:p99=2s --runs 500
+
+    Use --profile to attribute CPU (cProfile) and/or allocations (tracemalloc)
+    to each state, separating RSF engine overhead from handler time. Collapsed
+    stacks are written for flamegraph tools:
+
+        rsf test workflow.yaml --profile both --profile-out build/profile
+
+    Wait states and retry backoff advance a virtual clock instead of sleeping;
+    the summary reports both wall time and simulated end-to-end time.
+
+    Use --trace-out to stream the transition trace to a JSON Lines file
+    (buffered, suitable for long loops and --runs):
+
+        rsf test workflow.yaml --runs 1000 --trace-out trace.jsonl
+
+    Use --serve to keep the parsed workflow and imported handlers warm between
+    runs; only files that changed are re-parsed or re-imported:
+
+        rsf test workflow.yaml --serve --socket .rsf/test.sock
     """
     # Check workflow file exists
     if not workflow.exists():
@@ -487,24 +777,63 @@ def test_workflow(
         console.print(f"[red]Error:[/red] Invalid JSON input: {exc}")
         raise typer.Exit(code=1)
 
+    if serve:
+        if runs > 1 or profile is not None or chaos_specs or trace_out is not None:
+            console.print("[red]Error:[/red] --serve cannot be combined with --runs, --profile, --chaos or --trace-out")
+            raise typer.Exit(code=1)
+        from rsf.cli.test_server import serve as serve_worker
+
+        err_console = Console(stderr=True)
+        target = socket_path or "stdin"
+
+        def _ready() -> None:
+            err_console.print(f"[bold]rsf test worker ready[/bold] on {target} (Ctrl+C to stop)")
+
+        try:
+            serve_worker(workflow, socket_path=socket_path, mock_handlers=mock_handlers, seed=seed, on_ready=_ready)
+        except KeyboardInterrupt:
+            err_console.print("[dim]Worker stopped[/dim]")
+        except OSError as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            raise typer.Exit(code=1)
+        return
+
+    clock = VirtualClock(seed=seed)
+
+    profiler = None
+    if profile is not None:
+        from rsf.testing.profiling import StateProfiler
+
+        try:
+            profiler = StateProfiler(profile)
+        except ValueError as exc:
+            console.print(f"[red]Error:[/red] {exc}")
+            raise typer.Exit(code=1)
+
     # Set up chaos injection if requested
     chaos_fixture = None
     if chaos_specs:
-        from rsf.testing.chaos import ChaosFixture
+        from rsf.testing.chaos import ChaosFixture, parse_latency_spec
 
-        chaos_fixture = ChaosFixture()
+        chaos_fixture = ChaosFixture(clock=clock, seed=seed)
         for spec in chaos_specs:
-            parts = spec.split(":", 1)
-            if len(parts) != 2:
+            parts = spec.split(":", 2)
+            if len(parts) < 2 or (len(parts) == 3 and parts[1] != "latency"):
                 console.print(
                     f"[red]Error:[/red] Invalid --chaos format: '{spec}'. "
-                    "Expected STATE_NAME:FAILURE_TYPE (timeout|exception|throttle)"
+                    "Expected STATE_NAME:FAILURE_TYPE (timeout|exception|throttle) or STATE_NAME:latency:SPEC"
                 )
                 raise typer.Exit(code=1)
-            state_name, failure_type = parts
+            state_name, failure_type = parts[0], parts[1]
             try:
-                chaos_fixture.inject_failure(state_name, failure_type)
-            except ValueError as exc:
+                if failure_type == "latency":
+                    if len(parts) != 3:
+                        raise ValueError("latency chaos requires a spec, e.g. ChargeCard:latency:p99=2s")
+                    distribution, probability = parse_latency_spec(parts[2])
+                    chaos_fixture.inject_failure(state_name, "latency", latency=distribution, probability=probability)
+                else:
+                    chaos_fixture.inject_failure(state_name, failure_type)
+            except (ValueError, OSError) as exc:
                 console.print(f"[red]Error:[/red] {exc}")
                 raise typer.Exit(code=1)
         if not json_output:
@@ -520,11 +849,32 @@ def test_workflow(
         raise typer.Exit(code=1)
 
     workflow_dir = workflow.parent
+    trace_sink = JsonlTraceSink(trace_out) if trace_out is not None else None
 
     if not json_output:
         console.print(f"\n[bold]Testing workflow:[/bold] {workflow}")
         console.print(f"[bold]Input:[/bold] {input_data}\n")
 
+    if runs > 1:
+        with profiler or nullcontext(), trace_sink or nullcontext():
+            failures = _run_many(
+                definition,
+                workflow_dir,
+                parsed_input,
+                runs,
+                mock_handlers,
+                json_output,
+                chaos_fixture,
+                clock,
+                profiler=profiler,
+                trace_sink=trace_sink,
+            )
+        if profiler is not None:
+            _report_profile(profiler, profile_out, json_output)
+        if failures:
+            raise typer.Exit(code=1)
+        return
+
     # Execute
     runner = LocalRunner(
         definition=definition,
@@ -533,8 +883,14 @@ def test_workflow(
         json_output=json_output,
         verbose=verbose,
         chaos_fixture=chaos_fixture,
+        clock=clock,
+        profiler=profiler,
+        trace_sink=trace_sink,
     )
-    result = runner.run(parsed_input)
+    with profiler or nullcontext(), trace_sink or nullcontext():
+        result = runner.run(parsed_input)
+    if profiler is not None:
+        _report_profile(profiler, profile_out, json_output)
 
     # Summary
     if not json_output:
@@ -543,6 +899,7 @@ def test_workflow(
         console.print(summary)
 
         console.print(f"\n[bold]Total duration:[/bold] {result.total_duration_ms:.0f}ms")
+        console.print(f"[bold]Simulated duration:[/bold] {_format_ms(result.total_simulated_ms)}")
 
         if result.success:
             console.print(f"[bold]Final output:[/bold] {json.dumps(result.final_output, default=str)}")
@@ -0,0 +1,289 @@
+"""Warm worker for ``rsf test --serve``.
+
+Keeps the parsed workflow definition and imported handler modules in memory
+between runs so each test pays only for the workflow itself. Before every
+run the worker checks the workflow file and every loaded handler file:
+
+- the workflow YAML is re-parsed only when it changed;
+- a handler module is re-imported only when its own file changed.
+
+Files are compared by (mtime, size) first and by content hash when those
+differ, so a ``touch`` without an edit does not trigger a reload.
+
+Protocol: one JSON object per line in, one JSON object per line out, over
+stdin/stdout or a Unix domain socket:
+
+    {"id": 1, "input": {"order_id": "123"}, "mock_handlers": false, "seed": 7}
+    {"id": 1, "success": true, "final_output": {...}, "transitions": [...], ...}
+
+``{"command": "ping"}`` returns ``{"ok": true}``; ``{"command": "shutdown"}``
+stops the worker.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import socket
+import socketserver
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Callable
+
+from rsf.dsl.models import StateMachineDefinition
+from rsf.dsl.parser import load_definition
+from rsf.registry import registered_states, unregister
+from rsf.testing.clock import VirtualClock
+
+
+@dataclass
+class _Fingerprint:
+    """Identity of a file's contents, cheap to re-check."""
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+    @classmethod
+    def of(cls, path: Path) -> "_Fingerprint":
+        stat = path.stat()
+        return cls(stat.st_mtime_ns, stat.st_size, hashlib.sha256(path.read_bytes()).hexdigest())
+
+    def changed(self, path: Path) -> bool:
+        """Return True if ``path`` no longer has these contents; refreshes the stat fields if it does."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return True
+        if (stat.st_mtime_ns, stat.st_size) == (self.mtime_ns, self.size):
+            return False
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        if digest != self.digest:
+            return True
+        self.mtime_ns, self.size = stat.st_mtime_ns, stat.st_size
+        return False
+
+
+@dataclass
+class _LoadedHandler:
+    handler: Any
+    fingerprint: _Fingerprint
+    registered: frozenset[str] = field(default_factory=frozenset)  # @state names added by the module
+
+
+class WarmWorkspace:
+    """A workflow definition and its handlers, reloaded only when their files change.
+
+    Args:
+        workflow: Path to the workflow YAML file.
+    """
+
+    def __init__(self, workflow: Path) -> None:
+        self.workflow = workflow
+        self.workflow_dir = workflow.parent
+        self._definition: StateMachineDefinition | None = None
+        self._definition_fp: _Fingerprint | None = None
+        self._handlers: dict[Path, _LoadedHandler] = {}
+        self._paths: dict[str, Path] = {}  # state name -> handler file, valid until the next refresh()
+
+    def refresh(self) -> tuple[bool, list[str]]:
+        """Drop anything whose file changed since it was loaded.
+
+        Returns (workflow_changed, names of invalidated handler modules).
+        Handlers are re-imported lazily on their next use.
+        """
+        self._paths.clear()
+        workflow_changed = self._definition_fp is None or self._definition_fp.changed(self.workflow)
+        if workflow_changed:
+            self._definition = None
+        stale = [path for path, loaded in self._handlers.items() if loaded.fingerprint.changed(path)]
+        for path in stale:
+            for name in self._handlers.pop(path).registered:
+                unregister(name)
+        return workflow_changed, [path.stem for path in stale]
+
+    def definition(self) -> StateMachineDefinition:
+        """Return the parsed workflow, parsing it if needed."""
+        if self._definition is None:
+            fingerprint = _Fingerprint.of(self.workflow)
+            self._definition = load_definition(self.workflow)
+            self._definition_fp = fingerprint
+        return self._definition
+
+    def load_handler(self, state_name: str, workflow_dir: Path) -> Any:
+        """Handler loader for LocalRunner backed by this workspace's cache."""
+        from rsf.cli.test_cmd import _find_handler_path, _import_handler, _to_snake_case
+
+        path = self._paths.get(state_name)
+        if path is None:
+            path = self._paths[state_name] = _find_handler_path(state_name, workflow_dir)
+        loaded = self._handlers.get(path)
+        if loaded is None:
+            fingerprint = _Fingerprint.of(path)
+            before = registered_states()
+            handler = _import_handler(_to_snake_case(state_name), path)
+            loaded = self._handlers[path] = _LoadedHandler(handler, fingerprint, registered_states() - before)
+        return loaded.handler
+
+
+def _serialize_result(result: Any) -> dict[str, Any]:
+    return {
+        "success": result.success,
+        "final_output": result.final_output,
+        "error": result.error,
+        "total_duration_ms": round(result.total_duration_ms, 2),
+        "total_simulated_ms": round(result.total_simulated_ms, 2),
+        "transitions": [
+            {
+                "from": t.from_state,
+                "to": t.to_state,
+                "type": t.state_type,
+                "duration_ms": round(t.duration_ms, 2),
+                "simulated_ms": round(t.simulated_ms, 2),
+                **({"error": t.error} if t.error else {}),
+            }
+            for t in result.transitions
+        ],
+    }
+
+
+class TestServer:
+    """Executes run requests against a WarmWorkspace.
+
+    Args:
+        workspace: The workflow and handler cache to run against.
+        mock_handlers: Default for requests that do not set ``mock_handlers``.
+        seed: Default virtual-clock seed for requests that do not set ``seed``.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, workspace: WarmWorkspace, mock_handlers: bool = False, seed: int | None = None) -> None:
+        self.workspace = workspace
+        self.mock_handlers = mock_handlers
+        self.seed = seed
+        self.running = True
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle one request and return the response."""
+        from rich.console import Console
+
+        from rsf.cli.test_cmd import LocalRunner
+
+        response: dict[str, Any] = {"id": request["id"]} if "id" in request else {}
+        command = request.get("command", "run")
+        if command == "ping":
+            return {**response, "ok": True}
+        if command == "shutdown":
+            self.running = False
+            return {**response, "ok": True}
+        if command != "run":
+            return {**response, "success": False, "error": f"Unknown command: {command!r}"}
+
+        start = time.monotonic()
+        reparsed, reloaded = self.workspace.refresh()
+        response.update(reparsed=reparsed, reloaded=reloaded)
+        try:
+            definition = self.workspace.definition()
+        except Exception as exc:
+            return {**response, "success": False, "error": f"Invalid workflow: {exc}"}
+
+        runner = LocalRunner(
+            definition=definition,
+            workflow_dir=self.workspace.workflow_dir,
+            mock_handlers=request.get("mock_handlers", self.mock_handlers),
+            console=Console(quiet=True),
+            clock=VirtualClock(seed=request.get("seed", self.seed)),
+            handler_loader=self.workspace.load_handler,
+        )
+        result = runner.run(request.get("input", {}))
+        response.update(_serialize_result(result))
+        response["server_ms"] = round((time.monotonic() - start) * 1000, 2)
+        return response
+
+    def handle_line(self, line: str) -> str:
+        """Handle one JSON request line and return the JSON response line."""
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as exc:
+            response: dict[str, Any] = {"success": False, "error": f"Invalid request: {exc}"}
+        else:
+            response = self.handle(request)
+        return json.dumps(response, default=str) + "\n"
+
+    def serve_stream(self, reader: IO[str], writer: IO[str]) -> None:
+        """Serve requests line by line until EOF or a shutdown command."""
+        for line in reader:
+            if not line.strip():
+                continue
+            writer.write(self.handle_line(line))
+            writer.flush()
+            if not self.running:
+                break
+
+    def serve_socket(self, path: Path, on_ready: Callable[[], None] | None = None) -> None:
+        """Serve requests on a Unix domain socket until a shutdown command.
+
+        Connections are handled one at a time; each may send any number of
+        request lines.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix domain sockets are not supported on this platform")
+        if path.exists():
+            path.unlink()
+        server_ref = self
+
+        class _Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                for raw in self.rfile:
+                    line = raw.decode("utf-8")
+                    if not line.strip():
+                        continue
+                    self.wfile.write(server_ref.handle_line(line).encode("utf-8"))
+                    self.wfile.flush()
+                    if not server_ref.running:
+                        break
+
+        with socketserver.UnixStreamServer(str(path), _Handler) as server:
+            if on_ready is not None:
+                on_ready()
+            try:
+                while self.running:
+                    server.handle_request()
+            finally:
+                path.unlink(missing_ok=True)
+
+
+def send_request(path: str | Path, request: dict[str, Any], timeout: float = 30.0) -> dict[str, Any]:
+    """Send one request to a ``rsf test --serve --socket`` worker and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(path))
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("r", encoding="utf-8") as reader:
+            return json.loads(reader.readline())
+
+
+def serve(
+    workflow: Path,
+    socket_path: Path | None = None,
+    mock_handlers: bool = False,
+    seed: int | None = None,
+    on_ready: Callable[[], None] | None = None,
+) -> None:
+    """Run the warm test worker on stdin/stdout or a Unix socket."""
+    server = TestServer(WarmWorkspace(workflow), mock_handlers=mock_handlers, seed=seed)
+    try:
+        server.workspace.definition()  # parse up front so the first run is warm too
+    except Exception:
+        pass  # reported on the first run request
+    if socket_path is None:
+        if on_ready is not None:
+            on_ready()
+        server.serve_stream(sys.stdin, sys.stdout)
+    else:
+        server.serve_socket(socket_path, on_ready=on_ready)
@@ -15,7 +15,8 @@ from rich.console import Console
 from rsf.codegen.generator import generate as codegen_generate
 from rsf.config import resolve_infra_config
 from rsf.dsl import parser as dsl_parser
-from rsf.dsl.validator import validate_definition
+from rsf.dsl.incremental import WorkflowSession
+from rsf.dsl.validator import ValidationError, validate_definition
 from rsf.providers import ProviderNotFoundError, get_provider
 from rsf.providers.base import ProviderContext
 from rsf.providers.metadata import create_metadata, derive_workflow_name
@@ -42,33 +43,56 @@ def run_cycle(
     deploy: bool = False,
     tf_dir: Path | None = None,
     stage: str | None = None,
+    session: WorkflowSession | None = None,
 ) -> tuple[bool, str]:
     """Run one validate + generate cycle.
 
+    With a ``session`` (kept across cycles by ``watch``), an edit confined to
+    one state re-validates only that state, and errors are printed with
+    their line numbers.
+
     Returns (success, message) where message is a compact status string.
     """
     ts = _format_timestamp()
 
-    # Step 1: YAML parse
-    try:
-        data = dsl_parser.load_yaml(workflow)
-    except yaml.YAMLError as exc:
-        return False, f"{ts} YAML error: {exc}"
+    if session is not None:
+        try:
+            analysis = session.update(workflow.read_text())
+        except yaml.YAMLError as exc:
+            return False, f"{ts} YAML error: {exc}"
+        if analysis.definition is None:
+            _print_errors(workflow, analysis.errors)
+            return False, f"{ts} {len(analysis.errors)} validation error(s)"
+        definition = analysis.definition
+        errors = analysis.errors
+    else:
+        definition = dsl_parser.load_cached_definition(workflow)
+        errors = None
+    if definition is None:
+        # Step 1: YAML parse
+        try:
+            data = dsl_parser.load_yaml(workflow)
+        except yaml.YAMLError as exc:
+            return False, f"{ts} YAML error: {exc}"
 
-    if not isinstance(data, dict):
-        return False, f"{ts} Invalid workflow: must be a YAML mapping"
+        if not isinstance(data, dict):
+            return False, f"{ts} Invalid workflow: must be a YAML mapping"
 
-    # Step 2: Pydantic structural validation
-    try:
-        definition = dsl_parser.parse_definition(data)
-    except PydanticValidationError as exc:
-        error_count = len(exc.errors())
-        return False, f"{ts} {error_count} validation error(s)"
+        # Step 2: Pydantic structural validation
+        try:
+            definition = dsl_parser.parse_definition(data)
+        except PydanticValidationError as exc:
+            error_count = len(exc.errors())
+            return False, f"{ts} {error_count} validation error(s)"
+        dsl_parser.cache_definition(workflow, definition)
 
     # Step 3: Semantic validation
-    errors = validate_definition(definition)
+    if errors is None:
+        errors = validate_definition(definition)
     real_errors = [e for e in errors if e.severity == "error"]
     if real_errors:
+        if session is not None:
+            _print_errors(workflow, real_errors)
         return False, f"{ts} {len(real_errors)} error(s) \u2014 see above"
 
     # Step 4: Code generation
@@ -126,6 +150,13 @@ def run_cycle(
     return True, f"{ts} Valid + regenerated"
 
 
+def _print_errors(workflow: Path, errors: list[ValidationError]) -> None:
+    """Print errors as ``path:line:column message`` so terminals can link them."""
+    for error in errors:
+        location = f"{workflow}:{error.line}:{error.column}" if error.line is not None else str(workflow)
+        console.print(f"  [dim]{location}[/dim] {error.path + ': ' if error.path else ''}{error.message}")
+
+
 def watch(
     workflow: Path = typer.Argument("workflow.yaml", help="Path to workflow YAML file"),
     deploy: bool = typer.Option(False, "--deploy", help="Auto-deploy code changes after validation"),
@@ -154,8 +185,11 @@ def watch(
     console.print(f"[dim]Watching: {', '.join(str(p) for p in watch_paths)}[/dim]")
     console.print("[dim]Press Ctrl+C to stop[/dim]\n")
 
+    # One session for the whole watch, so single-state edits re-validate incrementally
+    session = WorkflowSession()
+
     # Run initial cycle
-    success, message = run_cycle(workflow, deploy=deploy, tf_dir=tf_dir, stage=stage)
+    success, message = run_cycle(workflow, deploy=deploy, tf_dir=tf_dir, stage=stage, session=session)
     if success:
         console.print(f"[green]{message}[/green]")
     else:
@@ -172,7 +206,7 @@ def watch(
                 if not relevant:
                     continue
 
-                success, message = run_cycle(workflow, deploy=deploy, tf_dir=tf_dir, stage=stage)
+                success, message = run_cycle(workflow, deploy=deploy, tf_dir=tf_dir, stage=stage, session=session)
                 if success:
                     console.print(f"[green]{message}[/green]")
                 else:
@@ -185,7 +219,7 @@ def watch(
         console.print(
             "[dim]watchfiles not installed \u2014 using polling (pip install rsf[watch] for better performance)[/dim]"
         )
-        _poll_loop(workflow, watch_paths, deploy, tf_dir, stage)
+        _poll_loop(workflow, watch_paths, deploy, tf_dir, stage, session)
 
 
 def _poll_loop(
@@ -194,6 +228,7 @@ def _poll_loop(
     deploy: bool,
     tf_dir: Path,
     stage: str | None,
+    session: WorkflowSession | None = None,
 ) -> None:
     """Simple polling fallback when watchfiles is not available."""
     last_mtimes: dict[str, float] = {}
@@ -218,7 +253,7 @@ def _poll_loop(
 
             if current_mtimes != last_mtimes:
                 last_mtimes = current_mtimes
-                success, message = run_cycle(workflow, deploy=deploy, tf_dir=tf_dir, stage=stage)
+                success, message = run_cycle(workflow, deploy=deploy, tf_dir=tf_dir, stage=stage, session=session)
                 if success:
                     console.print(f"[green]{message}[/green]")
                 else:
@@ -17,6 +17,7 @@ from pathlib import Path
 from rsf.codegen.emitter import emit_state_block
 from rsf.codegen.engine import render_template
 from rsf.codegen.state_mappers import StateMapping, map_states
+from rsf.dsl.graph import StateGraph
 from rsf.dsl.models import BranchDefinition, MapState, ParallelState, StateMachineDefinition, TaskState
 
 GENERATED_MARKER = "# DO NOT EDIT - Generated by RSF"
@@ -265,21 +266,9 @@ def _generate_map_helpers(definition: StateMachineDefinition) -> list[str]:
 
 
 def _collect_branch_steps(branch: BranchDefinition) -> list[str]:
-    """Collect ordered Task state names from a branch definition via BFS."""
-    steps: list[str] = []
-    visited: set[str] = set()
-    current = branch.start_at
-    while current and current not in visited:
-        visited.add(current)
-        state = branch.states.get(current)
-        if state is None:
-            break
-        if isinstance(state, TaskState):
-            steps.append(current)
-        # Advance to next state
-        next_state = getattr(state, "next", None)
-        current = next_state
-    return steps
+    """Collect ordered Task state names along a branch's Next chain from StartAt."""
+    graph = StateGraph.of(branch)
+    return [name for name in graph.next_chain() if isinstance(graph.states[name], TaskState)]
 
 
 def render_handler_stub(state_name: str) -> str:
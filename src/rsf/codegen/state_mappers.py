@@ -6,7 +6,6 @@ and mapping it to the appropriate Lambda Durable Functions SDK primitive.
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -16,6 +15,7 @@ from rsf.dsl.choice import (
     BooleanOrRule,
     DataTestRule,
 )
+from rsf.dsl.graph import StateGraph
 from rsf.dsl.models import (
     ChoiceState,
     FailState,
@@ -46,26 +46,8 @@ def map_states(definition: StateMachineDefinition) -> list[StateMapping]:
 
     Returns an ordered list of StateMapping instances in BFS visit order.
     """
-    mappings: list[StateMapping] = []
-    visited: set[str] = set()
-    queue: deque[str] = deque([definition.start_at])
-
-    while queue:
-        name = queue.popleft()
-        if name in visited or name not in definition.states:
-            continue
-        visited.add(name)
-
-        state = definition.states[name]
-        mapping = _map_single_state(name, state)
-        mappings.append(mapping)
-
-        # Enqueue all reachable next states
-        for target in _collect_targets(state):
-            if target not in visited:
-                queue.append(target)
-
-    return mappings
+    states = definition.states
+    return [_map_single_state(name, states[name]) for name in StateGraph.of(definition).bfs_order()]
 
 
 def _map_single_state(name: str, state: Any) -> StateMapping:
@@ -383,42 +365,3 @@ def _map_map(name: str, state: MapState) -> StateMapping:
         sdk_primitive="context.map",
         params=params,
     )
-
-
-def _collect_targets(state: Any) -> list[str]:
-    """Collect all possible next-state names from a state."""
-    targets: list[str] = []
-
-    # Next field (Task, Pass, Wait, Parallel, Map)
-    if hasattr(state, "next") and state.next is not None:
-        targets.append(state.next)
-
-    # Choice state: all rule targets + Default
-    if isinstance(state, ChoiceState):
-        if state.default is not None:
-            targets.append(state.default)
-        for rule in state.choices:
-            targets.extend(_collect_rule_targets(rule))
-
-    # Catch handlers
-    if hasattr(state, "catch") and state.catch:
-        for catcher in state.catch:
-            targets.append(catcher.next)
-
-    return targets
-
-
-def _collect_rule_targets(rule: Any) -> list[str]:
-    """Recursively collect Next targets from choice rules."""
-    targets: list[str] = []
-    if hasattr(rule, "next") and rule.next is not None:
-        targets.append(rule.next)
-    if isinstance(rule, BooleanAndRule):
-        for child in rule.and_:
-            targets.extend(_collect_rule_targets(child))
-    elif isinstance(rule, BooleanOrRule):
-        for child in rule.or_:
-            targets.extend(_collect_rule_targets(child))
-    elif isinstance(rule, BooleanNotRule):
-        targets.extend(_collect_rule_targets(rule.not_))
-    return targets
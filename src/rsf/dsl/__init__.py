@@ -30,7 +30,9 @@ from rsf.dsl.models import (
     ErrorRateAlarm,
     EventBridgeTrigger,
     FailState,
+    LAZY_STATES,
     LambdaUrlConfig,
+    LazyStates,
     MapState,
     ParallelState,
     PassState,
@@ -48,6 +50,7 @@ from rsf.dsl.models import (
 from rsf.dsl.types import (
     AlarmType,
     COMPARISON_OPERATORS,
+    ComparisonOperator,
     DynamoDBAttributeType,
     DynamoDBBillingMode,
     JitterStrategy,
@@ -75,8 +78,33 @@ State = Annotated[
 _state_adapter = TypeAdapter(State)
 
 
-def _validate_states_dict(states: dict[str, Any]) -> dict[str, Any]:
-    """Validate and parse a states dict, converting each value to a typed State."""
+_LAZY_CONTEXT = {LAZY_STATES: True}
+
+
+def _validate_state_lazily(data: dict[str, Any]) -> Any:
+    """Validate one raw state; any branches inside it get lazy states too."""
+    return _state_adapter.validate_python(data, context=_LAZY_CONTEXT)
+
+
+def validate_state(data: Any) -> Any:
+    """Validate one raw state value as an entry of a states dict would be.
+
+    Dicts become the matching State model; anything else is returned as is
+    (and rejected later by semantic validation), as in a full parse.
+    """
+    if isinstance(data, dict):
+        return _state_adapter.validate_python(data)
+    return data
+
+
+def _validate_states_dict(states: dict[str, Any], lazy: bool = False) -> dict[str, Any]:
+    """Validate and parse a states dict, converting each value to a typed State.
+
+    With ``lazy=True`` nothing is validated yet: the raw values are wrapped
+    in a LazyStates dict that validates each state on first access.
+    """
+    if lazy:
+        return LazyStates(states)
     result = {}
     for name, data in states.items():
         if isinstance(data, dict):
@@ -90,6 +118,7 @@ def _validate_states_dict(states: dict[str, Any]) -> dict[str, Any]:
 import rsf.dsl.models as _models  # noqa: E402
 
 _models._state_validator = _validate_states_dict
+_models._lazy_state_validator = _validate_state_lazily
 
 __all__ = [
     "AlarmConfig",
@@ -103,6 +132,7 @@ __all__ = [
     "ChoiceRule",
     "ChoiceState",
     "COMPARISON_OPERATORS",
+    "ComparisonOperator",
     "ConditionRule",
     "DataTestRule",
     "DurationAlarm",
@@ -114,8 +144,10 @@ __all__ = [
     "EventBridgeTrigger",
     "FailState",
     "JitterStrategy",
+    "LAZY_STATES",
     "LambdaUrlAuthType",
     "LambdaUrlConfig",
+    "LazyStates",
     "MapState",
     "ParallelState",
     "PassState",
@@ -134,4 +166,5 @@ __all__ = [
     "TriggerConfig",
     "WaitState",
     "discriminate_choice_rule",
+    "validate_state",
 ]
@@ -2,173 +2,338 @@
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Union
-
-from pydantic import BaseModel, Discriminator, Field, Tag, model_validator
+import re
+from typing import TYPE_CHECKING, Annotated, Any, Optional, Union
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Discriminator,
+    Field,
+    GetCoreSchemaHandler,
+    GetJsonSchemaHandler,
+    Tag,
+    TypeAdapter,
+    ValidationError,
+    create_model,
+)
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema, PydanticCustomError, core_schema
+from pydantic_core.core_schema import SerializationInfo
+
+from rsf.dsl.types import ComparisonOperator
+
+
+# Operand kinds: what the old per-operator Pydantic fields accepted
+_STRING = "string"
+_NUMERIC = "numeric"
+_BOOLEAN = "boolean"
+
+# (operator, is_path, value kind) in the historical field order, which is
+# also the key order of model_dump() and of the JSON schema
+_OPERATOR_SPECS: list[tuple[ComparisonOperator, bool, str]] = []
+for _op, _kind in (
+    (ComparisonOperator.STRING_EQUALS, _STRING),
+    (ComparisonOperator.STRING_GREATER_THAN, _STRING),
+    (ComparisonOperator.STRING_GREATER_THAN_EQUALS, _STRING),
+    (ComparisonOperator.STRING_LESS_THAN, _STRING),
+    (ComparisonOperator.STRING_LESS_THAN_EQUALS, _STRING),
+    (ComparisonOperator.STRING_MATCHES, _STRING),
+    (ComparisonOperator.NUMERIC_EQUALS, _NUMERIC),
+    (ComparisonOperator.NUMERIC_GREATER_THAN, _NUMERIC),
+    (ComparisonOperator.NUMERIC_GREATER_THAN_EQUALS, _NUMERIC),
+    (ComparisonOperator.NUMERIC_LESS_THAN, _NUMERIC),
+    (ComparisonOperator.NUMERIC_LESS_THAN_EQUALS, _NUMERIC),
+    (ComparisonOperator.BOOLEAN_EQUALS, _BOOLEAN),
+    (ComparisonOperator.TIMESTAMP_EQUALS, _STRING),
+    (ComparisonOperator.TIMESTAMP_GREATER_THAN, _STRING),
+    (ComparisonOperator.TIMESTAMP_GREATER_THAN_EQUALS, _STRING),
+    (ComparisonOperator.TIMESTAMP_LESS_THAN, _STRING),
+    (ComparisonOperator.TIMESTAMP_LESS_THAN_EQUALS, _STRING),
+):
+    _OPERATOR_SPECS.append((_op, False, _kind))
+    _OPERATOR_SPECS.append((_op, True, _STRING))
+for _op in (
+    ComparisonOperator.IS_BOOLEAN,
+    ComparisonOperator.IS_NULL,
+    ComparisonOperator.IS_NUMERIC,
+    ComparisonOperator.IS_PRESENT,
+    ComparisonOperator.IS_STRING,
+    ComparisonOperator.IS_TIMESTAMP,
+):
+    _OPERATOR_SPECS.append((_op, False, _BOOLEAN))
+
+
+def _snake(alias: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", alias).lower()
+
+
+class _OperatorKey:
+    """Everything the facade needs to know about one operator alias."""
+
+    __slots__ = ("alias", "field_name", "operator", "is_path", "kind")
+
+    def __init__(self, operator: ComparisonOperator, is_path: bool, kind: str) -> None:
+        self.alias = operator.value + ("Path" if is_path else "")
+        self.field_name = _snake(self.alias)
+        self.operator = operator
+        self.is_path = is_path
+        self.kind = kind
+
+
+_OPERATOR_KEYS = [_OperatorKey(*spec) for spec in _OPERATOR_SPECS]
+_KEY_BY_OPERATOR = {(key.operator, key.is_path): key for key in _OPERATOR_KEYS}
+# Accepts both aliases and field names (the models use populate_by_name)
+_KEY_BY_NAME = {name: key for key in _OPERATOR_KEYS for name in (key.alias, key.field_name)}
+_FIELD_NAMES = ("variable", "next", *(key.field_name for key in _OPERATOR_KEYS))
+_ALIAS_ORDER = {key.alias: index for index, key in enumerate(_OPERATOR_KEYS)}
+_ALIASES = {"variable": "Variable", "next": "Next", **{key.field_name: key.alias for key in _OPERATOR_KEYS}}
+
+_OPERAND_ADAPTERS = {
+    _STRING: TypeAdapter(str),
+    _NUMERIC: TypeAdapter(Union[int, float]),
+    _BOOLEAN: TypeAdapter(bool),
+}
+# Operand types that need no further validation (the common case from YAML)
+_EXACT_TYPES: dict[str, tuple[type, ...]] = {
+    _STRING: (str,),
+    _NUMERIC: (int, float),
+    _BOOLEAN: (bool,),
+}
+
+# model_fields_set values are shared between rules with the same keys and
+# copied before any mutation (see DataTestRule.__setattr__)
+_SHARED_FIELDS_SETS: dict[frozenset[str], set[str]] = {}
+
+
+class _InvalidRule(Exception):
+    """Raised on the fast path; the input is then re-validated for the full errors."""
+
+
+def _check(value: Any, kind: str) -> Any:
+    if type(value) in _EXACT_TYPES[kind]:
+        return value
+    try:
+        return _OPERAND_ADAPTERS[kind].validate_python(value)
+    except ValidationError:
+        raise _InvalidRule from None
+
+
+class Comparison:
+    """Compact form of a DataTestRule's test: operator, operand and is-path flag."""
+
+    __slots__ = ("operator", "operand", "is_path")
+
+    def __init__(self, operator: ComparisonOperator, operand: Any, is_path: bool = False) -> None:
+        self.operator = operator
+        self.operand = operand
+        self.is_path = is_path
+
+    @property
+    def alias(self) -> str:
+        """The DSL key, e.g. ``NumericGreaterThanPath``."""
+        return _KEY_BY_OPERATOR[(self.operator, self.is_path)].alias
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Comparison):
+            return NotImplemented
+        return (self.operator, self.operand, self.is_path) == (other.operator, other.operand, other.is_path)
+
+    def __hash__(self) -> int:
+        return hash((self.operator, self.operand, self.is_path))
+
+    def __repr__(self) -> str:
+        return f"Comparison({self.alias}={self.operand!r})"
 
 
 class DataTestRule(BaseModel):
-    """A single comparison rule with a Variable and exactly one operator."""
+    """A single comparison rule with a Variable and exactly one operator.
+
+    Stored compactly as ``variable``, ``next`` and a slotted Comparison
+    (``rule.comparison``) instead of one Pydantic field per operator. The
+    40 operator attributes (``rule.string_equals`` ...) are read-only
+    properties, and validation, ``model_dump()`` and the JSON schema keep
+    the shape of the original one-field-per-operator model.
+    """
 
     model_config = {"extra": "forbid", "populate_by_name": True}
 
     variable: str = Field(alias="Variable")
     next: str | None = Field(default=None, alias="Next")
 
-    # String operators
-    string_equals: str | None = Field(default=None, alias="StringEquals")
-    string_equals_path: str | None = Field(default=None, alias="StringEqualsPath")
-    string_greater_than: str | None = Field(default=None, alias="StringGreaterThan")
-    string_greater_than_path: str | None = Field(default=None, alias="StringGreaterThanPath")
-    string_greater_than_equals: str | None = Field(default=None, alias="StringGreaterThanEquals")
-    string_greater_than_equals_path: str | None = Field(default=None, alias="StringGreaterThanEqualsPath")
-    string_less_than: str | None = Field(default=None, alias="StringLessThan")
-    string_less_than_path: str | None = Field(default=None, alias="StringLessThanPath")
-    string_less_than_equals: str | None = Field(default=None, alias="StringLessThanEquals")
-    string_less_than_equals_path: str | None = Field(default=None, alias="StringLessThanEqualsPath")
-    string_matches: str | None = Field(default=None, alias="StringMatches")
-    string_matches_path: str | None = Field(default=None, alias="StringMatchesPath")
-
-    # Numeric operators
-    numeric_equals: int | float | None = Field(default=None, alias="NumericEquals")
-    numeric_equals_path: str | None = Field(default=None, alias="NumericEqualsPath")
-    numeric_greater_than: int | float | None = Field(default=None, alias="NumericGreaterThan")
-    numeric_greater_than_path: str | None = Field(default=None, alias="NumericGreaterThanPath")
-    numeric_greater_than_equals: int | float | None = Field(default=None, alias="NumericGreaterThanEquals")
-    numeric_greater_than_equals_path: str | None = Field(default=None, alias="NumericGreaterThanEqualsPath")
-    numeric_less_than: int | float | None = Field(default=None, alias="NumericLessThan")
-    numeric_less_than_path: str | None = Field(default=None, alias="NumericLessThanPath")
-    numeric_less_than_equals: int | float | None = Field(default=None, alias="NumericLessThanEquals")
-    numeric_less_than_equals_path: str | None = Field(default=None, alias="NumericLessThanEqualsPath")
-
-    # Boolean operator
-    boolean_equals: bool | None = Field(default=None, alias="BooleanEquals")
-    boolean_equals_path: str | None = Field(default=None, alias="BooleanEqualsPath")
-
-    # Timestamp operators
-    timestamp_equals: str | None = Field(default=None, alias="TimestampEquals")
-    timestamp_equals_path: str | None = Field(default=None, alias="TimestampEqualsPath")
-    timestamp_greater_than: str | None = Field(default=None, alias="TimestampGreaterThan")
-    timestamp_greater_than_path: str | None = Field(default=None, alias="TimestampGreaterThanPath")
-    timestamp_greater_than_equals: str | None = Field(default=None, alias="TimestampGreaterThanEquals")
-    timestamp_greater_than_equals_path: str | None = Field(default=None, alias="TimestampGreaterThanEqualsPath")
-    timestamp_less_than: str | None = Field(default=None, alias="TimestampLessThan")
-    timestamp_less_than_path: str | None = Field(default=None, alias="TimestampLessThanPath")
-    timestamp_less_than_equals: str | None = Field(default=None, alias="TimestampLessThanEquals")
-    timestamp_less_than_equals_path: str | None = Field(default=None, alias="TimestampLessThanEqualsPath")
-
-    # Type checking operators
-    is_boolean: bool | None = Field(default=None, alias="IsBoolean")
-    is_null: bool | None = Field(default=None, alias="IsNull")
-    is_numeric: bool | None = Field(default=None, alias="IsNumeric")
-    is_present: bool | None = Field(default=None, alias="IsPresent")
-    is_string: bool | None = Field(default=None, alias="IsString")
-    is_timestamp: bool | None = Field(default=None, alias="IsTimestamp")
-
-    @model_validator(mode="after")
-    def exactly_one_operator(self) -> DataTestRule:
-        """Ensure exactly one comparison operator is set."""
-        # Map alias -> field name for all operator fields
-        operator_fields = {
-            "StringEquals": "string_equals",
-            "StringEqualsPath": "string_equals_path",
-            "StringGreaterThan": "string_greater_than",
-            "StringGreaterThanPath": "string_greater_than_path",
-            "StringGreaterThanEquals": "string_greater_than_equals",
-            "StringGreaterThanEqualsPath": "string_greater_than_equals_path",
-            "StringLessThan": "string_less_than",
-            "StringLessThanPath": "string_less_than_path",
-            "StringLessThanEquals": "string_less_than_equals",
-            "StringLessThanEqualsPath": "string_less_than_equals_path",
-            "StringMatches": "string_matches",
-            "StringMatchesPath": "string_matches_path",
-            "NumericEquals": "numeric_equals",
-            "NumericEqualsPath": "numeric_equals_path",
-            "NumericGreaterThan": "numeric_greater_than",
-            "NumericGreaterThanPath": "numeric_greater_than_path",
-            "NumericGreaterThanEquals": "numeric_greater_than_equals",
-            "NumericGreaterThanEqualsPath": "numeric_greater_than_equals_path",
-            "NumericLessThan": "numeric_less_than",
-            "NumericLessThanPath": "numeric_less_than_path",
-            "NumericLessThanEquals": "numeric_less_than_equals",
-            "NumericLessThanEqualsPath": "numeric_less_than_equals_path",
-            "BooleanEquals": "boolean_equals",
-            "BooleanEqualsPath": "boolean_equals_path",
-            "TimestampEquals": "timestamp_equals",
-            "TimestampEqualsPath": "timestamp_equals_path",
-            "TimestampGreaterThan": "timestamp_greater_than",
-            "TimestampGreaterThanPath": "timestamp_greater_than_path",
-            "TimestampGreaterThanEquals": "timestamp_greater_than_equals",
-            "TimestampGreaterThanEqualsPath": "timestamp_greater_than_equals_path",
-            "TimestampLessThan": "timestamp_less_than",
-            "TimestampLessThanPath": "timestamp_less_than_path",
-            "TimestampLessThanEquals": "timestamp_less_than_equals",
-            "TimestampLessThanEqualsPath": "timestamp_less_than_equals_path",
-            "IsBoolean": "is_boolean",
-            "IsNull": "is_null",
-            "IsNumeric": "is_numeric",
-            "IsPresent": "is_present",
-            "IsString": "is_string",
-            "IsTimestamp": "is_timestamp",
-        }
-        set_operators = [
-            alias for alias, field_name in operator_fields.items() if getattr(self, field_name) is not None
-        ]
-        if len(set_operators) == 0:
+    if TYPE_CHECKING:
+        comparison: Comparison
+
+    def __init__(self, **data: Any) -> None:
+        rule = self._from_input(data)
+        object.__setattr__(self, "__dict__", rule.__dict__)
+        object.__setattr__(self, "__pydantic_fields_set__", rule.__pydantic_fields_set__)
+        object.__setattr__(self, "__pydantic_extra__", None)
+        object.__setattr__(self, "__pydantic_private__", None)
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._from_input,
+            serialization=core_schema.plain_serializer_function_ser_schema(cls._serialize, info_arg=True),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema: CoreSchema, handler: GetJsonSchemaHandler) -> JsonSchemaValue:
+        return handler(_DataTestRuleSchema.__pydantic_core_schema__)
+
+    @classmethod
+    def _from_input(cls, data: Any) -> "DataTestRule":
+        """Validate raw rule input in one pass over its keys.
+
+        Invalid keys or operands are reported by validating the input
+        against the one-field-per-operator model, so errors carry the same
+        types, messages and field locations as before.
+        """
+        if isinstance(data, cls):
+            return data
+        if not isinstance(data, dict):
+            raise PydanticCustomError("model_type", "Input should be a valid dictionary or instance of DataTestRule")
+        try:
+            return cls._build(data)
+        except _InvalidRule:
+            _DataTestRuleSchema.model_validate(data)  # raises with per-field locations
+            raise PydanticCustomError("data_test_rule", "Invalid DataTestRule") from None
+
+    @classmethod
+    def _build(cls, data: dict[str, Any]) -> "DataTestRule":
+        variable: Any = None
+        next_state: Any = None
+        comparison: Comparison | None = None
+        extra: list[str] = []
+        fields_set: set[str] = set()
+        for name, value in data.items():
+            if name == "Variable" or name == "variable":
+                if "variable" in fields_set:
+                    raise _InvalidRule  # given by alias and by name
+                variable = _check(value, _STRING)
+                fields_set.add("variable")
+            elif name == "Next" or name == "next":
+                if "next" in fields_set:
+                    raise _InvalidRule
+                next_state = None if value is None else _check(value, _STRING)
+                fields_set.add("next")
+            else:
+                key = _KEY_BY_NAME.get(name)
+                if key is None or key.field_name in fields_set:
+                    raise _InvalidRule
+                fields_set.add(key.field_name)
+                if value is None:
+                    continue
+                operand = _check(value, key.kind)
+                if comparison is not None:
+                    extra.append(key.alias)
+                    continue
+                comparison = Comparison(key.operator, operand, key.is_path)
+
+        if "variable" not in fields_set:
+            raise _InvalidRule
+        if comparison is None:
             raise ValueError("DataTestRule must have exactly one comparison operator")
-        if len(set_operators) > 1:
-            raise ValueError(f"DataTestRule must have exactly one comparison operator, got: {', '.join(set_operators)}")
-        return self
+        if extra:
+            got = ", ".join(sorted([comparison.alias, *extra], key=_ALIAS_ORDER.__getitem__))
+            raise ValueError(f"DataTestRule must have exactly one comparison operator, got: {got}")
+
+        rule = cls.__new__(cls)
+        object.__setattr__(rule, "__dict__", {"variable": variable, "next": next_state, "comparison": comparison})
+        frozen = frozenset(fields_set)
+        shared = _SHARED_FIELDS_SETS.get(frozen)
+        if shared is None:
+            shared = _SHARED_FIELDS_SETS[frozen] = fields_set
+        object.__setattr__(rule, "__pydantic_fields_set__", shared)
+        object.__setattr__(rule, "__pydantic_extra__", None)
+        object.__setattr__(rule, "__pydantic_private__", None)
+        return rule
+
+    def _serialize(self, info: SerializationInfo) -> dict[str, Any]:
+        """Serialize as the one-field-per-operator model did, honouring the dump options."""
+        comparison = self.comparison
+        set_field = _KEY_BY_OPERATOR[(comparison.operator, comparison.is_path)].field_name
+        values = {"variable": self.variable, "next": self.next}
+        fields_set = self.__pydantic_fields_set__
+        include, exclude = info.include, info.exclude
+        result: dict[str, Any] = {}
+        for name in _FIELD_NAMES:
+            value = values.get(name) if name in values else (comparison.operand if name == set_field else None)
+            if value is None and (info.exclude_none or (info.exclude_defaults and name != "variable")):
+                continue
+            if info.exclude_unset and name not in fields_set:
+                continue
+            if (include is not None and name not in include) or (exclude is not None and name in exclude):
+                continue
+            result[_ALIASES[name] if info.by_alias else name] = value
+        return result
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in ("variable", "next"):
+            raise AttributeError(f"DataTestRule.{name} is read-only; build a new rule instead")
+        # The fields set may be shared with other rules
+        object.__setattr__(self, "__pydantic_fields_set__", set(self.__pydantic_fields_set__))
+        super().__setattr__(name, value)
+
+    def __repr_args__(self) -> Any:
+        yield "variable", self.variable
+        yield "next", self.next
+        yield self.comparison.alias, self.comparison.operand
+
+    @property
+    def operator(self) -> ComparisonOperator:
+        """The comparison operator, without the ``Path`` suffix."""
+        return self.comparison.operator
+
+    @property
+    def operand(self) -> Any:
+        """The value (or, for ``*Path`` operators, the JSONPath) compared against."""
+        return self.comparison.operand
+
+    @property
+    def is_path(self) -> bool:
+        """True for ``*Path`` operators, whose operand is a JSONPath into the input."""
+        return self.comparison.is_path
 
     def get_operator(self) -> tuple[str, Any]:
         """Return (operator_alias, value) for the set operator."""
-        operator_fields = {
-            "StringEquals": "string_equals",
-            "StringEqualsPath": "string_equals_path",
-            "StringGreaterThan": "string_greater_than",
-            "StringGreaterThanPath": "string_greater_than_path",
-            "StringGreaterThanEquals": "string_greater_than_equals",
-            "StringGreaterThanEqualsPath": "string_greater_than_equals_path",
-            "StringLessThan": "string_less_than",
-            "StringLessThanPath": "string_less_than_path",
-            "StringLessThanEquals": "string_less_than_equals",
-            "StringLessThanEqualsPath": "string_less_than_equals_path",
-            "StringMatches": "string_matches",
-            "StringMatchesPath": "string_matches_path",
-            "NumericEquals": "numeric_equals",
-            "NumericEqualsPath": "numeric_equals_path",
-            "NumericGreaterThan": "numeric_greater_than",
-            "NumericGreaterThanPath": "numeric_greater_than_path",
-            "NumericGreaterThanEquals": "numeric_greater_than_equals",
-            "NumericGreaterThanEqualsPath": "numeric_greater_than_equals_path",
-            "NumericLessThan": "numeric_less_than",
-            "NumericLessThanPath": "numeric_less_than_path",
-            "NumericLessThanEquals": "numeric_less_than_equals",
-            "NumericLessThanEqualsPath": "numeric_less_than_equals_path",
-            "BooleanEquals": "boolean_equals",
-            "BooleanEqualsPath": "boolean_equals_path",
-            "TimestampEquals": "timestamp_equals",
-            "TimestampEqualsPath": "timestamp_equals_path",
-            "TimestampGreaterThan": "timestamp_greater_than",
-            "TimestampGreaterThanPath": "timestamp_greater_than_path",
-            "TimestampGreaterThanEquals": "timestamp_greater_than_equals",
-            "TimestampGreaterThanEqualsPath": "timestamp_greater_than_equals_path",
-            "TimestampLessThan": "timestamp_less_than",
-            "TimestampLessThanPath": "timestamp_less_than_path",
-            "TimestampLessThanEquals": "timestamp_less_than_equals",
-            "TimestampLessThanEqualsPath": "timestamp_less_than_equals_path",
-            "IsBoolean": "is_boolean",
-            "IsNull": "is_null",
-            "IsNumeric": "is_numeric",
-            "IsPresent": "is_present",
-            "IsString": "is_string",
-            "IsTimestamp": "is_timestamp",
-        }
-        for alias, field_name in operator_fields.items():
-            val = getattr(self, field_name)
-            if val is not None:
-                return (alias, val)
-        raise ValueError("No operator set")
+        return self.comparison.alias, self.comparison.operand
+
+
+def _operator_property(key: _OperatorKey) -> property:
+    operator, is_path = key.operator, key.is_path
+
+    def getter(self: DataTestRule) -> Any:
+        comparison = self.comparison
+        if comparison.operator is operator and comparison.is_path is is_path:
+            return comparison.operand
+        return None
+
+    getter.__name__ = key.field_name
+    getter.__doc__ = f"Operand of ``{key.alias}``, or None if the rule uses another operator."
+    return property(getter)
+
+
+for _key in _OPERATOR_KEYS:
+    setattr(DataTestRule, _key.field_name, _operator_property(_key))
+
+_OPERAND_TYPES = {_STRING: str, _NUMERIC: Union[int, float], _BOOLEAN: bool}
+
+# The original one-field-per-operator model, kept only to produce the
+# published JSON schema for DataTestRule
+_DataTestRuleSchema = create_model(
+    "DataTestRule",
+    __config__=ConfigDict(extra="forbid", populate_by_name=True),
+    __doc__="A single comparison rule with a Variable and exactly one operator.",
+    __module__=__name__,
+    variable=(str, Field(alias="Variable")),
+    next=(Optional[str], Field(default=None, alias="Next")),
+    **{
+        key.field_name: (Optional[_OPERAND_TYPES[key.kind]], Field(default=None, alias=key.alias))
+        for key in _OPERATOR_KEYS
+    },
+)
 
 
 class BooleanAndRule(BaseModel):
@@ -0,0 +1,440 @@
+"""Transition graph of a state machine, built once and shared by every analysis.
+
+The validator, code generator, cost estimator and diff all need the same
+facts about a workflow: which states each state can transition to, which
+references dangle, what is reachable from StartAt, where the terminals are
+and which Parallel branches / Map item processors nest inside which state.
+StateGraph computes those in a single linear pass per scope and memoizes
+the derived orders (BFS, strongly connected components, topological), so
+
+    graph = StateGraph.of(definition)
+
+is cheap to call from each consumer: the graph is built on first use and
+reused for as long as the definition's ``states`` dict is unchanged.
+
+Nested scopes (Parallel branches and Map item processors) get their own
+StateGraph, reachable through ``children`` / ``children_of(name)``; their
+transitions never cross scope boundaries, matching the ASL semantics.
+
+Editors re-validate after every keystroke, usually after a change to a
+single state. ``replace_state()`` updates an existing graph for such an
+edit in time proportional to the state's references, keeping reachability
+and terminals current without a rebuild; ``bind()`` then memoizes the
+graph for the definition that holds the new state.
+"""
+
+from __future__ import annotations
+
+import weakref
+from bisect import insort
+from collections import deque
+from typing import Any, Iterator, NamedTuple
+
+from rsf.dsl.choice import BooleanAndRule, BooleanNotRule, BooleanOrRule
+from rsf.dsl.models import ChoiceState, FailState, MapState, ParallelState, SucceedState
+
+# id(machine) -> graph; entries are dropped when the machine is garbage collected
+_graphs: dict[int, "StateGraph"] = {}
+
+
+class Edge(NamedTuple):
+    """A single transition reference in the definition.
+
+    Attributes:
+        source: Name of the state holding the reference.
+        target: Referenced state name (may not exist; see StateGraph.dangling).
+        kind: "Next", "Default", "Choice" or "Catch".
+        path: Field path relative to the source state, e.g. ".Choices[0].And[1].Next".
+    """
+
+    source: str
+    target: str
+    kind: str
+    path: str
+
+
+class StateGraph:
+    """Adjacency index over one state-machine scope and, recursively, its nested scopes.
+
+    Prefer ``StateGraph.of(machine)``, which memoizes the graph per
+    definition, over constructing one directly.
+
+    Args:
+        states: Name -> parsed state mapping of this scope.
+        start_at: StartAt of this scope.
+        path: Location prefix used in validation messages, e.g.
+            ``"States.Fanout.Branches[0]."`` (empty for the top level).
+        owner: Name of the Parallel/Map state this scope belongs to, if nested.
+    """
+
+    def __init__(self, states: dict[str, Any], start_at: str, path: str = "", owner: str | None = None) -> None:
+        self.states = states
+        self.start_at = start_at
+        self.path = path
+        self.owner = owner
+        self.names: list[str] = list(states)
+        self.index: dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.dangling: list[Edge] = []
+        self.terminals: list[str] = []
+        self.children: list[StateGraph] = []
+        self._successors: list[list[int]] = [[] for _ in self.names]
+        self._predecessors: list[list[int]] = [[] for _ in self.names]
+        self._next: list[int] = [-1] * len(self.names)
+        self._children_of: dict[str, list[StateGraph]] = {}
+        self._bfs: list[str] | None = None
+        self._reachable: list[bool] | None = None
+        self._sccs: list[list[str]] | None = None
+
+        index = self.index
+        predecessors = self._predecessors
+        for i, (name, state) in enumerate(states.items()):
+            if isinstance(state, (SucceedState, FailState)) or getattr(state, "end", None) is True:
+                self.terminals.append(name)
+
+            next_state = getattr(state, "next", None)
+            if next_state is not None:
+                self._next[i] = index.get(next_state, -1)
+
+            # Edges are only materialized for dangling references, which keeps
+            # the common path allocation-free beyond the adjacency lists
+            out: dict[int, None] = {}  # ordered set of successor indices
+            missing = False
+            for target in _state_targets(state):
+                j = index.get(target)
+                if j is None:
+                    missing = True
+                elif j not in out:
+                    out[j] = None
+                    predecessors[j].append(i)
+            if out:
+                self._successors[i] = list(out)
+            if missing:
+                self.dangling.extend(edge for edge in _state_edges(name, state) if edge.target not in index)
+
+            if isinstance(state, (ParallelState, MapState)):
+                nested = _nested_scopes(name, state, path)
+                if nested:
+                    self._children_of[name] = nested
+                    self.children.extend(nested)
+
+    # -- construction -------------------------------------------------------
+
+    @classmethod
+    def of(cls, machine: Any) -> "StateGraph":
+        """Return the (memoized) graph of a StateMachineDefinition or BranchDefinition.
+
+        The graph is rebuilt if ``machine.states`` has been replaced or
+        resized since it was built. Building a graph also memoizes the
+        graphs of every nested branch and item processor.
+        """
+        graph = _graphs.get(id(machine))
+        if graph is not None and graph.states is machine.states and len(graph.names) == len(machine.states):
+            return graph
+        graph = cls(machine.states, machine.start_at)
+        _remember(machine, graph)
+        return graph
+
+    def bind(self, machine: Any) -> None:
+        """Memoize this graph for ``machine``, which must hold ``self.states`` (see replace_state())."""
+        if machine.states is not self.states or machine.start_at != self.start_at:
+            raise ValueError("StateGraph.bind: the machine's states and StartAt must match the graph")
+        _remember(machine, self)
+
+    def replace_state(self, name: str, state: Any) -> None:
+        """Update the graph for a new version of the existing state ``name``.
+
+        Only that state's references, terminal flag and nested scopes are
+        recomputed. Reachability is extended in place when the state gains
+        transitions and recomputed only when a reachable state loses one.
+        ``self.states`` becomes a new dict holding ``state``, so the graph
+        no longer matches (and ``of()`` rebuilds for) the old machine; use
+        bind() to attach it to the machine built from ``self.states``.
+        """
+        i = self.index[name]
+        old_out = self._successors[i]
+        self.states = {**self.states, name: state}
+
+        out: dict[int, None] = {}
+        missing = False
+        for target in _state_targets(state):
+            j = self.index.get(target)
+            if j is None:
+                missing = True
+            else:
+                out[j] = None
+        new_out = list(out)
+        for j in old_out:
+            self._predecessors[j].remove(i)
+        for j in new_out:
+            insort(self._predecessors[j], i)
+        self._successors[i] = new_out
+
+        next_state = getattr(state, "next", None)
+        self._next[i] = self.index.get(next_state, -1) if next_state is not None else -1
+
+        # Dangling edges and terminals stay in definition order
+        index = self.index
+        kept = [edge for edge in self.dangling if edge.source != name]
+        at = next((k for k, edge in enumerate(kept) if index[edge.source] > i), len(kept))
+        if missing:
+            kept[at:at] = [edge for edge in _state_edges(name, state) if edge.target not in index]
+        self.dangling = kept
+
+        if name in self.terminals:
+            self.terminals.remove(name)
+        if isinstance(state, (SucceedState, FailState)) or getattr(state, "end", None) is True:
+            at = next((k for k, other in enumerate(self.terminals) if index[other] > i), len(self.terminals))
+            self.terminals.insert(at, name)
+
+        old_children = self._children_of.pop(name, [])
+        at = next(
+            (k for k, child in enumerate(self.children) if child.owner is not None and index[child.owner] > i),
+            len(self.children),
+        )
+        children = [child for child in self.children if child not in old_children]
+        nested = _nested_scopes(name, state, self.path) if isinstance(state, (ParallelState, MapState)) else []
+        if nested:
+            self._children_of[name] = nested
+        at -= len(old_children)
+        children[at:at] = nested
+        self.children = children
+
+        self._update_reachable(i, old_out, new_out)
+        self._bfs = None
+        self._sccs = None
+
+    # -- adjacency ----------------------------------------------------------
+
+    def successors(self, name: str) -> list[str]:
+        """Distinct existing states ``name`` can transition to, in reference order."""
+        return [self.names[j] for j in self._successors[self.index[name]]]
+
+    def predecessors(self, name: str) -> list[str]:
+        """Distinct states that can transition to ``name``, in definition order."""
+        return [self.names[j] for j in self._predecessors[self.index[name]]]
+
+    def next_state(self, name: str) -> str | None:
+        """The state's ``Next`` target if it exists in this scope."""
+        j = self._next[self.index[name]]
+        return self.names[j] if j >= 0 else None
+
+    def next_chain(self) -> list[str]:
+        """States visited by following only ``Next`` links from StartAt (stops on a cycle)."""
+        chain: list[str] = []
+        i = self.index.get(self.start_at, -1)
+        seen: set[int] = set()
+        while i >= 0 and i not in seen:
+            seen.add(i)
+            chain.append(self.names[i])
+            i = self._next[i]
+        return chain
+
+    # -- nested scopes --------------------------------------------------------
+
+    def children_of(self, name: str) -> list["StateGraph"]:
+        """Graphs of the Parallel branches or Map item processor of state ``name``."""
+        return self._children_of.get(name, [])
+
+    def iter_scopes(self) -> Iterator["StateGraph"]:
+        """This graph followed by every nested scope, depth first."""
+        stack = [self]
+        while stack:
+            graph = stack.pop()
+            yield graph
+            stack.extend(reversed(graph.children))
+
+    # -- orders ---------------------------------------------------------------
+
+    def bfs_order(self) -> list[str]:
+        """States reachable from StartAt in breadth-first visit order."""
+        if self._bfs is None:
+            start = self.index.get(self.start_at)
+            seen = [False] * len(self.names)
+            order: list[int] = []
+            if start is not None:
+                seen[start] = True
+                order = self._visit([start], seen)
+            self._bfs = [self.names[i] for i in order]
+            self._reachable = seen
+        return self._bfs
+
+    def unreachable(self) -> list[str]:
+        """States not reachable from StartAt, in definition order."""
+        if self._reachable is None:
+            self.bfs_order()
+        reachable = self._reachable
+        return [name for i, name in enumerate(self.names) if not reachable[i]]
+
+    def _visit(self, roots: list[int], seen: list[bool]) -> list[int]:
+        """Breadth-first from ``roots`` (already marked) over unseen states; returns the visit order."""
+        order: list[int] = []
+        queue: deque[int] = deque(roots)
+        while queue:
+            i = queue.popleft()
+            order.append(i)
+            for j in self._successors[i]:
+                if not seen[j]:
+                    seen[j] = True
+                    queue.append(j)
+        return order
+
+    def _update_reachable(self, i: int, old_out: list[int], new_out: list[int]) -> None:
+        reachable = self._reachable
+        if reachable is None or not reachable[i]:
+            return  # not computed yet, or the changed state is unreachable and cannot affect others
+        if set(old_out) - set(new_out):
+            self._reachable = None  # a lost edge may orphan a whole subgraph: recompute on demand
+            return
+        roots = [j for j in new_out if not reachable[j]]
+        for j in roots:
+            reachable[j] = True
+        self._visit(roots, reachable)
+
+    def sccs(self) -> list[list[str]]:
+        """Strongly connected components in topological order (Tarjan, iterative).
+
+        Every state belongs to exactly one component; a component with more
+        than one state, or a state that transitions to itself, is a loop.
+        """
+        if self._sccs is None:
+            self._sccs = [[self.names[i] for i in component] for component in reversed(self._tarjan())]
+        return self._sccs
+
+    def topological_order(self) -> list[str]:
+        """All states ordered so that transitions point forward, loops collapsed into their component."""
+        return [name for component in self.sccs() for name in component]
+
+    def has_cycle(self) -> bool:
+        """True if any state can transition back to itself."""
+        return any(
+            len(component) > 1 or self.index[component[0]] in self._successors[self.index[component[0]]]
+            for component in self.sccs()
+        )
+
+    def _tarjan(self) -> list[list[int]]:
+        n = len(self.names)
+        succ = self._successors
+        index = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        stack: list[int] = []
+        components: list[list[int]] = []
+        counter = 0
+        for root in range(n):
+            if index[root] >= 0:
+                continue
+            work = [(root, 0)]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            while work:
+                v, pos = work[-1]
+                if pos < len(succ[v]):
+                    work[-1] = (v, pos + 1)
+                    w = succ[v][pos]
+                    if index[w] < 0:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, 0))
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+                work.pop()
+                if work and low[v] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[v]
+                if low[v] == index[v]:
+                    component: list[int] = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = False
+                        component.append(w)
+                        if w == v:
+                            break
+                    component.sort()
+                    components.append(component)
+        return components
+
+
+def _remember(machine: Any, graph: StateGraph) -> None:
+    key = id(machine)
+    if key not in _graphs:
+        weakref.finalize(machine, _graphs.pop, key, None)
+    _graphs[key] = graph
+
+
+def _nested_scopes(name: str, state: Any, path: str) -> list[StateGraph]:
+    """Build (and memoize) the graphs of a Parallel's branches or a Map's item processor."""
+    prefix = f"{path}States.{name}."
+    scopes: list[tuple[Any, str]] = []
+    if isinstance(state, ParallelState):
+        scopes = [(branch, f"{prefix}Branches[{i}].") for i, branch in enumerate(state.branches)]
+    elif isinstance(state, MapState) and state.item_processor is not None:
+        scopes = [(state.item_processor, f"{prefix}ItemProcessor.")]
+    graphs: list[StateGraph] = []
+    for branch, branch_path in scopes:
+        graph = StateGraph(branch.states, branch.start_at, path=branch_path, owner=name)
+        _remember(branch, graph)
+        graphs.append(graph)
+    return graphs
+
+
+def _state_targets(state: Any) -> list[str]:
+    """Referenced state names in the same order as _state_edges()."""
+    next_state = getattr(state, "next", None)
+    targets = [next_state] if next_state is not None else []
+    if isinstance(state, ChoiceState):
+        if state.default is not None:
+            targets.append(state.default)
+        for rule in state.choices:
+            _rule_targets(rule, targets)
+    catch = getattr(state, "catch", None)
+    if catch:
+        targets.extend(catcher.next for catcher in catch)
+    return targets
+
+
+def _rule_targets(rule: Any, targets: list[str]) -> None:
+    next_state = getattr(rule, "next", None)
+    if next_state is not None:
+        targets.append(next_state)
+    if isinstance(rule, BooleanAndRule):
+        for child in rule.and_:
+            _rule_targets(child, targets)
+    elif isinstance(rule, BooleanOrRule):
+        for child in rule.or_:
+            _rule_targets(child, targets)
+    elif isinstance(rule, BooleanNotRule):
+        _rule_targets(rule.not_, targets)
+
+
+def _state_edges(name: str, state: Any) -> list[Edge]:
+    """All transition references of a state with their field paths, for error reporting."""
+    edges: list[Edge] = []
+    next_state = getattr(state, "next", None)
+    if next_state is not None:
+        edges.append(Edge(name, next_state, "Next", ".Next"))
+    if isinstance(state, ChoiceState):
+        if state.default is not None:
+            edges.append(Edge(name, state.default, "Default", ".Default"))
+        for i, rule in enumerate(state.choices):
+            _rule_edges(name, rule, f".Choices[{i}]", edges)
+    for i, catcher in enumerate(getattr(state, "catch", None) or ()):
+        edges.append(Edge(name, catcher.next, "Catch", f".Catch[{i}].Next"))
+    return edges
+
+
+def _rule_edges(name: str, rule: Any, path: str, edges: list[Edge]) -> None:
+    next_state = getattr(rule, "next", None)
+    if next_state is not None:
+        edges.append(Edge(name, next_state, "Choice", f"{path}.Next"))
+    if isinstance(rule, BooleanAndRule):
+        for i, child in enumerate(rule.and_):
+            _rule_edges(name, child, f"{path}.And[{i}]", edges)
+    elif isinstance(rule, BooleanOrRule):
+        for i, child in enumerate(rule.or_):
+            _rule_edges(name, child, f"{path}.Or[{i}]", edges)
+    elif isinstance(rule, BooleanNotRule):
+        _rule_edges(name, rule.not_, f"{path}.Not", edges)
@@ -0,0 +1,201 @@
+"""Incremental re-validation of a workflow text as it is edited.
+
+WorkflowSession keeps the last valid text with its SourceMap, definition
+and StateGraph. When the difference to a new text lies inside the span of a
+single state, below its key line, only that state's lines are parsed and
+validated: the new state is swapped into a copy of the definition and the
+graph is patched with StateGraph.replace_state(), so reachability and
+terminal checks see the change without rebuilding the graph. Anything else
+(top-level keys, renamed, added or removed states, anchors and aliases,
+flow-style States) falls back to a full parse. Either way, every error
+carries the line and column it refers to.
+
+    session = WorkflowSession()
+    analysis = session.update(text)      # full parse
+    analysis = session.update(edited)    # usually just the edited state
+    for error in analysis.errors:
+        print(error.line, error.path, error.message)
+
+Used by the graph editor (one session per connection) and ``rsf watch``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import yaml
+from pydantic import ValidationError as PydanticValidationError
+
+from rsf.dsl import LAZY_STATES, StateMachineDefinition, validate_state
+from rsf.dsl.graph import StateGraph
+from rsf.dsl.parser import _SafeLoader
+from rsf.dsl.sourcemap import _ANCHOR_OR_ALIAS, SourceMap, load_with_source_map
+from rsf.dsl.validator import ValidationError, validate_definition
+
+
+@dataclass
+class Analysis:
+    """Outcome of WorkflowSession.update().
+
+    Attributes:
+        definition: The parsed definition, or None if it failed structural
+            (Pydantic) validation.
+        errors: Structural errors when ``definition`` is None, semantic
+            errors otherwise; positioned when the path is found in the text.
+        revalidated: Name of the only state that was parsed and validated
+            again, or None after a full parse.
+    """
+
+    definition: StateMachineDefinition | None
+    errors: list[ValidationError]
+    revalidated: str | None = None
+
+
+class WorkflowSession:
+    """Validates successive versions of one workflow text, re-using work between them.
+
+    Not thread-safe; callers sharing a session across threads must
+    serialize update() calls. Definitions returned earlier are never
+    modified.
+    """
+
+    def __init__(self) -> None:
+        self._text: str | None = None
+        self._map: SourceMap | None = None
+        self._analysis: Analysis | None = None  # of self._text, always with a definition
+
+    def update(self, text: str) -> Analysis:
+        """Parse and validate ``text``.
+
+        Raises:
+            yaml.YAMLError: The text is not valid YAML. The previous valid
+                text stays the base for the next update.
+        """
+        if text == self._text and self._analysis is not None:
+            return self._analysis
+        if self._analysis is not None:
+            edit = self._single_state_edit(text)
+            if edit is not None:
+                return self._revalidate_state(text, *edit)
+        return self._full(text)
+
+    # -- full parse -----------------------------------------------------------
+
+    def _full(self, text: str) -> Analysis:
+        data, source_map = load_with_source_map(text)
+        if not isinstance(data, dict):
+            return Analysis(None, [ValidationError(message="Workflow must be a YAML mapping", line=1, column=1)])
+        try:
+            definition = StateMachineDefinition.model_validate(data, context={LAZY_STATES: True})
+        except PydanticValidationError as exc:
+            return Analysis(None, _structural_errors(exc, (), source_map))
+
+        # Validate each state on its own so errors name the state they belong to
+        states: dict[str, Any] = {}
+        errors: list[ValidationError] = []
+        for name, raw in dict.items(definition.states):
+            try:
+                states[name] = validate_state(raw)
+            except PydanticValidationError as exc:
+                errors.extend(_structural_errors(exc, ("States", name), source_map))
+        if errors:
+            return Analysis(None, errors)
+        definition.states = states
+
+        analysis = Analysis(definition, _positioned(validate_definition(definition), source_map))
+        self._text, self._map, self._analysis = text, source_map, analysis
+        return analysis
+
+    # -- single-state edits -----------------------------------------------------
+
+    def _single_state_edit(self, text: str) -> tuple[list[str], int, int, Any] | None:
+        """(new lines, state index, line delta, raw state) if only one state's span changed."""
+        old = self._map
+        if old is None or not old.block_states or old.aliases:
+            return None
+
+        lines = text.splitlines(keepends=True)
+        old_lines = old.lines
+        limit = min(len(old_lines), len(lines))
+        first = 0
+        while first < limit and old_lines[first] == lines[first]:
+            first += 1
+        common_suffix = 0
+        while (
+            common_suffix < limit - first
+            and old_lines[len(old_lines) - 1 - common_suffix] == lines[len(lines) - 1 - common_suffix]
+        ):
+            common_suffix += 1
+        old_stop = len(old_lines) - common_suffix  # changed lines: old[first:old_stop] -> new[first:new_stop]
+        new_stop = len(lines) - common_suffix
+
+        # A pure insertion belongs to the state that holds the line above it
+        i = old.state_at(first if old_stop > first else first - 1)
+        if i is None or old.starts[i] >= first or old_stop - 1 > old.ends[i]:
+            return None
+
+        changed = lines[first:new_stop]
+        key_column = old.key_columns[i]
+        for line in changed:
+            content = line.lstrip(" ")
+            if content.strip() and not content.startswith("#") and len(line) - len(content) <= key_column:
+                return None  # a sibling state or top-level key, not part of this state
+        if _ANCHOR_OR_ALIAS.search("".join(changed)):
+            return None
+
+        delta = new_stop - old_stop
+        state_lines = lines[old.starts[i] : old.ends[i] + delta + 1]
+        try:
+            parsed = yaml.load("".join(state_lines), Loader=_SafeLoader)
+        except yaml.YAMLError:
+            return None  # let the full parse report it with document positions
+        name = old.names[i]
+        if not isinstance(parsed, dict) or len(parsed) != 1 or not isinstance(parsed.get(name), dict):
+            return None
+        return lines, i, delta, parsed[name]
+
+    def _revalidate_state(self, text: str, lines: list[str], i: int, delta: int, raw: Any) -> Analysis:
+        assert self._map is not None and self._analysis is not None and self._analysis.definition is not None
+        name = self._map.names[i]
+        source_map = self._map.with_state_resized(lines, i, delta)
+        try:
+            state = validate_state(raw)
+        except PydanticValidationError as exc:
+            return Analysis(None, _structural_errors(exc, ("States", name), source_map), revalidated=name)
+
+        base = self._analysis.definition
+        graph = StateGraph.of(base)
+        graph.replace_state(name, state)
+        definition = base.model_copy(update={"states": graph.states})
+        graph.bind(definition)
+
+        analysis = Analysis(definition, _positioned(validate_definition(definition), source_map), revalidated=name)
+        self._text, self._map, self._analysis = text, source_map, analysis
+        return analysis
+
+
+def _structural_errors(
+    exc: PydanticValidationError, prefix: tuple[Any, ...], source_map: SourceMap
+) -> list[ValidationError]:
+    errors = []
+    for err in exc.errors():
+        loc = prefix + tuple(err["loc"])
+        position = source_map.locate(loc)
+        errors.append(
+            ValidationError(
+                message=err["msg"],
+                path=".".join(str(part) for part in loc),
+                line=position.line if position else None,
+                column=position.column if position else None,
+            )
+        )
+    return errors
+
+
+def _positioned(errors: list[ValidationError], source_map: SourceMap) -> list[ValidationError]:
+    for error in errors:
+        position = source_map.locate(error.path) if error.path else None
+        if position is not None:
+            error.line, error.column = position
+    return errors
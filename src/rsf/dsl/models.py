@@ -2,7 +2,7 @@
 
 from typing import Annotated, Any, Literal, Union
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, ValidationInfo, model_validator
 
 from rsf.dsl.choice import ChoiceRule
 from rsf.dsl.errors import Catcher, RetryPolicy
@@ -191,7 +191,29 @@ class ProcessorConfig(BaseModel):
     mode: ProcessorMode = Field(default=ProcessorMode.INLINE, alias="Mode")
 
 
-class BranchDefinition(BaseModel):
+class _StatesContainer(BaseModel):
+    """Shared behaviour of models that own a ``states`` dict (possibly lazy)."""
+
+    def validate_all(self) -> "_StatesContainer":
+        """Validate every state, including nested branches, and return self.
+
+        A no-op for eagerly parsed definitions. For lazy ones this gives the
+        same guarantee as eager parsing: it raises pydantic.ValidationError
+        for the first invalid state.
+        """
+        _validate_all_states(self.states)  # type: ignore[attr-defined]
+        return self
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        self.validate_all()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self.validate_all()
+        return super().model_dump_json(**kwargs)
+
+
+class BranchDefinition(_StatesContainer):
     """A sub-state machine used in Parallel branches and Map ItemProcessor.
 
     States are initially parsed as dicts, then validated against the State
@@ -207,9 +229,9 @@ class BranchDefinition(BaseModel):
     query_language: QueryLanguage | None = Field(default=None, alias="QueryLanguage")
 
     @model_validator(mode="after")
-    def _resolve_states(self) -> "BranchDefinition":
+    def _resolve_states(self, info: ValidationInfo) -> "BranchDefinition":
         if _state_validator is not None:
-            self.states = _state_validator(self.states)
+            self.states = _state_validator(self.states, lazy=_lazy_requested(info))
         return self
 
 
@@ -243,8 +265,90 @@ class MapState(_IOFields, _TransitionFields, _AssignOutput):
     query_language: QueryLanguage | None = Field(default=None, alias="QueryLanguage")
 
 
-# Hook for state validation — set by dsl/__init__.py after the State type is assembled
-_state_validator: Any = None
+# Hooks for state validation — set by dsl/__init__.py after the State type is assembled
+_state_validator: Any = None  # (states dict, lazy=bool) -> states dict
+_lazy_state_validator: Any = None  # raw state dict -> State, nested branches stay lazy
+
+# Validation context key that turns on lazy definition mode
+LAZY_STATES = "lazy_states"
+
+
+def _lazy_requested(info: ValidationInfo) -> bool:
+    return bool(info.context and info.context.get(LAZY_STATES))
+
+
+class LazyStates(dict):
+    """A states dict that validates each state the first time it is read.
+
+    Used in lazy definition mode. Values are kept as the raw YAML dicts and
+    replaced in place by the validated State model on first access through
+    ``[]``, ``get()``, ``values()``, ``items()`` or ``pop()``. Iterating
+    names, ``len()`` and ``in`` never validate. An invalid state raises
+    pydantic.ValidationError when it is accessed; call ``validate_all()``
+    on the definition for the full eager guarantee.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, name: str) -> Any:
+        value = dict.__getitem__(self, name)
+        if type(value) is dict:
+            value = _lazy_state_validator(value)
+            dict.__setitem__(self, name, value)
+        return value
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if dict.__contains__(self, name) else default
+
+    def __iter__(self) -> Any:
+        # Overriding __iter__ also stops dict(), {**x} and dict.update() from
+        # copying the raw values through CPython's dict fast path
+        return dict.__iter__(self)
+
+    def _materialize(self) -> None:
+        for name, value in list(dict.items(self)):
+            if type(value) is dict:
+                dict.__setitem__(self, name, _lazy_state_validator(value))
+
+    def values(self) -> Any:
+        self._materialize()
+        return dict.values(self)
+
+    def items(self) -> Any:
+        self._materialize()
+        return dict.items(self)
+
+    def pop(self, name: str, *default: Any) -> Any:
+        if dict.__contains__(self, name):
+            self[name]
+        return dict.pop(self, name, *default)
+
+    def copy(self) -> "LazyStates":
+        return LazyStates(dict.items(self))
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize()
+        if isinstance(other, LazyStates):
+            other._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> Any:
+        return (LazyStates, (list(dict.items(self)),))
+
+
+def _validate_all_states(states: dict[str, Any]) -> None:
+    for state in states.values():
+        if isinstance(state, ParallelState):
+            for branch in state.branches:
+                _validate_all_states(branch.states)
+        elif isinstance(state, MapState) and state.item_processor is not None:
+            _validate_all_states(state.item_processor.states)
 
 
 # Placeholder for the discriminated union — assembled in dsl/__init__.py
@@ -421,8 +525,13 @@ class InfrastructureConfig(BaseModel):
     custom: CustomProviderConfig | None = None
 
 
-class StateMachineDefinition(BaseModel):
-    """Root model for an RSF workflow definition."""
+class StateMachineDefinition(_StatesContainer):
+    """Root model for an RSF workflow definition.
+
+    Validate with ``context={LAZY_STATES: True}`` (or use
+    ``parse_definition(data, lazy=True)``) to keep states as raw dicts
+    until they are accessed; see LazyStates.
+    """
 
     model_config = {"extra": "forbid", "populate_by_name": True}
 
@@ -442,7 +551,7 @@ class StateMachineDefinition(BaseModel):
     infrastructure: InfrastructureConfig | None = Field(default=None, alias="infrastructure")
 
     @model_validator(mode="after")
-    def _resolve_states(self) -> "StateMachineDefinition":
+    def _resolve_states(self, info: ValidationInfo) -> "StateMachineDefinition":
         if _state_validator is not None:
-            self.states = _state_validator(self.states)
+            self.states = _state_validator(self.states, lazy=_lazy_requested(info))
         return self
@@ -1,14 +1,44 @@
-"""YAML/JSON loading and Pydantic validation for RSF workflow definitions."""
+"""YAML/JSON loading and Pydantic validation for RSF workflow definitions.
+
+Validated definitions are cached on disk under ``.rsf/cache/definitions/``
+next to the workflow file, keyed by the file's bytes, the RSF version and a
+fingerprint of the DSL model sources. Entries hold the validated model as
+JSON (never pickles: the directory lives in the user's project, so anything
+in it must be safe to load from an untrusted checkout). A cache hit skips
+YAML parsing and reloads the model with ``model_validate_json``. Use ``load_definition(path, use_cache=False)`` or
+``rsf --no-cache ...`` to bypass it; deleting ``.rsf/cache`` is always safe.
+"""
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
+from pydantic import ValidationError
+
+from rsf.dsl import LAZY_STATES, StateMachineDefinition
+
+# libyaml's loader is several times faster; fall back to the pure-Python one
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CACHE_DIR = Path(".rsf") / "cache" / "definitions"
+# Bump when the stored form changes in a way the source fingerprint cannot see
+CACHE_SCHEMA_VERSION = 2
+_CACHE_MAX_ENTRIES = 64
 
-from rsf.dsl import StateMachineDefinition
+_cache_enabled = True
+
+
+def set_parse_cache_enabled(enabled: bool) -> None:
+    """Turn the on-disk definition cache on or off for this process."""
+    global _cache_enabled
+    _cache_enabled = enabled
 
 
 def load_yaml(path: str | Path) -> dict[str, Any]:
@@ -17,20 +47,106 @@ def load_yaml(path: str | Path) -> dict[str, Any]:
     text = path.read_text(encoding="utf-8")
     if path.suffix in (".json",):
         return json.loads(text)
-    return yaml.safe_load(text)
+    return yaml.load(text, Loader=_SafeLoader)
 
 
 def parse_yaml(text: str) -> dict[str, Any]:
     """Parse a YAML string and return the raw dict."""
-    return yaml.safe_load(text)
+    return yaml.load(text, Loader=_SafeLoader)
+
 
+def parse_definition(data: dict[str, Any], lazy: bool = False) -> StateMachineDefinition:
+    """Parse a raw dict into a validated StateMachineDefinition.
 
-def parse_definition(data: dict[str, Any]) -> StateMachineDefinition:
-    """Parse a raw dict into a validated StateMachineDefinition."""
+    Args:
+        data: Raw workflow dict.
+        lazy: Validate only the top-level fields now and each state on first
+            access (see LazyStates). Call ``definition.validate_all()`` for
+            the full guarantee.
+    """
+    if lazy:
+        return StateMachineDefinition.model_validate(data, context={LAZY_STATES: True})
     return StateMachineDefinition.model_validate(data)
 
 
-def load_definition(path: str | Path) -> StateMachineDefinition:
-    """Load and parse a YAML/JSON workflow file into a StateMachineDefinition."""
-    data = load_yaml(path)
-    return parse_definition(data)
+def load_definition(path: str | Path, use_cache: bool | None = None, lazy: bool = False) -> StateMachineDefinition:
+    """Load and parse a YAML/JSON workflow file into a StateMachineDefinition.
+
+    Args:
+        path: Workflow file.
+        use_cache: Read/write the on-disk definition cache. Defaults to the
+            process-wide setting (see set_parse_cache_enabled()).
+        lazy: Defer per-state validation (see parse_definition()). A cache
+            hit still returns the fully validated definition; lazy parses
+            are not written to the cache.
+    """
+    path = Path(path)
+    if not (_cache_enabled if use_cache is None else use_cache):
+        return parse_definition(load_yaml(path), lazy=lazy)
+
+    definition = load_cached_definition(path)
+    if definition is None:
+        definition = parse_definition(load_yaml(path), lazy=lazy)
+        if not lazy:
+            cache_definition(path, definition)
+    return definition
+
+
+@lru_cache(maxsize=1)
+def _code_fingerprint() -> str:
+    """Fingerprint of everything that determines the validated model.
+
+    Covers the RSF version, Python version and the DSL model sources (by
+    size and mtime), so editing the models in a development checkout
+    invalidates old entries without a version bump.
+    """
+    from rsf import __version__
+
+    parts = [__version__, sys.version, str(CACHE_SCHEMA_VERSION)]
+    for source in sorted(Path(__file__).parent.glob("*.py")):
+        stat = source.stat()
+        parts.append(f"{source.name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def _cache_path(path: Path, content: bytes) -> Path:
+    key = hashlib.sha256(content + path.suffix.encode() + _code_fingerprint().encode()).hexdigest()
+    return path.parent / CACHE_DIR / f"{key}.json"
+
+
+def load_cached_definition(path: str | Path) -> StateMachineDefinition | None:
+    """Return the cached definition for the file's current contents, or None.
+
+    Unreadable or stale cache entries are treated as misses.
+    """
+    if not _cache_enabled:
+        return None
+    path = Path(path)
+    try:
+        entry = _cache_path(path, path.read_bytes())
+        return StateMachineDefinition.model_validate_json(entry.read_bytes())
+    except (OSError, ValidationError):
+        return None
+
+
+def cache_definition(path: str | Path, definition: StateMachineDefinition) -> None:
+    """Store a validated definition for the file's current contents (best effort)."""
+    if not _cache_enabled:
+        return
+    path = Path(path)
+    try:
+        entry = _cache_path(path, path.read_bytes())
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        tmp.write_text(definition.model_dump_json(by_alias=True, exclude_unset=True), encoding="utf-8")
+        os.replace(tmp, entry)  # atomic, so concurrent commands never read a partial entry
+        _prune_cache(entry.parent)
+    except (OSError, ValueError):
+        pass
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Keep only the most recently written entries."""
+    entries = sorted(cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+    for stale in entries[_CACHE_MAX_ENTRIES:]:
+        stale.unlink(missing_ok=True)
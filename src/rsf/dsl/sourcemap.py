@@ -0,0 +1,221 @@
+"""Source positions for workflow YAML.
+
+``load_with_source_map(text)`` parses a workflow like ``parse_yaml()`` and
+also returns a SourceMap: the line span of every top-level state and the
+line of every top-level key, recorded from the same composed node tree, so
+it costs no second parse. ``locate(path)`` turns a validation path such as
+``States.Fan.Branches[0].States.Work.Next`` (or a Pydantic location like
+``States.Work.Task.Catch.0``) into a line and column, composing only the
+enclosing state's lines when it needs anything deeper than the state.
+
+A state's span runs from its key to the line before the next state's key,
+so comments and blank lines between states belong to the state above.
+Lines and columns are 1-based, as editors display them.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from typing import Any, NamedTuple
+
+import yaml
+
+from rsf.dsl.parser import _SafeLoader
+
+# Anchors and aliases let one state's text change another state's value
+_ANCHOR_OR_ALIAS = re.compile(r"(?:^|[\s,\[{])[&*][^\s\[\]{},]+")
+_PATH_SEGMENT = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+
+
+class Position(NamedTuple):
+    """A 1-based line and column."""
+
+    line: int
+    column: int
+
+
+class SourceMap:
+    """Positions of the states and top-level keys of one workflow text.
+
+    Attributes:
+        lines: The text split into lines (with line endings).
+        names: Top-level state names in document order.
+        starts: 0-based line of each state's key.
+        ends: 0-based last line of each state's span.
+        key_columns: 0-based column of each state's key.
+        top_keys: Top-level key -> 0-based (line, column).
+        block_states: True if States is a block mapping with one state per line range.
+        aliases: True if the text may use YAML anchors or aliases.
+    """
+
+    def __init__(
+        self,
+        lines: list[str],
+        names: list[str],
+        starts: list[int],
+        ends: list[int],
+        key_columns: list[int],
+        top_keys: dict[str, tuple[int, int]],
+        block_states: bool,
+        aliases: bool,
+    ) -> None:
+        self.lines = lines
+        self.names = names
+        self.starts = starts
+        self.ends = ends
+        self.key_columns = key_columns
+        self.top_keys = top_keys
+        self.block_states = block_states
+        self.aliases = aliases
+        self.index = {name: i for i, name in enumerate(names)}
+
+    @classmethod
+    def from_node(cls, text: str, root: Any) -> "SourceMap":
+        """Build the map from the composed root node of ``text``."""
+        lines = text.splitlines(keepends=True)
+        names: list[str] = []
+        starts: list[int] = []
+        key_columns: list[int] = []
+        ends: list[int] = []
+        top_keys: dict[str, tuple[int, int]] = {}
+        block_states = False
+
+        if isinstance(root, yaml.MappingNode):
+            for key_node, value_node in root.value:
+                if not isinstance(key_node, yaml.ScalarNode):
+                    continue
+                top_keys[key_node.value] = (key_node.start_mark.line, key_node.start_mark.column)
+                if key_node.value != "States" or not isinstance(value_node, yaml.MappingNode):
+                    continue
+                for state_key, _ in value_node.value:
+                    names.append(state_key.value)
+                    starts.append(state_key.start_mark.line)
+                    key_columns.append(state_key.start_mark.column)
+                end = value_node.end_mark.line - (1 if value_node.end_mark.column == 0 else 0)
+                ends = [start - 1 for start in starts[1:]] + [end] if starts else []
+                block_states = not value_node.flow_style and all(s <= e for s, e in zip(starts, ends))
+
+        return cls(
+            lines=lines,
+            names=names,
+            starts=starts,
+            ends=ends,
+            key_columns=key_columns,
+            top_keys=top_keys,
+            block_states=block_states,
+            aliases=_ANCHOR_OR_ALIAS.search(text) is not None,
+        )
+
+    def state_at(self, line: int) -> int | None:
+        """Index of the state whose span contains 0-based ``line``, or None."""
+        i = bisect_right(self.starts, line) - 1
+        if i >= 0 and line <= self.ends[i]:
+            return i
+        return None
+
+    def state_text(self, i: int) -> str:
+        """The lines of state ``i``'s span, key line first."""
+        return "".join(self.lines[self.starts[i] : self.ends[i] + 1])
+
+    def with_state_resized(self, lines: list[str], i: int, delta: int) -> "SourceMap":
+        """Map for ``lines``, the text after state ``i`` grew by ``delta`` lines (possibly negative)."""
+        start = self.starts[i]
+        if delta == 0:
+            starts, ends = self.starts, self.ends
+            top_keys = self.top_keys
+        else:
+            starts = self.starts[: i + 1] + [line + delta for line in self.starts[i + 1 :]]
+            ends = self.ends[:i] + [line + delta for line in self.ends[i:]]
+            top_keys = {
+                key: (line + delta, column) if line > start else (line, column)
+                for key, (line, column) in self.top_keys.items()
+            }
+        resized = SourceMap.__new__(SourceMap)
+        resized.lines = lines
+        resized.names = self.names
+        resized.starts = starts
+        resized.ends = ends
+        resized.key_columns = self.key_columns
+        resized.top_keys = top_keys
+        resized.block_states = self.block_states
+        resized.aliases = self.aliases
+        resized.index = self.index
+        return resized
+
+    def locate(self, path: str | tuple[Any, ...]) -> Position | None:
+        """Position of the deepest node of ``path`` found in the text, or None.
+
+        Segments that do not name a key or index (such as the state type
+        Pydantic adds to union locations) are skipped.
+        """
+        segments = _segments(path)
+        if not segments:
+            return None
+        if segments[0] == "States" and len(segments) > 1 and str(segments[1]) in self.index:
+            i = self.index[str(segments[1])]
+            if len(segments) == 2:
+                return Position(self.starts[i] + 1, self.key_columns[i] + 1)
+            return self._locate_in_state(i, segments[2:])
+        if segments[0] in self.top_keys:
+            line, column = self.top_keys[segments[0]]
+            return Position(line + 1, column + 1)
+        return None
+
+    def _locate_in_state(self, i: int, segments: list[Any]) -> Position:
+        line, column = self.starts[i], self.key_columns[i]
+        try:
+            root = yaml.compose(self.state_text(i), Loader=_SafeLoader)
+        except yaml.YAMLError:
+            root = None
+        node = root.value[0][1] if isinstance(root, yaml.MappingNode) and root.value else None
+        for segment in segments:
+            found = _child(node, segment)
+            if found is None:
+                continue
+            mark, node = found
+            line, column = self.starts[i] + mark.line, mark.column
+        return Position(line + 1, column + 1)
+
+
+def load_with_source_map(text: str) -> tuple[Any, SourceMap]:
+    """Parse YAML text into raw data plus its SourceMap (raises yaml.YAMLError)."""
+    loader = _SafeLoader(text)
+    try:
+        root = loader.get_single_node()
+        data = loader.construct_document(root) if root is not None else None
+    finally:
+        loader.dispose()
+    return data, SourceMap.from_node(text, root)
+
+
+def error_position(exc: yaml.YAMLError) -> Position | None:
+    """Where a YAML syntax error was detected, if PyYAML reports it."""
+    mark = getattr(exc, "problem_mark", None) or getattr(exc, "context_mark", None)
+    return Position(mark.line + 1, mark.column + 1) if mark is not None else None
+
+
+def _segments(path: str | tuple[Any, ...]) -> list[Any]:
+    if isinstance(path, tuple):
+        return [part if isinstance(part, int) else str(part) for part in path]
+    segments: list[Any] = []
+    for name, index in _PATH_SEGMENT.findall(path):
+        if index:
+            segments.append(int(index))
+        elif name.isdigit():
+            segments.append(int(name))
+        else:
+            segments.append(name)
+    return segments
+
+
+def _child(node: Any, segment: Any) -> tuple[Any, Any] | None:
+    """(mark, child node) for a mapping key or sequence index."""
+    if isinstance(node, yaml.MappingNode) and not isinstance(segment, int):
+        for key_node, value_node in node.value:
+            if isinstance(key_node, yaml.ScalarNode) and key_node.value == segment:
+                return key_node.start_mark, value_node
+    elif isinstance(node, yaml.SequenceNode) and isinstance(segment, int) and segment < len(node.value):
+        item = node.value[segment]
+        return item.start_mark, item
+    return None
@@ -56,6 +56,38 @@ class AlarmType(str, Enum):
     THROTTLE = "throttle"
 
 
+class ComparisonOperator(str, Enum):
+    """Choice rule comparison operators, without the ``Path`` suffix.
+
+    A DataTestRule stores one of these plus an is-path flag; ``StringEqualsPath``
+    is (STRING_EQUALS, is_path=True).
+    """
+
+    STRING_EQUALS = "StringEquals"
+    STRING_GREATER_THAN = "StringGreaterThan"
+    STRING_GREATER_THAN_EQUALS = "StringGreaterThanEquals"
+    STRING_LESS_THAN = "StringLessThan"
+    STRING_LESS_THAN_EQUALS = "StringLessThanEquals"
+    STRING_MATCHES = "StringMatches"
+    NUMERIC_EQUALS = "NumericEquals"
+    NUMERIC_GREATER_THAN = "NumericGreaterThan"
+    NUMERIC_GREATER_THAN_EQUALS = "NumericGreaterThanEquals"
+    NUMERIC_LESS_THAN = "NumericLessThan"
+    NUMERIC_LESS_THAN_EQUALS = "NumericLessThanEquals"
+    BOOLEAN_EQUALS = "BooleanEquals"
+    TIMESTAMP_EQUALS = "TimestampEquals"
+    TIMESTAMP_GREATER_THAN = "TimestampGreaterThan"
+    TIMESTAMP_GREATER_THAN_EQUALS = "TimestampGreaterThanEquals"
+    TIMESTAMP_LESS_THAN = "TimestampLessThan"
+    TIMESTAMP_LESS_THAN_EQUALS = "TimestampLessThanEquals"
+    IS_BOOLEAN = "IsBoolean"
+    IS_NULL = "IsNull"
+    IS_NUMERIC = "IsNumeric"
+    IS_PRESENT = "IsPresent"
+    IS_STRING = "IsString"
+    IS_TIMESTAMP = "IsTimestamp"
+
+
 # All 39 comparison operators for Choice rules
 COMPARISON_OPERATORS: frozenset[str] = frozenset(
     {
@@ -1,4 +1,4 @@
-"""Semantic cross-state validation via BFS traversal.
+"""Semantic cross-state validation over the shared StateGraph.
 
 Performs validations that Pydantic field-level validators cannot:
 1. All Next/Default/Catch.Next references resolve to existing states
@@ -10,36 +10,32 @@ Performs validations that Pydantic field-level validators cannot:
 
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass
 from typing import Any
 
+from rsf.dsl.graph import StateGraph
 from rsf.dsl.models import (
-    ChoiceState,
     ErrorRateAlarm,
     EventBridgeTrigger,
-    FailState,
-    MapState,
-    ParallelState,
     SQSTrigger,
     StateMachineDefinition,
-    SucceedState,
     TaskState,
 )
-from rsf.dsl.choice import (
-    BooleanAndRule,
-    BooleanNotRule,
-    BooleanOrRule,
-)
 
 
 @dataclass
 class ValidationError:
-    """A single semantic validation error."""
+    """A single semantic validation error.
+
+    ``line`` and ``column`` (1-based) are filled in when the definition was
+    parsed with a source map, e.g. by rsf.dsl.incremental.WorkflowSession.
+    """
 
     message: str
     path: str = ""
     severity: str = "error"  # "error" or "warning"
+    line: int | None = None
+    column: int | None = None
 
 
 def validate_definition(definition: StateMachineDefinition) -> list[ValidationError]:
@@ -54,12 +50,7 @@ def validate_definition(definition: StateMachineDefinition) -> list[ValidationEr
     _validate_dynamodb_tables(definition, errors)
     _validate_alarms(definition, errors)
     _validate_dlq(definition, errors)
-    _validate_state_machine(
-        states=definition.states,
-        start_at=definition.start_at,
-        path="",
-        errors=errors,
-    )
+    _validate_state_machine(StateGraph.of(definition), errors)
     return errors
 
 
@@ -131,7 +122,7 @@ def _validate_sub_workflows(
 
     # Walk all states (including nested in Parallel/Map) to find SubWorkflow references
     referenced_names: set[str] = set()
-    _collect_sub_workflow_refs(definition.states, referenced_names, errors, declared_names)
+    _collect_sub_workflow_refs(StateGraph.of(definition), referenced_names, errors, declared_names)
 
     # Warn about unused declarations
     unused = declared_names - referenced_names
@@ -261,13 +252,13 @@ def _validate_dlq(
 
 
 def _collect_sub_workflow_refs(
-    states: dict[str, Any],
+    graph: StateGraph,
     referenced: set[str],
     errors: list[ValidationError],
     declared: set[str],
 ) -> None:
     """Recursively collect SubWorkflow references and validate them."""
-    for name, state in states.items():
+    for name, state in graph.states.items():
         if isinstance(state, TaskState) and state.sub_workflow is not None:
             referenced.add(state.sub_workflow)
             if state.sub_workflow not in declared:
@@ -279,206 +270,81 @@ def _collect_sub_workflow_refs(
                         path=f"States.{name}.SubWorkflow",
                     )
                 )
-        # Recurse into Parallel branches
-        if isinstance(state, ParallelState):
-            for branch in state.branches:
-                _collect_sub_workflow_refs(branch.states, referenced, errors, declared)
-        # Recurse into Map ItemProcessor
-        if isinstance(state, MapState) and state.item_processor is not None:
-            _collect_sub_workflow_refs(state.item_processor.states, referenced, errors, declared)
+        # Recurse into Parallel branches and Map ItemProcessor
+        for child in graph.children_of(name):
+            _collect_sub_workflow_refs(child, referenced, errors, declared)
 
 
-def _validate_state_machine(
-    states: dict[str, Any],
-    start_at: str,
-    path: str,
-    errors: list[ValidationError],
-) -> None:
+def _validate_state_machine(graph: StateGraph, errors: list[ValidationError]) -> None:
     """Validate a state machine (top-level or branch)."""
-    state_names = set(states.keys())
+    path = graph.path
 
     # 1. StartAt must reference an existing state
-    if start_at not in state_names:
+    if graph.start_at not in graph.index:
         errors.append(
             ValidationError(
-                message=f"StartAt '{start_at}' does not reference an existing state",
-                path=f"{path}StartAt" if path else "StartAt",
+                message=f"StartAt '{graph.start_at}' does not reference an existing state",
+                path=f"{path}StartAt",
             )
         )
 
     # 2. Validate all references resolve
-    _validate_references(states, state_names, path, errors)
+    _validate_references(graph, errors)
 
     # 3. Check reachability via BFS
-    _validate_reachability(states, start_at, state_names, path, errors)
+    _validate_reachability(graph, errors)
 
     # 4. Check at least one terminal state exists
-    _validate_terminal_exists(states, path, errors)
+    _validate_terminal_exists(graph, errors)
 
     # 5. Validate States.ALL ordering in Retry/Catch arrays
-    _validate_states_all_ordering(states, path, errors)
+    _validate_states_all_ordering(graph.states, path, errors)
 
     # 6. Recurse into Parallel branches and Map ItemProcessor
-    _validate_branches_recursive(states, path, errors)
-
-
-def _validate_references(
-    states: dict[str, Any],
-    state_names: set[str],
-    path: str,
-    errors: list[ValidationError],
-) -> None:
-    """Check all Next, Default, and Catch.Next references resolve."""
-    for name, state in states.items():
-        state_path = f"{path}States.{name}"
-
-        # Next field
-        if hasattr(state, "next") and state.next is not None:
-            if state.next not in state_names:
-                errors.append(
-                    ValidationError(
-                        message=f"Next '{state.next}' does not reference an existing state",
-                        path=f"{state_path}.Next",
-                    )
-                )
+    for child in graph.children:
+        _validate_state_machine(child, errors)
 
-        # Choice state: Choices[].Next and Default
-        if isinstance(state, ChoiceState):
-            if state.default is not None and state.default not in state_names:
-                errors.append(
-                    ValidationError(
-                        message=f"Default '{state.default}' does not reference an existing state",
-                        path=f"{state_path}.Default",
-                    )
-                )
-            for i, rule in enumerate(state.choices):
-                _validate_choice_rule_references(rule, state_names, f"{state_path}.Choices[{i}]", errors)
 
-        # Catch handlers
-        if hasattr(state, "catch") and state.catch:
-            for i, catcher in enumerate(state.catch):
-                if catcher.next not in state_names:
-                    errors.append(
-                        ValidationError(
-                            message=f"Catch.Next '{catcher.next}' does not reference an existing state",
-                            path=f"{state_path}.Catch[{i}].Next",
-                        )
-                    )
+_REFERENCE_LABELS = {
+    "Next": "Next",
+    "Default": "Default",
+    "Choice": "Choice rule Next",
+    "Catch": "Catch.Next",
+}
 
 
-def _validate_choice_rule_references(
-    rule: Any,
-    state_names: set[str],
-    path: str,
-    errors: list[ValidationError],
-) -> None:
-    """Recursively validate references in choice rules."""
-    if hasattr(rule, "next") and rule.next is not None:
-        if rule.next not in state_names:
-            errors.append(
-                ValidationError(
-                    message=f"Choice rule Next '{rule.next}' does not reference an existing state",
-                    path=f"{path}.Next",
-                )
+def _validate_references(graph: StateGraph, errors: list[ValidationError]) -> None:
+    """Check all Next, Default, Choices[].Next and Catch.Next references resolve."""
+    for edge in graph.dangling:
+        errors.append(
+            ValidationError(
+                message=f"{_REFERENCE_LABELS[edge.kind]} '{edge.target}' does not reference an existing state",
+                path=f"{graph.path}States.{edge.source}{edge.path}",
             )
-    # Recurse into boolean combinators
-    if isinstance(rule, BooleanAndRule):
-        for i, child in enumerate(rule.and_):
-            _validate_choice_rule_references(child, state_names, f"{path}.And[{i}]", errors)
-    elif isinstance(rule, BooleanOrRule):
-        for i, child in enumerate(rule.or_):
-            _validate_choice_rule_references(child, state_names, f"{path}.Or[{i}]", errors)
-    elif isinstance(rule, BooleanNotRule):
-        _validate_choice_rule_references(rule.not_, state_names, f"{path}.Not", errors)
-
-
-def _validate_reachability(
-    states: dict[str, Any],
-    start_at: str,
-    state_names: set[str],
-    path: str,
-    errors: list[ValidationError],
-) -> None:
-    """BFS from StartAt to check all states are reachable."""
-    if start_at not in state_names:
-        return  # Already reported as a StartAt error
-
-    visited: set[str] = set()
-    queue: deque[str] = deque([start_at])
-
-    while queue:
-        current = queue.popleft()
-        if current in visited or current not in state_names:
-            continue
-        visited.add(current)
-        state = states[current]
-
-        # Collect all possible next states
-        targets: list[str] = []
-
-        if hasattr(state, "next") and state.next is not None:
-            targets.append(state.next)
-
-        if isinstance(state, ChoiceState):
-            if state.default is not None:
-                targets.append(state.default)
-            for rule in state.choices:
-                targets.extend(_collect_choice_rule_targets(rule))
+        )
 
-        if hasattr(state, "catch") and state.catch:
-            for catcher in state.catch:
-                targets.append(catcher.next)
 
-        for target in targets:
-            if target not in visited:
-                queue.append(target)
+def _validate_reachability(graph: StateGraph, errors: list[ValidationError]) -> None:
+    """Report states that the BFS from StartAt never visits."""
+    if graph.start_at not in graph.index:
+        return  # Already reported as a StartAt error
 
-    unreachable = state_names - visited
-    for name in sorted(unreachable):
+    for name in sorted(graph.unreachable()):
         errors.append(
             ValidationError(
                 message=f"State '{name}' is not reachable from StartAt",
-                path=f"{path}States.{name}" if path else f"States.{name}",
+                path=f"{graph.path}States.{name}",
             )
         )
 
 
-def _collect_choice_rule_targets(rule: Any) -> list[str]:
-    """Collect all Next targets from a choice rule recursively."""
-    targets: list[str] = []
-    if hasattr(rule, "next") and rule.next is not None:
-        targets.append(rule.next)
-    if isinstance(rule, BooleanAndRule):
-        for child in rule.and_:
-            targets.extend(_collect_choice_rule_targets(child))
-    elif isinstance(rule, BooleanOrRule):
-        for child in rule.or_:
-            targets.extend(_collect_choice_rule_targets(child))
-    elif isinstance(rule, BooleanNotRule):
-        targets.extend(_collect_choice_rule_targets(rule.not_))
-    return targets
-
-
-def _validate_terminal_exists(
-    states: dict[str, Any],
-    path: str,
-    errors: list[ValidationError],
-) -> None:
+def _validate_terminal_exists(graph: StateGraph, errors: list[ValidationError]) -> None:
     """Check that at least one terminal state exists."""
-    has_terminal = False
-    for state in states.values():
-        if isinstance(state, (SucceedState, FailState)):
-            has_terminal = True
-            break
-        if hasattr(state, "end") and state.end is True:
-            has_terminal = True
-            break
-
-    if not has_terminal:
+    if not graph.terminals:
         errors.append(
             ValidationError(
                 message="State machine must have at least one terminal state (Succeed, Fail, or End: true)",
-                path=f"{path}States" if path else "States",
+                path=f"{graph.path}States",
             )
         )
 
@@ -511,30 +377,3 @@ def _validate_states_all_ordering(
                             path=f"{state_path}.Catch[{i}]",
                         )
                     )
-
-
-def _validate_branches_recursive(
-    states: dict[str, Any],
-    path: str,
-    errors: list[ValidationError],
-) -> None:
-    """Recurse into Parallel branches and Map ItemProcessor."""
-    for name, state in states.items():
-        state_path = f"{path}States.{name}." if path else f"States.{name}."
-
-        if isinstance(state, ParallelState):
-            for i, branch in enumerate(state.branches):
-                _validate_state_machine(
-                    states=branch.states,
-                    start_at=branch.start_at,
-                    path=f"{state_path}Branches[{i}].",
-                    errors=errors,
-                )
-
-        if isinstance(state, MapState) and state.item_processor is not None:
-            _validate_state_machine(
-                states=state.item_processor.states,
-                start_at=state.item_processor.start_at,
-                path=f"{state_path}ItemProcessor.",
-                errors=errors,
-            )
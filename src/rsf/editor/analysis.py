@@ -0,0 +1,201 @@
+"""Off-loop YAML parsing and validation for the graph editor.
+
+Parsing, Pydantic validation and semantic validation of a large workflow
+take long enough to stall the event loop, and with it every connected
+editor. AnalysisPool runs them on a small thread pool instead and caches
+the outcome by the SHA-256 of the YAML text, so identical buffers (the same
+file open in two tabs, an undo back to a previous state) are analyzed once.
+Concurrent requests for the same text share a single job; a job nobody is
+waiting for any more is dropped before it starts.
+
+Each connection analyzes through its own IncrementalAnalyzer, so an edit
+inside one state re-validates and re-dumps just that state (see
+rsf.dsl.incremental). Errors carry the 1-based line and column they refer to.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import yaml
+
+from rsf.dsl.incremental import WorkflowSession
+from rsf.dsl.sourcemap import error_position
+from rsf.dsl.validator import ValidationError
+
+_DEFAULT_CACHE_SIZE = 64
+
+
+@dataclass(frozen=True)
+class AnalysisResult:
+    """Outcome of parsing and validating one YAML buffer.
+
+    Results are shared between connections through the cache; treat
+    ``ast`` and ``errors`` as read-only.
+
+    Attributes:
+        ast: The definition dumped by alias without None values, or None if
+            the YAML or schema is invalid.
+        errors: ``{"message", "path", "severity"}`` dicts.
+    """
+
+    ast: dict[str, Any] | None
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+
+class IncrementalAnalyzer:
+    """Analyzes successive buffers of one editor connection.
+
+    Keeps a WorkflowSession and the AST of its last valid buffer; when the
+    session re-validated a single state, only that state is dumped and
+    spliced into a copy of the previous AST.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()  # buffers of one connection may reach different workers
+        self._session = WorkflowSession()
+        self._ast: dict[str, Any] | None = None
+
+    def __call__(self, yaml_content: str) -> AnalysisResult:
+        with self._lock:
+            try:
+                analysis = self._session.update(yaml_content)
+            except yaml.YAMLError as exc:
+                position = error_position(exc)
+                return AnalysisResult(
+                    ast=None,
+                    errors=[
+                        {
+                            "message": f"YAML syntax error: {exc}",
+                            "path": "",
+                            "severity": "error",
+                            "line": position.line if position else None,
+                            "column": position.column if position else None,
+                        }
+                    ],
+                )
+
+            errors = [_error_dict(err) for err in analysis.errors]
+            definition = analysis.definition
+            if definition is None:
+                return AnalysisResult(ast=None, errors=errors)
+
+            name = analysis.revalidated
+            if name is not None and self._ast is not None:
+                ast = dict(self._ast)
+                ast["States"] = {
+                    **ast["States"],
+                    name: definition.states[name].model_dump(by_alias=True, exclude_none=True),
+                }
+            else:
+                ast = definition.model_dump(by_alias=True, exclude_none=True)
+            self._ast = ast
+            return AnalysisResult(ast=ast, errors=errors)
+
+
+def analyze_yaml(yaml_content: str) -> AnalysisResult:
+    """Parse, validate and dump a YAML buffer (blocking)."""
+    return IncrementalAnalyzer()(yaml_content)
+
+
+def _error_dict(err: ValidationError) -> dict[str, Any]:
+    return {
+        "message": err.message,
+        "path": err.path,
+        "severity": err.severity,
+        "line": err.line,
+        "column": err.column,
+    }
+
+
+class _Job:
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: Future) -> None:
+        self.future = future
+        self.waiters = 0
+
+
+class AnalysisPool:
+    """Thread pool plus content-hash cache for analyze_yaml().
+
+    One pool is shared by every connection of an editor server.
+
+    Args:
+        max_workers: Worker threads (default: up to 4, depending on CPUs).
+        cache_size: Number of results kept, least recently used first out.
+    """
+
+    def __init__(self, max_workers: int | None = None, cache_size: int = _DEFAULT_CACHE_SIZE) -> None:
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.cache_size = cache_size
+        self.analyzed = 0  # number of buffers actually parsed, for diagnostics
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._results: OrderedDict[str, AnalysisResult] = OrderedDict()
+        self._jobs: dict[str, _Job] = {}
+
+    async def analyze(
+        self, yaml_content: str, analyzer: Callable[[str], AnalysisResult] | None = None
+    ) -> AnalysisResult:
+        """Return the analysis of ``yaml_content``, computing it in a worker if not cached.
+
+        ``analyzer`` (e.g. the connection's IncrementalAnalyzer) computes a
+        miss instead of analyze_yaml(); either gives the same result for the
+        same text, so the cache is shared regardless.
+
+        Cancelling the caller never cancels a job other callers are waiting
+        on; the last waiter to go away cancels it if it has not started.
+        """
+        key = hashlib.sha256(yaml_content.encode("utf-8")).hexdigest()
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+            job = self._jobs.get(key)
+            if job is None:
+                job = self._jobs[key] = _Job(self._pool().submit(self._run, key, yaml_content, analyzer))
+            job.waiters += 1
+
+        try:
+            return await asyncio.shield(asyncio.wrap_future(job.future))
+        except asyncio.CancelledError:
+            with self._lock:
+                job.waiters -= 1
+                if job.waiters == 0 and job.future.cancel():
+                    self._jobs.pop(key, None)
+            raise
+
+    def shutdown(self) -> None:
+        """Stop the worker threads (pending jobs are cancelled)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="rsf-editor")
+        return self._executor
+
+    def _run(self, key: str, yaml_content: str, analyzer: Callable[[str], AnalysisResult] | None) -> AnalysisResult:
+        try:
+            result = analyzer(yaml_content) if analyzer is not None else analyze_yaml(yaml_content)
+        except BaseException:
+            with self._lock:
+                self._jobs.pop(key, None)
+            raise
+        with self._lock:
+            self.analyzed += 1
+            self._results[key] = result
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+            self._jobs.pop(key, None)
+        return result
@@ -0,0 +1,88 @@
+"""AST deltas for the graph editor WebSocket.
+
+Re-sending the whole dumped definition after every edit costs megabytes per
+keystroke on large workflows, while a typical edit touches one state. The
+editor therefore keeps the last AST it sent on each connection and sends a
+JSON-Patch (RFC 6902) style list of operations instead, at the granularity
+of top-level keys and individual states:
+
+    [{"op": "replace", "path": "/States/Validate", "value": {...}},
+     {"op": "remove", "path": "/States/Old"},
+     {"op": "add", "path": "/States/New", "value": {...}}]
+
+Paths are JSON Pointers, so ``~`` and ``/`` in state names are escaped as
+``~0`` and ``~1``. Applying ``remove`` and ``add`` to a JavaScript object
+appends new keys at the end; ast_patch() returns None whenever that would
+not reproduce the new key order, and the caller falls back to a full AST.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Send the full AST instead once a patch touches more than this share of the states
+_MAX_CHANGED_RATIO = 0.5
+
+
+def ast_patch(old: dict[str, Any], new: dict[str, Any]) -> list[dict[str, Any]] | None:
+    """Operations turning ``old`` into ``new``, or None if a full AST is the better message.
+
+    Args:
+        old: AST the client currently holds.
+        new: AST to bring it to.
+    """
+    ops: list[dict[str, Any]] = []
+    old_states = old.get("States")
+    new_states = new.get("States")
+    nested = isinstance(old_states, dict) and isinstance(new_states, dict)
+
+    if not _keyed_patch("", old, new, ops, skip="States" if nested else None):
+        return None
+    if nested:
+        if not _keyed_patch("/States", old_states, new_states, ops):
+            return None
+        if len(ops) > max(1, len(new_states) * _MAX_CHANGED_RATIO):
+            return None
+    return ops
+
+
+def apply_ast_patch(ast: dict[str, Any], ops: list[dict[str, Any]]) -> dict[str, Any]:
+    """Apply ast_patch() operations without mutating ``ast`` (mirrors the UI's applyAstPatch)."""
+    result = dict(ast)
+    if any(op["path"].startswith("/States/") for op in ops):
+        result["States"] = dict(result["States"])
+    for op in ops:
+        parts = [_unescape(part) for part in op["path"].split("/")[1:]]
+        target = result["States"] if len(parts) == 2 else result
+        if op["op"] == "remove":
+            del target[parts[-1]]
+        else:
+            target[parts[-1]] = op["value"]
+    return result
+
+
+def _keyed_patch(
+    prefix: str, old: dict[str, Any], new: dict[str, Any], ops: list[dict[str, Any]], skip: str | None = None
+) -> bool:
+    """Append per-key operations; False if the new key order cannot be reached by remove + append."""
+    kept = [key for key in old if key in new]
+    added = [key for key in new if key not in old]
+    if kept + added != list(new):
+        return False
+    for key in old:
+        if key not in new:
+            ops.append({"op": "remove", "path": f"{prefix}/{_escape(key)}"})
+    for key in kept:
+        if key != skip and old[key] != new[key]:
+            ops.append({"op": "replace", "path": f"{prefix}/{_escape(key)}", "value": new[key]})
+    for key in added:
+        ops.append({"op": "add", "path": f"{prefix}/{_escape(key)}", "value": new[key]})
+    return True
+
+
+def _escape(key: str) -> str:
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(part: str) -> str:
+    return part.replace("~1", "/").replace("~0", "~")
@@ -15,19 +15,31 @@ from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from rsf.editor.analysis import AnalysisPool
 from rsf.editor.websocket import websocket_endpoint
 from rsf.schema.generate import generate_json_schema
 
 # Default static files directory (React SPA build output)
 _STATIC_DIR = Path(__file__).parent / "static"
 
+# Server-side debounce on top of the UI's own, absorbs bursts from several tabs
+_PARSE_DEBOUNCE_SECONDS = 0.05
 
-def create_app(workflow_path: str | None = None) -> FastAPI:
+
+def create_app(
+    workflow_path: str | None = None,
+    analysis_pool: AnalysisPool | None = None,
+    parse_debounce: float = _PARSE_DEBOUNCE_SECONDS,
+) -> FastAPI:
     """Create the FastAPI application for the graph editor.
 
     Args:
         workflow_path: Optional path to a workflow YAML file to auto-load
                       on WebSocket connect.
+        analysis_pool: Worker pool and result cache for parse/validate
+                      messages (default: a new AnalysisPool).
+        parse_debounce: Seconds to wait for a newer parse/validate message
+                      on the same connection before analyzing.
 
     Returns:
         Configured FastAPI application.
@@ -43,6 +55,10 @@ def create_app(workflow_path: str | None = None) -> FastAPI:
     # Cache the JSON Schema (generated once, immutable during server lifetime)
     app.state.json_schema = generate_json_schema()
 
+    # Shared by all connections so identical YAML buffers are analyzed once
+    app.state.analysis_pool = analysis_pool if analysis_pool is not None else AnalysisPool()
+    app.state.parse_debounce = parse_debounce
+
     # REST endpoint: GET /api/schema
     @app.get("/api/schema")
     async def get_schema() -> JSONResponse:
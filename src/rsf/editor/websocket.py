@@ -8,34 +8,127 @@ Handles bidirectional messages for:
 - get_schema: → JSON Schema for DSL
 
 On connect, auto-loads workflow file if configured via app state.
+
+parse and validate run on the app's AnalysisPool, off the event loop. Each
+connection debounces them (``app.state.parse_debounce`` seconds) and only
+answers the latest one of each type: a newer parse cancels a pending parse,
+so a burst of keystrokes produces a single ``parsed`` response. Other
+messages are answered immediately.
+
+The first parse on a connection is answered with the full AST (``parsed``).
+Later ones are answered with ``parsed_delta``: a patch against the previous
+AST (see rsf.editor.delta) plus ``version`` / ``base_version`` counters. A
+client whose version does not match ``base_version`` sends
+``{"type": "parse", "yaml": ..., "full": true}`` to resync; the server also
+sends a full AST every FULL_RESYNC_EVERY deltas.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from pathlib import Path
 from typing import Any
 
-import yaml
 from fastapi import WebSocket, WebSocketDisconnect
-from pydantic import ValidationError
 
-from rsf.dsl.parser import parse_definition, parse_yaml
-from rsf.dsl.validator import validate_definition
+from rsf.editor.analysis import AnalysisResult, IncrementalAnalyzer
+from rsf.editor.delta import ast_patch
 
 logger = logging.getLogger(__name__)
 
+FULL_RESYNC_EVERY = 50
+
+
+class _LatestWins:
+    """Per-connection scheduler: debounce analysis requests, keep only the newest of each type."""
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+        self.debounce: float = websocket.app.state.parse_debounce
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def submit(self, msg_type: str, message: dict[str, Any]) -> None:
+        """Schedule ``message``, cancelling a pending request of the same type."""
+        pending = self._tasks.get(msg_type)
+        if pending is not None:
+            pending.cancel()
+        self._tasks[msg_type] = asyncio.create_task(self._run(msg_type, message))
+
+    def cancel_all(self) -> None:
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
+
+    async def _run(self, msg_type: str, message: dict[str, Any]) -> None:
+        try:
+            if self.debounce > 0:
+                await asyncio.sleep(self.debounce)
+            await _ANALYSIS_HANDLERS[msg_type](self.websocket, message)
+        except asyncio.CancelledError:
+            raise
+        except WebSocketDisconnect:
+            logger.debug("WebSocket client disconnected before %s response", msg_type)
+        except Exception:
+            logger.exception("Failed to handle %s message", msg_type)
+        finally:
+            if self._tasks.get(msg_type) is asyncio.current_task():
+                del self._tasks[msg_type]
+
+
+class _AstSync:
+    """The AST a connection's client holds, for answering parses with deltas."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.ast: dict[str, Any] | None = None
+        self.deltas = 0
+
+    def response(self, result: AnalysisResult, yaml_content: str, full: bool = False) -> dict[str, Any]:
+        """Build the parse response and record its AST as the client's new base."""
+        if result.ast is None:
+            # The client keeps its last good AST, and so do we
+            return {"type": "parsed", "ast": None, "yaml": yaml_content, "errors": result.errors}
+
+        patch = None
+        if not full and self.ast is not None and self.deltas < FULL_RESYNC_EVERY:
+            patch = ast_patch(self.ast, result.ast)
+        base_version = self.version
+        self.version += 1
+        self.ast = result.ast
+
+        if patch is None:
+            self.deltas = 0
+            return {
+                "type": "parsed",
+                "ast": result.ast,
+                "yaml": yaml_content,
+                "errors": result.errors,
+                "version": self.version,
+            }
+        self.deltas += 1
+        return {
+            "type": "parsed_delta",
+            "version": self.version,
+            "base_version": base_version,
+            "patch": patch,
+            "errors": result.errors,
+        }
+
 
 async def websocket_endpoint(websocket: WebSocket) -> None:
     """Handle WebSocket connections for the graph editor."""
     await websocket.accept()
+    websocket.state.ast_sync = _AstSync()
+    websocket.state.analyzer = IncrementalAnalyzer()
 
     # Auto-load workflow file on connect if configured
     workflow_path = websocket.app.state.workflow_path
     if workflow_path is not None:
         await _handle_load_file(websocket, {"path": workflow_path})
 
+    scheduler = _LatestWins(websocket)
     try:
         while True:
             raw = await websocket.receive_text()
@@ -50,10 +143,11 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
                 await _send_error(websocket, "Missing 'type' field in message")
                 continue
 
-            if msg_type == "parse":
-                await _handle_parse(websocket, message)
-            elif msg_type == "validate":
-                await _handle_validate(websocket, message)
+            if msg_type in _ANALYSIS_HANDLERS:
+                if message.get("yaml") is None:
+                    await _send_error(websocket, f"Missing 'yaml' field in {msg_type} message")
+                    continue
+                scheduler.submit(msg_type, message)
             elif msg_type == "load_file":
                 await _handle_load_file(websocket, message)
             elif msg_type == "save_file":
@@ -65,114 +159,36 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
 
     except WebSocketDisconnect:
         logger.debug("WebSocket client disconnected")
+    finally:
+        scheduler.cancel_all()
 
 
 async def _handle_parse(websocket: WebSocket, message: dict[str, Any]) -> None:
-    """Parse YAML and return AST + validation errors."""
-    yaml_content = message.get("yaml")
-    if yaml_content is None:
-        await _send_error(websocket, "Missing 'yaml' field in parse message")
-        return
-
-    errors: list[dict[str, str]] = []
-    ast: dict[str, Any] | None = None
-
-    try:
-        raw = parse_yaml(yaml_content)
-        definition = parse_definition(raw)
-        ast = definition.model_dump(by_alias=True, exclude_none=True)
-
-        # Run semantic validation
-        semantic_errors = validate_definition(definition)
-        for err in semantic_errors:
-            errors.append(
-                {
-                    "message": err.message,
-                    "path": err.path,
-                    "severity": err.severity,
-                }
-            )
-
-    except yaml.YAMLError as exc:
-        errors.append(
-            {
-                "message": f"YAML syntax error: {exc}",
-                "path": "",
-                "severity": "error",
-            }
-        )
-    except ValidationError as exc:
-        for err in exc.errors():
-            loc = ".".join(str(part) for part in err["loc"])
-            errors.append(
-                {
-                    "message": err["msg"],
-                    "path": loc,
-                    "severity": "error",
-                }
-            )
-
-    await websocket.send_json(
-        {
-            "type": "parsed",
-            "ast": ast,
-            "yaml": yaml_content,
-            "errors": errors,
-        }
-    )
+    """Parse YAML and return the AST (or a delta against the last one) + validation errors."""
+    yaml_content = message["yaml"]
+    result = await websocket.app.state.analysis_pool.analyze(yaml_content, websocket.state.analyzer)
+    sync: _AstSync = websocket.state.ast_sync
+    await websocket.send_json(sync.response(result, yaml_content, full=bool(message.get("full"))))
 
 
 async def _handle_validate(websocket: WebSocket, message: dict[str, Any]) -> None:
     """Validate YAML and return errors only (no AST)."""
-    yaml_content = message.get("yaml")
-    if yaml_content is None:
-        await _send_error(websocket, "Missing 'yaml' field in validate message")
-        return
-
-    errors: list[dict[str, str]] = []
-
-    try:
-        raw = parse_yaml(yaml_content)
-        definition = parse_definition(raw)
-
-        # Run semantic validation
-        semantic_errors = validate_definition(definition)
-        for err in semantic_errors:
-            errors.append(
-                {
-                    "message": err.message,
-                    "path": err.path,
-                    "severity": err.severity,
-                }
-            )
-
-    except yaml.YAMLError as exc:
-        errors.append(
-            {
-                "message": f"YAML syntax error: {exc}",
-                "path": "",
-                "severity": "error",
-            }
-        )
-    except ValidationError as exc:
-        for err in exc.errors():
-            loc = ".".join(str(part) for part in err["loc"])
-            errors.append(
-                {
-                    "message": err["msg"],
-                    "path": loc,
-                    "severity": "error",
-                }
-            )
-
+    result = await websocket.app.state.analysis_pool.analyze(message["yaml"], websocket.state.analyzer)
     await websocket.send_json(
         {
             "type": "validated",
-            "errors": errors,
+            "errors": result.errors,
         }
     )
 
 
+# Message types answered from the AnalysisPool, debounced and latest-wins
+_ANALYSIS_HANDLERS = {
+    "parse": _handle_parse,
+    "validate": _handle_validate,
+}
+
+
 async def _handle_load_file(websocket: WebSocket, message: dict[str, Any]) -> None:
     """Load a workflow file from disk and send its contents."""
     file_path = message.get("path")
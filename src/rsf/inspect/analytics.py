@@ -0,0 +1,424 @@
+"""Per-state analytics across executions for the RSF execution inspector.
+
+The inspector shows one execution at a time; capacity planning needs
+per-state latency distributions, error rates and retry counts across
+thousands. StateAnalytics folds execution histories into per-state
+counters and a LatencySketch of visit durations:
+
+- LatencySketch is a log-bucketed histogram (DDSketch / HDR style) with
+  1% relative accuracy. Its size depends on the range of durations, not
+  on how many were added, so memory stays constant as history grows.
+- Aggregates are incremental: each execution is folded in once. With an
+  ExecutionIndex the aggregate and the set of executions already folded
+  in are persisted in the index database, so analytics resume across
+  restarts. Without one they live for the process and follow a
+  high-water mark (the newest start time analyzed): a refresh only pages
+  back to the mark, and executions still running when the mark passes
+  them are not counted.
+
+Durations come from ``HistoryEvent`` timestamps: from the event that
+enters a state to the one that leaves it (succeeded, failed or caught).
+
+Usage:
+    engine = AnalyticsEngine(client, cache, index=index)
+    await engine.refresh(limit=1000)  # or engine.start_refresh(1000) in a server
+    report = engine.analytics.report()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from typing import Any
+
+from rsf.inspect.cache import ExecutionCache
+from rsf.inspect.client import LambdaInspectClient, Priority, prioritized
+from rsf.inspect.index import ExecutionIndex
+from rsf.inspect.models import TERMINAL_STATUSES, ExecutionDetail, ExecutionSummary, HistoryEvent
+from rsf.inspect.timemachine import event_status, state_name
+
+logger = logging.getLogger(__name__)
+
+_RELATIVE_ACCURACY = 0.01
+_MIN_VALUE = 0.001  # ms; anything shorter counts as zero
+_PAGE_SIZE = 50
+_HISTOGRAM_BINS = 20
+
+
+class LatencySketch:
+    """Quantile sketch over positive values with bounded relative error.
+
+    Values fall into buckets whose bounds grow geometrically by
+    ``gamma = (1 + a) / (1 - a)``, so any quantile is answered within
+    ``a`` (1%) of the true value.
+    """
+
+    def __init__(self, relative_accuracy: float = _RELATIVE_ACCURACY) -> None:
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: dict[int, int] = defaultdict(int)
+        self.zeros = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        if value <= _MIN_VALUE:
+            self.zeros += 1
+        else:
+            self.buckets[math.ceil(math.log(value) / self._log_gamma)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimated value at quantile ``q`` (0..1), or None if empty."""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                return min(max(self._value(index), self.min), self.max)
+        return self.max
+
+    def histogram(self, bins: int = _HISTOGRAM_BINS) -> list[dict[str, float]]:
+        """Counts in up to ``bins`` log-spaced ranges between min and max."""
+        if self.count == 0:
+            return []
+        low = max(self.min, _MIN_VALUE)
+        high = max(self.max, low)
+        if high <= low * 1.0001:
+            return [{"le": round(high, 3), "count": self.count}]
+        step = (math.log(high) - math.log(low)) / bins
+        counts = [0] * bins
+        counts[0] += self.zeros
+        for index, count in self.buckets.items():
+            value = self._value(index)
+            position = int((math.log(min(max(value, low), high)) - math.log(low)) / step)
+            counts[min(position, bins - 1)] += count
+        return [{"le": round(math.exp(math.log(low) + step * (i + 1)), 3), "count": c} for i, c in enumerate(counts)]
+
+    def merge(self, other: LatencySketch) -> None:
+        for index, count in other.buckets.items():
+            self.buckets[index] += count
+        self.zeros += other.zeros
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+            "zeros": self.zeros,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencySketch:
+        sketch = cls(data.get("relative_accuracy", _RELATIVE_ACCURACY))
+        for index, count in data.get("buckets", {}).items():
+            sketch.buckets[int(index)] = count
+        sketch.zeros = data.get("zeros", 0)
+        sketch.count = data.get("count", 0)
+        sketch.total = data.get("total", 0.0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+    def _value(self, index: int) -> float:
+        # Midpoint (in relative terms) of bucket (gamma^(i-1), gamma^i]
+        return 2 * self._gamma**index / (self._gamma + 1)
+
+
+class StateStats:
+    """Counters and duration sketch for one state."""
+
+    def __init__(self) -> None:
+        self.visits = 0
+        self.failures = 0
+        self.caught = 0
+        self.retries = 0
+        self.durations = LatencySketch()
+
+    def report(self) -> dict[str, Any]:
+        finished = self.durations.count
+        return {
+            "visits": self.visits,
+            "failures": self.failures,
+            "caught": self.caught,
+            "error_rate": round(self.failures / self.visits, 4) if self.visits else 0.0,
+            "retries": self.retries,
+            "duration_ms": {
+                "count": finished,
+                "mean": round(self.durations.total / finished, 3) if finished else None,
+                "min": self.durations.min if finished else None,
+                "max": self.durations.max if finished else None,
+                "p50": _round(self.durations.quantile(0.5)),
+                "p90": _round(self.durations.quantile(0.9)),
+                "p99": _round(self.durations.quantile(0.99)),
+            },
+            "histogram": self.durations.histogram(),
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "visits": self.visits,
+            "failures": self.failures,
+            "caught": self.caught,
+            "retries": self.retries,
+            "durations": self.durations.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StateStats:
+        stats = cls()
+        stats.visits = data.get("visits", 0)
+        stats.failures = data.get("failures", 0)
+        stats.caught = data.get("caught", 0)
+        stats.retries = data.get("retries", 0)
+        stats.durations = LatencySketch.from_dict(data.get("durations", {}))
+        return stats
+
+
+class StateAnalytics:
+    """Per-state aggregates over every execution added so far."""
+
+    def __init__(self) -> None:
+        self.executions = 0
+        self.states: dict[str, StateStats] = defaultdict(StateStats)
+
+    def add_history(self, history: list[HistoryEvent]) -> None:
+        """Fold one execution's history in."""
+        entered: dict[str, datetime] = {}
+        retry_attempts: dict[str, int] = {}
+        for event in history:
+            state = state_name(event)
+            if state is None:
+                continue
+            stats = self.states[state]
+            status = event_status(event)
+            event_type = f"{event.event_type} {event.sub_type or ''}".lower()
+            if "retri" in event_type:
+                stats.retries += 1
+            elif event.details.get("retryAttempt") is not None:
+                attempt = int(event.details["retryAttempt"])
+                if attempt > retry_attempts.get(state, 0):
+                    stats.retries += attempt - retry_attempts.get(state, 0)
+                    retry_attempts[state] = attempt
+
+            if status == "running" and state not in entered:
+                entered[state] = event.timestamp
+                stats.visits += 1
+            elif status in ("succeeded", "failed", "caught"):
+                start = entered.pop(state, None)
+                if start is None:
+                    stats.visits += 1  # left without a recorded entry
+                else:
+                    stats.durations.add((event.timestamp - start).total_seconds() * 1000)
+                if status == "failed":
+                    stats.failures += 1
+                elif status == "caught":
+                    stats.caught += 1
+        self.executions += 1
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "executions": self.executions,
+            "states": {name: self.states[name].report() for name in sorted(self.states)},
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "executions": self.executions,
+            "states": {name: stats.to_dict() for name, stats in self.states.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StateAnalytics:
+        analytics = cls()
+        analytics.executions = data.get("executions", 0)
+        for name, stats in data.get("states", {}).items():
+            analytics.states[name] = StateStats.from_dict(stats)
+        return analytics
+
+
+class AnalyticsEngine:
+    """Keeps a StateAnalytics up to date with a function's finished executions.
+
+    Args:
+        client: Client for the function to analyze.
+        cache: Execution cache; details are read from and added to it.
+        index: Optional execution index. When given, it supplies the
+            executions to analyze and persists the aggregate.
+    """
+
+    def __init__(
+        self,
+        client: LambdaInspectClient,
+        cache: ExecutionCache | None = None,
+        index: ExecutionIndex | None = None,
+    ) -> None:
+        self.client = client
+        self.cache = cache
+        self.index = index
+        stored = index.load_analytics(client.function_name) if index is not None else None
+        self.analytics = StateAnalytics.from_dict(stored) if stored is not None else StateAnalytics()
+        # Without an index: newest start time analyzed, and the executions analyzed at exactly that time
+        self._mark: datetime | None = None
+        self._at_mark: set[str] = set()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[int] | None = None
+
+    @property
+    def refreshing(self) -> bool:
+        """Whether a background refresh is running."""
+        return self._task is not None and not self._task.done()
+
+    def start_refresh(self, limit: int = 1000) -> None:
+        """Start refresh(limit) in a background task, unless one is running; failures are logged."""
+        if not self.refreshing:
+            self._task = asyncio.create_task(self._refresh_logged(limit))
+
+    async def stop(self) -> None:
+        """Cancel a background refresh (what it already folded in is kept)."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refresh(self, limit: int = 1000) -> int:
+        """Fold in up to ``limit`` finished executions not analyzed yet.
+
+        With an index these are the newest unanalyzed ones; without one,
+        the oldest started after the high-water mark. Executions whose
+        details cannot be fetched (expired or deleted) are logged and skipped
+        for good.
+
+        Concurrent refreshes run one after the other, so no execution is
+        counted twice.
+
+        Returns:
+            Number of executions added.
+        """
+        async with self._lock:
+            return await self._refresh(limit)
+
+    async def _refresh_logged(self, limit: int) -> int:
+        try:
+            return await self.refresh(limit)
+        except Exception as exc:
+            logger.warning("Analytics refresh for %s failed: %s", self.client.function_name, exc)
+            return 0
+
+    async def _refresh(self, limit: int) -> int:
+        function_name = self.client.function_name
+        added: list[str] = []
+        failed: list[str] = []
+        try:
+            with prioritized(Priority.BACKGROUND):
+                if self.index is not None:
+                    for execution_id in self.index.unanalyzed(function_name, limit):
+                        if await self._add(execution_id):
+                            added.append(execution_id)
+                        else:
+                            failed.append(execution_id)
+                else:
+                    for summary in await self._after_mark(limit):
+                        if await self._add(summary.execution_id):
+                            added.append(summary.execution_id)
+                        self._advance_mark(summary)  # past failed ones too, or they block the mark
+        finally:
+            # Persist what was folded in, even if the refresh was interrupted part-way
+            if self.index is not None and (added or failed):
+                self.index.save_analytics(function_name, self.analytics.to_dict(), added, failed)
+        return len(added)
+
+    async def _add(self, execution_id: str) -> bool:
+        """Fold one execution in; False if its details could not be fetched."""
+        try:
+            detail = await self._detail(execution_id)
+        except Exception:
+            # E.g. expired or deleted: skip it rather than retry it ahead of every older execution
+            logger.warning(
+                "Fetching details of execution %s of %s failed",
+                execution_id,
+                self.client.function_name,
+                exc_info=True,
+            )
+            return False
+        self.analytics.add_history(detail.history)
+        return True
+
+    async def _after_mark(self, limit: int) -> list[ExecutionSummary]:
+        """Up to ``limit`` finished executions started after the mark, oldest first.
+
+        Pages back only to the mark. Before the first refresh there is no
+        mark, and the newest ``limit`` executions are taken.
+        """
+        if limit <= 0:
+            return []
+        window: deque[ExecutionSummary] = deque(maxlen=limit)  # newest first, so the oldest are kept
+        next_token = None
+        while True:
+            page = await self.client.list_executions(max_items=_PAGE_SIZE, next_token=next_token)
+            reached_mark = False
+            for summary in page.executions:
+                start = _aware(summary.start_time)
+                if self._mark is not None and start < self._mark:
+                    reached_mark = True
+                elif summary.status in TERMINAL_STATUSES and not (
+                    start == self._mark and summary.execution_id in self._at_mark
+                ):
+                    window.append(summary)
+                    if self._mark is None and len(window) == limit:
+                        break
+            next_token = page.next_token
+            if next_token is None or reached_mark or (self._mark is None and len(window) == limit):
+                break
+        return list(reversed(window))
+
+    def _advance_mark(self, summary: ExecutionSummary) -> None:
+        start = _aware(summary.start_time)
+        if self._mark is None or start > self._mark:
+            self._mark = start
+            self._at_mark = {summary.execution_id}
+        elif start == self._mark:
+            self._at_mark.add(summary.execution_id)
+
+    async def _detail(self, execution_id: str) -> ExecutionDetail:
+        function_name = self.client.function_name
+        if self.cache is not None:
+            entry = self.cache.get(function_name, execution_id)
+            if entry is not None:
+                return entry.detail
+        detail = await self.client.get_execution(execution_id)
+        if self.cache is not None:
+            self.cache.put(function_name, execution_id, detail)
+        return detail
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 3) if value is not None else None
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,211 @@
+"""Execution detail cache for the RSF execution inspector.
+
+An execution in a terminal status never changes again, yet every detail,
+history or replay request for it used to cost a Lambda control-plane call
+(out of a 12 req/s budget shared by everyone using the inspector) plus a
+fresh Pydantic serialization. ExecutionCache keeps details in two tiers:
+
+1. An in-memory LRU of ``CachedExecution`` entries. Each holds the model,
+   its JSON response bodies and its time machine timeline, each built once
+   on first use.
+2. An optional SQLite file (``ExecutionStore``) holding terminal details
+   only, so they survive restarts and can be shared by several inspector
+   processes.
+
+Terminal details are kept until evicted; running ones expire after a short
+TTL so polling clients still see progress.
+
+Usage:
+    cache = ExecutionCache(store=ExecutionStore("~/.rsf/inspect-cache.db"))
+    entry = cache.get(function_name, execution_id)
+    if entry is None:
+        entry = cache.put(function_name, execution_id, await client.get_execution(execution_id))
+    return Response(entry.body("detail"), media_type="application/json")
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Literal
+
+from rsf.inspect.models import TERMINAL_STATUSES, ExecutionDetail, dump_history_json
+from rsf.inspect.timemachine import Timeline
+
+BodyKind = Literal["detail", "info", "history", "events"]
+
+_DEFAULT_MAX_ENTRIES = 256
+_DEFAULT_RUNNING_TTL = 2.0
+
+
+class CachedExecution:
+    """One cached ExecutionDetail with its lazily serialized JSON bodies.
+
+    Treat ``detail`` as read-only: it is shared by every request that hits
+    the entry.
+
+    Attributes:
+        detail: The execution detail.
+        expires_at: ``time.monotonic()`` deadline, or None for terminal
+            executions, which never go stale.
+    """
+
+    __slots__ = ("detail", "expires_at", "_bodies", "_timeline")
+
+    def __init__(self, detail: ExecutionDetail, expires_at: float | None = None) -> None:
+        self.detail = detail
+        self.expires_at = expires_at
+        self._bodies: dict[str, bytes] = {}
+        self._timeline: Timeline | None = None
+
+    @property
+    def terminal(self) -> bool:
+        return self.detail.status in TERMINAL_STATUSES
+
+    def body(self, kind: BodyKind) -> bytes:
+        """JSON body for a response, serialized on first use.
+
+        Args:
+            kind: ``"detail"`` (the whole model), ``"info"`` (without
+                history, as sent on SSE streams), ``"history"`` (the
+                ``{"execution_id", "events"}`` history endpoint body) or
+                ``"events"`` (the bare event list of the SSE history event).
+        """
+        body = self._bodies.get(kind)
+        if body is None:
+            if kind == "detail":
+                body = self.detail.model_dump_json().encode("utf-8")
+            elif kind == "info":
+                body = self.detail.model_dump_json(exclude={"history"}).encode("utf-8")
+            elif kind == "history":
+                execution_id = json.dumps(self.detail.execution_id).encode("utf-8")
+                body = b'{"execution_id": ' + execution_id + b', "events": ' + self.body("events") + b"}"
+            elif kind == "events":
+                body = dump_history_json(self.detail.history)
+            else:
+                raise ValueError(f"Unknown body kind: {kind}")
+            self._bodies[kind] = body
+        return body
+
+    def timeline(self) -> Timeline:
+        """Time machine snapshots of the history, replayed on first use."""
+        if self._timeline is None:
+            self._timeline = Timeline(self.detail.history)
+        return self._timeline
+
+
+class ExecutionStore:
+    """SQLite store for terminal execution details (stored as JSON).
+
+    Args:
+        path: Database file (parent directories are created), or ":memory:".
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS executions ("
+            "function_name TEXT NOT NULL, execution_id TEXT NOT NULL, detail TEXT NOT NULL, "
+            "PRIMARY KEY (function_name, execution_id))"
+        )
+
+    def load(self, function_name: str, execution_id: str) -> bytes | None:
+        """Serialized detail JSON, or None if not stored."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT detail FROM executions WHERE function_name = ? AND execution_id = ?",
+                (function_name, execution_id),
+            ).fetchone()
+        return row[0].encode("utf-8") if row is not None else None
+
+    def save(self, function_name: str, execution_id: str, body: bytes) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO executions VALUES (?, ?, ?)",
+                (function_name, execution_id, body.decode("utf-8")),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM executions").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ExecutionCache:
+    """Two-tier cache of execution details keyed by (function name, execution id).
+
+    Args:
+        max_entries: In-memory entries kept, least recently used first out.
+        running_ttl: Seconds a non-terminal detail stays fresh.
+        store: Optional persistent store for terminal details.
+        clock: Monotonic time source (for tests).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        running_ttl: float = _DEFAULT_RUNNING_TTL,
+        store: ExecutionStore | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.running_ttl = running_ttl
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: OrderedDict[tuple[str, str], CachedExecution] = OrderedDict()
+
+    def get(self, function_name: str, execution_id: str) -> CachedExecution | None:
+        """Fresh cached entry, or None (a miss the caller should fetch and put())."""
+        key = (function_name, execution_id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at is None or entry.expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            del self._entries[key]
+
+        if self.store is not None:
+            body = self.store.load(function_name, execution_id)
+            if body is not None:
+                entry = CachedExecution(ExecutionDetail.model_validate_json(body))
+                entry._bodies["detail"] = body
+                self._insert(key, entry)
+                self.hits += 1
+                return entry
+
+        self.misses += 1
+        return None
+
+    def put(self, function_name: str, execution_id: str, detail: ExecutionDetail) -> CachedExecution:
+        """Cache a freshly fetched detail and return its entry."""
+        entry = CachedExecution(detail)
+        if not entry.terminal:
+            entry.expires_at = self._clock() + self.running_ttl
+        elif self.store is not None:
+            self.store.save(function_name, execution_id, entry.body("detail"))
+        self._insert((function_name, execution_id), entry)
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _insert(self, key: tuple[str, str], entry: CachedExecution) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
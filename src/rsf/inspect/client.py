@@ -3,17 +3,38 @@
 Wraps synchronous boto3 Lambda calls with ``asyncio.to_thread`` and
 enforces a token-bucket rate limiter (12 req/s ceiling) to stay under
 the 15 req/s Lambda control-plane limit.
+
+Requests wait for tokens in priority lanes (see Priority): interactive
+views go first, then SSE polls, then background work such as prefetch and
+bulk export. Code that runs at a lower priority says so with
+``with prioritized(Priority.POLL): ...``. Concurrent identical read calls
+(same API, same arguments) are coalesced into one upstream request,
+unless that request waits in a less urgent lane than the new caller.
+
+One inspector can serve many functions: ClientPool creates a client per
+function on first use, all sharing one boto3 client (and so one tuned
+botocore connection pool), one bounded thread pool for the blocking boto3
+calls, and one rate limiter that enforces the account-wide control-plane
+limit across every function.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import heapq
+import itertools
 import json
 import logging
 import time
-from typing import Any
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import ContextVar
+from enum import IntEnum
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
 
 import boto3
+from botocore.config import Config
 
 from rsf.inspect.models import (
     ExecutionDetail,
@@ -21,24 +42,64 @@ from rsf.inspect.models import (
     ExecutionListResponse,
     ExecutionStatus,
     ExecutionSummary,
-    HistoryEvent,
     normalize_timestamp,
+    parse_history,
 )
 
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Request priorities
+# ---------------------------------------------------------------------------
+
+
+class Priority(IntEnum):
+    """Rate-limiter lanes, most urgent first."""
+
+    INTERACTIVE = 0  # a user is waiting on the response (detail views, replay)
+    POLL = 1  # SSE stream polling
+    BACKGROUND = 2  # prefetch, bulk export and other batch work
+
+
+_priority: ContextVar[Priority] = ContextVar("rsf_inspect_priority", default=Priority.INTERACTIVE)
+
+
+@contextlib.contextmanager
+def prioritized(priority: Priority) -> Iterator[None]:
+    """Run the client calls made inside the block (and tasks it starts) at ``priority``."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
 # ---------------------------------------------------------------------------
 # Token-bucket rate limiter
 # ---------------------------------------------------------------------------
 
 
+class _Lane:
+    __slots__ = ("queued", "granted", "wait_total", "wait_max")
+
+    def __init__(self) -> None:
+        self.queued = 0
+        self.granted = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+
 class TokenBucketRateLimiter:
-    """Async-safe token-bucket rate limiter.
+    """Async-safe token-bucket rate limiter with priority lanes.
 
     Defaults to 12 tokens/s with a bucket capacity of 12, ensuring we
     never exceed the 15 req/s Lambda control-plane limit even under
     sustained load.
+
+    When the bucket is empty, callers queue and a single dispatcher task
+    hands out tokens as they refill: lower Priority values first, first
+    come first served within a lane. Nobody holds a lock while sleeping.
     """
 
     def __init__(self, rate: float = 12.0, capacity: float = 12.0) -> None:
@@ -46,23 +107,74 @@ class TokenBucketRateLimiter:
         self._capacity = capacity
         self._tokens = capacity
         self._last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._dispatcher: asyncio.Task[None] | None = None
+        self._lanes = {priority: _Lane() for priority in Priority}
 
-    async def acquire(self) -> None:
-        """Wait until a token is available, then consume it."""
-        async with self._lock:
-            now = time.monotonic()
-            elapsed = now - self._last_refill
-            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
-            self._last_refill = now
+    async def acquire(self, priority: Priority | None = None) -> None:
+        """Wait until a token is available, then consume it.
 
-            if self._tokens < 1.0:
-                wait_time = (1.0 - self._tokens) / self._rate
-                await asyncio.sleep(wait_time)
-                self._tokens = 0.0
-                self._last_refill = time.monotonic()
-            else:
-                self._tokens -= 1.0
+        Args:
+            priority: Lane to wait in (default: the current ``prioritized()``
+                priority, interactive outside any block).
+        """
+        if priority is None:
+            priority = _priority.get()
+        lane = self._lanes[priority]
+        self._refill()
+        if not self._waiters and self._tokens >= 1.0:
+            self._tokens -= 1.0
+            lane.granted += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._seq), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        started = time.monotonic()
+        lane.queued += 1
+        try:
+            await future
+        finally:
+            lane.queued -= 1
+        waited = time.monotonic() - started
+        lane.granted += 1
+        lane.wait_total += waited
+        lane.wait_max = max(lane.wait_max, waited)
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth and wait times per lane."""
+        return {
+            "rate": self._rate,
+            "capacity": self._capacity,
+            "lanes": {
+                priority.name.lower(): {
+                    "queued": lane.queued,
+                    "granted": lane.granted,
+                    "wait_seconds_total": round(lane.wait_total, 6),
+                    "wait_seconds_max": round(lane.wait_max, 6),
+                }
+                for priority, lane in self._lanes.items()
+            },
+        }
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            self._refill()
+            while self._waiters and self._tokens >= 1.0:
+                _, _, future = heapq.heappop(self._waiters)
+                if not future.done():  # skip callers that were cancelled while queued
+                    self._tokens -= 1.0
+                    future.set_result(None)
+            if self._waiters:
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
 
 
 # ---------------------------------------------------------------------------
@@ -77,6 +189,10 @@ class LambdaInspectClient:
         function_name: The Lambda function name or ARN to inspect.
         region_name: AWS region (defaults to session default).
         rate_limiter: Optional custom rate limiter instance.
+        boto_client: Shared boto3 Lambda client (see ClientPool); it is
+            not closed by close(). Default: a client of its own.
+        executor: Thread pool for the blocking boto3 calls. Default: the
+            event loop's default executor (``asyncio.to_thread``).
     """
 
     def __init__(
@@ -84,10 +200,17 @@ class LambdaInspectClient:
         function_name: str,
         region_name: str | None = None,
         rate_limiter: TokenBucketRateLimiter | None = None,
+        boto_client: Any | None = None,
+        executor: Executor | None = None,
     ) -> None:
         self.function_name = function_name
-        self._client = boto3.client("lambda", region_name=region_name)
+        self._owns_client = boto_client is None
+        self._client = boto3.client("lambda", region_name=region_name) if boto_client is None else boto_client
+        self._executor = executor
         self._limiter = rate_limiter or TokenBucketRateLimiter()
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+        self.upstream_calls = 0
+        self.coalesced = 0
 
     # -- Public API ---------------------------------------------------------
 
@@ -116,8 +239,7 @@ class LambdaInspectClient:
         if next_token is not None:
             kwargs["NextToken"] = next_token
 
-        await self._limiter.acquire()
-        raw = await asyncio.to_thread(self._client.list_durable_executions_by_function, **kwargs)
+        raw = await self._read("list_durable_executions_by_function", **kwargs)
 
         executions = [self._parse_summary(item) for item in raw.get("DurableExecutions", [])]
 
@@ -135,9 +257,8 @@ class LambdaInspectClient:
         Returns:
             ExecutionDetail with history events.
         """
-        await self._limiter.acquire()
-        raw = await asyncio.to_thread(
-            self._client.get_durable_execution,
+        raw = await self._read(
+            "get_durable_execution",
             FunctionName=self.function_name,
             ExecutionId=execution_id,
         )
@@ -157,7 +278,8 @@ class LambdaInspectClient:
             Raw response dict from boto3 invoke call.
         """
         await self._limiter.acquire()
-        raw = await asyncio.to_thread(
+        self.upstream_calls += 1
+        raw = await self._run(
             self._client.invoke,
             FunctionName=self.function_name,
             InvocationType="Event",
@@ -166,11 +288,58 @@ class LambdaInspectClient:
         return raw
 
     async def close(self) -> None:
-        """Close the underlying boto3 client."""
-        await asyncio.to_thread(self._client.close)
+        """Close the underlying boto3 client, unless it is shared."""
+        if self._owns_client:
+            await self._run(self._client.close)
+
+    def stats(self) -> dict[str, Any]:
+        """Rate-limiter lanes plus upstream and coalesced call counts."""
+        return {
+            "function_name": self.function_name,
+            "upstream_calls": self.upstream_calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+            "rate_limiter": self._limiter.stats(),
+        }
 
     # -- Internal helpers ---------------------------------------------------
 
+    async def _read(self, api: str, **kwargs: Any) -> dict[str, Any]:
+        """Call a read-only boto3 API, sharing one upstream call between identical concurrent requests.
+
+        A shared call waits in the lane of the caller that started it, so a
+        caller only joins one started in its own lane or a more urgent one:
+        an interactive view never waits behind background work.
+        Cancelling one caller does not cancel the call for the others.
+        """
+        request = (api, tuple(sorted(kwargs.items())))
+        priority = _priority.get()
+        call = None
+        for lane in Priority:  # most urgent first
+            if lane > priority:
+                break
+            call = self._inflight.get((*request, lane))
+            if call is not None:
+                break
+        if call is not None:
+            self.coalesced += 1
+        else:
+            key = (*request, priority)
+            call = self._inflight[key] = asyncio.ensure_future(self._call_upstream(api, kwargs))
+            call.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(call)
+
+    async def _call_upstream(self, api: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+        await self._limiter.acquire()
+        self.upstream_calls += 1
+        return await self._run(getattr(self._client, api), **kwargs)
+
+    async def _run(self, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        """Run a blocking boto3 call in the client's thread pool."""
+        if self._executor is None:
+            return await asyncio.to_thread(fn, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(fn, **kwargs))
+
     def _parse_summary(self, item: dict[str, Any]) -> ExecutionSummary:
         """Parse a raw API execution summary into our model."""
         return ExecutionSummary(
@@ -197,8 +366,8 @@ class LambdaInspectClient:
                 cause=exec_data.get("Cause", ""),
             )
 
-        # Parse history events.
-        history = [self._parse_history_event(evt) for evt in exec_data.get("Events", [])]
+        # Parse history events (in bulk: histories can be tens of thousands long).
+        history = parse_history(exec_data.get("Events") or [])
 
         return ExecutionDetail(
             execution_id=exec_data.get("ExecutionId", ""),
@@ -213,16 +382,6 @@ class LambdaInspectClient:
             history=history,
         )
 
-    def _parse_history_event(self, evt: dict[str, Any]) -> HistoryEvent:
-        """Parse a single history event from the API response."""
-        return HistoryEvent(
-            event_id=evt.get("EventId", 0),
-            timestamp=normalize_timestamp(evt.get("Timestamp", 0)),
-            event_type=evt.get("EventType", ""),
-            sub_type=evt.get("SubType"),
-            details=evt.get("Details", {}),
-        )
-
     @staticmethod
     def _try_parse_json(value: Any) -> dict[str, Any] | None:
         """Try to parse a value as JSON; return dict or None."""
@@ -237,3 +396,112 @@ class LambdaInspectClient:
             except (json.JSONDecodeError, TypeError):
                 return {"raw": value}
         return {"value": value}
+
+
+# ---------------------------------------------------------------------------
+# Client pool (multi-function inspector)
+# ---------------------------------------------------------------------------
+
+_DEFAULT_MAX_CONNECTIONS = 16
+
+
+def function_key(function_name: str) -> str:
+    """Short name of a function, as used in URLs: the name part of an ARN, or the name itself."""
+    if function_name.startswith("arn:"):
+        # arn:aws:lambda:<region>:<account>:function:<name>[:<qualifier>]
+        parts = function_name.split(":")
+        if len(parts) >= 7:
+            return parts[6]
+    return function_name
+
+
+class ClientPool:
+    """LambdaInspectClients for many functions, created on first use.
+
+    Every client shares one boto3 Lambda client, whose botocore connection
+    pool is sized to ``max_connections``, and one thread pool of the same
+    size for the blocking calls, so a busy function cannot starve the
+    event loop's default executor. All clients draw from one rate
+    limiter: the control-plane limit is per account, not per function.
+
+    Args:
+        functions: Function names or ARNs. Each is addressed by its
+            function_key() (e.g. in ``/api/inspect/{function}/...``).
+        region_name: AWS region (defaults to session default).
+        rate_limiter: Shared rate limiter (default: the 12 req/s limiter).
+        max_connections: Connection pool size and thread pool size.
+    """
+
+    def __init__(
+        self,
+        functions: Iterable[str],
+        region_name: str | None = None,
+        rate_limiter: TokenBucketRateLimiter | None = None,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        self.region_name = region_name
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter()
+        self.max_connections = max_connections
+        self.functions: dict[str, str] = {function_key(name): name for name in functions}
+        self._clients: dict[str, LambdaInspectClient] = {}
+        self._boto_client: Any | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def names(self) -> list[str]:
+        return sorted(self.functions)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.functions
+
+    def __len__(self) -> int:
+        return len(self.functions)
+
+    def get(self, name: str) -> LambdaInspectClient:
+        """Client for the function with this short name.
+
+        Raises:
+            KeyError: The pool has no such function.
+        """
+        client = self._clients.get(name)
+        if client is None:
+            function_name = self.functions[name]
+            if self._boto_client is None:
+                self._boto_client = boto3.client(
+                    "lambda",
+                    region_name=self.region_name,
+                    config=Config(
+                        max_pool_connections=self.max_connections,
+                        retries={"mode": "standard", "max_attempts": 3},
+                        tcp_keepalive=True,
+                    ),
+                )
+                self._executor = ThreadPoolExecutor(max_workers=self.max_connections, thread_name_prefix="rsf-inspect")
+            client = self._clients[name] = LambdaInspectClient(
+                function_name=function_name,
+                rate_limiter=self.rate_limiter,
+                boto_client=self._boto_client,
+                executor=self._executor,
+            )
+        return client
+
+    def stats(self) -> dict[str, Any]:
+        """Per-function call counts plus the shared rate limiter."""
+        return {
+            "functions": len(self.functions),
+            "max_connections": self.max_connections,
+            "clients": {
+                name: {"upstream_calls": client.upstream_calls, "coalesced": client.coalesced}
+                for name, client in sorted(self._clients.items())
+            },
+            "rate_limiter": self.rate_limiter.stats(),
+        }
+
+    async def close(self) -> None:
+        """Close the shared boto3 client and stop the thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._boto_client is not None:
+            await asyncio.to_thread(self._boto_client.close)
+        self._clients.clear()
+        self._boto_client = self._executor = None
@@ -0,0 +1,351 @@
+"""Streaming bulk export of executions for the RSF execution inspector.
+
+Scraping the inspector API page by page does not scale to a week of
+executions. Exporter pages through the list API itself and fetches the
+details of each page concurrently, in the client's background lane, so
+every call stays under the shared rate limiter:
+
+- Rows are written as they arrive, to part files of ``part_size``
+  executions. Only one page of details is held in memory at a time.
+- A part is written under a temporary name and renamed when complete.
+  Each completed part is recorded in a checkpoint file in the output
+  directory, with the list token to continue from. Running the same
+  export again resumes after the last completed part.
+- An execution whose details cannot be fetched (expired or deleted) is
+  logged and skipped, and counted in ``skipped``; it does not stop the
+  export.
+- JSON Lines keeps inputs, results and history as nested objects.
+  Parquet (which needs the optional ``pyarrow`` dependency) stores them
+  as JSON strings in a flat schema.
+
+Usage:
+    exporter = Exporter(client, "exports/", fmt="parquet", since=now - timedelta(days=7))
+    async for progress in exporter.run():
+        print(progress.exported, progress.parts)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from rsf.inspect.client import LambdaInspectClient, Priority, prioritized
+from rsf.inspect.models import HISTORY_ADAPTER, ExecutionDetail, ExecutionStatus
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("jsonl", "parquet")
+CHECKPOINT_NAME = "_checkpoint.json"
+
+_DEFAULT_CONCURRENCY = 5
+_DEFAULT_PART_SIZE = 1000
+_PAGE_SIZE = 50
+_JSON_COLUMNS = ("input", "result", "history")
+
+
+@dataclass
+class ExportCheckpoint:
+    """Progress of an export, saved after every completed part.
+
+    Attributes:
+        fmt: Output format.
+        status: Status filter (None: all statuses).
+        since: Only executions started at or after this time (ISO 8601).
+        next_token: List token to continue from.
+        parts: Completed part files, in order.
+        exported: Executions written to the completed parts.
+        skipped: Executions before the resume point whose details could
+            not be fetched.
+        done: Whether the export has finished.
+    """
+
+    fmt: str
+    status: str | None = None
+    since: str | None = None
+    next_token: str | None = None
+    parts: list[str] = field(default_factory=list)
+    exported: int = 0
+    skipped: int = 0
+    done: bool = False
+
+    @classmethod
+    def load(cls, path: Path) -> ExportCheckpoint | None:
+        if not path.exists():
+            return None
+        return cls(**json.loads(path.read_text(encoding="utf-8")))
+
+    def save(self, path: Path) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(asdict(self), indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+
+@dataclass
+class ExportProgress:
+    """Running totals, reported after every page.
+
+    Attributes:
+        exported: Executions written so far (including resumed parts).
+        skipped: Executions whose details could not be fetched.
+        parts: Completed part files.
+        resumed: Whether the export continued from a checkpoint.
+        done: Whether the export has finished.
+    """
+
+    exported: int = 0
+    skipped: int = 0
+    parts: int = 0
+    resumed: bool = False
+    done: bool = False
+
+
+def export_row(detail: ExecutionDetail) -> dict[str, Any]:
+    """One execution as a flat, JSON-compatible record."""
+    return {
+        "execution_id": detail.execution_id,
+        "name": detail.name,
+        "function_name": detail.function_name,
+        "status": detail.status.value,
+        "start_time": _iso(detail.start_time),
+        "end_time": _iso(detail.end_time),
+        "input": detail.input_payload,
+        "result": detail.result,
+        "error": detail.error.error if detail.error is not None else None,
+        "cause": detail.error.cause if detail.error is not None else None,
+        "event_count": len(detail.history),
+        "history": HISTORY_ADAPTER.dump_python(detail.history, mode="json"),
+    }
+
+
+class _JsonlPart:
+    """Part file with one JSON object per line."""
+
+    def __init__(self, path: Path) -> None:
+        self._fh = path.open("w", encoding="utf-8")
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._fh.writelines(json.dumps(row, default=str) + "\n" for row in rows)
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+class _ParquetPart:
+    """Part file with one Parquet row group per page."""
+
+    def __init__(self, path: Path) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("execution_id", pa.string()),
+                ("name", pa.string()),
+                ("function_name", pa.string()),
+                ("status", pa.string()),
+                ("start_time", pa.timestamp("us", tz="UTC")),
+                ("end_time", pa.timestamp("us", tz="UTC")),
+                ("input", pa.string()),
+                ("result", pa.string()),
+                ("error", pa.string()),
+                ("cause", pa.string()),
+                ("event_count", pa.int64()),
+                ("history", pa.string()),
+            ]
+        )
+        self._writer = pq.ParquetWriter(str(path), self._schema)
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        columns: dict[str, list[Any]] = {name: [] for name in self._schema.names}
+        for row in rows:
+            for name in self._schema.names:
+                value = row[name]
+                if name in _JSON_COLUMNS:
+                    value = json.dumps(value, default=str) if value is not None else None
+                elif name in ("start_time", "end_time") and value is not None:
+                    value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+                columns[name].append(value)
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class Exporter:
+    """Exports a function's executions, with details, to part files in a directory.
+
+    Args:
+        client: Client for the function whose executions to export.
+        out_dir: Output directory (created if missing). Holds the part
+            files and the checkpoint.
+        fmt: ``jsonl`` or ``parquet``.
+        status: Only executions in this status (None: all).
+        since: Only executions started at or after this time.
+        concurrency: Detail fetches in flight at once.
+        part_size: Executions per part file (rounded up to whole pages).
+
+    Raises:
+        ValueError: Unknown format, or the directory holds an export made
+            with different options.
+        ImportError: Parquet was requested but pyarrow is not installed.
+    """
+
+    def __init__(
+        self,
+        client: LambdaInspectClient,
+        out_dir: str | Path,
+        fmt: str = "jsonl",
+        status: ExecutionStatus | None = None,
+        since: datetime | None = None,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        part_size: int = _DEFAULT_PART_SIZE,
+    ) -> None:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format {fmt!r}, expected one of: {', '.join(EXPORT_FORMATS)}")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if part_size < 1:
+            raise ValueError("part_size must be at least 1")
+        if fmt == "parquet":
+            try:
+                import pyarrow.parquet  # noqa: F401
+            except ImportError as exc:
+                raise ImportError("Parquet export requires pyarrow (pip install rsf[export])") from exc
+        self.client = client
+        self.out_dir = Path(out_dir).expanduser()
+        self.fmt = fmt
+        self.concurrency = concurrency
+        self.part_size = part_size
+        self.checkpoint_path = self.out_dir / CHECKPOINT_NAME
+
+        status_value = status.value if status is not None else None
+        checkpoint = ExportCheckpoint.load(self.checkpoint_path)
+        self.resumed = checkpoint is not None
+        if checkpoint is None:
+            checkpoint = ExportCheckpoint(fmt=fmt, status=status_value, since=_iso(since))
+        elif checkpoint.fmt != fmt or checkpoint.status != status_value:
+            raise ValueError(
+                f"{self.out_dir} holds an export with format={checkpoint.fmt}, status={checkpoint.status or 'ALL'}; "
+                "use a new output directory"
+            )
+        # A resumed export keeps its original window, even for relative --since values
+        self.checkpoint = checkpoint
+        self.since = _parse_iso(checkpoint.since)
+        self.status = ExecutionStatus(checkpoint.status) if checkpoint.status is not None else None
+
+    async def run(self) -> AsyncIterator[ExportProgress]:
+        """Export, yielding progress after every page written."""
+        checkpoint = self.checkpoint
+        progress = ExportProgress(
+            exported=checkpoint.exported,
+            skipped=checkpoint.skipped,
+            parts=len(checkpoint.parts),
+            resumed=self.resumed,
+            done=checkpoint.done,
+        )
+        if checkpoint.done:
+            yield progress
+            return
+
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        for stale in self.out_dir.glob("*.tmp"):
+            stale.unlink()  # part interrupted before it was completed
+
+        next_token = checkpoint.next_token
+        part: _JsonlPart | _ParquetPart | None = None
+        part_path = tmp_path = None
+        part_rows = part_skipped = 0
+        try:
+            with prioritized(Priority.BACKGROUND):
+                while True:
+                    page = await self.client.list_executions(
+                        status=self.status, max_items=_PAGE_SIZE, next_token=next_token
+                    )
+                    summaries = [s for s in page.executions if self.since is None or _aware(s.start_time) >= self.since]
+                    reached_since = len(summaries) < len(page.executions)
+                    next_token = None if reached_since else page.next_token
+
+                    details = await self._details([s.execution_id for s in summaries])
+                    rows = [export_row(detail) for detail in details if detail is not None]
+                    part_skipped += len(details) - len(rows)
+                    progress.skipped += len(details) - len(rows)
+                    if rows:
+                        if part is None:
+                            part_path = self.out_dir / f"executions-{len(checkpoint.parts):05d}.{self.fmt}"
+                            tmp_path = part_path.with_name(part_path.name + ".tmp")
+                            part = _JsonlPart(tmp_path) if self.fmt == "jsonl" else _ParquetPart(tmp_path)
+                        part.write(rows)
+                        part_rows += len(rows)
+                        progress.exported += len(rows)
+
+                    finished = next_token is None
+                    if part is not None and (part_rows >= self.part_size or finished):
+                        part.close()
+                        part = None
+                        os.replace(tmp_path, part_path)
+                        checkpoint.parts.append(part_path.name)
+                        checkpoint.exported += part_rows
+                        part_rows = 0
+                        progress.parts = len(checkpoint.parts)
+                    if part is None:
+                        checkpoint.skipped += part_skipped
+                        part_skipped = 0
+                        checkpoint.next_token = next_token
+                        checkpoint.done = finished
+                        checkpoint.save(self.checkpoint_path)
+                    progress.done = finished
+                    yield progress
+                    if finished:
+                        return
+        finally:
+            if part is not None:
+                part.close()
+
+    async def _details(self, execution_ids: list[str]) -> list[ExecutionDetail | None]:
+        """Details of a page, in order; None for executions whose details could not be fetched."""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(execution_id: str) -> ExecutionDetail | None:
+            async with semaphore:
+                try:
+                    return await self.client.get_execution(execution_id)
+                except Exception:
+                    # E.g. expired or deleted: skip it, or every resume would stop at the same page
+                    logger.warning(
+                        "Fetching details of execution %s of %s failed; skipped",
+                        execution_id,
+                        self.client.function_name,
+                        exc_info=True,
+                    )
+                    return None
+
+        tasks = [asyncio.create_task(fetch(execution_id)) for execution_id in execution_ids]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Cancelled: stop the rest of the page; the export resumes from the checkpoint
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+def _iso(value: datetime | None) -> str | None:
+    if value is None:
+        return None
+    return _aware(value).isoformat().replace("+00:00", "Z")
+
+
+def _parse_iso(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")) if value is not None else None
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
@@ -0,0 +1,238 @@
+"""Shared pollers behind the inspector's SSE execution streams.
+
+Every browser tab watching a running execution used to run its own
+5-second poll loop, so ten viewers cost ten times the control-plane budget
+and each received the full execution info on every poll. StreamHub keeps
+one poller per execution instead and fans its results out to all
+subscribers:
+
+- The first subscriber starts the poller; the last one to leave stops it,
+  as does the execution reaching a terminal status.
+- Subscribers get the poller's latest snapshot on joining, then only
+  changes: ``execution_info`` when the status or output changed, and
+  ``history_update`` with just the new events. Each update is serialized
+  once for all subscribers.
+- The poll interval adapts: it drops to ``min_interval`` after new events
+  arrive and doubles on every idle poll up to ``max_interval``.
+
+Usage:
+    async with hub.subscribe(key, fetch) as subscription:
+        snapshot = subscription.snapshot      # CachedExecution
+        async for update in subscription:     # StreamUpdate
+            ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Hashable
+
+from rsf.inspect.cache import CachedExecution
+from rsf.inspect.models import dump_history_json
+
+logger = logging.getLogger(__name__)
+
+# fetch(fresh) -> detail; fresh=False may be answered from the cache
+Fetch = Callable[[bool], Awaitable[CachedExecution]]
+
+_DEFAULT_MIN_INTERVAL = 1.0
+_DEFAULT_MAX_INTERVAL = 10.0
+
+
+@dataclass(frozen=True)
+class StreamUpdate:
+    """One change broadcast to every subscriber of an execution.
+
+    Attributes:
+        events: SSE events as ``{"event", "data"}`` dicts, data already serialized.
+        final: True if the execution reached a terminal status (or polling
+            failed) and the stream should close after these events.
+    """
+
+    events: list[dict[str, str]] = field(default_factory=list)
+    final: bool = False
+
+
+class Subscription:
+    """A subscriber's view of one execution poller.
+
+    Attributes:
+        snapshot: The execution as last seen by the poller when joining
+            (set before subscribe() returns the subscription).
+    """
+
+    def __init__(self, snapshot: CachedExecution | None) -> None:
+        self.snapshot = snapshot
+        self.queue: asyncio.Queue[StreamUpdate] = asyncio.Queue()
+
+    @property
+    def terminal(self) -> bool:
+        return self.snapshot is not None and self.snapshot.terminal
+
+    def __aiter__(self) -> AsyncIterator[StreamUpdate]:
+        return self._updates()
+
+    async def _updates(self) -> AsyncIterator[StreamUpdate]:
+        if self.terminal:
+            return
+        while True:
+            update = await self.queue.get()
+            yield update
+            if update.final:
+                return
+
+
+class _Poller:
+    def __init__(self, fetch: Fetch) -> None:
+        self.fetch = fetch
+        self.subscribers: set[Subscription] = set()
+        self.snapshot: CachedExecution | None = None
+        self.ready = asyncio.Event()
+        self.error: BaseException | None = None
+        self.task: asyncio.Task[None] | None = None
+
+
+class StreamHub:
+    """One refcounted poller per execution, shared by all its SSE streams.
+
+    Args:
+        min_interval: Seconds between polls right after new events.
+        max_interval: Upper bound the interval backs off to while idle.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = _DEFAULT_MIN_INTERVAL,
+        max_interval: float = _DEFAULT_MAX_INTERVAL,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.polls = 0  # control-plane fetches made by pollers, for diagnostics
+        self._pollers: dict[Hashable, _Poller] = {}
+
+    def subscribe(self, key: Hashable, fetch: Fetch) -> "_SubscriptionContext":
+        """Join (or start) the poller for ``key``.
+
+        Args:
+            key: Identifies the execution, e.g. (function name, execution id).
+            fetch: Used if this call starts the poller; it must return the
+                current detail, bypassing caches when passed True.
+        """
+        return _SubscriptionContext(self, key, fetch)
+
+    def stats(self) -> dict[str, int]:
+        """Running pollers, their subscribers and the polls made so far."""
+        return {
+            "pollers": len(self._pollers),
+            "subscribers": sum(len(poller.subscribers) for poller in self._pollers.values()),
+            "polls": self.polls,
+        }
+
+    def active(self, key: Hashable) -> int:
+        """Number of subscribers of ``key``'s poller (0 if none is running)."""
+        poller = self._pollers.get(key)
+        return len(poller.subscribers) if poller is not None else 0
+
+    async def _join(self, key: Hashable, fetch: Fetch) -> Subscription:
+        poller = self._pollers.get(key)
+        if poller is None:
+            poller = self._pollers[key] = _Poller(fetch)
+            poller.task = asyncio.create_task(self._poll(key, poller))
+        subscription = Subscription(poller.snapshot)
+        if poller.ready.is_set():
+            # The snapshot was read synchronously, so no update can be missed
+            if poller.error is not None:
+                raise poller.error
+            if not subscription.terminal:
+                poller.subscribers.add(subscription)
+            return subscription
+
+        # Registered before the first fetch completes; the poller hands out its snapshot
+        poller.subscribers.add(subscription)
+        try:
+            await poller.ready.wait()
+        except BaseException:
+            self._leave(key, subscription)
+            raise
+        if poller.error is not None:
+            raise poller.error
+        return subscription
+
+    def _leave(self, key: Hashable, subscription: Subscription) -> None:
+        poller = self._pollers.get(key)
+        if poller is None:
+            return
+        poller.subscribers.discard(subscription)
+        if not poller.subscribers and poller.ready.is_set() and poller.task is not None:
+            poller.task.cancel()
+            if self._pollers.get(key) is poller:
+                del self._pollers[key]
+
+    async def _poll(self, key: Hashable, poller: _Poller) -> None:
+        try:
+            try:
+                poller.snapshot = await poller.fetch(False)
+            except Exception as exc:
+                poller.error = exc
+                return
+            finally:
+                for subscription in poller.subscribers:
+                    subscription.snapshot = poller.snapshot
+                poller.ready.set()
+
+            interval = self.min_interval
+            while poller.subscribers and not poller.snapshot.terminal:
+                await asyncio.sleep(interval)
+                if not poller.subscribers:
+                    break
+                try:
+                    self.polls += 1
+                    current = await poller.fetch(True)
+                except Exception:
+                    logger.exception("Polling execution %s failed", key)
+                    self._broadcast(poller, StreamUpdate(final=True))
+                    break
+                update, new_events = _diff(poller.snapshot, current)
+                poller.snapshot = current
+                interval = self.min_interval if new_events else min(interval * 2, self.max_interval)
+                if update.events or update.final:
+                    self._broadcast(poller, update)
+        finally:
+            if self._pollers.get(key) is poller:
+                del self._pollers[key]
+
+    @staticmethod
+    def _broadcast(poller: _Poller, update: StreamUpdate) -> None:
+        for subscription in poller.subscribers:
+            subscription.queue.put_nowait(update)
+
+
+class _SubscriptionContext:
+    def __init__(self, hub: StreamHub, key: Hashable, fetch: Fetch) -> None:
+        self._hub = hub
+        self._key = key
+        self._fetch = fetch
+        self._subscription: Subscription | None = None
+
+    async def __aenter__(self) -> Subscription:
+        self._subscription = await self._hub._join(self._key, self._fetch)
+        return self._subscription
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._subscription is not None:
+            self._hub._leave(self._key, self._subscription)
+
+
+def _diff(old: CachedExecution, new: CachedExecution) -> tuple[StreamUpdate, bool]:
+    """Update turning ``old`` into ``new`` for subscribers, and whether it has new events."""
+    events: list[dict[str, str]] = []
+    info = new.body("info")
+    if info != old.body("info"):
+        events.append({"event": "execution_info", "data": info.decode("utf-8")})
+    seen = {evt.event_id for evt in old.detail.history}
+    new_events = [evt for evt in new.detail.history if evt.event_id not in seen]
+    if new_events:
+        events.append({"event": "history_update", "data": dump_history_json(new_events).decode("utf-8")})
+    return StreamUpdate(events=events, final=new.terminal), bool(new_events)
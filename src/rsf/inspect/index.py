@@ -0,0 +1,452 @@
+"""Local execution index for the RSF execution inspector.
+
+The Lambda API pages through executions 50 at a time with a status filter
+as the only criterion. ExecutionIndex mirrors execution summaries (and,
+optionally, inputs and errors) into SQLite with an FTS5 table, so the
+inspector can answer filtered, sorted, paginated queries locally:
+
+    index.query("my-fn", status=ExecutionStatus.FAILED,
+                since=now - timedelta(hours=6),
+                inputs={"customer_id": "X"})
+
+ExecutionIndexer fills it in the background. The first sync pages through
+the whole history, saving its NextToken after every page so an interrupted
+sync resumes where it stopped. After that it periodically re-reads the
+newest pages until a page brings nothing new or changed. All of its calls
+run in the rate limiter's background lane.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Literal
+
+from rsf.inspect.client import LambdaInspectClient, Priority, prioritized
+from rsf.inspect.models import TERMINAL_STATUSES, ExecutionDetail, ExecutionStatus, ExecutionSummary
+
+logger = logging.getLogger(__name__)
+
+SortKey = Literal["start_time", "end_time", "name", "status"]
+
+_DEFAULT_REFRESH_INTERVAL = 30.0
+_PAGE_SIZE = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    id INTEGER PRIMARY KEY,
+    function_name TEXT NOT NULL,
+    execution_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    start_time REAL NOT NULL,
+    end_time REAL,
+    input TEXT,
+    error TEXT,
+    cause TEXT,
+    has_details INTEGER NOT NULL DEFAULT 0,  -- 1: fetched, -1: fetch failed (not retried)
+    analyzed INTEGER NOT NULL DEFAULT 0,  -- 1: in the analytics, -1: details unavailable (not retried)
+    UNIQUE (function_name, execution_id)
+);
+CREATE INDEX IF NOT EXISTS executions_by_start ON executions (function_name, start_time);
+CREATE INDEX IF NOT EXISTS executions_by_status ON executions (function_name, status, start_time);
+CREATE VIRTUAL TABLE IF NOT EXISTS executions_fts USING fts5 (execution_id, name, input, error, cause);
+CREATE TABLE IF NOT EXISTS analytics (
+    function_name TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    function_name TEXT PRIMARY KEY,
+    cursor TEXT,
+    complete INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL
+);
+"""
+
+
+class ExecutionIndex:
+    """SQLite mirror of execution summaries, searchable with FTS5.
+
+    Args:
+        path: Database file (parent directories are created), or ":memory:".
+    """
+
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(executions)")}
+        if "analyzed" not in columns:  # index files created before analytics existed
+            self._conn.execute("ALTER TABLE executions ADD COLUMN analyzed INTEGER NOT NULL DEFAULT 0")
+
+    # -- Writes ---------------------------------------------------------------
+
+    def upsert(self, function_name: str, summaries: list[ExecutionSummary]) -> int:
+        """Insert or update summaries; returns how many were new or changed."""
+        changed = 0
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for summary in summaries:
+                    row = self._conn.execute(
+                        "SELECT id, status, end_time FROM executions WHERE function_name = ? AND execution_id = ?",
+                        (function_name, summary.execution_id),
+                    ).fetchone()
+                    end_time = _epoch(summary.end_time)
+                    if row is None:
+                        cursor = self._conn.execute(
+                            "INSERT INTO executions (function_name, execution_id, name, status, start_time, end_time) "
+                            "VALUES (?, ?, ?, ?, ?, ?)",
+                            (
+                                function_name,
+                                summary.execution_id,
+                                summary.name,
+                                summary.status.value,
+                                _epoch(summary.start_time),
+                                end_time,
+                            ),
+                        )
+                        self._index_text(cursor.lastrowid, summary.execution_id, summary.name)
+                        changed += 1
+                    elif (row[1], row[2]) != (summary.status.value, end_time):
+                        self._conn.execute(
+                            "UPDATE executions SET status = ?, end_time = ? WHERE id = ?",
+                            (summary.status.value, end_time, row[0]),
+                        )
+                        changed += 1
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return changed
+
+    def add_details(self, function_name: str, execution_id: str, detail: ExecutionDetail) -> None:
+        """Store an execution's input and error so they can be searched."""
+        input_text = json.dumps(detail.input_payload) if detail.input_payload is not None else None
+        error = detail.error.error if detail.error else None
+        cause = detail.error.cause if detail.error else None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM executions WHERE function_name = ? AND execution_id = ?",
+                (function_name, execution_id),
+            ).fetchone()
+            if row is None:
+                return
+            self._conn.execute(
+                "UPDATE executions SET input = ?, error = ?, cause = ?, has_details = 1 WHERE id = ?",
+                (input_text, error, cause, row[0]),
+            )
+            self._conn.execute("DELETE FROM executions_fts WHERE rowid = ?", (row[0],))
+            self._index_text(row[0], execution_id, detail.name, input_text, error, cause)
+
+    def details_failed(self, function_name: str, execution_id: str) -> None:
+        """Record that an execution's details could not be fetched, so it is not asked for again."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE executions SET has_details = -1 WHERE function_name = ? AND execution_id = ?",
+                (function_name, execution_id),
+            )
+
+    def missing_details(self, function_name: str, limit: int = _PAGE_SIZE) -> list[str]:
+        """Ids of terminal executions whose input and error were not fetched (or tried) yet, newest first."""
+        terminal = [status.value for status in TERMINAL_STATUSES]
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT execution_id FROM executions WHERE function_name = ? AND has_details = 0 "
+                f"AND status IN ({', '.join('?' * len(terminal))}) ORDER BY start_time DESC LIMIT ?",
+                (function_name, *terminal, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def unanalyzed(self, function_name: str, limit: int) -> list[str]:
+        """Ids of terminal executions not yet folded into the analytics, newest first."""
+        terminal = [status.value for status in TERMINAL_STATUSES]
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT execution_id FROM executions WHERE function_name = ? AND analyzed = 0 "
+                f"AND status IN ({', '.join('?' * len(terminal))}) ORDER BY start_time DESC LIMIT ?",
+                (function_name, *terminal, limit),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def load_analytics(self, function_name: str) -> dict[str, Any] | None:
+        """Stored analytics aggregate (see rsf.inspect.analytics), or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM analytics WHERE function_name = ?", (function_name,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def save_analytics(
+        self,
+        function_name: str,
+        data: dict[str, Any],
+        execution_ids: list[str],
+        failed_ids: list[str] | None = None,
+    ) -> None:
+        """Store the aggregate and mark the executions it now includes, atomically.
+
+        ``failed_ids`` are executions whose details could not be fetched;
+        they are marked so that later refreshes do not ask for them again.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("INSERT OR REPLACE INTO analytics VALUES (?, ?)", (function_name, json.dumps(data)))
+                self._conn.executemany(
+                    "UPDATE executions SET analyzed = ? WHERE function_name = ? AND execution_id = ?",
+                    [(1, function_name, execution_id) for execution_id in execution_ids]
+                    + [(-1, function_name, execution_id) for execution_id in failed_ids or []],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def running(self, function_name: str) -> list[str]:
+        """Ids of executions last seen running."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT execution_id FROM executions WHERE function_name = ? AND status = ?",
+                (function_name, ExecutionStatus.RUNNING.value),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def sync_state(self, function_name: str) -> tuple[str | None, bool]:
+        """(saved NextToken, whether a full sync has completed)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cursor, complete FROM sync_state WHERE function_name = ?", (function_name,)
+            ).fetchone()
+        return (row[0], bool(row[1])) if row is not None else (None, False)
+
+    def save_sync_state(self, function_name: str, cursor: str | None, complete: bool) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)",
+                (function_name, cursor, int(complete), time.time()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -- Queries --------------------------------------------------------------
+
+    def query(
+        self,
+        function_name: str,
+        status: ExecutionStatus | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        text: str | None = None,
+        inputs: dict[str, str] | None = None,
+        sort: SortKey = "start_time",
+        descending: bool = True,
+        limit: int = _PAGE_SIZE,
+        offset: int = 0,
+    ) -> tuple[list[ExecutionSummary], int | None]:
+        """Matching summaries and the offset of the next page (None on the last page).
+
+        Args:
+            function_name: Function whose executions to search.
+            status: Only executions in this status.
+            since: Only executions started at or after this time.
+            until: Only executions started before this time.
+            text: FTS5 query over id, name, input, error and cause, e.g.
+                ``Timeout OR Throttled`` or ``refund*``. Text that is not
+                valid FTS5 syntax (such as a bare ``exec-1234``) is searched
+                as a phrase.
+            inputs: Top-level input fields that must equal the given values
+                (compared as text; needs indexed details).
+            sort: Column to sort by (ties broken by execution id).
+            descending: Sort order.
+            limit: Page size.
+            offset: Rows to skip, from a previous page's next offset.
+
+        Raises:
+            ValueError: ``sort`` is unknown.
+        """
+        if sort not in ("start_time", "end_time", "name", "status"):
+            raise ValueError(f"Cannot sort by {sort!r}")
+        clauses = ["e.function_name = ?"]
+        params: list[Any] = [function_name]
+        if status is not None:
+            clauses.append("e.status = ?")
+            params.append(status.value)
+        if since is not None:
+            clauses.append("e.start_time >= ?")
+            params.append(_epoch(since))
+        if until is not None:
+            clauses.append("e.start_time < ?")
+            params.append(_epoch(until))
+        if text:
+            clauses.append("e.id IN (SELECT rowid FROM executions_fts WHERE executions_fts MATCH ?)")
+            params.append(self._match_expression(text))
+        for field, value in (inputs or {}).items():
+            clauses.append("CAST(json_extract(e.input, ?) AS TEXT) = ?")
+            params.extend([f"$.{json.dumps(field)}", value])
+
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            "SELECT e.execution_id, e.name, e.status, e.start_time, e.end_time FROM executions e "
+            f"WHERE {' AND '.join(clauses)} ORDER BY e.{sort} {direction}, e.execution_id {direction} "
+            "LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, (*params, limit + 1, offset)).fetchall()
+
+        summaries = [
+            ExecutionSummary(
+                execution_id=execution_id,
+                name=name,
+                status=ExecutionStatus(status_value),
+                function_name=function_name,
+                start_time=start_time,
+                end_time=end_time,
+            )
+            for execution_id, name, status_value, start_time, end_time in rows[:limit]
+        ]
+        return summaries, (offset + limit if len(rows) > limit else None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM executions").fetchone()[0]
+
+    def _match_expression(self, text: str) -> str:
+        # Checked on its own: inside the main query SQLite may never evaluate the MATCH
+        try:
+            with self._lock:
+                self._conn.execute("SELECT rowid FROM executions_fts WHERE executions_fts MATCH ? LIMIT 1", (text,))
+        except sqlite3.OperationalError:
+            return '"' + text.replace('"', '""') + '"'
+        return text
+
+    def _index_text(self, rowid: int | None, *values: str | None) -> None:
+        self._conn.execute(
+            "INSERT INTO executions_fts (rowid, execution_id, name, input, error, cause) VALUES (?, ?, ?, ?, ?, ?)",
+            (rowid, *values, *([None] * (5 - len(values)))),
+        )
+
+
+class ExecutionIndexer:
+    """Keeps an ExecutionIndex in sync with one function's executions.
+
+    Args:
+        client: Client for the function to index.
+        index: Where to store the executions.
+        details: Also fetch each terminal execution's input and error
+            (one extra call per execution) so they can be searched.
+        refresh_interval: Seconds between incremental refreshes once the
+            initial sync is complete.
+    """
+
+    def __init__(
+        self,
+        client: LambdaInspectClient,
+        index: ExecutionIndex,
+        details: bool = False,
+        refresh_interval: float = _DEFAULT_REFRESH_INTERVAL,
+    ) -> None:
+        self.client = client
+        self.index = index
+        self.details = details
+        self.refresh_interval = refresh_interval
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def function_name(self) -> str:
+        return self.client.function_name
+
+    def start(self) -> None:
+        """Start syncing in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def run(self) -> None:
+        """Sync forever (until cancelled), logging and retrying on errors."""
+        with prioritized(Priority.BACKGROUND):
+            while True:
+                try:
+                    await self.sync_once()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Indexing executions of %s failed", self.function_name)
+                await asyncio.sleep(self.refresh_interval)
+
+    async def sync_once(self) -> int:
+        """Finish (or resume) the full sync, else refresh the newest pages; returns rows changed."""
+        cursor, complete = self.index.sync_state(self.function_name)
+        changed = 0
+        if complete:
+            # Newest first: stop at the first page that brings nothing new
+            seen: set[str] = set()
+            next_token = None
+            while True:
+                page = await self.client.list_executions(max_items=_PAGE_SIZE, next_token=next_token)
+                seen.update(summary.execution_id for summary in page.executions)
+                page_changed = self.index.upsert(self.function_name, page.executions)
+                changed += page_changed
+                next_token = page.next_token
+                if not page_changed or next_token is None:
+                    break
+            # Executions still running beyond the pages read: ask for them one by one
+            for execution_id in self.index.running(self.function_name):
+                if execution_id not in seen:
+                    detail = await self.client.get_execution(execution_id)
+                    changed += self.index.upsert(self.function_name, [detail])
+        else:
+            while True:
+                page = await self.client.list_executions(max_items=_PAGE_SIZE, next_token=cursor)
+                changed += self.index.upsert(self.function_name, page.executions)
+                cursor = page.next_token
+                self.index.save_sync_state(self.function_name, cursor, complete=cursor is None)
+                if cursor is None:
+                    break
+
+        if self.details:
+            await self._fetch_details()
+        return changed
+
+    async def _fetch_details(self) -> None:
+        while True:
+            missing = self.index.missing_details(self.function_name)
+            if not missing:
+                return
+            for execution_id in missing:
+                try:
+                    detail = await self.client.get_execution(execution_id)
+                except Exception:
+                    # E.g. expired or deleted: skip it rather than retry it ahead of every older execution
+                    logger.warning(
+                        "Fetching details of execution %s of %s failed", execution_id, self.function_name, exc_info=True
+                    )
+                    self.index.details_failed(self.function_name, execution_id)
+                    continue
+                self.index.add_details(self.function_name, execution_id, detail)
+
+
+def _epoch(value: datetime | None) -> float | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
@@ -3,15 +3,21 @@
 Pydantic v2 models for durable execution data returned by the Lambda
 control plane APIs: execution summaries, details, history events, and
 timestamp normalization utilities.
+
+Histories can run to tens of thousands of events, so they are parsed and
+serialized as a whole: parse_history() validates a raw event list in one
+TypeAdapter pass (with timestamps normalized in bulk beforehand) and
+dump_history_json() writes JSON straight from the models, without
+building an intermediate dict per event.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any
+from typing import Any, Iterable
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
 class ExecutionStatus(str, Enum):
@@ -42,6 +48,8 @@ def normalize_timestamp(value: Any) -> datetime:
     datetime objects, or already-aware datetimes.  This function
     normalizes all of them to UTC.
     """
+    if type(value) is datetime and value.tzinfo is timezone.utc:
+        return value
     if isinstance(value, (int, float)):
         return datetime.fromtimestamp(value, tz=timezone.utc)
     if isinstance(value, datetime):
@@ -56,6 +64,36 @@ def normalize_timestamp(value: Any) -> datetime:
     raise TypeError(f"Cannot normalize timestamp of type {type(value).__name__}")
 
 
+def normalize_timestamps(values: Iterable[Any]) -> list[datetime]:
+    """Normalize many AWS timestamps at once; see normalize_timestamp.
+
+    Looks up the UTC offset once per distinct time zone rather than once
+    per value, which is what dominates for boto3's zone-aware datetimes.
+    """
+    utc = timezone.utc
+    # Keyed by id(): dateutil's tzutc()/tzlocal() (what botocore attaches) are
+    # unhashable. Each entry holds its tzinfo so the id cannot be reused.
+    offsets: dict[int, tuple[Any, timedelta | None]] = {}
+    result: list[datetime] = []
+    append = result.append
+    for value in values:
+        if type(value) is datetime and value.tzinfo is not None:
+            tz = value.tzinfo
+            if tz is utc:
+                append(value)
+                continue
+            entry = offsets.get(id(tz))
+            if entry is None:
+                # utcoffset(None) is None for zones with DST: convert each value
+                entry = offsets[id(tz)] = (tz, tz.utcoffset(None))
+            offset = entry[1]
+            if offset is not None:
+                append(value.replace(tzinfo=utc) - offset)
+                continue
+        append(normalize_timestamp(value))
+    return result
+
+
 def _ts_validator(v: Any) -> datetime | None:
     """Pydantic field validator that normalizes timestamps."""
     if v is None:
@@ -110,6 +148,38 @@ class HistoryEvent(BaseModel):
 # Rebuild ExecutionDetail now that HistoryEvent is defined.
 ExecutionDetail.model_rebuild()
 
+# Validates and serializes whole histories in one pydantic-core pass.
+HISTORY_ADAPTER = TypeAdapter(list[HistoryEvent])
+
+
+def parse_history(events: list[dict[str, Any]]) -> list[HistoryEvent]:
+    """Parse raw API history events (``EventId``, ``Timestamp``, ...) into HistoryEvents.
+
+    Timestamps are normalized in bulk first, so the per-event timestamp
+    validator only sees UTC datetimes and returns them as they are.
+
+    Raises:
+        ValidationError: An event does not fit the HistoryEvent model.
+    """
+    timestamps = normalize_timestamps([evt.get("Timestamp", 0) for evt in events])
+    return HISTORY_ADAPTER.validate_python(
+        [
+            {
+                "event_id": evt.get("EventId", 0),
+                "timestamp": timestamp,
+                "event_type": evt.get("EventType", ""),
+                "sub_type": evt.get("SubType"),
+                "details": evt.get("Details") or {},
+            }
+            for evt, timestamp in zip(events, timestamps)
+        ]
+    )
+
+
+def dump_history_json(history: list[HistoryEvent]) -> bytes:
+    """Serialize a history to a JSON array, in the same form as ``model_dump(mode="json")``."""
+    return HISTORY_ADAPTER.dump_json(history)
+
 
 class ExecutionListResponse(BaseModel):
     """Response for the execution list endpoint with pagination."""
@@ -124,6 +194,23 @@ class ReplayRequest(BaseModel):
     input_payload: dict[str, Any] | None = None
 
 
+class RedriveRequest(BaseModel):
+    """Request body for redriving many executions at once.
+
+    Executions are either listed explicitly or selected by status and
+    start time.
+    """
+
+    execution_ids: list[str] | None = None
+    status: ExecutionStatus = ExecutionStatus.FAILED
+    since: datetime | None = None
+    until: datetime | None = None
+    concurrency: int = Field(default=5, ge=1, le=50)
+    rate: float | None = Field(default=None, gt=0, description="Maximum invocations per second")
+    patch: dict[str, Any] | None = Field(default=None, description="JSON merge patch applied to each input")
+    dry_run: bool = False
+
+
 class ReplayResponse(BaseModel):
     """Response from a replay invocation."""
 
@@ -0,0 +1,300 @@
+"""Bulk redrive of durable executions for the RSF execution inspector.
+
+Replaying executions one at a time does not scale to the hundreds that
+fail during an outage, and firing them all at once gets throttled by the
+control plane or swamps downstream systems. Redriver re-invokes a set of
+terminal executions with their original (optionally patched) input:
+
+- ``concurrency`` bounds how many redrives are in flight at once.
+- ``rate`` caps invocations per second on top of the client's shared
+  rate limiter, which every call still goes through (in its background
+  lane, so the inspector UI stays responsive).
+- An optional RedriveJournal records every outcome as a JSON line, so an
+  interrupted redrive resumes without re-invoking executions that were
+  already redriven.
+
+Usage:
+    redriver = Redriver(client, concurrency=5, rate=3.0, journal=RedriveJournal("redrive.jsonl"))
+    targets = await redriver.select(ExecutionStatus.FAILED, since=now - timedelta(hours=2))
+    async for progress in redriver.run(targets):
+        print(progress.outcome, progress.succeeded, progress.failed)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator
+
+from rsf.inspect.client import LambdaInspectClient, Priority, TokenBucketRateLimiter, prioritized
+from rsf.inspect.models import TERMINAL_STATUSES, ExecutionStatus
+
+_DEFAULT_CONCURRENCY = 5
+_PAGE_SIZE = 50
+_RATE_UNITS = {"s": 1.0, "sec": 1.0, "m": 60.0, "min": 60.0, "h": 3600.0}
+
+
+@dataclass(frozen=True)
+class RedriveOutcome:
+    """Result of redriving one execution.
+
+    Attributes:
+        execution_id: The execution that was redriven.
+        ok: Whether the new invocation was accepted.
+        request_id: Request id of the new invocation.
+        error: Why the redrive failed.
+        at: Wall-clock time of the outcome (epoch seconds).
+    """
+
+    execution_id: str
+    ok: bool
+    request_id: str = ""
+    error: str = ""
+    at: float = field(default_factory=time.time)
+
+
+@dataclass
+class RedriveProgress:
+    """Running totals, reported after every outcome.
+
+    Attributes:
+        total: Executions selected for this run.
+        succeeded: Redriven successfully (in this run).
+        failed: Failed to redrive (in this run).
+        skipped: Already redriven according to the journal.
+        outcome: The outcome that triggered this report.
+    """
+
+    total: int
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    outcome: RedriveOutcome | None = None
+
+    @property
+    def done(self) -> int:
+        return self.succeeded + self.failed + self.skipped
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "outcome": asdict(self.outcome) if self.outcome is not None else None,
+        }
+
+
+class RedriveJournal:
+    """Append-only JSON Lines record of redrive outcomes.
+
+    Executions with a successful outcome in the journal are skipped when a
+    redrive is resumed; failed ones are retried.
+
+    Args:
+        path: Journal file (created with its parent directories if missing).
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self._redriven: set[str] = set()
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as fh:
+                for line in fh:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn write from an interrupted run
+                    if entry.get("ok"):
+                        self._redriven.add(entry["execution_id"])
+
+    def redriven(self, execution_id: str) -> bool:
+        return execution_id in self._redriven
+
+    def record(self, outcome: RedriveOutcome) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(asdict(outcome)) + "\n")
+        if outcome.ok:
+            self._redriven.add(outcome.execution_id)
+
+    def __len__(self) -> int:
+        return len(self._redriven)
+
+
+class Redriver:
+    """Re-invokes terminal executions with bounded concurrency and rate.
+
+    Args:
+        client: Client for the function whose executions to redrive.
+        concurrency: Redrives in flight at once.
+        rate: Maximum invocations per second (None: only the client's
+            shared limit applies).
+        journal: Records outcomes and skips executions already redriven.
+        patch: JSON merge patch (RFC 7386) applied to every input payload.
+    """
+
+    def __init__(
+        self,
+        client: LambdaInspectClient,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        rate: float | None = None,
+        journal: RedriveJournal | None = None,
+        patch: dict[str, Any] | None = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self.client = client
+        self.concurrency = concurrency
+        self.journal = journal
+        self.patch = patch
+        self._limiter = TokenBucketRateLimiter(rate=rate, capacity=1.0) if rate is not None else None
+
+    async def select(
+        self,
+        status: ExecutionStatus = ExecutionStatus.FAILED,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> list[str]:
+        """Ids of executions in ``status`` started in [since, until), oldest first.
+
+        Pages through the list API newest first and stops at the first page
+        that reaches back before ``since``.
+        """
+        since = _aware(since) if since is not None else None
+        until = _aware(until) if until is not None else None
+        selected: list[str] = []
+        next_token = None
+        with prioritized(Priority.BACKGROUND):
+            while True:
+                page = await self.client.list_executions(status=status, max_items=_PAGE_SIZE, next_token=next_token)
+                for summary in page.executions:
+                    start = _aware(summary.start_time)
+                    if (since is None or start >= since) and (until is None or start < until):
+                        selected.append(summary.execution_id)
+                next_token = page.next_token
+                reached_since = since is not None and any(_aware(s.start_time) < since for s in page.executions)
+                if next_token is None or reached_since:
+                    break
+        selected.reverse()
+        return selected
+
+    async def run(self, execution_ids: list[str]) -> AsyncIterator[RedriveProgress]:
+        """Redrive the executions, yielding progress after each outcome.
+
+        Executions the journal already records as redriven are reported as
+        skipped up front. Each outcome is journaled as soon as it happens,
+        not when it is reported, so a slow or departed consumer never loses
+        a record. Leaving the iteration early cancels the redrives still in
+        flight.
+
+        Raises:
+            OSError: The journal could not be written. The outcome is still
+                reported first; the redrives in flight are cancelled, since
+                going on unjournaled would repeat them on resume.
+        """
+        progress = RedriveProgress(total=len(execution_ids))
+        pending: asyncio.Queue[str] = asyncio.Queue()
+        for execution_id in execution_ids:
+            if self.journal is not None and self.journal.redriven(execution_id):
+                progress.skipped += 1
+            else:
+                pending.put_nowait(execution_id)
+        if progress.skipped:
+            yield progress
+
+        # Outcomes, each followed by the journal error if recording it failed
+        outcomes: asyncio.Queue[RedriveOutcome | Exception] = asyncio.Queue()
+
+        async def worker() -> None:
+            while not pending.empty():
+                execution_id = pending.get_nowait()
+                outcome = await self._redrive_one(execution_id)
+                try:
+                    if self.journal is not None:
+                        self.journal.record(outcome)
+                except Exception as exc:
+                    outcomes.put_nowait(outcome)
+                    outcomes.put_nowait(exc)
+                    return
+                outcomes.put_nowait(outcome)
+
+        remaining = pending.qsize()
+        with prioritized(Priority.BACKGROUND):
+            workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, remaining))]
+        received = 0
+        try:
+            # A journal error is queued together with its outcome, so it is seen even after the last one
+            while received < remaining or not outcomes.empty():
+                outcome = await outcomes.get()
+                if isinstance(outcome, Exception):
+                    raise outcome
+                received += 1
+                if outcome.ok:
+                    progress.succeeded += 1
+                else:
+                    progress.failed += 1
+                progress.outcome = outcome
+                yield progress
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _redrive_one(self, execution_id: str) -> RedriveOutcome:
+        try:
+            source = await self.client.get_execution(execution_id)
+            if source.status not in TERMINAL_STATUSES:
+                return RedriveOutcome(execution_id, ok=False, error=f"Execution is {source.status.value}")
+            payload = source.input_payload or {}
+            if self.patch is not None:
+                payload = merge_patch(payload, self.patch)
+            if self._limiter is not None:
+                await self._limiter.acquire()
+            result = await self.client.invoke_execution(payload)
+        except Exception as exc:
+            return RedriveOutcome(execution_id, ok=False, error=str(exc) or type(exc).__name__)
+        request_id = result.get("ResponseMetadata", {}).get("RequestId", "")
+        return RedriveOutcome(execution_id, ok=True, request_id=request_id)
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """Apply a JSON merge patch (RFC 7386): objects merge, null deletes, anything else replaces."""
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+def parse_rate(value: str) -> float:
+    """Parse a rate such as ``3/s``, ``90/min`` or ``2.5`` into calls per second.
+
+    Raises:
+        ValueError: The value is not a positive rate.
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*(?:/\s*([a-z]+))?\s*", value.lower())
+    if match is None or (match.group(2) is not None and match.group(2) not in _RATE_UNITS):
+        raise ValueError(f"Invalid rate {value!r}, expected e.g. 3/s or 120/min")
+    rate = float(match.group(1)) / _RATE_UNITS[match.group(2) or "s"]
+    if rate <= 0:
+        raise ValueError(f"Rate must be positive: {value!r}")
+    return rate
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
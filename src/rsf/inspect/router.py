@@ -1,42 +1,74 @@
 """FastAPI router for the RSF execution inspector.
 
 Provides REST endpoints for listing and inspecting durable executions,
-plus an SSE stream for live execution updates.
+plus an SSE stream for live execution updates. Execution details go
+through the app's ExecutionCache (see rsf.inspect.cache), so terminal
+executions are fetched from Lambda and serialized once.
 
 Endpoints:
-- GET /api/inspect/executions         — list executions (INB-01)
+- GET /api/inspect/executions         — list / search executions (INB-01)
 - GET /api/inspect/execution/{id}     — execution detail + history (INB-02)
 - GET /api/inspect/execution/{id}/history — history events only (INB-03)
 - GET /api/inspect/execution/{id}/stream  — SSE live stream (INB-04, INB-05)
+- GET /api/inspect/execution/{id}/snapshot?at=N        — time machine overlays after event N
+- GET /api/inspect/execution/{id}/snapshots?start=&count= — a window of consecutive snapshots
+- GET /api/inspect/execution/{id}/diff?from=&to=       — structural diff between two events
+- POST /api/inspect/redrive           — bulk replay, progress streamed as SSE
+- GET /api/inspect/analytics?limit=N  — per-state latency percentiles, error rates, retries (refreshed in background)
+- GET /api/inspect/stats              — rate limiter, coalescing, cache and stream metrics
+- GET /api/inspect/functions          — functions served by a multi-function inspector
+
+A multi-function inspector (``create_app(functions=[...])``) serves every
+endpoint above for each function under ``/api/inspect/{function}/...``,
+where ``{function}`` is the function name (see rsf.inspect.client.ClientPool).
 """
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
-from typing import Any, AsyncGenerator
+from datetime import datetime
+from typing import Any, AsyncGenerator, Literal
 
-from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from sse_starlette.sse import EventSourceResponse
 
-from rsf.inspect.client import LambdaInspectClient
+from rsf.inspect.analytics import AnalyticsEngine
+from rsf.inspect.cache import CachedExecution, ExecutionCache
+from rsf.inspect.client import ClientPool, LambdaInspectClient, Priority, prioritized
+from rsf.inspect.hub import StreamHub
+from rsf.inspect.index import ExecutionIndex, SortKey
 from rsf.inspect.models import (
     TERMINAL_STATUSES,
     ExecutionDetail,
     ExecutionListResponse,
     ExecutionStatus,
+    RedriveRequest,
     ReplayRequest,
     ReplayResponse,
 )
+from rsf.inspect.redrive import Redriver
+from rsf.inspect.timemachine import MAX_WINDOW, Timeline
 
 logger = logging.getLogger(__name__)
 
+# Marks next tokens of pages served from the execution index (Lambda tokens never have it)
+_INDEX_TOKEN_PREFIX = "idx:"
+
 router = APIRouter(prefix="/api/inspect")
 
+# Per-execution endpoints, mounted on ``router`` and, per function, on ``function_router`` (see the end of the module).
+_endpoints = APIRouter()
+
 
 def _get_client(request: Request) -> LambdaInspectClient:
-    """Retrieve the Lambda inspect client from app state."""
+    """Retrieve the Lambda inspect client from app state (or the client pool, on per-function routes)."""
+    function = request.path_params.get("function")
+    if function is not None:
+        pool: ClientPool | None = getattr(request.app.state, "client_pool", None)
+        if pool is None or function not in pool:
+            raise HTTPException(status_code=404, detail=f"Unknown function {function!r}")
+        return pool.get(function)
     client: LambdaInspectClient | None = getattr(request.app.state, "inspect_client", None)
     if client is None:
         raise HTTPException(
@@ -46,52 +78,241 @@ def _get_client(request: Request) -> LambdaInspectClient:
     return client
 
 
+def _function_name(request: Request) -> str:
+    """Name (or ARN) of the function a request is for; keys the cache and the stream hub."""
+    function = request.path_params.get("function")
+    if function is not None:
+        return request.app.state.client_pool.functions[function]
+    return request.app.state.function_name or ""
+
+
+async def _fetch_execution(
+    request: Request,
+    client: LambdaInspectClient,
+    execution_id: str,
+    fresh: bool = False,
+) -> CachedExecution:
+    """Execution detail from the app's cache, fetching it on a miss.
+
+    Args:
+        fresh: Skip the cache lookup (the result is still cached), for
+            pollers that must see the latest status.
+    """
+    cache: ExecutionCache | None = getattr(request.app.state, "execution_cache", None)
+    if cache is None:
+        return CachedExecution(await client.get_execution(execution_id))
+    function_name = _function_name(request)
+    if not fresh:
+        entry = cache.get(function_name, execution_id)
+        if entry is not None:
+            return entry
+    return cache.put(function_name, execution_id, await client.get_execution(execution_id))
+
+
 # -----------------------------------------------------------------------
 # REST endpoints
 # -----------------------------------------------------------------------
 
 
-@router.get("/executions", response_model=ExecutionListResponse)
+@_endpoints.get("/executions", response_model=ExecutionListResponse)
 async def list_executions(
     request: Request,
     status: ExecutionStatus | None = Query(default=None),
     max_items: int = Query(default=50, ge=1, le=200),
     next_token: str | None = Query(default=None),
+    q: str | None = Query(default=None, description="Full-text search (FTS5 syntax) over id, name, input, error"),
+    since: datetime | None = Query(default=None, description="Started at or after"),
+    until: datetime | None = Query(default=None, description="Started before"),
+    input_filter: list[str] = Query(default=[], alias="input", description="Input field match, as key=value"),
+    sort: SortKey = Query(default="start_time"),
+    order: Literal["asc", "desc"] = Query(default="desc"),
 ) -> ExecutionListResponse:
-    """List durable executions with optional status filter and pagination."""
+    """List durable executions with optional status filter and pagination.
+
+    With an execution index (``rsf inspect --index``) the list can also be
+    searched, filtered by time and input fields, and sorted; those queries
+    are answered from the index. Plain listings come from the Lambda API
+    until the index has finished its first full sync. Index pages have
+    ``idx:``-prefixed next tokens, so a listing that started on the Lambda
+    API keeps paging there after the sync completes.
+    """
     client = _get_client(request)
-    return await client.list_executions(
+    index: ExecutionIndex | None = getattr(request.app.state, "execution_index", None)
+    searching = bool(q or since or until or input_filter) or (sort, order) != ("start_time", "desc")
+    index_token = next_token is not None and next_token.startswith(_INDEX_TOKEN_PREFIX)
+
+    if index is None or not (
+        searching or index_token or (next_token is None and index.sync_state(client.function_name)[1])
+    ):
+        if searching:
+            raise HTTPException(
+                status_code=400,
+                detail="Search, time filters and sorting need the execution index (rsf inspect --index FILE)",
+            )
+        if index_token:
+            raise HTTPException(status_code=400, detail=f"Invalid next_token {next_token!r}")
+        return await client.list_executions(
+            status=status,
+            max_items=max_items,
+            next_token=next_token,
+        )
+
+    inputs: dict[str, str] = {}
+    for item in input_filter:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise HTTPException(status_code=400, detail=f"Invalid input filter {item!r}, expected key=value")
+        inputs[key] = value
+    try:
+        if next_token is not None and not index_token:
+            raise ValueError(next_token)  # a Lambda token cannot page an index query
+        offset = int(next_token.removeprefix(_INDEX_TOKEN_PREFIX)) if next_token is not None else 0
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid next_token {next_token!r}")
+
+    executions, next_offset = index.query(
+        client.function_name,
         status=status,
-        max_items=max_items,
-        next_token=next_token,
+        since=since,
+        until=until,
+        text=q,
+        inputs=inputs,
+        sort=sort,
+        descending=order == "desc",
+        limit=max_items,
+        offset=offset,
+    )
+    return ExecutionListResponse(
+        executions=executions,
+        next_token=f"{_INDEX_TOKEN_PREFIX}{next_offset}" if next_offset is not None else None,
     )
 
 
-@router.get("/execution/{execution_id}", response_model=ExecutionDetail)
+@_endpoints.get("/stats")
+async def get_stats(request: Request) -> dict[str, Any]:
+    """Rate-limiter queue depth and wait times, coalesced calls, cache hits and live streams."""
+    if "function" in request.path_params:
+        client: LambdaInspectClient | None = _get_client(request)
+    else:
+        client = getattr(request.app.state, "inspect_client", None)
+    cache: ExecutionCache = request.app.state.execution_cache
+    hub: StreamHub = request.app.state.stream_hub
+    pool: ClientPool | None = getattr(request.app.state, "client_pool", None)
+    return {
+        "client": client.stats() if client is not None else None,
+        "pool": pool.stats() if pool is not None else None,
+        "cache": {"entries": len(cache), "hits": cache.hits, "misses": cache.misses},
+        "streams": hub.stats(),
+    }
+
+
+@router.get("/functions")
+async def list_functions(request: Request) -> dict[str, Any]:
+    """Functions served under ``/api/inspect/{function}`` (empty for a single-function inspector)."""
+    pool: ClientPool | None = getattr(request.app.state, "client_pool", None)
+    if pool is None:
+        return {"functions": []}
+    return {"functions": [{"name": name, "function_name": pool.functions[name]} for name in pool.names]}
+
+
+@_endpoints.get("/analytics")
+async def get_analytics(
+    request: Request,
+    limit: int = Query(default=100, ge=0, le=5000, description="Most new executions to fold in"),
+) -> dict[str, Any]:
+    """Per-state analytics across finished executions.
+
+    Reports the aggregate over everything analyzed so far at once, and
+    starts a background refresh that folds in up to ``limit`` executions
+    not analyzed yet (from the index when configured, else those started
+    since the last refresh). ``refreshing`` is true while one runs; poll
+    again for the updated aggregate.
+    """
+    client = _get_client(request)
+    engines: dict[str, AnalyticsEngine] = request.app.state.analytics_engines
+    function_name = _function_name(request)
+    engine = engines.get(function_name)
+    if engine is None:
+        engine = engines[function_name] = AnalyticsEngine(
+            client,
+            cache=request.app.state.execution_cache,
+            index=getattr(request.app.state, "execution_index", None),
+        )
+    engine.start_refresh(limit)
+    return {**engine.analytics.report(), "refreshing": engine.refreshing}
+
+
+@_endpoints.get("/execution/{execution_id}", response_model=ExecutionDetail)
 async def get_execution(
     request: Request,
     execution_id: str,
 ) -> ExecutionDetail:
     """Get execution detail including history events."""
     client = _get_client(request)
-    return await client.get_execution(execution_id)
+    entry = await _fetch_execution(request, client, execution_id)
+    return Response(content=entry.body("detail"), media_type="application/json")
 
 
-@router.get("/execution/{execution_id}/history")
+@_endpoints.get("/execution/{execution_id}/history")
 async def get_execution_history(
     request: Request,
     execution_id: str,
-) -> dict[str, Any]:
+) -> Response:
     """Get history events only for a specific execution."""
     client = _get_client(request)
-    detail = await client.get_execution(execution_id)
-    return {
-        "execution_id": execution_id,
-        "events": [evt.model_dump(mode="json") for evt in detail.history],
-    }
+    entry = await _fetch_execution(request, client, execution_id)
+    return Response(content=entry.body("history"), media_type="application/json")
+
+
+async def _timeline(request: Request, execution_id: str, *indexes: int) -> Timeline:
+    """The execution's time machine timeline, checking that every index is an event."""
+    client = _get_client(request)
+    timeline = (await _fetch_execution(request, client, execution_id)).timeline()
+    for index in indexes:
+        if index >= len(timeline):
+            raise HTTPException(
+                status_code=404,
+                detail=f"Event index {index} out of range: execution {execution_id} has {len(timeline)} events",
+            )
+    return timeline
+
+
+@_endpoints.get("/execution/{execution_id}/snapshot")
+async def get_snapshot(
+    request: Request,
+    execution_id: str,
+    at: int = Query(ge=0, description="Event index (0-based)"),
+) -> Response:
+    """Node overlays and transitions after the given history event."""
+    timeline = await _timeline(request, execution_id, at)
+    return Response(content=timeline.snapshot_body(at), media_type="application/json")
 
 
-@router.get("/execution/{execution_id}/stream")
+@_endpoints.get("/execution/{execution_id}/snapshots")
+async def get_snapshot_window(
+    request: Request,
+    execution_id: str,
+    start: int = Query(default=0, ge=0),
+    count: int = Query(default=50, ge=1, le=MAX_WINDOW),
+) -> Response:
+    """Consecutive snapshots from ``start``, for scrubbing through a range of events."""
+    timeline = await _timeline(request, execution_id, start)
+    return Response(content=timeline.window_body(start, count), media_type="application/json")
+
+
+@_endpoints.get("/execution/{execution_id}/diff")
+async def get_snapshot_diff(
+    request: Request,
+    execution_id: str,
+    start: int = Query(alias="from", ge=0),
+    end: int = Query(alias="to", ge=0),
+) -> Response:
+    """Structural diff of node overlays between two history events."""
+    timeline = await _timeline(request, execution_id, start, end)
+    return Response(content=timeline.diff_body(start, end), media_type="application/json")
+
+
+@_endpoints.get("/execution/{execution_id}/stream")
 async def stream_execution(
     request: Request,
     execution_id: str,
@@ -100,67 +321,43 @@ async def stream_execution(
 
     Stream lifecycle:
     1. Connect → send execution_info + full history
-    2. Poll every 5s → send execution_info; if new events, send history_update
+    2. Join the execution's shared poller (see rsf.inspect.hub): send
+       execution_info when it changes and history_update with new events
     3. Close when execution reaches a terminal status
     """
     client = _get_client(request)
+    hub: StreamHub = request.app.state.stream_hub
+    key = (_function_name(request), execution_id)
 
-    async def event_generator() -> AsyncGenerator[dict[str, str], None]:
-        seen_event_ids: set[int] = set()
-
-        # Initial fetch: send execution info + full history.
-        detail = await client.get_execution(execution_id)
-
-        yield {
-            "event": "execution_info",
-            "data": detail.model_dump_json(exclude={"history"}),
-        }
-
-        if detail.history:
-            for evt in detail.history:
-                seen_event_ids.add(evt.event_id)
-            yield {
-                "event": "history",
-                "data": json.dumps([e.model_dump(mode="json") for e in detail.history]),
-            }
-
-        # If already terminal, close immediately.
-        if detail.status in TERMINAL_STATUSES:
-            return
-
-        # Poll loop.
-        while True:
-            await asyncio.sleep(5)
-
-            # Check if the client has disconnected.
-            if await request.is_disconnected():
-                logger.debug("SSE client disconnected for %s", execution_id)
-                return
-
-            detail = await client.get_execution(execution_id)
+    async def fetch(fresh: bool) -> CachedExecution:
+        if not fresh:
+            return await _fetch_execution(request, client, execution_id)
+        with prioritized(Priority.POLL):
+            return await _fetch_execution(request, client, execution_id, fresh=True)
 
+    async def event_generator() -> AsyncGenerator[dict[str, str], None]:
+        async with hub.subscribe(key, fetch) as subscription:
+            entry = subscription.snapshot
             yield {
                 "event": "execution_info",
-                "data": detail.model_dump_json(exclude={"history"}),
+                "data": entry.body("info").decode("utf-8"),
             }
-
-            # Send only new history events.
-            new_events = [e for e in detail.history if e.event_id not in seen_event_ids]
-            if new_events:
-                for evt in new_events:
-                    seen_event_ids.add(evt.event_id)
+            if entry.detail.history:
                 yield {
-                    "event": "history_update",
-                    "data": json.dumps([e.model_dump(mode="json") for e in new_events]),
+                    "event": "history",
+                    "data": entry.body("events").decode("utf-8"),
                 }
 
-            if detail.status in TERMINAL_STATUSES:
-                return
+            # Ends right away for terminal executions.
+            async for update in subscription:
+                for event in update.events:
+                    yield event
+        logger.debug("SSE stream closed for %s", execution_id)
 
     return EventSourceResponse(event_generator())
 
 
-@router.post("/execution/{execution_id}/replay", response_model=ReplayResponse)
+@_endpoints.post("/execution/{execution_id}/replay", response_model=ReplayResponse)
 async def replay_execution(
     request: Request,
     execution_id: str,
@@ -176,7 +373,7 @@ async def replay_execution(
 
     # Fetch source execution
     try:
-        source = await client.get_execution(execution_id)
+        source = (await _fetch_execution(request, client, execution_id)).detail
     except Exception:
         raise HTTPException(
             status_code=404,
@@ -204,3 +401,43 @@ async def replay_execution(
         function_name=client.function_name,
         status_code=result.get("StatusCode", 202),
     )
+
+
+@_endpoints.post("/redrive")
+async def redrive_executions(
+    request: Request,
+    body: RedriveRequest,
+) -> EventSourceResponse:
+    """Replay many executions with bounded concurrency and rate.
+
+    Streams SSE events: ``selected`` (the execution ids), one ``progress``
+    per outcome with running totals, and ``done``. With ``dry_run`` only
+    the selection is sent. Clients resume an interrupted redrive by posting
+    the ids that were not redriven yet.
+    """
+    client = _get_client(request)
+    redriver = Redriver(client, concurrency=body.concurrency, rate=body.rate, patch=body.patch)
+    if body.execution_ids is not None:
+        execution_ids = body.execution_ids
+    else:
+        execution_ids = await redriver.select(body.status, since=body.since, until=body.until)
+
+    async def event_generator() -> AsyncGenerator[dict[str, str], None]:
+        yield {"event": "selected", "data": json.dumps({"execution_ids": execution_ids})}
+        if body.dry_run:
+            return
+        totals: dict[str, Any] = {"total": len(execution_ids), "succeeded": 0, "failed": 0, "skipped": 0}
+        async for progress in redriver.run(execution_ids):
+            totals = progress.to_dict()
+            yield {"event": "progress", "data": json.dumps(totals)}
+        totals.pop("outcome", None)
+        yield {"event": "done", "data": json.dumps(totals)}
+
+    return EventSourceResponse(event_generator())
+
+
+router.include_router(_endpoints)
+
+# The same endpoints for each function of a multi-function inspector.
+function_router = APIRouter(prefix="/api/inspect/{function}")
+function_router.include_router(_endpoints)
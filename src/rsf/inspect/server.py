@@ -4,17 +4,26 @@ Serves:
 1. REST endpoints under /api/inspect for execution list, detail, and history
 2. SSE stream for live execution updates
 3. Static files for the inspector React SPA (when built)
+
+Given several functions, one server inspects them all: each is served
+under /api/inspect/{function}/... by a ClientPool client sharing one
+connection pool, thread pool and rate limiter with the others.
 """
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator, Sequence
 
 import uvicorn
 from fastapi import FastAPI
 
-from rsf.inspect.client import LambdaInspectClient
-from rsf.inspect.router import router
+from rsf.inspect.cache import ExecutionCache, ExecutionStore
+from rsf.inspect.client import ClientPool, LambdaInspectClient, function_key
+from rsf.inspect.hub import StreamHub
+from rsf.inspect.index import ExecutionIndex, ExecutionIndexer
+from rsf.inspect.router import function_router, router
 
 # Both editor and inspector share the same React SPA build (hash routing).
 # The Vite build outputs to editor/static/, so we reference it from there.
@@ -24,26 +33,66 @@ _STATIC_DIR = Path(__file__).resolve().parent.parent / "editor" / "static"
 def create_app(
     function_name: str | None = None,
     region_name: str | None = None,
+    cache_path: str | Path | None = None,
+    index_path: str | Path | None = None,
+    index_details: bool = False,
+    functions: Sequence[str] | None = None,
 ) -> FastAPI:
     """Create the FastAPI application for the execution inspector.
 
     Args:
         function_name: Lambda function name or ARN to inspect.
         region_name: AWS region name (defaults to session default).
+        cache_path: Optional SQLite file that keeps finished executions
+            across restarts (they are always cached in memory).
+        index_path: Optional SQLite file for a local, searchable index of
+            all executions, kept in sync in the background while serving.
+        index_details: Also index each finished execution's input and
+            error (one extra API call per execution).
+        functions: Function names or ARNs to serve under
+            ``/api/inspect/{function}``. ``function_name``, if also given,
+            joins them and is served under ``/api/inspect`` as well.
 
     Returns:
         Configured FastAPI application.
     """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        indexers: list[ExecutionIndexer] = [*app.state.indexers]
+        if app.state.indexer is not None:
+            indexers.append(app.state.indexer)
+        for indexer in indexers:
+            indexer.start()
+        try:
+            yield
+        finally:
+            for indexer in indexers:
+                await indexer.stop()
+            for engine in app.state.analytics_engines.values():
+                await engine.stop()
+            if app.state.client_pool is not None:
+                await app.state.client_pool.close()
+
     app = FastAPI(
         title="RSF Execution Inspector",
         description="Live execution inspector for Lambda Durable Functions",
+        lifespan=lifespan,
     )
 
     # Store function_name in app state for diagnostics.
     app.state.function_name = function_name
 
+    # Multi-function inspector: one client per function, created on first use.
+    app.state.client_pool = None
+    if functions:
+        names = list(dict.fromkeys([*([function_name] if function_name is not None else []), *functions]))
+        app.state.client_pool = ClientPool(names, region_name=region_name)
+
     # Create the Lambda inspect client if a function name is provided.
-    if function_name is not None:
+    if function_name is not None and app.state.client_pool is not None:
+        app.state.inspect_client = app.state.client_pool.get(function_key(function_name))
+    elif function_name is not None:
         app.state.inspect_client = LambdaInspectClient(
             function_name=function_name,
             region_name=region_name,
@@ -51,8 +100,31 @@ def create_app(
     else:
         app.state.inspect_client = None
 
-    # Include the inspector router.
+    # Execution details: in memory, plus on disk for terminal ones if requested.
+    store = ExecutionStore(cache_path) if cache_path is not None else None
+    app.state.execution_cache = ExecutionCache(store=store)
+
+    # One shared poller per streamed execution, however many tabs watch it.
+    app.state.stream_hub = StreamHub()
+
+    # Local search index, synced in the background while the app runs.
+    app.state.execution_index = ExecutionIndex(index_path) if index_path is not None else None
+    app.state.indexer = None
+    app.state.indexers = []
+    if app.state.execution_index is not None and app.state.client_pool is not None:
+        pool: ClientPool = app.state.client_pool
+        app.state.indexers = [
+            ExecutionIndexer(pool.get(name), app.state.execution_index, details=index_details) for name in pool.names
+        ]
+    elif app.state.execution_index is not None and app.state.inspect_client is not None:
+        app.state.indexer = ExecutionIndexer(app.state.inspect_client, app.state.execution_index, details=index_details)
+
+    # Per-function analytics, created on first request.
+    app.state.analytics_engines = {}
+
+    # Include the inspector routers.
     app.include_router(router)
+    app.include_router(function_router)
 
     # Static file serving for inspector React SPA (only if build exists).
     if _STATIC_DIR.is_dir():
@@ -64,10 +136,14 @@ def create_app(
 
 
 def launch(
-    function_name: str,
+    function_name: str | None = None,
     region_name: str | None = None,
     port: int = 8766,
     open_browser: bool = True,
+    cache_path: str | Path | None = None,
+    index_path: str | Path | None = None,
+    index_details: bool = False,
+    functions: Sequence[str] | None = None,
 ) -> None:
     """Start the execution inspector server.
 
@@ -76,8 +152,19 @@ def launch(
         region_name: AWS region name.
         port: Port to listen on (default: 8766).
         open_browser: Whether to open the browser automatically.
+        cache_path: Optional SQLite file for caching finished executions.
+        index_path: Optional SQLite file for the searchable execution index.
+        index_details: Also index inputs and errors.
+        functions: Functions to serve from one multi-function inspector.
     """
-    app = create_app(function_name=function_name, region_name=region_name)
+    app = create_app(
+        function_name=function_name,
+        region_name=region_name,
+        cache_path=cache_path,
+        index_path=index_path,
+        index_details=index_details,
+        functions=functions,
+    )
 
     if open_browser:
         import threading
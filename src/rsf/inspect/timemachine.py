@@ -0,0 +1,327 @@
+"""Server-side time machine for the RSF execution inspector.
+
+The inspector UI used to precompute a full copy of every node and edge
+overlay at every history event and diff state payloads in the browser,
+which for thousands of events with large payloads costs gigabytes in the
+tab. Timeline does the same replay once per execution on the server and
+keeps it compact:
+
+- Each event is reduced to a delta: the overlay of the one state it
+  touched, plus the transition it took, if any.
+- Every ``keyframe_interval`` events a keyframe holds the full overlay
+  map. A snapshot at event N replays at most ``keyframe_interval - 1``
+  deltas on top of the nearest keyframe.
+- Payloads are parsed once and shared by reference between deltas,
+  keyframes and snapshots, never copied.
+
+Serialized snapshot, window and diff bodies are memoized on the timeline.
+Timelines are built lazily per cached execution (see
+``CachedExecution.timeline``), so a terminal execution is replayed once.
+
+Overlays mirror ``ui/src/inspector/timeMachine.ts``: states start
+``pending`` and are absent from snapshots until an event touches them.
+``transitions`` maps a source state to the targets entered from it.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Literal
+
+from rsf.inspect.models import HistoryEvent
+
+DEFAULT_KEYFRAME_INTERVAL = 64
+MAX_WINDOW = 200
+
+_MEMO_SIZE = 64
+_EXIT_STATUSES = ("succeeded", "failed", "caught")
+_STATE_NAME_KEYS = ("stateName", "StateName", "state_name", "name", "Name")
+
+Overlays = dict[str, dict[str, Any]]
+Transitions = dict[str, dict[str, str]]
+
+
+class _Delta:
+    __slots__ = ("state", "overlay", "transition")
+
+    def __init__(
+        self,
+        state: str | None = None,
+        overlay: dict[str, Any] | None = None,
+        transition: tuple[str, str, str] | None = None,
+    ) -> None:
+        self.state = state
+        self.overlay = overlay
+        self.transition = transition
+
+
+class Timeline:
+    """Keyframed replay of one execution's history.
+
+    Args:
+        history: The execution's history events, oldest first.
+        keyframe_interval: Events between full snapshots (K). Larger
+            values use less memory; snapshots replay up to K - 1 deltas.
+    """
+
+    def __init__(self, history: list[HistoryEvent], keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be at least 1")
+        self.keyframe_interval = keyframe_interval
+        self._timestamps: list[str] = []
+        self._deltas: list[_Delta] = []
+        self._keyframes: list[tuple[Overlays, Transitions]] = []
+        self._memo: OrderedDict[tuple[Any, ...], bytes] = OrderedDict()
+
+        nodes: Overlays = {}
+        transitions: Transitions = {}
+        entered: dict[str, datetime] = {}
+        previous: str | None = None
+        for index, event in enumerate(history):
+            timestamp = _iso(event.timestamp)
+            delta, previous = _apply(event, timestamp, nodes, entered, previous)
+            if delta.transition is not None:
+                source, target, at = delta.transition
+                transitions.setdefault(source, {})[target] = at
+            self._timestamps.append(timestamp)
+            self._deltas.append(delta)
+            if index % keyframe_interval == 0:
+                self._keyframes.append((dict(nodes), {source: dict(t) for source, t in transitions.items()}))
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    def snapshot(self, at: int) -> dict[str, Any]:
+        """Overlays after event ``at`` (0-based).
+
+        Raises:
+            IndexError: ``at`` is not an event index.
+        """
+        if not 0 <= at < len(self):
+            raise IndexError(f"No event at index {at}")
+        keyframe = at // self.keyframe_interval
+        nodes, transitions = self._keyframes[keyframe]
+        nodes = dict(nodes)
+        transitions = {source: dict(targets) for source, targets in transitions.items()}
+        for index in range(keyframe * self.keyframe_interval + 1, at + 1):
+            self._replay(self._deltas[index], nodes, transitions)
+        return self._snapshot(at, nodes, transitions)
+
+    def window(self, start: int, count: int) -> list[dict[str, Any]]:
+        """Consecutive snapshots from ``start``, at most ``count`` (capped at MAX_WINDOW)."""
+        first = self.snapshot(start)
+        snapshots = [first]
+        nodes = dict(first["nodes"])
+        transitions = {source: dict(targets) for source, targets in first["transitions"].items()}
+        for index in range(start + 1, min(start + min(count, MAX_WINDOW), len(self))):
+            self._replay(self._deltas[index], nodes, transitions)
+            snapshots.append(self._snapshot(index, dict(nodes), {s: dict(t) for s, t in transitions.items()}))
+        return snapshots
+
+    def diff(self, start: int, end: int) -> dict[str, Any]:
+        """Structural diff of the overlays between events ``start`` and ``end``.
+
+        Node changes are flattened to dotted paths (``output.order.total``)
+        with ``added``, ``removed`` or ``changed`` entries, as rendered by
+        the UI's JsonDiff. States not reached yet count as pending, and
+        unset (null) overlay fields as absent.
+        """
+        before = self.snapshot(start)
+        after = self.snapshot(end)
+        nodes: dict[str, list[dict[str, Any]]] = {}
+        for state in sorted(before["nodes"].keys() | after["nodes"].keys()):
+            old = before["nodes"].get(state)
+            new = after["nodes"].get(state)
+            if old is not new:
+                changes = diff_values(_set_fields(old), _set_fields(new))
+                if changes:
+                    nodes[state] = changes
+        transitions = [
+            {"source": source, "target": target, "timestamp": at}
+            for source, targets in after["transitions"].items()
+            for target, at in targets.items()
+            if target not in before["transitions"].get(source, {})
+        ]
+        return {"from": start, "to": end, "nodes": nodes, "transitions": transitions}
+
+    # -- Serialized, memoized ---------------------------------------------------
+
+    def snapshot_body(self, at: int) -> bytes:
+        return self._memoized(("snapshot", at), lambda: self.snapshot(at))
+
+    def window_body(self, start: int, count: int) -> bytes:
+        count = min(count, MAX_WINDOW)
+        return self._memoized(
+            ("window", start, count),
+            lambda: {"event_count": len(self), "start": start, "snapshots": self.window(start, count)},
+        )
+
+    def diff_body(self, start: int, end: int) -> bytes:
+        return self._memoized(("diff", start, end), lambda: self.diff(start, end))
+
+    def _memoized(self, key: tuple[Any, ...], build: Callable[[], Any]) -> bytes:
+        body = self._memo.get(key)
+        if body is None:
+            body = json.dumps(build()).encode("utf-8")
+            self._memo[key] = body
+            while len(self._memo) > _MEMO_SIZE:
+                self._memo.popitem(last=False)
+        else:
+            self._memo.move_to_end(key)
+        return body
+
+    def _snapshot(self, at: int, nodes: Overlays, transitions: Transitions) -> dict[str, Any]:
+        return {"index": at, "timestamp": self._timestamps[at], "nodes": nodes, "transitions": transitions}
+
+    @staticmethod
+    def _replay(delta: _Delta, nodes: Overlays, transitions: Transitions) -> None:
+        if delta.state is not None:
+            nodes[delta.state] = delta.overlay  # type: ignore[assignment]
+        if delta.transition is not None:
+            source, target, at = delta.transition
+            transitions.setdefault(source, {})[target] = at
+
+
+def diff_values(before: dict[str, Any], after: dict[str, Any]) -> list[dict[str, Any]]:
+    """Flat structural diff of two JSON objects, sorted by path.
+
+    Nested objects are walked into dotted paths; lists and scalars are
+    compared as whole values.
+    """
+    flat_before = _flatten(before)
+    flat_after = _flatten(after)
+    changes: list[dict[str, Any]] = []
+    for path in sorted(flat_before.keys() | flat_after.keys()):
+        kind: Literal["added", "removed", "changed"]
+        if path not in flat_after:
+            kind = "removed"
+        elif path not in flat_before:
+            kind = "added"
+        elif flat_before[path] != flat_after[path]:
+            kind = "changed"
+        else:
+            continue
+        change: dict[str, Any] = {"path": path, "type": kind}
+        if path in flat_before:
+            change["old_value"] = flat_before[path]
+        if path in flat_after:
+            change["new_value"] = flat_after[path]
+        changes.append(change)
+    return changes
+
+
+def _set_fields(overlay: dict[str, Any] | None) -> dict[str, Any]:
+    return {key: value for key, value in (overlay or _default_overlay()).items() if value is not None}
+
+
+def _flatten(value: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    flat: dict[str, Any] = {}
+    for key, item in value.items():
+        path = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(item, dict) and item:
+            flat.update(_flatten(item, path))
+        else:
+            flat[path] = item
+    return flat
+
+
+def _apply(
+    event: HistoryEvent,
+    timestamp: str,
+    nodes: Overlays,
+    entered: dict[str, datetime],
+    previous: str | None,
+) -> tuple[_Delta, str | None]:
+    """Apply one event to ``nodes``; returns its delta and the new current state."""
+    state = state_name(event)
+    if state is None:
+        return _Delta(), previous
+
+    overlay = dict(nodes.get(state) or _default_overlay())
+    status = event_status(event)
+    details = event.details
+    if status is not None:
+        overlay["status"] = status
+    if status == "running" and overlay["entered_at"] is None:
+        overlay["entered_at"] = timestamp
+        entered[state] = event.timestamp
+    if status in _EXIT_STATUSES:
+        overlay["exited_at"] = timestamp
+        if state in entered:
+            overlay["duration_ms"] = round((event.timestamp - entered[state]).total_seconds() * 1000)
+    if details.get("input"):
+        overlay["input"] = _payload(details["input"])
+    if details.get("output"):
+        overlay["output"] = _payload(details["output"])
+    if details.get("error"):
+        error = details["error"]
+        overlay["error"] = error if isinstance(error, str) else json.dumps(error)
+    if details.get("retryAttempt") is not None:
+        overlay["retry_attempt"] = int(details["retryAttempt"])
+
+    transition = None
+    if previous is not None and previous != state and status == "running":
+        transition = (previous, state, timestamp)
+    if status == "running":
+        previous = state
+    nodes[state] = overlay
+    return _Delta(state, overlay, transition), previous
+
+
+def _default_overlay() -> dict[str, Any]:
+    return {
+        "status": "pending",
+        "entered_at": None,
+        "exited_at": None,
+        "duration_ms": None,
+        "input": None,
+        "output": None,
+        "error": None,
+        "retry_attempt": 0,
+    }
+
+
+def state_name(event: HistoryEvent) -> str | None:
+    """State an event belongs to, from the detail keys the UI also looks at."""
+    for key in _STATE_NAME_KEYS:
+        value = event.details.get(key)
+        if value and isinstance(value, str):
+            return value
+    return None
+
+
+def event_status(event: HistoryEvent) -> str | None:
+    """Overlay status for an event, matched on its type and sub-type like the UI does."""
+    event_type = event.event_type.lower()
+    sub_type = (event.sub_type or "").lower()
+
+    def has(*words: str) -> bool:
+        return any(word in event_type or word in sub_type for word in words)
+
+    if has("started", "enter"):
+        return "running"
+    if has("succeeded", "completed"):
+        return "succeeded"
+    if has("failed"):
+        return "failed"
+    if has("caught"):
+        return "caught"
+    if has("retri"):
+        return "running"
+    return None
+
+
+def _payload(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        return {"raw": value}
+    return parsed if isinstance(parsed, (dict, list)) else {"value": parsed}
+
+
+def _iso(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
@@ -9,6 +9,7 @@ from rsf.registry.registry import (
     registered_states,
     startup,
     state,
+    unregister,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "registered_states",
     "startup",
     "state",
+    "unregister",
 ]
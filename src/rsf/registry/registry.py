@@ -72,6 +72,11 @@ def registered_states() -> frozenset[str]:
     return frozenset(_handlers.keys())
 
 
+def unregister(name: str) -> None:
+    """Remove the handler for a named state, if any. Used when reloading handler modules."""
+    _handlers.pop(name, None)
+
+
 def clear() -> None:
     """Remove all registered handlers. Used for test isolation."""
     _handlers.clear()
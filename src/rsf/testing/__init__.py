@@ -1,9 +1,30 @@
 """RSF testing utilities.
 
 Public API for testing RSF workflows:
-- ChaosFixture: Inject failures into specific states during mock SDK runs
+- LocalDurableContext: In-process durable context with concurrent parallel/map
+- MemoryCheckpointStore, SQLiteCheckpointStore: Where LocalDurableContext records operations
+- ChaosFixture: Inject failures and latency into specific states during mock SDK runs
+- VirtualClock: Simulated time for Wait states, retry backoff and handler latency
+- simulated_latency: Declare a handler's real-world latency for simulated runs
+- ReplaySimulator: Model durable replay cost by re-invoking the orchestrator
+- JsonlTraceSink, RingBufferTraceSink: Destinations for LocalRunner transition traces
 """
 
 from rsf.testing.chaos import ChaosFixture
+from rsf.testing.clock import VirtualClock, simulated_latency
+from rsf.testing.local_context import LocalDurableContext, MemoryCheckpointStore, SQLiteCheckpointStore
+from rsf.testing.replay import ReplayReport, ReplaySimulator
+from rsf.testing.trace import JsonlTraceSink, RingBufferTraceSink
 
-__all__ = ["ChaosFixture"]
+__all__ = [
+    "ChaosFixture",
+    "JsonlTraceSink",
+    "LocalDurableContext",
+    "MemoryCheckpointStore",
+    "ReplayReport",
+    "ReplaySimulator",
+    "RingBufferTraceSink",
+    "SQLiteCheckpointStore",
+    "VirtualClock",
+    "simulated_latency",
+]
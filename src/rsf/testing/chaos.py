@@ -1,7 +1,7 @@
 """Chaos injection for RSF workflow testing.
 
 Provides ChaosFixture to inject failures (timeout, exception, throttle, custom)
-into specific workflow states during local mock SDK test runs.
+and latency into specific workflow states during local mock SDK test runs.
 
 Usage as pytest fixture:
     def test_retry_logic():
@@ -15,13 +15,24 @@ Usage as standalone:
     chaos = ChaosFixture()
     chaos.inject_failure("StateName", "exception")
     ctx = chaos.patch(mock_context)
+
+Latency injection (slow dependencies rather than failing ones):
+    chaos = ChaosFixture(clock=VirtualClock())  # omit clock to really sleep
+    chaos.inject_failure("ChargeCard", "latency", latency=LognormalLatency.from_percentiles(p99=2.0),
+                         probability=0.2)
 """
 
 from __future__ import annotations
 
 import functools
+import json
+import math
+import random
+import re
+import time
 from dataclasses import dataclass
-from typing import Any, Callable
+from pathlib import Path
+from typing import Any, Callable, Protocol
 
 
 class ChaosTimeoutError(TimeoutError):
@@ -39,6 +50,157 @@ class ChaosThrottleError(Exception):
         self.state_name = state_name
 
 
+class LatencyDistribution(Protocol):
+    """A source of simulated latencies, in seconds."""
+
+    def sample(self, rng: random.Random) -> float: ...
+
+
+@dataclass(frozen=True)
+class FixedLatency:
+    """Always the same latency."""
+
+    seconds: float
+
+    def sample(self, rng: random.Random) -> float:
+        return self.seconds
+
+
+@dataclass(frozen=True)
+class UniformLatency:
+    """Latency drawn uniformly from [low, high]."""
+
+    low: float
+    high: float
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.uniform(self.low, self.high)
+
+
+# z-score of the 99th percentile of a standard normal distribution
+_Z99 = 2.326
+
+
+@dataclass(frozen=True)
+class LognormalLatency:
+    """Long-tailed latency: ln(latency) is normal with the given median and sigma."""
+
+    median: float
+    sigma: float = 1.0
+
+    @classmethod
+    def from_percentiles(cls, p99: float, p50: float | None = None) -> "LognormalLatency":
+        """Build from a p99 (and optionally p50).
+
+        With only p99, a shape of sigma=1 is assumed (p50 is roughly p99 / 10).
+        """
+        if p50 is None:
+            return cls(median=p99 / math.exp(_Z99), sigma=1.0)
+        if not 0 < p50 <= p99:
+            raise ValueError(f"Expected 0 < p50 <= p99, got p50={p50}, p99={p99}")
+        return cls(median=p50, sigma=math.log(p99 / p50) / _Z99)
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.lognormvariate(math.log(self.median), self.sigma)
+
+
+@dataclass(frozen=True)
+class HistogramLatency:
+    """Latency replayed from observed values, weighted by their counts."""
+
+    values: tuple[float, ...]
+    weights: tuple[float, ...]
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "HistogramLatency":
+        """Load a histogram of latencies in seconds.
+
+        Accepts JSON (a list of samples or of [value, count] pairs) or plain
+        text with one ``value [count]`` per line.
+        """
+        text = Path(path).read_text(encoding="utf-8")
+        try:
+            entries = json.loads(text)
+        except json.JSONDecodeError:
+            entries = [line.split() for line in text.splitlines() if line.strip() and not line.startswith("#")]
+        values: list[float] = []
+        weights: list[float] = []
+        for entry in entries:
+            if isinstance(entry, (int, float, str)):
+                entry = [entry]
+            values.append(float(entry[0]))
+            weights.append(float(entry[1]) if len(entry) > 1 else 1.0)
+        if not values:
+            raise ValueError(f"Latency histogram is empty: {path}")
+        return cls(values=tuple(values), weights=tuple(weights))
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.choices(self.values, weights=self.weights)[0]
+
+
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_seconds(text: str) -> float:
+    """Parse a duration like '150ms', '2s', '1.5m' or '3' (seconds)."""
+    match = re.fullmatch(r"\s*([0-9]*\.?[0-9]+)\s*(ms|s|m|h)?\s*", text)
+    if match is None:
+        raise ValueError(f"Invalid duration '{text}'. Expected e.g. 150ms, 2s, 1m")
+    return float(match.group(1)) * _DURATION_UNITS[match.group(2) or "s"]
+
+
+def parse_latency_spec(spec: str) -> tuple[LatencyDistribution, float]:
+    """Parse a CLI latency spec into (distribution, probability).
+
+    Comma-separated ``key=value`` parts:
+      - ``2s`` or ``fixed=2s``: fixed latency
+      - ``uniform=100ms..2s``: uniform range
+      - ``p99=2s`` with optional ``p50=200ms``: lognormal
+      - ``hist=latencies.json``: replayed histogram file
+      - ``prob=0.1``: probability of injecting on each call (default 1)
+    """
+    options: dict[str, str] = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        key, sep, value = part.partition("=")
+        if not sep:
+            key, value = "fixed", part
+        options[key.strip().lower()] = value.strip()
+
+    probability = float(options.pop("prob", "1"))
+    distribution: LatencyDistribution
+    if "fixed" in options:
+        distribution = FixedLatency(_parse_seconds(options.pop("fixed")))
+    elif "uniform" in options:
+        low, sep, high = options.pop("uniform").partition("..")
+        if not sep:
+            raise ValueError("uniform latency must be written as LOW..HIGH, e.g. uniform=100ms..2s")
+        distribution = UniformLatency(_parse_seconds(low), _parse_seconds(high))
+    elif "p99" in options:
+        p50 = _parse_seconds(options.pop("p50")) if "p50" in options else None
+        distribution = LognormalLatency.from_percentiles(_parse_seconds(options.pop("p99")), p50)
+    elif "hist" in options:
+        distribution = HistogramLatency.from_file(options.pop("hist"))
+    else:
+        raise ValueError(f"Invalid latency spec '{spec}'. Expected fixed=, uniform=, p99= or hist=")
+    if options:
+        raise ValueError(f"Unknown latency option(s): {sorted(options)}")
+    return distribution, probability
+
+
+def latency_percentiles(samples_ms: list[float], percentiles: tuple[int, ...] = (50, 90, 99)) -> dict[str, float]:
+    """Summarize workflow latencies (nearest-rank percentiles plus min/max/mean)."""
+    if not samples_ms:
+        return {}
+    ordered = sorted(samples_ms)
+    summary = {"min": ordered[0]}
+    for p in percentiles:
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        summary[f"p{p}"] = ordered[rank - 1]
+    summary["max"] = ordered[-1]
+    summary["mean"] = sum(ordered) / len(ordered)
+    return summary
+
+
 @dataclass
 class _InjectedFailure:
     """Internal record of an injected failure."""
@@ -46,20 +208,28 @@ class _InjectedFailure:
     state_name: str
     failure_type: str | Callable
     remaining: int | None = None  # None = persistent, int = countdown
+    probability: float = 1.0
+    latency: LatencyDistribution | None = None
 
 
 class ChaosFixture:
     """Inject failures into workflow states during mock SDK test runs.
 
-    Supports four failure types:
+    Supports five failure types:
     - "timeout": raises ChaosTimeoutError
     - "exception": raises RuntimeError
     - "throttle": raises ChaosThrottleError (simulates TooManyRequestsException)
+    - "latency": sleeps for a sampled latency, then calls the handler normally
     - callable: called with (state_name, input_data), return value or exception propagates
+
+    Latency sleeps use ``clock.sleep`` when a clock (e.g. VirtualClock) is
+    given, otherwise a real ``time.sleep``.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, clock: Any | None = None, seed: int | None = None) -> None:
         self._failures: dict[str, _InjectedFailure] = {}
+        self.clock = clock
+        self._random = random.Random(seed)
 
     def inject_failure(
         self,
@@ -67,22 +237,35 @@ class ChaosFixture:
         failure_type: str | Callable,
         *,
         count: int | None = None,
+        probability: float = 1.0,
+        latency: LatencyDistribution | float | None = None,
     ) -> None:
         """Register a failure for a specific state.
 
         Args:
             state_name: The state name to inject failure into.
-            failure_type: One of "timeout", "exception", "throttle",
+            failure_type: One of "timeout", "exception", "throttle", "latency",
                 or a callable(state_name, input_data).
             count: Number of times to trigger (None = every time).
+            probability: Chance (0-1) that each call triggers the failure.
+            latency: Distribution (or fixed seconds) for "latency" failures.
         """
-        valid_types = ("timeout", "exception", "throttle")
+        valid_types = ("timeout", "exception", "throttle", "latency")
         if isinstance(failure_type, str) and failure_type not in valid_types:
             raise ValueError(f"Invalid failure_type '{failure_type}'. Must be one of {valid_types} or a callable.")
+        if not 0.0 <= probability <= 1.0:
+            raise ValueError(f"probability must be between 0 and 1, got {probability}")
+        if failure_type == "latency":
+            if latency is None:
+                raise ValueError("failure_type 'latency' requires a latency distribution")
+            if isinstance(latency, (int, float)):
+                latency = FixedLatency(float(latency))
         self._failures[state_name] = _InjectedFailure(
             state_name=state_name,
             failure_type=failure_type,
             remaining=count,
+            probability=probability,
+            latency=latency,
         )
 
     def reset(self) -> None:
@@ -95,6 +278,9 @@ class ChaosFixture:
         if failure is None:
             return None
 
+        if failure.probability < 1.0 and self._random.random() >= failure.probability:
+            return None
+
         if failure.remaining is not None:
             if failure.remaining <= 0:
                 return None
@@ -113,16 +299,37 @@ class ChaosFixture:
             raise RuntimeError(f"Exception injected for state '{name}'")
         elif ft == "throttle":
             raise ChaosThrottleError(name)
+        elif ft == "latency":
+            self._sleep(failure.latency.sample(self._random))
+            return None
         elif callable(ft):
             return ft(name, input_data)
         else:
             raise ValueError(f"Unknown failure type: {ft}")
 
+    def _sleep(self, seconds: float) -> None:
+        """Sleep on the configured clock, or for real when there is none."""
+        if self.clock is not None:
+            self.clock.sleep(seconds)
+        else:
+            time.sleep(seconds)
+
+    def _call(self, state_name: str | None, call: Callable[[], Any], input_data: Any = None) -> Any:
+        """Run ``call`` for a state, applying any injected failure or latency first."""
+        failure = self._should_trigger(state_name)
+        if failure is None:
+            return call()
+        if failure.failure_type == "latency":
+            self._trigger_failure(failure, input_data)
+            return call()
+        return self._trigger_failure(failure, input_data)
+
     def patch(self, context: Any) -> Any:
         """Patch a MockDurableContext to check for injected failures.
 
         Wraps the context's step() method. When a state has an injected
-        failure, the failure triggers instead of calling the handler.
+        failure, the failure triggers instead of calling the handler;
+        injected latency delays the handler call instead.
 
         Args:
             context: A MockDurableContext instance.
@@ -134,10 +341,7 @@ class ChaosFixture:
 
         @functools.wraps(original_step)
         def patched_step(func: Callable, name: str | None = None, config: Any = None) -> Any:
-            failure = self._should_trigger(name)
-            if failure is not None:
-                return self._trigger_failure(failure, None)
-            return original_step(func, name, config)
+            return self._call(name, lambda: original_step(func, name, config))
 
         context.step = patched_step
         return context
@@ -0,0 +1,143 @@
+"""Virtual clock for RSF local execution.
+
+Lets Wait states, retry backoff and simulated handler latency advance time
+without actually sleeping, so a workflow with hour-long waits runs in
+milliseconds while still reporting how long it would take in production.
+
+Usage:
+    from rsf.testing.clock import VirtualClock, simulated_latency
+
+    @simulated_latency(2.5)  # the real dependency takes ~2.5s
+    def charge_card(event):
+        ...
+
+    clock = VirtualClock(seed=42)
+    runner = LocalRunner(definition, workflow_dir, clock=clock)
+    result = runner.run({})
+    print(result.total_simulated_ms)
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from rsf.dsl.types import JitterStrategy
+
+_LATENCY_ATTR = "__rsf_simulated_latency__"
+
+
+class VirtualClock:
+    """A clock that only moves when told to.
+
+    Time starts at ``start`` (default: the current UTC time) and advances by
+    ``advance()``/``sleep()`` calls. ``elapsed`` is the total simulated time
+    in seconds. A seeded ``random.Random`` is exposed for retry jitter so
+    simulated runs are reproducible.
+    """
+
+    def __init__(self, start: datetime | None = None, seed: int | None = None) -> None:
+        if start is None:
+            start = datetime.now(timezone.utc)
+        elif start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        self.start = start
+        self.random = random.Random(seed)
+        self._elapsed = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        """Simulated seconds since the clock started."""
+        return self._elapsed
+
+    def now(self) -> datetime:
+        """Return the current simulated wall-clock time (timezone-aware, UTC)."""
+        return self.start + timedelta(seconds=self._elapsed)
+
+    def advance(self, seconds: float) -> None:
+        """Move simulated time forward by ``seconds``."""
+        if seconds < 0:
+            raise ValueError(f"Cannot advance clock by a negative duration: {seconds}")
+        self._elapsed += seconds
+
+    def sleep(self, seconds: float) -> None:
+        """Drop-in replacement for ``time.sleep`` that only advances simulated time."""
+        self.advance(seconds)
+
+    def sleep_until(self, when: datetime) -> None:
+        """Advance to ``when`` if it is in the simulated future; otherwise do nothing."""
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        delta = (when - self.now()).total_seconds()
+        if delta > 0:
+            self.advance(delta)
+
+    def rewind(self, elapsed: float) -> None:
+        """Reset simulated time to an earlier ``elapsed`` reading.
+
+        Used to model concurrent branches: each branch runs from the same
+        start time and the clock is then moved to the slowest branch's end.
+        """
+        if elapsed > self._elapsed:
+            raise ValueError(f"Cannot rewind forward: {elapsed} > {self._elapsed}")
+        self._elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return f"VirtualClock(start={self.start.isoformat()}, elapsed={self._elapsed:.3f}s)"
+
+
+def retry_delay(policy: Any, attempt: int, rng: random.Random | None = None) -> float:
+    """Compute the backoff delay in seconds before retry number ``attempt``.
+
+    Follows the ASL semantics of a RetryPolicy: ``IntervalSeconds *
+    BackoffRate ** attempt``, capped by ``MaxDelaySeconds``. With
+    ``JitterStrategy: FULL`` the delay is drawn uniformly from ``[0, delay]``.
+
+    Args:
+        policy: A RetryPolicy model.
+        attempt: Zero-based retry number (0 = first retry).
+        rng: Random source for jitter (defaults to the ``random`` module).
+    """
+    delay = policy.interval_seconds * (policy.backoff_rate**attempt)
+    if policy.max_delay_seconds is not None:
+        delay = min(delay, policy.max_delay_seconds)
+    if policy.jitter_strategy == JitterStrategy.FULL:
+        delay = (rng or random).uniform(0, delay)
+    return float(delay)
+
+
+def parse_timestamp(value: Any) -> datetime:
+    """Parse an ASL timestamp (ISO 8601, ``Z`` suffix allowed) into an aware datetime.
+
+    Raises:
+        ValueError: If ``value`` is not a valid timestamp string.
+    """
+    if not isinstance(value, str):
+        raise ValueError(f"Timestamp must be a string, got {type(value).__name__}")
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def simulated_latency(seconds: float) -> Callable[[Callable], Callable]:
+    """Decorator declaring how long a handler takes in a real deployment.
+
+    Local runners with a VirtualClock advance simulated time by ``seconds``
+    after each call. The handler itself is returned unchanged, so the
+    decorator has no effect when deployed.
+    """
+    if seconds < 0:
+        raise ValueError(f"Simulated latency must be non-negative, got {seconds}")
+
+    def decorator(func: Callable) -> Callable:
+        setattr(func, _LATENCY_ATTR, float(seconds))
+        return func
+
+    return decorator
+
+
+def declared_latency(func: Any) -> float:
+    """Return the latency declared with @simulated_latency, or 0.0."""
+    return getattr(func, _LATENCY_ATTR, 0.0)
@@ -0,0 +1,387 @@
+"""Local stand-in for the Lambda Durable Functions SDK context.
+
+LocalDurableContext runs generated orchestrators (or hand-written durable
+code) in-process for tests. It matches the SDK context API:
+
+    context.step(func, name=None, config=None)
+    context.wait(duration, name=None)
+    context.parallel(functions, name=None, config=None)
+    context.map(inputs, func, name=None, config=None)
+
+Parallel branches and Map items run concurrently on a thread pool, Map items
+are passed to the item function as-is (no copies), and completed operations
+are written to a pluggable CheckpointStore. Stores take an optional
+``max_records`` limit so very large Map states keep memory flat.
+
+Usage:
+    from rsf.testing import LocalDurableContext, SQLiteCheckpointStore
+    from rsf.testing.replay import load_orchestrator
+
+    lambda_handler = load_orchestrator("src/generated/orchestrator.py")
+    ctx = LocalDurableContext(store=SQLiteCheckpointStore("run.db", max_records=10_000))
+    result = lambda_handler({"items": list(range(100_000))}, ctx)
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Protocol, Sequence
+
+from rsf.registry import get_handler
+from rsf.testing.clock import VirtualClock, declared_latency, parse_timestamp
+
+logger = logging.getLogger("rsf.testing.local_context")
+
+
+@dataclass(slots=True)
+class OperationRecord:
+    """One completed durable operation."""
+
+    operation: str  # "step", "wait", "parallel", "map"
+    name: str | None = None
+    result: Any = None
+    error: str | None = None
+    duration: Any = None  # wait duration (Duration, seconds or timestamp string)
+    sim_time: float | None = None  # simulated seconds since the run started, when a clock is attached
+    seq: int = 0  # assigned by the store
+
+
+class CheckpointStore(Protocol):
+    """Destination for completed operations."""
+
+    def save(self, record: OperationRecord) -> None: ...
+
+    def records(self, operation: str | None = None, name: str | None = None) -> Iterator[OperationRecord]: ...
+
+    def __len__(self) -> int: ...
+
+
+class MemoryCheckpointStore:
+    """Keep operation records in memory.
+
+    Args:
+        max_records: Keep only the most recent N records (None keeps all).
+    """
+
+    def __init__(self, max_records: int | None = None) -> None:
+        if max_records is not None and max_records < 0:
+            raise ValueError(f"max_records must be non-negative, got {max_records}")
+        self.max_records = max_records
+        self.total = 0
+        self._records: deque[OperationRecord] = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def save(self, record: OperationRecord) -> None:
+        with self._lock:
+            self.total += 1
+            record.seq = self.total
+            self._records.append(record)
+
+    def records(self, operation: str | None = None, name: str | None = None) -> Iterator[OperationRecord]:
+        with self._lock:
+            snapshot = list(self._records)
+        for record in snapshot:
+            if (operation is None or record.operation == operation) and (name is None or record.name == name):
+                yield record
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class SQLiteCheckpointStore:
+    """Persist operation records to SQLite (results are stored as JSON).
+
+    Useful for large runs that should not hold results in memory, and for
+    inspecting a run afterwards with any SQLite client.
+
+    Args:
+        path: Database file, or ":memory:".
+        max_records: Keep only the most recent N records (None keeps all).
+            Older rows are pruned in batches.
+    """
+
+    _PRUNE_EVERY = 1000
+
+    def __init__(self, path: str | Path = ":memory:", max_records: int | None = None) -> None:
+        if max_records is not None and max_records < 0:
+            raise ValueError(f"max_records must be non-negative, got {max_records}")
+        self.max_records = max_records
+        self.total = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS operations ("
+            "seq INTEGER PRIMARY KEY, operation TEXT NOT NULL, name TEXT, "
+            "result TEXT, error TEXT, duration TEXT, sim_time REAL)"
+        )
+        self.total = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM operations").fetchone()[0]
+
+    def save(self, record: OperationRecord) -> None:
+        result = json.dumps(record.result, default=str)
+        duration = None if record.duration is None else json.dumps(getattr(record.duration, "seconds", record.duration))
+        with self._lock:
+            self.total += 1
+            record.seq = self.total
+            self._conn.execute(
+                "INSERT INTO operations VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (record.seq, record.operation, record.name, result, record.error, duration, record.sim_time),
+            )
+            if self.max_records is not None and (self.total % self._PRUNE_EVERY == 0 or self.max_records == 0):
+                self._prune()
+
+    def _prune(self) -> None:
+        self._conn.execute("DELETE FROM operations WHERE seq <= ?", (self.total - self.max_records,))
+
+    def records(self, operation: str | None = None, name: str | None = None) -> Iterator[OperationRecord]:
+        query = "SELECT seq, operation, name, result, error, duration, sim_time FROM operations"
+        clauses, params = [], []
+        if operation is not None:
+            clauses.append("operation = ?")
+            params.append(operation)
+        if name is not None:
+            clauses.append("name = ?")
+            params.append(name)
+        if self.max_records is not None:
+            clauses.append("seq > ?")
+            params.append(self.total - self.max_records)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY seq", params).fetchall()
+        for seq, op, op_name, result, error, duration, sim_time in rows:
+            yield OperationRecord(
+                operation=op,
+                name=op_name,
+                result=json.loads(result) if result is not None else None,
+                error=error,
+                duration=json.loads(duration) if duration is not None else None,
+                sim_time=sim_time,
+                seq=seq,
+            )
+
+    def __len__(self) -> int:
+        if self.max_records is not None:
+            return min(self.total, self.max_records)
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM operations").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self.max_records is not None:
+                self._prune()
+            self._conn.close()
+
+
+class LocalStepContext:
+    """StepContext passed to step functions (the SDK's only exposes a logger)."""
+
+    def __init__(self) -> None:
+        self.logger = logger
+
+
+class BatchResult:
+    """Result container for parallel/map operations (SDK: BatchResult)."""
+
+    def __init__(self, results: list[Any]) -> None:
+        self._results = results
+
+    def get_results(self) -> list[Any]:
+        return self._results
+
+
+class LocalDurableContext:
+    """In-process implementation of the durable execution context.
+
+    Args:
+        store: Where completed operations are recorded (default: an
+            unbounded MemoryCheckpointStore).
+        clock: Optional VirtualClock. Waits and declared handler latency
+            advance it; concurrent branches each get their own clock and
+            the parent advances by the simulated makespan.
+        max_concurrency: Default worker count for parallel/map when the
+            call's ``config`` has no ``max_concurrency``. 1 runs branches
+            inline on the calling thread.
+        record_branches: Also record operations performed inside parallel
+            branches and Map items (the parent operation is always recorded).
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore | None = None,
+        clock: VirtualClock | None = None,
+        max_concurrency: int | None = None,
+        record_branches: bool = True,
+    ) -> None:
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+        self.store: CheckpointStore = store if store is not None else MemoryCheckpointStore()
+        self.clock = clock
+        self.max_concurrency = max_concurrency
+        self.record_branches = record_branches
+        self._step_overrides: dict[str, Any] = {}
+        self._latency_overrides: dict[str, float] = {}
+        self._sim_offset = 0.0  # simulated time at which this (branch) context's clock started
+        self._is_branch = False
+
+    @property
+    def calls(self) -> list[OperationRecord]:
+        """All records currently held by the store, oldest first."""
+        return list(self.store.records())
+
+    def override_step(self, name: str, result: Any) -> None:
+        """Return ``result`` from the named step instead of calling its function."""
+        self._step_overrides[name] = result
+
+    def override_latency(self, name: str, seconds: float) -> None:
+        """Set the simulated latency of the named step (requires a clock)."""
+        self._latency_overrides[name] = seconds
+
+    # -- SDK context API -------------------------------------------------
+
+    def step(self, func: Callable, name: str | None = None, config: Any = None) -> Any:
+        """Run ``func(step_context)`` and record its result."""
+        if name in self._step_overrides:
+            result = self._step_overrides[name]
+        else:
+            try:
+                result = func(LocalStepContext())
+            except Exception as exc:
+                self._record(OperationRecord("step", name, error=f"{type(exc).__name__}: {exc}"))
+                raise
+        if self.clock is not None:
+            self.clock.advance(self._step_latency(name))
+        self._record(OperationRecord("step", name, result=result))
+        return result
+
+    def wait(self, duration: Any, name: str | None = None) -> None:
+        """Record a wait; with a clock, advance simulated time instead of sleeping.
+
+        ``duration`` may be an SDK Duration, a number of seconds, or an ISO
+        8601 timestamp string to wait until.
+        """
+        if self.clock is not None:
+            if isinstance(duration, str):
+                self.clock.sleep_until(parse_timestamp(duration))
+            else:
+                self.clock.sleep(getattr(duration, "seconds", duration))
+        self._record(OperationRecord("wait", name, duration=duration))
+
+    def parallel(self, functions: Sequence[Callable], name: str | None = None, config: Any = None) -> BatchResult:
+        """Run each ``function(branch_context)`` concurrently and return their results in order."""
+        results = self._run_concurrently(len(functions), lambda ctx, i: functions[i](ctx), config)
+        self._record(OperationRecord("parallel", name, result=results))
+        return BatchResult(results)
+
+    def map(self, inputs: Sequence[Any], func: Callable, name: str | None = None, config: Any = None) -> BatchResult:
+        """Run ``func(item_context, item, index, inputs)`` for every item concurrently.
+
+        Items are passed without copying; item functions must not mutate
+        shared input they do not own.
+        """
+        results = self._run_concurrently(len(inputs), lambda ctx, i: func(ctx, inputs[i], i, inputs), config)
+        self._record(OperationRecord("map", name, result=results))
+        return BatchResult(results)
+
+    # -- internals -------------------------------------------------------
+
+    def _step_latency(self, name: str | None) -> float:
+        if name in self._latency_overrides:
+            return self._latency_overrides[name]
+        try:
+            return declared_latency(get_handler(name)) if name else 0.0
+        except KeyError:
+            return 0.0
+
+    def _record(self, record: OperationRecord) -> None:
+        if self._is_branch and not self.record_branches:
+            return
+        if self.clock is not None:
+            record.sim_time = self._sim_offset + self.clock.elapsed
+        self.store.save(record)
+
+    def _child(self, seed: float | None) -> "LocalDurableContext":
+        child = LocalDurableContext.__new__(LocalDurableContext)
+        child.store = self.store
+        child.max_concurrency = self.max_concurrency
+        child.record_branches = self.record_branches
+        child._step_overrides = self._step_overrides
+        child._latency_overrides = self._latency_overrides
+        child._is_branch = True
+        if self.clock is not None:
+            child.clock = VirtualClock(start=self.clock.now(), seed=seed)
+            child._sim_offset = self._sim_offset + self.clock.elapsed
+        else:
+            child.clock = None
+            child._sim_offset = 0.0
+        return child
+
+    def _workers(self, config: Any, count: int) -> int:
+        limit = getattr(config, "max_concurrency", None) or self.max_concurrency or min(32, (os.cpu_count() or 1) + 4)
+        return max(1, min(limit, count))
+
+    def _run_concurrently(self, count: int, run: Callable[["LocalDurableContext", int], Any], config: Any) -> list[Any]:
+        """Run ``run(child_context, index)`` for ``range(count)`` and return results by index.
+
+        At most ``workers`` branches are in flight at once; no new branches
+        start after one fails, and the failure of the lowest index is raised.
+        """
+        workers = self._workers(config, count)
+        # Seeds come from the parent clock in index order so jitter stays reproducible
+        seeds = [self.clock.random.random() for _ in range(count)] if self.clock is not None else None
+        results: list[Any] = [None] * count
+        branch_seconds = [0.0] * count
+
+        def run_one(index: int) -> None:
+            child = self._child(seeds[index] if seeds is not None else None)
+            results[index] = run(child, index)
+            if child.clock is not None:
+                branch_seconds[index] = child.clock.elapsed
+
+        if workers == 1 or count <= 1:
+            for index in range(count):
+                run_one(index)
+        else:
+            errors: dict[int, BaseException] = {}
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rsf-local") as pool:
+                pending: dict[Future, int] = {}
+                next_index = 0
+                while next_index < count or pending:
+                    while next_index < count and len(pending) < workers * 2 and not errors:
+                        pending[pool.submit(run_one, next_index)] = next_index
+                        next_index += 1
+                    if not pending:
+                        break
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = pending.pop(future)
+                        exc = future.exception()
+                        if exc is not None:
+                            errors[index] = exc
+            if errors:
+                raise errors[min(errors)]
+
+        if self.clock is not None:
+            self.clock.advance(_makespan(branch_seconds, workers))
+        return results
+
+
+def _makespan(durations: list[float], workers: int) -> float:
+    """Simulated time to run ``durations`` in order on ``workers`` parallel workers."""
+    if not durations:
+        return 0.0
+    if workers >= len(durations):
+        return max(durations)
+    free_at = [0.0] * workers
+    for duration in durations:
+        heapq.heappush(free_at, heapq.heappop(free_at) + duration)
+    return max(free_at)
@@ -0,0 +1,275 @@
+"""Per-state CPU and memory profiling for local workflow runs.
+
+StateProfiler wraps regions of the local engine in cProfile and/or
+tracemalloc and attributes the results to the state being executed, split
+into ``engine`` (RSF's own overhead: dispatch, retry/catch, tracing) and
+``handler`` (user code) phases.
+
+Usage:
+    profiler = StateProfiler("both")
+    runner = LocalRunner(definition, workflow_dir, profiler=profiler)
+    with profiler:
+        runner.run(payload)
+    profiler.write_collapsed("rsf-profile")  # flamegraph.pl / speedscope input
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+PROFILE_MODES = ("cpu", "mem", "both")
+PHASES = ("engine", "handler")
+
+# pstats function key: (filename, line number, function name)
+_FuncKey = tuple[str, int, str]
+
+
+@dataclass
+class StateProfile:
+    """Profiling totals for one state across all of its transitions."""
+
+    name: str
+    transitions: int = 0
+    cpu_ms: dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    peak_bytes: int = 0
+    net_blocks: int = 0
+
+    @property
+    def engine_cpu_ms(self) -> float:
+        """CPU time spent in RSF itself, excluding the handler."""
+        return self.cpu_ms["engine"]
+
+    @property
+    def handler_cpu_ms(self) -> float:
+        return self.cpu_ms["handler"]
+
+    @property
+    def net_live_blocks_per_transition(self) -> float:
+        """Net change in live memory blocks per transition.
+
+        This is allocations minus frees (a ``sys.getallocatedblocks()`` delta),
+        not an allocation count: a handler that allocates and frees a million
+        objects scores about zero. It shows what a state retains, not its churn.
+        """
+        return self.net_blocks / self.transitions if self.transitions else 0.0
+
+
+@dataclass
+class _Region:
+    state: str
+    phase: str
+    cpu_start: float
+    mem_start: int = 0
+    peak_seen: int = 0
+    blocks_start: int = 0
+    snapshot: Any = None
+
+
+def _func_label(func: _FuncKey) -> str:
+    filename, line, name = func
+    if filename == "~":  # built-in
+        return name.strip("<>")
+    return f"{os.path.basename(filename)}:{name}:{line}"
+
+
+class StateProfiler:
+    """Attribute CPU and memory to workflow states.
+
+    Args:
+        mode: "cpu" (cProfile), "mem" (tracemalloc) or "both".
+        traceback_depth: Frames kept per tracemalloc allocation.
+    """
+
+    def __init__(self, mode: str = "cpu", traceback_depth: int = 12) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Invalid profile mode '{mode}'. Must be one of {PROFILE_MODES}")
+        self.mode = mode
+        self.cpu = mode in ("cpu", "both")
+        self.mem = mode in ("mem", "both")
+        self.traceback_depth = traceback_depth
+        self.states: dict[str, StateProfile] = {}
+        self._profiles: dict[tuple[str, str], cProfile.Profile] = {}
+        self._stack: list[_Region] = []
+        self._mem_stacks: dict[str, int] = defaultdict(int)
+        self._started_tracemalloc = False
+
+    def __enter__(self) -> "StateProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start tracemalloc if memory profiling is enabled."""
+        if self.mem and not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_depth)
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """Stop tracemalloc if this profiler started it."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _state(self, name: str) -> StateProfile:
+        profile = self.states.get(name)
+        if profile is None:
+            profile = self.states[name] = StateProfile(name=name)
+        return profile
+
+    def record_transition(self, state: str) -> None:
+        """Count one transition out of ``state``."""
+        self._state(state).transitions += 1
+
+    @contextmanager
+    def region(self, state: str, phase: str) -> Iterator[None]:
+        """Attribute everything run inside the block to ``state``/``phase``.
+
+        Regions nest: entering a handler region pauses the enclosing engine
+        region's cProfile so engine and handler time are kept apart.
+        """
+        parent = self._stack[-1] if self._stack else None
+        if self.cpu and parent is not None:
+            self._profiles[(parent.state, parent.phase)].disable()
+
+        region = _Region(state=state, phase=phase, cpu_start=time.process_time())
+        if self.mem and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent.peak_seen = max(parent.peak_seen, peak)
+            tracemalloc.reset_peak()
+            region.mem_start = region.peak_seen = current
+            if parent is None:
+                region.blocks_start = sys.getallocatedblocks()
+                region.snapshot = tracemalloc.take_snapshot()
+        self._stack.append(region)
+
+        profile = None
+        if self.cpu:
+            profile = self._profiles.get((state, phase))
+            if profile is None:
+                profile = self._profiles[(state, phase)] = cProfile.Profile()
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            self._stack.pop()
+            self._close_region(region, parent)
+            if self.cpu and parent is not None:
+                self._profiles[(parent.state, parent.phase)].enable()
+
+    def _close_region(self, region: _Region, parent: _Region | None) -> None:
+        stats = self._state(region.state)
+        elapsed_ms = (time.process_time() - region.cpu_start) * 1000
+        stats.cpu_ms[region.phase] += elapsed_ms
+        if parent is not None:
+            # The parent's clock kept running during this region; keep phases disjoint
+            stats_parent = self._state(parent.state)
+            stats_parent.cpu_ms[parent.phase] -= elapsed_ms
+
+        if not (self.mem and tracemalloc.is_tracing()):
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        region.peak_seen = max(region.peak_seen, peak)
+        stats.peak_bytes = max(stats.peak_bytes, region.peak_seen - region.mem_start)
+        if parent is not None:
+            parent.peak_seen = max(parent.peak_seen, region.peak_seen)
+            return
+        stats.net_blocks += sys.getallocatedblocks() - region.blocks_start
+        snapshot = tracemalloc.take_snapshot()
+        for diff in snapshot.compare_to(region.snapshot, "traceback"):
+            if diff.size_diff <= 0:
+                continue
+            frames = [f"{os.path.basename(f.filename)}:{f.lineno}" for f in reversed(diff.traceback)]
+            self._mem_stacks[";".join([region.state, *frames])] += diff.size_diff
+
+    def _stats(self, state: str, phase: str | None = None) -> pstats.Stats | None:
+        profiles = [p for (s, ph), p in self._profiles.items() if s == state and (phase is None or ph == phase)]
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def top_functions(self, state: str, limit: int = 5) -> list[tuple[str, float]]:
+        """Return the ``limit`` functions with the most self time in ``state`` as (label, ms)."""
+        stats = self._stats(state)
+        if stats is None:
+            return []
+        entries = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)  # type: ignore[attr-defined]
+        return [(_func_label(func), data[2] * 1000) for func, data in entries[:limit]]
+
+    def cpu_collapsed(self) -> dict[str, int]:
+        """Collapsed CPU stacks (``state;phase;frame;...`` -> microseconds of self time).
+
+        cProfile records caller/callee edges rather than full stacks, so
+        stacks are reconstructed by splitting each function's time across
+        its callers in proportion to the time spent via each edge.
+        """
+        collapsed: dict[str, int] = defaultdict(int)
+        for state, phase in self._profiles:
+            stats = self._stats(state, phase)
+            if stats is None:
+                continue
+            raw: dict[_FuncKey, Any] = stats.stats  # type: ignore[attr-defined]
+            callees: dict[_FuncKey, list[tuple[_FuncKey, float]]] = defaultdict(list)
+            for func, (_, _, _, _, callers) in raw.items():
+                for caller, edge in callers.items():
+                    callees[caller].append((func, edge[3]))
+            roots = [func for func, data in raw.items() if not any(c in raw for c in data[4])]
+
+            def emit(func: _FuncKey, path: tuple[str, ...], cumulative: float, seen: frozenset) -> None:
+                total = raw[func][3]
+                scale = cumulative / total if total else 0.0
+                frame_path = (*path, _func_label(func))
+                self_us = int(raw[func][2] * scale * 1_000_000)
+                if self_us:
+                    collapsed[";".join(frame_path)] += self_us
+                if len(frame_path) > 128:
+                    return
+                for child, edge_ct in callees.get(func, []):
+                    if child not in seen:
+                        emit(child, frame_path, edge_ct * scale, seen | {child})
+
+            for root in roots:
+                emit(root, (state, phase), raw[root][3], frozenset({root}))
+        return dict(collapsed)
+
+    def mem_collapsed(self) -> dict[str, int]:
+        """Collapsed allocation stacks (``state;frame;...`` -> bytes still allocated after the state)."""
+        return dict(self._mem_stacks)
+
+    def write_collapsed(self, prefix: str | Path) -> list[Path]:
+        """Write ``<prefix>.cpu.collapsed`` and/or ``<prefix>.mem.collapsed``.
+
+        Each line is ``frame;frame;... weight`` as consumed by flamegraph.pl,
+        inferno and speedscope. Returns the paths written.
+        """
+        prefix = Path(prefix)
+        written: list[Path] = []
+        outputs = []
+        if self.cpu:
+            outputs.append(("cpu", self.cpu_collapsed()))
+        if self.mem:
+            outputs.append(("mem", self.mem_collapsed()))
+        for kind, stacks in outputs:
+            path = prefix.with_name(f"{prefix.name}.{kind}.collapsed")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            lines = [f"{stack} {weight}" for stack, weight in sorted(stacks.items())]
+            path.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+            written.append(path)
+        return written
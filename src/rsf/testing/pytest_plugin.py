@@ -0,0 +1,201 @@
+"""pytest plugin with session-cached RSF workflows, orchestrators and handlers.
+
+Installed through the ``pytest11`` entry point, so any project that has rsf
+installed gets these fixtures:
+
+- ``rsf_workflow(path)`` returns a WorkflowBundle: the parsed definition,
+  the generated orchestrator (``bundle.orchestrator()``) and the workflow's
+  @state handlers (``bundle.register_handlers()``).
+- ``rsf_runner(path, **kwargs)`` returns a LocalRunner for the workflow that
+  reuses the cached definition and imported handler modules.
+
+Everything is parsed, generated or imported once per session and keyed by
+the SHA-256 of the file contents, so editing a workflow mid-session (or two
+paths with identical contents) behaves correctly.
+
+    def test_order(rsf_workflow, rsf_runner):
+        bundle = rsf_workflow("workflow.yaml")
+        assert bundle.definition.start_at == "ValidateOrder"
+        result = rsf_runner("workflow.yaml").run({"total": 10})
+        assert result.success
+
+Under pytest-xdist each worker process has its own caches, and generated
+files go to the worker's own ``tmp_path_factory`` directory, so workers
+never share mutable state.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+import pytest
+
+from rsf.dsl.models import StateMachineDefinition
+from rsf.dsl.parser import load_definition
+from rsf.registry import clear, get_handler, registered_states, state, unregister
+
+
+def _digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@contextmanager
+def _isolated_handler_imports(workflow_dir: Path) -> Iterator[dict[str, Callable]]:
+    """Import a workflow's handlers without touching the caller's registry or modules.
+
+    Puts the workflow directory first on sys.path with any already-imported
+    ``handlers`` package set aside, and collects what the imports register
+    into the yielded dict. The previous registry and modules are restored
+    afterwards.
+    """
+    saved_registry = {name: get_handler(name) for name in registered_states()}
+    saved_modules = {
+        name: sys.modules.pop(name) for name in list(sys.modules) if name == "handlers" or name.startswith("handlers.")
+    }
+    roots = [str(p) for p in (workflow_dir / "src", workflow_dir) if (p / "handlers").is_dir()]
+    sys.path[:0] = roots
+    clear()
+    registrations: dict[str, Callable] = {}
+    try:
+        yield registrations
+        registrations.update({name: get_handler(name) for name in registered_states()})
+    finally:
+        for root in roots:
+            sys.path.remove(root)
+        for name in [m for m in sys.modules if m == "handlers" or m.startswith("handlers.")]:
+            del sys.modules[name]
+        sys.modules.update(saved_modules)
+        clear()
+        for name, func in saved_registry.items():
+            state(name)(func)
+
+
+class WorkflowBundle:
+    """A workflow file with its cached definition, orchestrator and handlers."""
+
+    def __init__(self, path: Path, digest: str, definition: StateMachineDefinition, cache: "RsfSessionCache") -> None:
+        self.path = path
+        self.digest = digest
+        self.definition = definition
+        self.workflow_dir = path.parent
+        self._cache = cache
+        self._handlers: dict[str, Callable] | None = None
+        self._orchestrator: Callable[[dict, Any], Any] | None = None
+        self._workspace: Any = None
+
+    @property
+    def handlers(self) -> dict[str, Callable]:
+        """Handlers the workflow's ``handlers/`` modules register with @state."""
+        if self._handlers is None:
+            from rsf.registry import discover_handlers
+
+            with _isolated_handler_imports(self.workflow_dir) as registrations:
+                for root in (self.workflow_dir / "handlers", self.workflow_dir / "src" / "handlers"):
+                    discover_handlers(root)
+            self._handlers = registrations
+        return self._handlers
+
+    def register_handlers(self) -> None:
+        """Register the cached handlers in the global registry (replacing same-named ones)."""
+        for name, func in self.handlers.items():
+            unregister(name)
+            state(name)(func)
+
+    def orchestrator(self) -> Callable[[dict, Any], Any]:
+        """Return the generated, undecorated ``lambda_handler`` for this workflow.
+
+        Call it with any durable context, e.g. LocalDurableContext. Handlers
+        must be registered (``register_handlers()``) before running it.
+        """
+        if self._orchestrator is None:
+            from rsf.codegen.generator import render_orchestrator
+            from rsf.codegen.state_mappers import map_states
+            from rsf.testing.replay import load_orchestrator
+
+            code = render_orchestrator(self.definition, map_states(self.definition), self.path)
+            target = self._cache.generated_dir / f"orchestrator_{self.digest[:16]}.py"
+            target.write_text(code, encoding="utf-8")
+            with _isolated_handler_imports(self.workflow_dir) as registrations:
+                self._orchestrator = load_orchestrator(target)
+            if self._handlers is None:
+                self._handlers = registrations
+        return self._orchestrator
+
+    def load_handler(self, state_name: str, workflow_dir: Path) -> Any:
+        """LocalRunner handler loader that reuses imported modules until their files change."""
+        if self._workspace is None:
+            from rsf.cli.test_server import WarmWorkspace
+
+            self._workspace = WarmWorkspace(self.path)
+        return self._workspace.load_handler(state_name, workflow_dir)
+
+    def refresh_handlers(self) -> None:
+        """Drop handler modules whose files changed since they were imported."""
+        if self._workspace is not None:
+            self._workspace.refresh()
+
+
+class RsfSessionCache:
+    """Per-session (per-xdist-worker) cache of workflow bundles keyed by content hash.
+
+    Args:
+        generated_dir: Directory for generated orchestrator files.
+    """
+
+    def __init__(self, generated_dir: Path) -> None:
+        self.generated_dir = generated_dir
+        self._definitions: dict[str, StateMachineDefinition] = {}
+        self._bundles: dict[tuple[Path, str], WorkflowBundle] = {}
+
+    def workflow(self, path: str | Path) -> WorkflowBundle:
+        """Return the bundle for ``path``, parsing only if its contents are new."""
+        path = Path(path).resolve()
+        digest = _digest(path)
+        bundle = self._bundles.get((path, digest))
+        if bundle is None:
+            definition = self._definitions.get(digest)
+            if definition is None:
+                definition = self._definitions[digest] = load_definition(path)
+            bundle = self._bundles[(path, digest)] = WorkflowBundle(path, digest, definition, self)
+        return bundle
+
+
+@pytest.fixture(scope="session")
+def rsf_session_cache(tmp_path_factory: pytest.TempPathFactory) -> RsfSessionCache:
+    """Session-wide RSF cache (one per xdist worker)."""
+    return RsfSessionCache(tmp_path_factory.mktemp("rsf-generated"))
+
+
+@pytest.fixture(scope="session")
+def rsf_workflow(rsf_session_cache: RsfSessionCache) -> Callable[[str | Path], WorkflowBundle]:
+    """Factory: ``rsf_workflow(path)`` returns the cached WorkflowBundle for a workflow file."""
+    return rsf_session_cache.workflow
+
+
+@pytest.fixture
+def rsf_runner(rsf_session_cache: RsfSessionCache) -> Callable[..., Any]:
+    """Factory: ``rsf_runner(path, **kwargs)`` returns a LocalRunner backed by the session cache.
+
+    Keyword arguments are passed to LocalRunner; output goes to a quiet
+    console unless ``console`` is given.
+    """
+    from rich.console import Console
+
+    from rsf.cli.test_cmd import LocalRunner
+
+    def make_runner(path: str | Path, **kwargs: Any) -> LocalRunner:
+        bundle = rsf_session_cache.workflow(path)
+        bundle.refresh_handlers()
+        kwargs.setdefault("console", Console(quiet=True))
+        return LocalRunner(
+            definition=bundle.definition,
+            workflow_dir=bundle.workflow_dir,
+            handler_loader=bundle.load_handler,
+            **kwargs,
+        )
+
+    return make_runner
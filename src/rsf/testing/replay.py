@@ -0,0 +1,351 @@
+"""Durable replay cost simulator.
+
+Lambda durable functions re-run the orchestrator from the top on every
+resume, returning completed operations from the checkpoint log instead of
+executing them again. ReplaySimulator models that: it acts as the durable
+context, suspends the invocation at wait (and optionally step) boundaries,
+and re-invokes the generated ``lambda_handler`` until it completes.
+
+Usage:
+    from rsf.testing import ReplaySimulator
+    from rsf.testing.replay import load_orchestrator
+
+    lambda_handler = load_orchestrator("src/generated/orchestrator.py")
+    sim = ReplaySimulator()
+    result = sim.run(lambda_handler, {"order_id": "123"})
+    print(sim.report())
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import time
+import types
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from rsf.testing.clock import VirtualClock, parse_timestamp
+
+SUSPEND_POINTS = frozenset({"step", "wait"})
+
+
+class _Suspend(BaseException):
+    """Ends the current invocation after a new checkpoint.
+
+    Derives from BaseException so generated Catch blocks (``except
+    Exception``) cannot swallow it.
+    """
+
+
+@dataclass
+class _Checkpoint:
+    """One completed operation in the checkpoint log."""
+
+    operation: str
+    name: str | None
+    payload: bytes  # serialized result, as the SDK would store it
+    error: BaseException | None = None
+
+
+@dataclass
+class StateReplayStats:
+    """Replay cost attributed to one named operation (state)."""
+
+    name: str
+    executions: int = 0
+    replays: int = 0
+    bytes_checkpointed: int = 0
+    bytes_deserialized: int = 0
+    replay_cpu_ms: float = 0.0
+
+
+@dataclass
+class ReplayReport:
+    """Aggregate replay cost of one simulated execution."""
+
+    invocations: int
+    states: dict[str, StateReplayStats] = field(default_factory=dict)
+
+    @property
+    def total_replays(self) -> int:
+        return sum(s.replays for s in self.states.values())
+
+    @property
+    def total_bytes_deserialized(self) -> int:
+        return sum(s.bytes_deserialized for s in self.states.values())
+
+    @property
+    def total_replay_cpu_ms(self) -> float:
+        return sum(s.replay_cpu_ms for s in self.states.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a JSON-serializable dict."""
+        return {
+            "invocations": self.invocations,
+            "total_replays": self.total_replays,
+            "total_bytes_deserialized": self.total_bytes_deserialized,
+            "total_replay_cpu_ms": round(self.total_replay_cpu_ms, 3),
+            "states": {
+                name: {
+                    "executions": s.executions,
+                    "replays": s.replays,
+                    "bytes_checkpointed": s.bytes_checkpointed,
+                    "bytes_deserialized": s.bytes_deserialized,
+                    "replay_cpu_ms": round(s.replay_cpu_ms, 3),
+                }
+                for name, s in self.states.items()
+            },
+        }
+
+    def __str__(self) -> str:
+        header = f"{'State':<32} {'Exec':>5} {'Replays':>8} {'Ckpt B':>10} {'Deser B':>10} {'Replay CPU':>11}"
+        lines = [f"Invocations: {self.invocations}", header, "-" * len(header)]
+        for s in self.states.values():
+            lines.append(
+                f"{s.name:<32} {s.executions:>5} {s.replays:>8} {s.bytes_checkpointed:>10} "
+                f"{s.bytes_deserialized:>10} {s.replay_cpu_ms:>9.2f}ms"
+            )
+        lines.append(
+            f"{'TOTAL':<32} {'':>5} {self.total_replays:>8} {'':>10} "
+            f"{self.total_bytes_deserialized:>10} {self.total_replay_cpu_ms:>9.2f}ms"
+        )
+        return "\n".join(lines)
+
+
+class _StepContext:
+    """StepContext passed to step functions — matches real SDK (only has logger)."""
+
+    def __init__(self) -> None:
+        self.logger = None
+
+
+class _BatchResult:
+    """Result container for parallel/map operations (real SDK: BatchResult)."""
+
+    def __init__(self, results: list[Any]):
+        self._results = results
+
+    def get_results(self) -> list[Any]:
+        return self._results
+
+
+class _InlineContext:
+    """Context for Parallel branches and Map items.
+
+    Branch operations run inline within the parent operation; their combined
+    result is checkpointed once by the parent.
+    """
+
+    def __init__(self, sim: "ReplaySimulator"):
+        self._sim = sim
+
+    def step(self, func: Callable, name: str | None = None, config: Any = None) -> Any:
+        self._sim._stats(name).executions += 1
+        return func(_StepContext())
+
+    def wait(self, duration: Any, name: str | None = None) -> None:
+        self._sim._stats(name).executions += 1
+        self._sim._advance_clock(duration)
+
+    def parallel(self, functions: list[Callable], name: str | None = None, config: Any = None) -> _BatchResult:
+        self._sim._stats(name).executions += 1
+        return _BatchResult([fn(_InlineContext(self._sim)) for fn in functions])
+
+    def map(self, inputs: list[Any], func: Callable, name: str | None = None, config: Any = None) -> _BatchResult:
+        self._sim._stats(name).executions += 1
+        return _BatchResult([func(_InlineContext(self._sim), item, i, inputs) for i, item in enumerate(inputs)])
+
+
+class ReplaySimulator:
+    """Durable context that replays the orchestrator from a checkpoint log.
+
+    Matches the SDK context API (step, wait, parallel, map). Each call to
+    ``lambda_handler`` is one invocation: operations already in the log are
+    replayed by deserializing their stored result, and the first new
+    operation is executed, checkpointed and — if it is a suspend point —
+    ends the invocation. ``run()`` keeps re-invoking until the handler
+    returns.
+
+    Args:
+        suspend_on: Operations that end an invocation once checkpointed.
+            The real SDK suspends on waits; adding "step" models the worst
+            case where every step boundary is a resume.
+        clock: Optional VirtualClock advanced by waits.
+        max_invocations: Safety limit against runaway workflows.
+    """
+
+    def __init__(
+        self,
+        suspend_on: frozenset[str] | set[str] = SUSPEND_POINTS,
+        clock: VirtualClock | None = None,
+        max_invocations: int = 10_000,
+    ) -> None:
+        unknown = set(suspend_on) - {"step", "wait", "parallel", "map"}
+        if unknown:
+            raise ValueError(f"Unknown suspend operation(s): {sorted(unknown)}")
+        self.suspend_on = frozenset(suspend_on)
+        self.clock = clock
+        self.max_invocations = max_invocations
+        self.checkpoints: list[_Checkpoint] = []
+        self.invocations = 0
+        self._state_stats: dict[str, StateReplayStats] = {}
+        self._cursor = 0
+        self._cpu_mark = 0.0
+
+    def run(self, handler: Callable[[dict, Any], Any], event: dict) -> Any:
+        """Invoke ``handler(event, self)`` until it completes and return its result.
+
+        Exceptions raised by the workflow propagate after the final invocation.
+        """
+        while True:
+            self.invocations += 1
+            if self.invocations > self.max_invocations:
+                raise RuntimeError(f"Workflow did not complete within {self.max_invocations} invocations")
+            self._cursor = 0
+            self._cpu_mark = time.process_time()
+            try:
+                return handler(event, self)
+            except _Suspend:
+                continue
+
+    def report(self) -> ReplayReport:
+        """Return per-state replay statistics collected so far."""
+        return ReplayReport(invocations=self.invocations, states=dict(self._state_stats))
+
+    # -- SDK context API -------------------------------------------------
+
+    def step(self, func: Callable, name: str | None = None, config: Any = None) -> Any:
+        return self._operation("step", name, lambda: func(_StepContext()))
+
+    def wait(self, duration: Any, name: str | None = None) -> None:
+        def execute() -> None:
+            self._advance_clock(duration)
+
+        self._operation("wait", name, execute)
+
+    def parallel(self, functions: list[Callable], name: str | None = None, config: Any = None) -> _BatchResult:
+        results = self._operation("parallel", name, lambda: [fn(_InlineContext(self)) for fn in functions])
+        return _BatchResult(results)
+
+    def map(self, inputs: list[Any], func: Callable, name: str | None = None, config: Any = None) -> _BatchResult:
+        results = self._operation(
+            "map",
+            name,
+            lambda: [func(_InlineContext(self), item, i, inputs) for i, item in enumerate(inputs)],
+        )
+        return _BatchResult(results)
+
+    # -- internals -------------------------------------------------------
+
+    def _stats(self, name: str | None) -> StateReplayStats:
+        key = name or "<unnamed>"
+        stats = self._state_stats.get(key)
+        if stats is None:
+            stats = self._state_stats[key] = StateReplayStats(name=key)
+        return stats
+
+    def _advance_clock(self, duration: Any) -> None:
+        if self.clock is None:
+            return
+        if isinstance(duration, str):
+            self.clock.sleep_until(parse_timestamp(duration))
+        else:
+            self.clock.sleep(getattr(duration, "seconds", duration))
+
+    def _operation(self, operation: str, name: str | None, execute: Callable[[], Any]) -> Any:
+        stats = self._stats(name)
+        now = time.process_time()
+        replaying = self._cursor < len(self.checkpoints)
+
+        if replaying:
+            # Orchestrator code run since the previous operation was replay work
+            stats.replay_cpu_ms += (now - self._cpu_mark) * 1000
+            checkpoint = self.checkpoints[self._cursor]
+            if checkpoint.operation != operation or checkpoint.name != name:
+                raise RuntimeError(
+                    f"Non-deterministic replay: expected {checkpoint.operation} '{checkpoint.name}' "
+                    f"at position {self._cursor}, got {operation} '{name}'"
+                )
+            self._cursor += 1
+            stats.replays += 1
+            stats.bytes_deserialized += len(checkpoint.payload)
+            start = time.process_time()
+            result = json.loads(checkpoint.payload)
+            stats.replay_cpu_ms += (time.process_time() - start) * 1000
+            self._cpu_mark = time.process_time()
+            if checkpoint.error is not None:
+                raise checkpoint.error
+            return result
+
+        stats.executions += 1
+        error: BaseException | None = None
+        try:
+            result = execute()
+        except Exception as exc:
+            error = exc
+            result = {"Error": type(exc).__name__, "Cause": str(exc)}
+        payload = json.dumps(result, default=str).encode("utf-8")
+        stats.bytes_checkpointed += len(payload)
+        self.checkpoints.append(_Checkpoint(operation=operation, name=name, payload=payload, error=error))
+        self._cursor += 1
+        self._cpu_mark = time.process_time()
+
+        if operation in self.suspend_on:
+            raise _Suspend()
+        if error is not None:
+            raise error
+        # Callers see the deserialized form, exactly as on replay
+        return json.loads(payload)
+
+
+class Duration:
+    """Minimal stand-in for the SDK's Duration, used by load_orchestrator()."""
+
+    def __init__(self, seconds: int = 0):
+        self.seconds = seconds
+
+    @classmethod
+    def from_seconds(cls, value: float) -> "Duration":
+        return cls(seconds=int(value))
+
+    def to_seconds(self) -> int:
+        return self.seconds
+
+    def __repr__(self) -> str:
+        return f"Duration(seconds={self.seconds!r})"
+
+
+def load_orchestrator(path: str | Path) -> Callable[[dict, Any], Any]:
+    """Import a generated orchestrator and return its undecorated ``lambda_handler``.
+
+    The durable execution SDK is stubbed for the duration of the import so
+    the module loads without it installed and ``@durable_execution`` is a
+    no-op. Handler modules (``handlers.*``) must be importable from sys.path.
+    """
+    path = Path(path)
+    sdk = types.ModuleType("aws_durable_execution_sdk_python")
+    sdk.DurableContext = ReplaySimulator  # type: ignore[attr-defined]
+    sdk.durable_execution = lambda f: f  # type: ignore[attr-defined]
+    sdk_config = types.ModuleType("aws_durable_execution_sdk_python.config")
+    sdk_config.Duration = Duration  # type: ignore[attr-defined]
+
+    stub_names = ("aws_durable_execution_sdk_python", "aws_durable_execution_sdk_python.config")
+    saved = {name: sys.modules.get(name) for name in stub_names}
+    sys.modules[stub_names[0]] = sdk
+    sys.modules[stub_names[1]] = sdk_config
+    try:
+        spec = importlib.util.spec_from_file_location(f"_rsf_orchestrator_{abs(hash(path.resolve()))}", path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load orchestrator module: {path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        for name, original in saved.items():
+            if original is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = original
+    return module.lambda_handler
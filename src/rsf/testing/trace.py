@@ -0,0 +1,261 @@
+"""Trace sinks and delta-encoded payload storage for local workflow runs.
+
+LocalRunner hands one dict per state transition to a TraceSink. Sinks are
+plain objects with ``emit``/``flush``/``close``, so a run can stream JSON
+lines to stdout or a file, keep a bounded in-memory window, or both.
+
+Usage:
+    from rsf.testing.trace import JsonlTraceSink, RingBufferTraceSink
+
+    with JsonlTraceSink("trace.jsonl") as sink:
+        LocalRunner(definition, workflow_dir, trace_sink=sink).run(payload)
+
+    tail = RingBufferTraceSink(capacity=100)  # only the last 100 transitions
+    LocalRunner(definition, workflow_dir, trace_sink=tail).run(payload)
+    print(tail.records[-1])
+
+PayloadLog stores verbose-mode input/output payloads as deltas against the
+previous payload, so long loops that touch a few keys per state do not keep
+a full copy of the workflow data for every transition.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import sys
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Iterable, Protocol
+
+
+class TraceSink(Protocol):
+    """Destination for per-transition trace records."""
+
+    def emit(self, record: dict[str, Any]) -> None: ...
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonlTraceSink:
+    """Buffered JSON Lines writer for trace records.
+
+    Records are encoded compactly with ``json`` and written in batches
+    straight to the stream, without going through Rich.
+
+    Args:
+        target: File path, open text stream, or None for stdout. Paths are
+            opened (and closed) by the sink; streams are left open.
+        buffer_size: Number of records held before writing a batch.
+    """
+
+    def __init__(self, target: str | Path | IO[str] | None = None, buffer_size: int = 512) -> None:
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size must be at least 1, got {buffer_size}")
+        self._owns_stream = isinstance(target, (str, Path))
+        if target is None:
+            self._stream: IO[str] = sys.stdout
+        elif isinstance(target, (str, Path)):
+            path = Path(target)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._stream = path.open("w", encoding="utf-8")
+        else:
+            self._stream = target
+        self.buffer_size = buffer_size
+        self._buffer: list[str] = []
+        self._encode = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+    def __enter__(self) -> "JsonlTraceSink":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def emit(self, record: dict[str, Any]) -> None:
+        self._buffer.append(self._encode(record))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records to the stream."""
+        if self._buffer:
+            self._buffer.append("")  # trailing newline
+            self._stream.write("\n".join(self._buffer))
+            self._buffer.clear()
+        self._stream.flush()
+
+    def close(self) -> None:
+        """Flush, and close the stream if the sink opened it."""
+        self.flush()
+        if self._owns_stream:
+            self._stream.close()
+
+
+class RingBufferTraceSink:
+    """Keep only the most recent ``capacity`` trace records in memory.
+
+    Useful as a flight recorder for long or repeated runs: memory stays
+    constant and the tail is available after a failure.
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.records: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self.total = 0
+
+    @property
+    def dropped(self) -> int:
+        """Number of records evicted because the buffer was full."""
+        return self.total - len(self.records)
+
+    def emit(self, record: dict[str, Any]) -> None:
+        self.records.append(record)
+        self.total += 1
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def write_jsonl(self, target: str | Path | IO[str]) -> None:
+        """Write the buffered records as JSON Lines."""
+        with JsonlTraceSink(target) as sink:
+            for record in self.records:
+                sink.emit(record)
+
+
+class MultiTraceSink:
+    """Fan out each record to several sinks."""
+
+    def __init__(self, sinks: Iterable[TraceSink]) -> None:
+        self.sinks = list(sinks)
+
+    def emit(self, record: dict[str, Any]) -> None:
+        for sink in self.sinks:
+            sink.emit(record)
+
+    def flush(self) -> None:
+        for sink in self.sinks:
+            sink.flush()
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+
+# -- delta-encoded payloads ---------------------------------------------
+
+
+@dataclass(frozen=True, slots=True)
+class _Replace:
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class _Extend:
+    """List grew by appending ``items`` to the previous value."""
+
+    items: list[Any]
+
+
+@dataclass(frozen=True, slots=True)
+class _DictPatch:
+    changed: dict[Any, Any]  # key -> nested delta
+    removed: tuple[Any, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class _Keyframe:
+    value: Any
+
+
+def diff_payload(old: Any, new: Any) -> Any:
+    """Return a delta that turns ``old`` into ``new`` (None when they are equal).
+
+    Dicts are diffed key by key, lists that only grew store the appended
+    items, and anything else is replaced wholesale. Values stored in the
+    delta are copies, so later mutation of ``new`` does not affect it.
+    """
+    if type(old) is type(new) and old == new:
+        return None
+    if isinstance(old, dict) and isinstance(new, dict):
+        changed: dict[Any, Any] = {}
+        for key, value in new.items():
+            if key not in old:
+                changed[key] = _Replace(copy.deepcopy(value))
+            else:
+                delta = diff_payload(old[key], value)
+                if delta is not None:
+                    changed[key] = delta
+        removed = tuple(key for key in old if key not in new)
+        return _DictPatch(changed, removed)
+    if isinstance(old, list) and isinstance(new, list) and len(new) > len(old) and new[: len(old)] == old:
+        return _Extend(copy.deepcopy(new[len(old) :]))
+    return _Replace(copy.deepcopy(new))
+
+
+def apply_delta(base: Any, delta: Any) -> Any:
+    """Apply a delta from diff_payload() to ``base`` without mutating it."""
+    if delta is None:
+        return base
+    if isinstance(delta, _Replace):
+        return delta.value
+    if isinstance(delta, _Extend):
+        return [*base, *delta.items]
+    result = dict(base)
+    for key in delta.removed:
+        del result[key]
+    for key, nested in delta.changed.items():
+        result[key] = apply_delta(base.get(key), nested)
+    return result
+
+
+class PayloadLog:
+    """Append-only sequence of JSON-like payloads stored as deltas.
+
+    Every ``keyframe_interval``-th entry is stored whole; the rest are
+    deltas against the entry before them. Reading an entry replays at most
+    ``keyframe_interval - 1`` deltas. Stored values are shared structurally
+    and never mutated; ``get()`` returns a private copy.
+
+    Args:
+        keyframe_interval: Entries between full copies. Larger values use
+            less memory and make random access slower.
+    """
+
+    def __init__(self, keyframe_interval: int = 256) -> None:
+        if keyframe_interval < 1:
+            raise ValueError(f"keyframe_interval must be at least 1, got {keyframe_interval}")
+        self.keyframe_interval = keyframe_interval
+        self._entries: list[Any] = []
+        self._last: Any = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def append(self, value: Any) -> int:
+        """Store ``value`` and return its index."""
+        index = len(self._entries)
+        if index % self.keyframe_interval == 0:
+            self._last = copy.deepcopy(value)
+            self._entries.append(_Keyframe(self._last))
+        else:
+            delta = diff_payload(self._last, value)
+            self._last = apply_delta(self._last, delta)
+            self._entries.append(delta)
+        return index
+
+    def get(self, index: int) -> Any:
+        """Reconstruct the payload stored at ``index``."""
+        if not 0 <= index < len(self._entries):
+            raise IndexError(f"PayloadLog index out of range: {index}")
+        start = index - index % self.keyframe_interval
+        value = self._entries[start].value
+        for delta in self._entries[start + 1 : index + 1]:
+            value = apply_delta(value, delta)
+        return copy.deepcopy(value)
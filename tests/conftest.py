@@ -1,5 +1,20 @@
 """Root conftest for RSF test suite."""
 
+import pytest
+
+from rsf.dsl.parser import set_parse_cache_enabled
+
+
+@pytest.fixture(autouse=True)
+def _no_parse_cache():
+    """Keep the on-disk parse cache from writing .rsf/cache/ next to fixtures and examples.
+
+    Tests of the cache itself enable it under tmp_path.
+    """
+    set_parse_cache_enabled(False)
+    yield
+    set_parse_cache_enabled(True)
+
 
 def pytest_addoption(parser):
     """Add custom CLI options."""
@@ -9,3 +24,19 @@ def pytest_addoption(parser):
         default=False,
         help="Regenerate snapshot golden files instead of comparing.",
     )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the wall-clock benchmarks (marked benchmark).",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmarks unless --run-benchmarks is given; their timings are too noisy for CI."""
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark (use --run-benchmarks)")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
@@ -8,6 +8,9 @@ API matches the real AWS Lambda Durable Functions SDK (DurableFunction.v9):
   context.wait(duration, name=None)
   context.parallel(functions, name=None, config=None)
   context.map(inputs, func, name=None, config=None)
+
+Pass a ``rsf.testing.clock.VirtualClock`` to advance simulated time on
+waits and declared handler latency instead of ignoring them.
 """
 
 from __future__ import annotations
@@ -16,6 +19,9 @@ import copy
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
+from rsf.registry import get_handler
+from rsf.testing.clock import VirtualClock, declared_latency, parse_timestamp
+
 
 class Duration:
     """Mock Duration class matching real SDK dataclass API.
@@ -67,7 +73,8 @@ class StepRecord:
     name: str | None = None
     input_data: Any = None
     result: Any = None
-    duration: Duration | None = None
+    duration: Duration | str | None = None
+    sim_time: float | None = None  # VirtualClock.elapsed when the call completed
 
 
 @dataclass
@@ -91,11 +98,17 @@ class MockDurableContext:
       wait(duration, name=None)
       parallel(functions, name=None)       — each function receives MockDurableContext
       map(inputs, func, name=None)         — func receives (MockDurableContext, item, idx, all)
+
+    With a VirtualClock, wait() advances simulated time, steps advance it by
+    their latency (override_latency() or @simulated_latency on the registered
+    handler), and parallel/map branches are timed as if run concurrently.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, clock: VirtualClock | None = None) -> None:
         self.calls: list[StepRecord] = []
+        self.clock = clock
         self._step_overrides: dict[str, Any] = {}
+        self._latency_overrides: dict[str, float] = {}
 
     def override_step(self, name: str, result: Any) -> None:
         """Pre-configure the return value for a named step.
@@ -104,6 +117,30 @@ class MockDurableContext:
         """
         self._step_overrides[name] = result
 
+    def override_latency(self, name: str, seconds: float) -> None:
+        """Pre-configure the simulated latency for a named step (requires a clock)."""
+        self._latency_overrides[name] = seconds
+
+    def _child(self) -> "MockDurableContext":
+        """Create a branch/item context sharing overrides and the clock."""
+        child = MockDurableContext(clock=self.clock)
+        child._step_overrides = self._step_overrides  # share overrides
+        child._latency_overrides = self._latency_overrides
+        return child
+
+    def _step_latency(self, name: str | None) -> float:
+        if name in self._latency_overrides:
+            return self._latency_overrides[name]
+        try:
+            return declared_latency(get_handler(name)) if name else 0.0
+        except KeyError:
+            return 0.0
+
+    def _record(self, record: StepRecord) -> None:
+        if self.clock is not None:
+            record.sim_time = self.clock.elapsed
+        self.calls.append(record)
+
     def step(self, func: Callable, name: str | None = None, config: Any = None) -> Any:
         """Execute a step function and record the call.
 
@@ -120,17 +157,27 @@ class MockDurableContext:
         else:
             result = func(step_ctx)
 
+        if self.clock is not None:
+            self.clock.advance(self._step_latency(name))
+
         record.result = result
-        self.calls.append(record)
+        self._record(record)
         return result
 
-    def wait(self, duration: Duration, name: str | None = None) -> None:
+    def wait(self, duration: Duration | str, name: str | None = None) -> None:
         """Record a Wait state without actually waiting.
 
         Matches real SDK: wait(duration, name=None) -> None
+        A timestamp string (from Timestamp/TimestampPath waits) waits until
+        that simulated time.
         """
         record = StepRecord(operation="wait", name=name, duration=duration)
-        self.calls.append(record)
+        if self.clock is not None:
+            if isinstance(duration, str):
+                self.clock.sleep_until(parse_timestamp(duration))
+            else:
+                self.clock.sleep(duration.seconds)
+        self._record(record)
 
     def parallel(
         self,
@@ -145,17 +192,10 @@ class MockDurableContext:
         """
         record = StepRecord(operation="parallel", name=name)
 
-        results = []
-        for branch_fn in functions:
-            branch_ctx = MockDurableContext()
-            branch_ctx._step_overrides = self._step_overrides  # share overrides
-            branch_result = branch_fn(branch_ctx)
-            # Merge branch calls for inspection
-            self.calls.extend(branch_ctx.calls)
-            results.append(branch_result)
+        results = self._run_concurrently(functions, lambda fn, ctx: fn(ctx))
 
         record.result = results
-        self.calls.append(record)
+        self._record(record)
         return BranchResult(_results=results)
 
     def map(
@@ -172,14 +212,34 @@ class MockDurableContext:
         """
         record = StepRecord(operation="map", name=name, input_data=copy.deepcopy(inputs))
 
-        results = []
-        for idx, item in enumerate(inputs):
-            item_ctx = MockDurableContext()
-            item_ctx._step_overrides = self._step_overrides  # share overrides
-            result = func(item_ctx, copy.deepcopy(item), idx, inputs)
-            self.calls.extend(item_ctx.calls)
-            results.append(result)
+        results = self._run_concurrently(
+            list(enumerate(inputs)),
+            lambda pair, ctx: func(ctx, copy.deepcopy(pair[1]), pair[0], inputs),
+        )
 
         record.result = results
-        self.calls.append(record)
+        self._record(record)
         return BranchResult(_results=results)
+
+    def _run_concurrently(self, items: list[Any], run: Callable[[Any, "MockDurableContext"], Any]) -> list[Any]:
+        """Run branches one after another, timing them as if concurrent.
+
+        Each branch starts from the same simulated time; afterwards the
+        clock sits at the end of the slowest branch.
+        """
+        start = self.clock.elapsed if self.clock is not None else 0.0
+        end = start
+        results = []
+        for item in items:
+            if self.clock is not None:
+                self.clock.rewind(start)
+            child = self._child()
+            results.append(run(item, child))
+            # Merge branch calls for inspection
+            self.calls.extend(child.calls)
+            if self.clock is not None:
+                end = max(end, self.clock.elapsed)
+        if self.clock is not None:
+            self.clock.rewind(start)
+            self.clock.advance(end - start)
+        return results
@@ -284,3 +284,23 @@ class TestProviderAwareDiff:
             result = runner.invoke(app, ["diff", str(workflow)])
             assert result.exit_code == 0
             assert "custom" in result.output
+
+
+class TestLazyDiff:
+    """compute_diff on lazily parsed definitions."""
+
+    def test_unchanged_states_stay_unvalidated(self):
+        states = {
+            "Start": {"Type": "Task", "Next": "Done"},
+            "Done": {"Type": "Succeed"},
+        }
+        local = parse_definition(
+            {"StartAt": "Start", "States": {**states, "Start": {"Type": "Task", "End": True}}}, lazy=True
+        )
+        deployed = parse_definition({"StartAt": "Start", "States": states}, lazy=True)
+
+        diffs = compute_diff(local, deployed)
+
+        assert [(d.component, d.name) for d in diffs] == [("Transition", "Start"), ("Transition", "Start")]
+        assert type(dict.__getitem__(local.states, "Done")) is dict
+        assert type(dict.__getitem__(deployed.states, "Done")) is dict
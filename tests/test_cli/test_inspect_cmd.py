@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
@@ -117,3 +117,236 @@ def test_inspect_default_port_and_open_browser(tmp_path: Path, monkeypatch: pyte
     _, kwargs = mock_launch.call_args
     assert kwargs.get("port") == 8766
     assert kwargs.get("open_browser") is True
+
+
+def test_inspect_cache_flag(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """rsf inspect --cache <file> passes the SQLite cache path to launch."""
+    monkeypatch.chdir(tmp_path)
+
+    with patch("rsf.inspect.server.launch") as mock_launch:
+        result = runner.invoke(app, ["inspect", "--arn", _SAMPLE_ARN, "--cache", "inspect.db"])
+
+    assert result.exit_code == 0, f"Unexpected exit: {result.output}"
+    _, kwargs = mock_launch.call_args
+    assert kwargs.get("cache_path") == Path("inspect.db")
+
+
+def test_inspect_index_flags(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """rsf inspect --index <file> --index-inputs passes the index options to launch."""
+    monkeypatch.chdir(tmp_path)
+
+    with patch("rsf.inspect.server.launch") as mock_launch:
+        result = runner.invoke(app, ["inspect", "--arn", _SAMPLE_ARN, "--index", "index.db", "--index-inputs"])
+
+    assert result.exit_code == 0, f"Unexpected exit: {result.output}"
+    _, kwargs = mock_launch.call_args
+    assert kwargs.get("index_path") == Path("index.db")
+    assert kwargs.get("index_details") is True
+
+    with patch("rsf.inspect.server.launch"):
+        result = runner.invoke(app, ["inspect", "--arn", _SAMPLE_ARN, "--index-inputs"])
+    assert result.exit_code == 1
+
+
+def test_inspect_redrive(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """rsf inspect redrive re-invokes the given executions and reports the totals."""
+    from rsf.inspect.models import ExecutionDetail, ExecutionStatus
+
+    monkeypatch.chdir(tmp_path)
+    client = MagicMock()
+    client.get_execution = AsyncMock(
+        side_effect=lambda execution_id: ExecutionDetail(
+            execution_id=execution_id,
+            status=ExecutionStatus.FAILED,
+            function_name=_SAMPLE_ARN,
+            start_time="2026-01-01T00:00:00Z",
+            input_payload={"id": execution_id},
+        )
+    )
+    client.invoke_execution = AsyncMock(return_value={"StatusCode": 202, "ResponseMetadata": {"RequestId": "req-1"}})
+
+    with patch("rsf.inspect.client.LambdaInspectClient", return_value=client):
+        result = runner.invoke(
+            app,
+            [
+                "inspect",
+                "redrive",
+                "--arn",
+                _SAMPLE_ARN,
+                "--execution-id",
+                "exec-1",
+                "--execution-id",
+                "exec-2",
+                "--rate",
+                "100/s",
+                "--patch",
+                '{"redrive": true}',
+                "--journal",
+                "redrive.jsonl",
+                "--yes",
+            ],
+        )
+
+    assert result.exit_code == 0, f"Unexpected exit: {result.output}"
+    assert "2 succeeded" in result.output
+    assert client.invoke_execution.await_args.args[0]["redrive"] is True
+    assert len((tmp_path / "redrive.jsonl").read_text().splitlines()) == 2
+
+
+def test_inspect_redrive_invalid_options(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """rsf inspect redrive rejects bad --status, --rate and --patch values."""
+    monkeypatch.chdir(tmp_path)
+    for bad in (["--status", "BROKEN"], ["--rate", "fast"], ["--patch", "[1]"], ["--since", "yesterday"]):
+        result = runner.invoke(app, ["inspect", "redrive", "--arn", _SAMPLE_ARN, *bad])
+        assert result.exit_code == 1, bad
+
+
+def test_inspect_stats(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """rsf inspect stats analyzes finished executions and prints per-state percentiles."""
+    from rsf.inspect.models import ExecutionDetail, ExecutionListResponse, ExecutionStatus, ExecutionSummary
+
+    monkeypatch.chdir(tmp_path)
+    client = MagicMock()
+    client.function_name = _SAMPLE_ARN
+    client.list_executions = AsyncMock(
+        return_value=ExecutionListResponse(
+            executions=[
+                ExecutionSummary(
+                    execution_id="exec-1",
+                    status=ExecutionStatus.SUCCEEDED,
+                    function_name=_SAMPLE_ARN,
+                    start_time="2026-01-01T00:00:00Z",
+                )
+            ]
+        )
+    )
+    client.get_execution = AsyncMock(
+        return_value=ExecutionDetail(
+            execution_id="exec-1",
+            status=ExecutionStatus.SUCCEEDED,
+            function_name=_SAMPLE_ARN,
+            start_time="2026-01-01T00:00:00Z",
+            history=[
+                {
+                    "event_id": 1,
+                    "timestamp": "2026-01-01T00:00:00Z",
+                    "event_type": "StateEntered",
+                    "details": {"stateName": "Validate"},
+                },
+                {
+                    "event_id": 2,
+                    "timestamp": "2026-01-01T00:00:00.250Z",
+                    "event_type": "StateSucceeded",
+                    "details": {"stateName": "Validate"},
+                },
+            ],
+        )
+    )
+
+    with patch("rsf.inspect.client.LambdaInspectClient", return_value=client):
+        result = runner.invoke(app, ["inspect", "stats", "--arn", _SAMPLE_ARN, "--json"])
+        table = runner.invoke(app, ["inspect", "stats", "--arn", _SAMPLE_ARN])
+
+    assert result.exit_code == 0, f"Unexpected exit: {result.output}"
+    report = json.loads(result.output)
+    assert report["executions"] == 1
+    assert report["states"]["Validate"]["duration_ms"]["p50"] == pytest.approx(250, rel=0.01)
+    assert table.exit_code == 0, f"Unexpected exit: {table.output}"
+    assert "Validate" in table.output
+
+
+def test_inspect_export(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """rsf inspect export writes executions to JSON Lines part files and rejects bad options."""
+    from rsf.inspect.models import ExecutionDetail, ExecutionListResponse, ExecutionStatus, ExecutionSummary
+
+    monkeypatch.chdir(tmp_path)
+    client = MagicMock()
+    client.function_name = _SAMPLE_ARN
+    client.list_executions = AsyncMock(
+        return_value=ExecutionListResponse(
+            executions=[
+                ExecutionSummary(
+                    execution_id=f"exec-{n}",
+                    status=ExecutionStatus.SUCCEEDED,
+                    function_name=_SAMPLE_ARN,
+                    start_time="2026-01-01T00:00:00Z",
+                )
+                for n in range(3)
+            ]
+        )
+    )
+    client.get_execution = AsyncMock(
+        side_effect=lambda execution_id: ExecutionDetail(
+            execution_id=execution_id,
+            status=ExecutionStatus.SUCCEEDED,
+            function_name=_SAMPLE_ARN,
+            start_time="2026-01-01T00:00:00Z",
+        )
+    )
+
+    with patch("rsf.inspect.client.LambdaInspectClient", return_value=client):
+        result = runner.invoke(app, ["inspect", "export", "--arn", _SAMPLE_ARN, "--out", "out"])
+        bad_format = runner.invoke(app, ["inspect", "export", "--arn", _SAMPLE_ARN, "--out", "x", "--format", "csv"])
+        bad_status = runner.invoke(app, ["inspect", "export", "--arn", _SAMPLE_ARN, "--out", "x", "--status", "NOPE"])
+
+    assert result.exit_code == 0, f"Unexpected exit: {result.output}"
+    assert "Exported 3 execution(s)" in result.output
+    lines = (tmp_path / "out" / "executions-00000.jsonl").read_text().splitlines()
+    assert [json.loads(line)["execution_id"] for line in lines] == ["exec-0", "exec-1", "exec-2"]
+    assert bad_format.exit_code == 1
+    assert bad_status.exit_code == 1
+
+
+def _write_tfstate(path: Path, *function_names: str) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    resources = [
+        {
+            "type": "aws_lambda_function",
+            "instances": [
+                {"attributes": {"arn": f"arn:aws:lambda:us-east-2:123456789:function:{name}", "function_name": name}}
+            ],
+        }
+        for name in function_names
+    ]
+    (path / "terraform.tfstate").write_text(json.dumps({"resources": resources}))
+
+
+def test_inspect_all_discovers_functions(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """rsf inspect --all serves every function in Terraform state, optionally for one stage."""
+    monkeypatch.chdir(tmp_path)
+    _write_tfstate(tmp_path / "terraform", "orders")
+    _write_tfstate(tmp_path / "terraform" / "prod", "orders-prod", "payments-prod")
+    _write_tfstate(tmp_path / "terraform" / "prod" / ".terraform", "ignored")
+
+    with patch("rsf.inspect.server.launch") as mock_launch:
+        result = runner.invoke(app, ["inspect", "--all", "--function", "extra-fn"])
+
+    assert result.exit_code == 0, f"Unexpected exit: {result.output}"
+    _, kwargs = mock_launch.call_args
+    assert kwargs["function_name"] is None
+    assert kwargs["functions"] == [
+        "extra-fn",
+        "arn:aws:lambda:us-east-2:123456789:function:orders-prod",
+        "arn:aws:lambda:us-east-2:123456789:function:payments-prod",
+        "arn:aws:lambda:us-east-2:123456789:function:orders",
+    ]
+
+    with patch("rsf.inspect.server.launch") as mock_launch:
+        result = runner.invoke(app, ["inspect", "--all", "--stage", "prod"])
+
+    assert result.exit_code == 0, f"Unexpected exit: {result.output}"
+    _, kwargs = mock_launch.call_args
+    assert [name.rsplit(":", 1)[1] for name in kwargs["functions"]] == ["orders-prod", "payments-prod"]
+
+
+def test_inspect_all_invalid_options(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """--stage needs --all, and --all needs at least one function."""
+    monkeypatch.chdir(tmp_path)
+
+    with patch("rsf.inspect.server.launch") as mock_launch:
+        result = runner.invoke(app, ["inspect", "--arn", _SAMPLE_ARN, "--stage", "prod"])
+        assert result.exit_code == 1
+        result = runner.invoke(app, ["inspect", "--all"])
+        assert result.exit_code == 1
+        assert "No Lambda functions found" in result.output
+    mock_launch.assert_not_called()
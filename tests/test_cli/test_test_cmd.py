@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import textwrap
 from io import StringIO
 
@@ -625,3 +626,273 @@ class TestChaosIntegration:
 
         assert result.success is True
         assert result.final_output == {"result": "done"}
+
+
+class TestVirtualClock:
+    """Tests for simulated time in LocalRunner."""
+
+    def test_wait_seconds_advances_simulated_time(self, tmp_path):
+        """A one-hour Wait is reported as simulated time without sleeping."""
+        from rsf.testing.clock import VirtualClock
+
+        defn = _make_definition(
+            {
+                "Start": {"Type": "Wait", "Seconds": 3600, "Next": "Done"},
+                "Done": {"Type": "Succeed"},
+            }
+        )
+
+        clock = VirtualClock()
+        runner = LocalRunner(definition=defn, workflow_dir=tmp_path, clock=clock, console=Console(file=StringIO()))
+        result = runner.run({})
+
+        assert result.success is True
+        assert clock.elapsed == 3600
+        assert result.transitions[0].simulated_ms >= 3_600_000
+        assert result.total_simulated_ms >= 3_600_000
+        assert result.total_duration_ms < 1000
+
+    def test_wait_seconds_path_and_timestamp(self, tmp_path):
+        """SecondsPath and Timestamp waits advance the clock from input data and the simulated now."""
+        from datetime import datetime, timezone
+
+        from rsf.testing.clock import VirtualClock
+
+        defn = _make_definition(
+            {
+                "Start": {"Type": "Wait", "SecondsPath": "$.delay", "Next": "Until"},
+                "Until": {"Type": "Wait", "Timestamp": "2026-01-01T01:00:00Z", "End": True},
+            }
+        )
+
+        clock = VirtualClock(start=datetime(2026, 1, 1, tzinfo=timezone.utc))
+        runner = LocalRunner(definition=defn, workflow_dir=tmp_path, clock=clock, console=Console(file=StringIO()))
+        result = runner.run({"delay": 600})
+
+        assert result.success is True
+        assert result.transitions[0].simulated_ms >= 600_000
+        assert clock.elapsed == 3600
+
+    def test_invalid_seconds_path_fails(self, tmp_path):
+        """A SecondsPath that does not resolve to a number fails with States.Runtime."""
+        defn = _make_definition({"Start": {"Type": "Wait", "SecondsPath": "$.missing", "End": True}})
+
+        runner = LocalRunner(definition=defn, workflow_dir=tmp_path, console=Console(file=StringIO()))
+        result = runner.run({})
+
+        assert result.success is False
+        assert "States.Runtime" in result.error
+
+    def test_retry_backoff_and_declared_latency(self, tmp_path):
+        """Retry backoff and @simulated_latency advance simulated time."""
+        from rsf.testing.clock import VirtualClock
+
+        defn = _make_definition(
+            {
+                "Start": {
+                    "Type": "Task",
+                    "Retry": [{"ErrorEquals": ["States.ALL"], "MaxAttempts": 2, "IntervalSeconds": 5}],
+                    "End": True,
+                },
+            }
+        )
+
+        handlers_dir = tmp_path / "handlers"
+        handlers_dir.mkdir()
+        (handlers_dir / "start.py").write_text(
+            textwrap.dedent("""\
+            from rsf.testing.clock import simulated_latency
+            _call_count = 0
+
+            @simulated_latency(1)
+            def start(event):
+                global _call_count
+                _call_count += 1
+                if _call_count < 3:
+                    raise ValueError('flaky')
+                return {'attempt': _call_count}
+        """)
+        )
+
+        clock = VirtualClock()
+        runner = LocalRunner(definition=defn, workflow_dir=tmp_path, clock=clock, console=Console(file=StringIO()))
+        result = runner.run({})
+
+        assert result.success is True
+        # 3 calls x 1s latency + backoff of 5s then 10s
+        assert clock.elapsed == 18
+
+    def test_json_trace_reports_simulated_ms(self, tmp_path):
+        """JSON trace lines include simulated_ms."""
+        defn = _make_definition({"Start": {"Type": "Wait", "Seconds": 2, "End": True}})
+
+        output = StringIO()
+        runner = LocalRunner(definition=defn, workflow_dir=tmp_path, json_output=True, console=Console(file=output))
+        runner.run({})
+
+        assert "simulated_ms" in output.getvalue()
+
+
+class TestLatencyChaosCli:
+    """Tests for --chaos STATE:latency:SPEC with --runs."""
+
+    def _workflow(self, tmp_path):
+        wf = tmp_path / "workflow.yaml"
+        wf.write_text('rsf_version: "1.0"\nStartAt: Charge\nStates:\n  Charge:\n    Type: Task\n    End: true\n')
+        handlers_dir = tmp_path / "handlers"
+        handlers_dir.mkdir()
+        (handlers_dir / "charge.py").write_text("def charge(event):\n    return {'charged': True}\n")
+        return wf
+
+    def test_latency_percentiles_over_runs(self, tmp_path):
+        """Fixed latency shows up in every simulated percentile."""
+        import json
+
+        from typer.testing import CliRunner
+
+        from rsf.cli.main import app
+
+        wf = self._workflow(tmp_path)
+        result = CliRunner().invoke(
+            app, ["test", str(wf), "--chaos", "Charge:latency:fixed=2s", "--runs", "20", "--json"]
+        )
+
+        assert result.exit_code == 0, result.output
+        summary = json.loads(result.output)
+        assert summary["runs"] == 20
+        assert summary["failures"] == 0
+        assert summary["simulated_ms"]["p50"] >= 2000
+        assert summary["wall_ms"]["max"] < 2000
+
+    def test_invalid_latency_spec_exits(self, tmp_path):
+        """A malformed latency spec is reported as an error."""
+        from typer.testing import CliRunner
+
+        from rsf.cli.main import app
+
+        wf = self._workflow(tmp_path)
+        result = CliRunner().invoke(app, ["test", str(wf), "--chaos", "Charge:latency:p99=later"])
+
+        assert result.exit_code == 1
+        assert "Invalid duration" in result.output
+
+
+class TestProfileCli:
+    """Tests for rsf test --profile."""
+
+    def test_profile_both_writes_collapsed_stacks(self, tmp_path):
+        """--profile both prints the per-state table and writes flamegraph input."""
+        from typer.testing import CliRunner
+
+        from rsf.cli.main import app
+
+        wf = tmp_path / "workflow.yaml"
+        wf.write_text('rsf_version: "1.0"\nStartAt: Work\nStates:\n  Work:\n    Type: Task\n    End: true\n')
+        (tmp_path / "handlers").mkdir()
+        (tmp_path / "handlers" / "work.py").write_text("def work(event):\n    return {'n': sum(range(1000))}\n")
+
+        prefix = tmp_path / "prof"
+        result = CliRunner().invoke(app, ["test", str(wf), "--profile", "both", "--profile-out", str(prefix)])
+
+        assert result.exit_code == 0, result.output
+        assert "Per-State Profile" in result.output
+        assert (tmp_path / "prof.cpu.collapsed").exists()
+        assert (tmp_path / "prof.mem.collapsed").exists()
+
+    def test_invalid_profile_mode_exits(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from rsf.cli.main import app
+
+        wf = tmp_path / "workflow.yaml"
+        wf.write_text('rsf_version: "1.0"\nStartAt: Done\nStates:\n  Done:\n    Type: Succeed\n')
+        result = CliRunner().invoke(app, ["test", str(wf), "--profile", "gpu"])
+
+        assert result.exit_code == 1
+        assert "Invalid profile mode" in result.output
+
+
+class TestTraceSinks:
+    """Tests for pluggable trace sinks and delta-encoded verbose payloads."""
+
+    def _loop(self, iterations):
+        return _make_definition(
+            {
+                "Start": {
+                    "Type": "Choice",
+                    "Choices": [{"Variable": "$.n", "NumericLessThan": iterations, "Next": "Work"}],
+                    "Default": "Done",
+                },
+                "Work": {"Type": "Task", "Next": "Start"},
+                "Done": {"Type": "Succeed"},
+            }
+        )
+
+    def _handlers(self, tmp_path):
+        handlers_dir = tmp_path / "handlers"
+        handlers_dir.mkdir()
+        (handlers_dir / "work.py").write_text("def work(event):\n    return {**event, 'n': event['n'] + 1}\n")
+
+    def test_json_lines_are_compact_and_parseable(self, tmp_path):
+        self._handlers(tmp_path)
+        output = StringIO()
+        runner = LocalRunner(
+            definition=self._loop(3), workflow_dir=tmp_path, json_output=True, console=Console(file=output)
+        )
+        runner.run({"n": 0})
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert [r["from"] for r in records] == ["Start", "Work"] * 3 + ["Start", "Done"]
+
+    def test_ring_buffer_sink_keeps_tail(self, tmp_path):
+        from rsf.testing.trace import RingBufferTraceSink
+
+        self._handlers(tmp_path)
+        sink = RingBufferTraceSink(capacity=2)
+        runner = LocalRunner(
+            definition=self._loop(50), workflow_dir=tmp_path, trace_sink=sink, console=Console(file=StringIO())
+        )
+        runner.run({"n": 0})
+
+        assert [r["from"] for r in sink.records] == ["Start", "Done"]
+        assert sink.total == 102
+
+    def test_verbose_payloads_are_delta_encoded(self, tmp_path):
+        self._handlers(tmp_path)
+        runner = LocalRunner(
+            definition=self._loop(300),
+            workflow_dir=tmp_path,
+            verbose=True,
+            console=Console(file=StringIO(), quiet=True),
+        )
+        result = runner.run({"n": 0, "blob": "x" * 1000})
+
+        work = [t for t in result.transitions if t.from_state == "Work"]
+        assert work[150].input_data == {"n": 150, "blob": "x" * 1000}
+        assert work[150].output_data == {"n": 151, "blob": "x" * 1000}
+        # Only the keyframes hold the blob; every other entry is a small delta
+        assert sum(type(e).__name__ == "_Keyframe" for e in runner.payloads._entries) <= 5
+        assert work[150].handler_result == work[150].output_data
+
+    def test_payloads_not_kept_without_verbose(self, tmp_path):
+        self._handlers(tmp_path)
+        runner = LocalRunner(
+            definition=self._loop(10), workflow_dir=tmp_path, console=Console(file=StringIO(), quiet=True)
+        )
+        result = runner.run({"n": 0, "blob": "x" * 1000})
+
+        assert result.success
+        assert all(t.handler_result is None and t.output_data is None for t in result.transitions)
+
+    def test_trace_out_option(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from rsf.cli.main import app
+
+        wf = tmp_path / "workflow.yaml"
+        wf.write_text('rsf_version: "1.0"\nStartAt: A\nStates:\n  A:\n    Type: Pass\n    End: true\n')
+        trace = tmp_path / "trace.jsonl"
+        result = CliRunner().invoke(app, ["test", str(wf), "--runs", "3", "--trace-out", str(trace)])
+
+        assert result.exit_code == 0, result.output
+        assert [json.loads(line)["from"] for line in trace.read_text().splitlines()] == ["A", "A", "A"]
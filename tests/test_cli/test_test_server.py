@@ -0,0 +1,144 @@
+"""Tests for the warm rsf test worker (rsf test --serve)."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+
+import pytest
+
+from rsf.cli.test_server import TestServer, WarmWorkspace, send_request
+from rsf.registry import clear, get_handler
+
+WORKFLOW = """\
+rsf_version: "1.0"
+StartAt: Greet
+States:
+  Greet:
+    Type: Task
+    End: true
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    wf = tmp_path / "workflow.yaml"
+    wf.write_text(WORKFLOW)
+    handlers = tmp_path / "handlers"
+    handlers.mkdir()
+    (handlers / "greet.py").write_text("def greet(event):\n    return {'greeting': 'hello'}\n")
+    return wf
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _edit(path, text):
+    path.write_text(text)
+    _bump_mtime(path)  # guarantee a visible change on coarse-mtime filesystems
+
+
+class TestWarmWorkspace:
+    def test_runs_with_warm_cache(self, project):
+        server = TestServer(WarmWorkspace(project))
+        first = server.handle({"id": 1, "input": {}})
+        second = server.handle({"id": 2, "input": {}})
+
+        assert first["success"] is True
+        assert first["final_output"] == {"greeting": "hello"}
+        assert second["id"] == 2
+        assert second["reparsed"] is False
+        assert second["reloaded"] == []
+
+    def test_changed_handler_is_reloaded(self, project):
+        server = TestServer(WarmWorkspace(project))
+        server.handle({"input": {}})
+        _edit(project.parent / "handlers" / "greet.py", "def greet(event):\n    return {'greeting': 'hi'}\n")
+
+        response = server.handle({"input": {}})
+
+        assert response["reloaded"] == ["greet"]
+        assert response["final_output"] == {"greeting": "hi"}
+
+    def test_touch_without_edit_does_not_reload(self, project):
+        server = TestServer(WarmWorkspace(project))
+        server.handle({"input": {}})
+        _bump_mtime(project.parent / "handlers" / "greet.py")
+
+        assert server.handle({"input": {}})["reloaded"] == []
+
+    def test_workflow_reparsed_only_when_changed(self, project):
+        server = TestServer(WarmWorkspace(project))
+        server.handle({"input": {}})
+        _edit(project, WORKFLOW.replace("StartAt: Greet", "StartAt: Missing"))
+
+        response = server.handle({"input": {}})
+        assert response["reparsed"] is True
+        assert response["success"] is False
+
+    def test_state_decorated_handler_reloads_without_duplicate_error(self, project):
+        clear()
+        handler = project.parent / "handlers" / "greet.py"
+        source = "from rsf.registry import state\n\n@state('Greet')\ndef greet(event):\n    return {{'v': {}}}\n"
+        handler.write_text(source.format(1))
+        server = TestServer(WarmWorkspace(project))
+        try:
+            assert server.handle({"input": {}})["final_output"] == {"v": 1}
+            _edit(handler, source.format(2))
+            assert server.handle({"input": {}})["final_output"] == {"v": 2}
+            assert get_handler("Greet")({}) == {"v": 2}
+        finally:
+            clear()
+
+    def test_invalid_request_and_commands(self, project):
+        server = TestServer(WarmWorkspace(project))
+        assert "Invalid request" in json.loads(server.handle_line("not json"))["error"]
+        assert server.handle({"command": "ping"}) == {"ok": True}
+        assert server.handle({"command": "shutdown", "id": 9}) == {"id": 9, "ok": True}
+        assert server.running is False
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets not available")
+def test_socket_transport(project, tmp_path):
+    sock_path = tmp_path / "worker.sock"
+    ready = threading.Event()
+    server = TestServer(WarmWorkspace(project))
+    thread = threading.Thread(target=server.serve_socket, args=(sock_path,), kwargs={"on_ready": ready.set})
+    thread.start()
+    try:
+        assert ready.wait(5)
+        response = send_request(sock_path, {"id": "a", "input": {}})
+        assert response["id"] == "a"
+        assert response["success"] is True
+    finally:
+        send_request(sock_path, {"command": "shutdown"})
+        thread.join(5)
+    assert not sock_path.exists()
+
+
+class TestServeCli:
+    def test_serve_over_stdin(self, project):
+        from typer.testing import CliRunner
+
+        from rsf.cli.main import app
+
+        requests = "\n".join(json.dumps(r) for r in [{"id": 1, "input": {}}, {"command": "shutdown"}]) + "\n"
+        result = CliRunner().invoke(app, ["test", str(project), "--serve"], input=requests)
+
+        assert result.exit_code == 0, result.output
+        lines = [json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+        assert lines[0]["success"] is True
+        assert lines[1] == {"ok": True}
+
+    def test_serve_rejects_runs(self, project):
+        from typer.testing import CliRunner
+
+        from rsf.cli.main import app
+
+        result = CliRunner().invoke(app, ["test", str(project), "--serve", "--runs", "2"])
+        assert result.exit_code == 1
+        assert "--serve cannot be combined" in result.output
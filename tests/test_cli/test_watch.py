@@ -9,6 +9,7 @@ from unittest.mock import MagicMock, patch
 import yaml
 
 from rsf.cli.watch_cmd import _format_timestamp, _get_watch_paths, run_cycle
+from rsf.dsl.incremental import WorkflowSession
 
 
 def _write_valid_workflow(path: Path) -> None:
@@ -220,6 +221,32 @@ class TestWatchCycle:
             ctx = mock_provider.deploy.call_args[0][0]
             assert ctx.auto_approve is True
 
+    def test_session_revalidates_edited_state(self, tmp_path, capsys):
+        """run_cycle with a session re-validates only the edited state and prints error lines."""
+        workflow = tmp_path / "workflow.yaml"
+        _write_valid_workflow(workflow)
+        session = WorkflowSession()
+
+        assert run_cycle(workflow, session=session)[0] is True
+
+        workflow.write_text(workflow.read_text().replace("End: true", "Next: Missing"), encoding="utf-8")
+        success, message = run_cycle(workflow, session=session)
+
+        assert success is False
+        assert "2 error(s)" in message  # the dangling Next, and no terminal state left
+        assert session.update(workflow.read_text()).revalidated == "Start"
+        assert f"{workflow}:4:5" in capsys.readouterr().out.replace("\n", "")
+
+    def test_session_structural_error(self, tmp_path):
+        """run_cycle with a session reports Pydantic errors as a count."""
+        workflow = tmp_path / "workflow.yaml"
+        _write_invalid_workflow(workflow)
+
+        success, message = run_cycle(workflow, session=WorkflowSession())
+
+        assert success is False
+        assert "validation error(s)" in message
+
     def test_format_timestamp_returns_bracketed_time(self):
         """_format_timestamp returns [HH:MM:SS] format."""
         ts = _format_timestamp()
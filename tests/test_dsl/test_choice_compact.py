@@ -0,0 +1,185 @@
+"""Tests for the compact DataTestRule representation and its Pydantic facade."""
+
+import gc
+import pickle
+import sys
+import time
+import tracemalloc
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from rsf.dsl import ComparisonOperator, StateMachineDefinition
+from rsf.dsl.choice import Comparison, DataTestRule, _DataTestRuleSchema
+
+RULES = [
+    {"Variable": "$.name", "StringEquals": "Alice", "Next": "A"},
+    {"Variable": "$.n", "NumericGreaterThanEqualsPath": "$.limit", "Next": "B"},
+    {"Variable": "$.n", "NumericLessThan": 2.5},
+    {"Variable": "$.flag", "BooleanEquals": False, "Next": "C"},
+    {"Variable": "$.ts", "TimestampLessThan": "2024-01-01T00:00:00Z"},
+    {"Variable": "$.x", "IsPresent": True, "Next": "D"},
+]
+
+
+class TestCompactRepresentation:
+    def test_comparison_fields(self):
+        rule = DataTestRule.model_validate({"Variable": "$.a", "StringEqualsPath": "$.b", "Next": "N"})
+        assert rule.comparison == Comparison(ComparisonOperator.STRING_EQUALS, "$.b", is_path=True)
+        assert rule.operator is ComparisonOperator.STRING_EQUALS
+        assert rule.is_path
+        assert rule.operand == "$.b"
+        assert rule.get_operator() == ("StringEqualsPath", "$.b")
+
+    def test_operator_attributes(self):
+        rule = DataTestRule.model_validate({"Variable": "$.n", "NumericEquals": 3})
+        assert rule.numeric_equals == 3
+        assert rule.numeric_equals_path is None
+        assert rule.string_equals is None
+
+    def test_operand_coercion_matches_field_types(self):
+        assert DataTestRule.model_validate({"Variable": "$.n", "NumericEquals": "5"}).numeric_equals == 5
+        with pytest.raises(ValidationError, match="StringEquals"):
+            DataTestRule.model_validate({"Variable": "$.s", "StringEquals": 5})
+
+    def test_extra_key_rejected(self):
+        with pytest.raises(ValidationError, match="Extra inputs"):
+            DataTestRule.model_validate({"Variable": "$.s", "StringEquals": "a", "Bogus": 1})
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ({"StringEquals": "a"}, [("missing", ("rules", 0, "Variable"))]),
+            ({"Variable": "$.s", "StringEquals": "a", "Foo": 1}, [("extra_forbidden", ("rules", 0, "Foo"))]),
+            (
+                {"Variable": 1, "NumericEquals": "x"},
+                [
+                    ("string_type", ("rules", 0, "Variable")),
+                    ("int_parsing", ("rules", 0, "NumericEquals", "int")),
+                    ("float_parsing", ("rules", 0, "NumericEquals", "float")),
+                ],
+            ),
+            ({"Variable": "$.s"}, [("value_error", ("rules", 0))]),
+        ],
+    )
+    def test_errors_keep_field_locations(self, raw, expected):
+        adapter = TypeAdapter(dict[str, list[DataTestRule]])
+        with pytest.raises(ValidationError) as exc_info:
+            adapter.validate_python({"rules": [raw]})
+        assert [(e["type"], e["loc"]) for e in exc_info.value.errors()] == expected
+
+    def test_field_given_by_alias_and_name_is_extra(self):
+        with pytest.raises(ValidationError) as exc_info:
+            DataTestRule.model_validate({"Variable": "$.s", "StringEquals": "a", "string_equals": "b"})
+        assert [(e["type"], e["loc"]) for e in exc_info.value.errors()] == [("extra_forbidden", ("string_equals",))]
+
+    def test_several_operators_listed_in_field_order(self):
+        with pytest.raises(ValidationError, match="got: StringEquals, NumericEquals, IsPresent"):
+            DataTestRule.model_validate({"Variable": "$.s", "IsPresent": True, "StringEquals": "a", "NumericEquals": 1})
+
+    def test_operator_attributes_are_read_only(self):
+        rule = DataTestRule.model_validate({"Variable": "$.n", "NumericEquals": 3})
+        with pytest.raises(AttributeError):
+            rule.numeric_equals = 4
+
+    def test_next_assignment_does_not_leak_between_rules(self):
+        first = DataTestRule.model_validate({"Variable": "$.a", "IsNull": True})
+        second = DataTestRule.model_validate({"Variable": "$.b", "IsNull": False})
+        first.next = "Elsewhere"
+        assert "next" in first.model_fields_set
+        assert "next" not in second.model_fields_set
+
+    def test_constructor_and_pickle(self):
+        rule = DataTestRule(Variable="$.a", StringMatches="a*", Next="N")
+        assert rule == DataTestRule.model_validate({"Variable": "$.a", "StringMatches": "a*", "Next": "N"})
+        assert pickle.loads(pickle.dumps(rule)) == rule
+
+
+class TestFacadeCompatibility:
+    @pytest.mark.parametrize("raw", RULES)
+    def test_dump_matches_one_field_per_operator_model(self, raw):
+        rule = DataTestRule.model_validate(raw)
+        legacy = _DataTestRuleSchema.model_validate(raw)
+        for options in ({"by_alias": True}, {}, {"by_alias": True, "exclude_none": True}, {"exclude_unset": True}):
+            assert rule.model_dump(**options) == legacy.model_dump(**options)
+        assert rule.model_dump_json(by_alias=True) == legacy.model_dump_json(by_alias=True)
+
+    def test_dump_key_order(self):
+        dumped = DataTestRule.model_validate(RULES[0]).model_dump(by_alias=True)
+        assert list(dumped)[:4] == ["Variable", "Next", "StringEquals", "StringEqualsPath"]
+        assert len(dumped) == 42
+
+    def test_round_trip_through_definition(self):
+        data = {
+            "StartAt": "Route",
+            "States": {
+                "Route": {
+                    "Type": "Choice",
+                    "Choices": [dict(RULES[0], Next="Done"), {"Not": RULES[2], "Next": "Done"}],
+                    "Default": "Done",
+                },
+                "Done": {"Type": "Succeed"},
+            },
+        }
+        sm = StateMachineDefinition.model_validate(data)
+        dumped = sm.model_dump(by_alias=True, exclude_none=True)
+        assert dumped["States"]["Route"]["Choices"][0] == dict(RULES[0], Next="Done")
+        assert StateMachineDefinition.model_validate(dumped) == sm
+
+    def test_json_schema_unchanged(self):
+        schema = TypeAdapter(DataTestRule).json_schema(mode="serialization")
+        assert schema == _DataTestRuleSchema.model_json_schema(mode="serialization")
+        assert schema["title"] == "DataTestRule"
+        assert len(schema["properties"]) == 42
+
+    def test_instance_holds_three_fields(self):
+        legacy = _DataTestRuleSchema.model_validate(RULES[0])
+        for raw in RULES:
+            rule = DataTestRule.model_validate(raw)
+            assert list(rule.__dict__) == ["variable", "next", "comparison"]
+            assert not hasattr(rule.comparison, "__dict__")  # slotted
+        assert len(legacy.__dict__) == 42
+        assert sys.getsizeof(rule.__dict__) < sys.getsizeof(legacy.__dict__) / 4
+
+
+@pytest.mark.benchmark
+class TestBenchmarks:
+    """Memory and parse-time budgets, measured against the one-field-per-operator model (run with --run-benchmarks)."""
+
+    N = 5000
+
+    def _raw(self) -> list[dict]:
+        return [dict(RULES[i % len(RULES)], Variable=f"$.v{i}") for i in range(self.N)]
+
+    def _bytes_per_rule(self, adapter: TypeAdapter, raw: list[dict]) -> float:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            rules = adapter.validate_python(raw)
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert len(rules) == self.N
+        return current / self.N
+
+    def _seconds(self, adapter: TypeAdapter, raw: list[dict]) -> float:
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            adapter.validate_python(raw)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def test_memory_per_rule(self):
+        raw = self._raw()
+        compact = self._bytes_per_rule(TypeAdapter(list[DataTestRule]), raw)
+        legacy = self._bytes_per_rule(TypeAdapter(list[_DataTestRuleSchema]), raw)
+        assert compact < 500
+        assert compact < legacy / 2
+
+    def test_parse_time(self):
+        raw = self._raw()
+        compact = self._seconds(TypeAdapter(list[DataTestRule]), raw)
+        # The legacy model without its exactly-one-operator check: a lower bound on the old cost
+        legacy = self._seconds(TypeAdapter(list[_DataTestRuleSchema]), raw)
+        assert compact < legacy * 1.5
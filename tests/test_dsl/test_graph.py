@@ -0,0 +1,249 @@
+"""Tests for the shared StateGraph index."""
+
+import time
+
+import pytest
+
+from rsf.codegen.state_mappers import map_states
+from rsf.dsl import StateMachineDefinition
+from rsf.dsl.graph import StateGraph
+from rsf.dsl.validator import validate_definition
+
+
+def _definition(data: dict) -> StateMachineDefinition:
+    return StateMachineDefinition.model_validate(data)
+
+
+def _loop_definition() -> StateMachineDefinition:
+    return _definition(
+        {
+            "StartAt": "Fetch",
+            "States": {
+                "Fetch": {
+                    "Type": "Task",
+                    "Next": "Check",
+                    "Catch": [{"ErrorEquals": ["States.ALL"], "Next": "Failed"}],
+                },
+                "Check": {
+                    "Type": "Choice",
+                    "Choices": [
+                        {"Variable": "$.ready", "BooleanEquals": False, "Next": "Pause"},
+                        {
+                            "And": [
+                                {"Variable": "$.ready", "BooleanEquals": True},
+                                {"Variable": "$.count", "NumericGreaterThan": 0},
+                            ],
+                            "Next": "Done",
+                        },
+                    ],
+                    "Default": "Failed",
+                },
+                "Pause": {"Type": "Wait", "Seconds": 1, "Next": "Fetch"},
+                "Done": {"Type": "Succeed"},
+                "Failed": {"Type": "Fail", "Error": "E", "Cause": "c"},
+                "Orphan": {"Type": "Pass", "End": True},
+            },
+        }
+    )
+
+
+def _chain_definition(size: int) -> StateMachineDefinition:
+    """A retry loop every 10 states, a catch to a shared Fail and a Parallel every 100."""
+    states: dict = {}
+    for i in range(size):
+        name = f"S{i}"
+        nxt = f"S{i + 1}" if i + 1 < size else "Done"
+        if i % 100 == 50:
+            states[name] = {
+                "Type": "Parallel",
+                "Branches": [{"StartAt": f"B{i}", "States": {f"B{i}": {"Type": "Task", "End": True}}}],
+                "Next": nxt,
+            }
+        elif i % 10 == 9:
+            states[name] = {
+                "Type": "Choice",
+                "Choices": [{"Variable": "$.retry", "BooleanEquals": True, "Next": f"S{i - 9}"}],
+                "Default": nxt,
+            }
+        else:
+            states[name] = {
+                "Type": "Task",
+                "Next": nxt,
+                "Catch": [{"ErrorEquals": ["States.ALL"], "Next": "Failed"}],
+            }
+    states["Done"] = {"Type": "Succeed"}
+    states["Failed"] = {"Type": "Fail", "Error": "E", "Cause": "c"}
+    return _definition({"StartAt": "S0", "States": states})
+
+
+class TestAdjacency:
+    def test_successors_in_reference_order(self):
+        graph = StateGraph.of(_loop_definition())
+        assert graph.successors("Fetch") == ["Check", "Failed"]
+        assert graph.successors("Check") == ["Failed", "Pause", "Done"]
+
+    def test_predecessors(self):
+        graph = StateGraph.of(_loop_definition())
+        assert graph.predecessors("Failed") == ["Fetch", "Check"]
+        assert graph.predecessors("Fetch") == ["Pause"]
+
+    def test_dangling_edges_carry_field_paths(self):
+        graph = StateGraph.of(
+            _definition(
+                {
+                    "StartAt": "C",
+                    "States": {
+                        "C": {
+                            "Type": "Choice",
+                            "Choices": [
+                                {"Variable": "$.x", "BooleanEquals": True, "Next": "Done"},
+                                {"Not": {"Variable": "$.x", "BooleanEquals": True}, "Next": "Gone"},
+                            ],
+                            "Default": "Done",
+                        },
+                        "Done": {"Type": "Succeed"},
+                    },
+                }
+            )
+        )
+        assert [(e.source, e.kind, e.path) for e in graph.dangling] == [("C", "Choice", ".Choices[1].Next")]
+
+    def test_dangling_references(self):
+        graph = StateGraph.of(
+            _definition(
+                {
+                    "StartAt": "A",
+                    "States": {
+                        "A": {"Type": "Task", "Next": "Missing"},
+                        "B": {"Type": "Succeed"},
+                    },
+                }
+            )
+        )
+        assert [(e.source, e.target, e.kind) for e in graph.dangling] == [("A", "Missing", "Next")]
+        assert graph.successors("A") == []
+        assert graph.next_state("A") is None
+
+    def test_terminals(self):
+        assert StateGraph.of(_loop_definition()).terminals == ["Done", "Failed", "Orphan"]
+
+
+class TestOrders:
+    def test_bfs_order_and_unreachable(self):
+        graph = StateGraph.of(_loop_definition())
+        assert graph.bfs_order() == ["Fetch", "Check", "Failed", "Pause", "Done"]
+        assert graph.unreachable() == ["Orphan"]
+
+    def test_bfs_matches_map_states(self):
+        definition = _loop_definition()
+        assert [m.state_name for m in map_states(definition)] == StateGraph.of(definition).bfs_order()
+
+    def test_sccs_collapse_loops_in_topological_order(self):
+        graph = StateGraph.of(_loop_definition())
+        components = graph.sccs()
+        assert ["Fetch", "Check", "Pause"] in components
+        order = graph.topological_order()
+        assert order.index("Fetch") < order.index("Done")
+        assert order.index("Check") < order.index("Failed")
+        assert sorted(order) == sorted(graph.names)
+        assert graph.has_cycle()
+
+    def test_acyclic(self):
+        graph = StateGraph.of(
+            _definition(
+                {
+                    "StartAt": "A",
+                    "States": {"A": {"Type": "Pass", "Next": "B"}, "B": {"Type": "Succeed"}},
+                }
+            )
+        )
+        assert graph.topological_order() == ["A", "B"]
+        assert not graph.has_cycle()
+
+    def test_next_chain_stops_on_cycle(self):
+        assert StateGraph.of(_loop_definition()).next_chain() == ["Fetch", "Check"]
+
+
+class TestScopes:
+    def _nested(self) -> StateMachineDefinition:
+        return _definition(
+            {
+                "StartAt": "Fan",
+                "States": {
+                    "Fan": {
+                        "Type": "Parallel",
+                        "Branches": [
+                            {"StartAt": "L", "States": {"L": {"Type": "Task", "End": True}}},
+                            {
+                                "StartAt": "Each",
+                                "States": {
+                                    "Each": {
+                                        "Type": "Map",
+                                        "ItemProcessor": {
+                                            "StartAt": "Item",
+                                            "States": {"Item": {"Type": "Task", "End": True}},
+                                        },
+                                        "End": True,
+                                    }
+                                },
+                            },
+                        ],
+                        "End": True,
+                    }
+                },
+            }
+        )
+
+    def test_nested_scope_paths(self):
+        graph = StateGraph.of(self._nested())
+        assert [scope.path for scope in graph.iter_scopes()] == [
+            "",
+            "States.Fan.Branches[0].",
+            "States.Fan.Branches[1].",
+            "States.Fan.Branches[1].States.Each.ItemProcessor.",
+        ]
+        assert [child.owner for child in graph.children_of("Fan")] == ["Fan", "Fan"]
+
+    def test_branch_graphs_are_shared(self):
+        definition = self._nested()
+        graph = StateGraph.of(definition)
+        branch = definition.states["Fan"].branches[0]
+        assert StateGraph.of(branch) is graph.children[0]
+
+
+class TestMemoization:
+    def test_built_once_per_definition(self):
+        definition = _loop_definition()
+        assert StateGraph.of(definition) is StateGraph.of(definition)
+
+    def test_rebuilt_when_states_replaced(self):
+        definition = _loop_definition()
+        first = StateGraph.of(definition)
+        definition.states = {"Only": definition.states["Done"]}
+        definition.start_at = "Only"
+        assert StateGraph.of(definition) is not first
+        assert StateGraph.of(definition).bfs_order() == ["Only"]
+
+
+class TestLargeDefinition:
+    def test_20k_states(self):
+        """Deep chains are walked iteratively, without hitting the recursion limit."""
+        definition = _chain_definition(20_000)
+        graph = StateGraph(definition.states, definition.start_at)
+        assert len(graph.bfs_order()) == 20_002
+        assert len(graph.sccs()) == 2_002
+
+        assert validate_definition(definition) == []
+        assert len(map_states(definition)) == 20_002
+
+    @pytest.mark.benchmark
+    def test_20k_states_linear(self):
+        """Run with --run-benchmarks."""
+        definition = _chain_definition(20_000)
+        start = time.perf_counter()
+        graph = StateGraph(definition.states, definition.start_at)
+        assert len(graph.bfs_order()) == 20_002
+        assert len(graph.sccs()) == 2_002
+        elapsed = time.perf_counter() - start
+        # One linear pass; generous bound so slow machines do not flake
+        assert elapsed < 2.0
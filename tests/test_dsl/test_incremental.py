@@ -0,0 +1,248 @@
+"""Tests for source maps and incremental re-validation (WorkflowSession, StateGraph.replace_state)."""
+
+import time
+
+import pytest
+import yaml
+
+from rsf.dsl import StateMachineDefinition, validate_state
+from rsf.dsl.graph import StateGraph
+from rsf.dsl.incremental import WorkflowSession
+from rsf.dsl.parser import parse_definition, parse_yaml
+from rsf.dsl.sourcemap import load_with_source_map
+from rsf.dsl.validator import validate_definition
+
+WORKFLOW = """\
+rsf_version: "1.0"
+StartAt: Fetch
+States:
+  Fetch:
+    Type: Task
+    Next: Check
+    Catch:
+      - ErrorEquals: [States.ALL]
+        Next: Failed
+
+  Check:
+    Type: Choice
+    Choices:
+      - Variable: $.ready
+        BooleanEquals: true
+        Next: Fan
+    Default: Failed
+  Fan:
+    Type: Parallel
+    Branches:
+      - StartAt: Work
+        States:
+          Work:
+            Type: Task
+            End: true
+    Next: Done
+  Done:
+    Type: Succeed
+  Failed:
+    Type: Fail
+TimeoutSeconds: 60
+"""
+
+
+def _chain(size: int, edits: dict[int, str] | None = None) -> str:
+    edits = edits or {}
+    lines = ['rsf_version: "1.0"', "StartAt: S0", "States:"]
+    for i in range(size):
+        lines += [
+            f"  S{i}:",
+            "    Type: Task",
+            f"    Next: {edits.get(i, f'S{i + 1}' if i + 1 < size else 'Done')}",
+            "    Retry:",
+            "      - ErrorEquals: [States.TaskFailed]",
+            "        MaxAttempts: 3",
+        ]
+    lines += ["  Done:", "    Type: Succeed"]
+    return "\n".join(lines) + "\n"
+
+
+def _full_errors(text: str) -> list[tuple[str, str, str]]:
+    return [(e.message, e.path, e.severity) for e in validate_definition(parse_definition(parse_yaml(text)))]
+
+
+def _errors(analysis) -> list[tuple[str, str, str]]:
+    return [(e.message, e.path, e.severity) for e in analysis.errors]
+
+
+class TestSourceMap:
+    def test_state_spans(self):
+        _, source_map = load_with_source_map(WORKFLOW)
+        assert source_map.names == ["Fetch", "Check", "Fan", "Done", "Failed"]
+        assert source_map.starts == [3, 10, 17, 26, 28]
+        # The blank line after Fetch belongs to Fetch; Failed ends before TimeoutSeconds
+        assert source_map.ends == [9, 16, 25, 27, 29]
+        assert source_map.block_states and not source_map.aliases
+
+    def test_locate(self):
+        _, source_map = load_with_source_map(WORKFLOW)
+        assert source_map.locate("States.Check") == (11, 3)
+        assert source_map.locate("States.Fetch.Catch[0].Next") == (9, 9)
+        assert source_map.locate("States.Fan.Branches[0].States.Work.End") == (25, 13)
+        assert source_map.locate(("States", "Fetch", "Task", "Catch", 0)) == (8, 9)
+        assert source_map.locate("TimeoutSeconds") == (31, 1)
+        assert source_map.locate("Nowhere") is None
+
+    def test_flow_style_states_not_incremental(self):
+        _, source_map = load_with_source_map("StartAt: A\nStates: {A: {Type: Succeed}}\n")
+        assert not source_map.block_states
+
+
+class TestReplaceState:
+    def _assert_matches_fresh(self, graph: StateGraph, definition: StateMachineDefinition) -> None:
+        fresh = StateGraph(definition.states, definition.start_at)
+        for name in fresh.names:
+            assert graph.successors(name) == fresh.successors(name)
+            assert sorted(graph.predecessors(name)) == sorted(fresh.predecessors(name))
+            assert graph.next_state(name) == fresh.next_state(name)
+        assert graph.dangling == fresh.dangling
+        assert graph.terminals == fresh.terminals
+        assert graph.unreachable() == fresh.unreachable()
+        assert [scope.path for scope in graph.iter_scopes()] == [scope.path for scope in fresh.iter_scopes()]
+
+    @pytest.mark.parametrize(
+        "name, state",
+        [
+            ("Check", {"Type": "Choice", "Choices": [{"Variable": "$.x", "IsNull": True, "Next": "Done"}]}),
+            ("Fetch", {"Type": "Task", "Next": "Missing"}),
+            ("Done", {"Type": "Pass", "Next": "Fetch"}),
+            ("Fan", {"Type": "Pass", "Next": "Done"}),
+            (
+                "Fetch",
+                {
+                    "Type": "Parallel",
+                    "Branches": [{"StartAt": "X", "States": {"X": {"Type": "Succeed"}}}],
+                    "End": True,
+                },
+            ),
+        ],
+    )
+    def test_matches_fresh_graph(self, name, state):
+        definition = parse_definition(parse_yaml(WORKFLOW))
+        graph = StateGraph.of(definition)
+        graph.bfs_order()  # populate the reachability cache
+        graph.replace_state(name, validate_state(state))
+        updated = definition.model_copy(update={"states": graph.states})
+        graph.bind(updated)
+        self._assert_matches_fresh(graph, updated)
+        # The original definition is untouched and gets its own graph again
+        assert StateGraph.of(definition) is not graph
+        assert definition.states[name] is not graph.states[name]
+
+    def test_bind_rejects_other_states(self):
+        definition = parse_definition(parse_yaml(WORKFLOW))
+        with pytest.raises(ValueError):
+            StateGraph.of(definition).bind(parse_definition(parse_yaml(WORKFLOW)))
+
+
+class TestWorkflowSession:
+    def test_single_state_edits_match_full_validation(self):
+        session = WorkflowSession()
+        assert session.update(_chain(20)).revalidated is None
+        # Each step differs from the previous one in a single state
+        steps = [
+            ({5: "Missing"}, "S5"),
+            ({}, "S5"),
+            ({5: "Done"}, "S5"),
+            ({5: "Done", 19: "S0"}, "S19"),
+            ({5: "Done", 19: "S0", 3: "S3"}, "S3"),
+            ({19: "S0", 3: "S3"}, "S5"),
+        ]
+        for edits, state in steps:
+            text = _chain(20, edits)
+            analysis = session.update(text)
+            assert analysis.revalidated == state
+            assert _errors(analysis) == _full_errors(text)
+
+    def test_errors_carry_lines(self):
+        session = WorkflowSession()
+        session.update(_chain(5))
+        analysis = session.update(_chain(5, {2: "Missing"}))
+        (error,) = [e for e in analysis.errors if "Missing" in e.message]
+        assert error.path == "States.S2.Next"
+        assert (error.line, error.column) == (18, 5)
+
+    def test_inserted_lines_shift_later_positions(self):
+        session = WorkflowSession()
+        text = _chain(5)
+        session.update(text)
+        grown = text.replace("    Next: S2\n", "    Comment: longer\n    Next: S2\n")
+        session.update(grown)
+        analysis = session.update(grown.replace("Next: S4", "Next: Missing"))
+        assert analysis.revalidated == "S3"
+        (error,) = [e for e in analysis.errors if "Missing" in e.message]
+        assert error.line == grown.splitlines().index("    Next: S4") + 1
+
+    def test_structural_error_names_state_and_keeps_base(self):
+        session = WorkflowSession()
+        session.update(_chain(3))
+        broken = session.update(_chain(3).replace("    Type: Task\n    Next: S2", "    Type: Bogus\n    Next: S2"))
+        assert broken.definition is None
+        assert broken.revalidated == "S1"
+        assert broken.errors[0].path.startswith("States.S1")
+        assert broken.errors[0].line == 10
+        assert session.update(_chain(3, {1: "Missing"})).revalidated == "S1"
+
+    @pytest.mark.parametrize(
+        "edit",
+        [
+            lambda text: text.replace("  S1:", "  Renamed:"),
+            lambda text: text.replace("StartAt: S0", "StartAt: S1"),
+            lambda text: text.replace("  Done:", "  Extra:\n    Type: Succeed\n  Done:"),
+            lambda text: text.replace("  S2:", "  Inserted:\n    Type: Succeed\n  S2:"),
+            lambda text: text.replace("    Next: S1", "    Next: &target S1"),
+            lambda text: text.replace("    Next: S1", "    Next: S2").replace("    Next: S3", "    Next: Done"),
+        ],
+    )
+    def test_other_edits_reparse_everything(self, edit):
+        session = WorkflowSession()
+        text = _chain(5)
+        session.update(text)
+        edited = edit(text)
+        analysis = session.update(edited)
+        assert analysis.revalidated is None
+        assert _errors(analysis) == _full_errors(edited)
+
+    def test_yaml_error_keeps_base(self):
+        session = WorkflowSession()
+        session.update(_chain(3))
+        with pytest.raises(yaml.YAMLError):
+            session.update("States: [unclosed")
+        assert session.update(_chain(3, {0: "S2"})).revalidated == "S0"
+
+    def test_not_a_mapping(self):
+        analysis = WorkflowSession().update("- just\n- a list\n")
+        assert analysis.definition is None
+        assert analysis.errors[0].message == "Workflow must be a YAML mapping"
+
+    def test_single_state_edit_on_large_workflow_revalidates_only_that_state(self):
+        session = WorkflowSession()
+        base = session.update(_chain(2000)).definition
+        analysis = session.update(_chain(2000, {1999: "Missing"}))
+
+        assert analysis.revalidated == "S1999"
+        assert [e.path for e in analysis.errors] == ["States.S1999.Next", "States.Done"]
+        states = analysis.definition.states
+        assert all(states[name] is base.states[name] for name in states if name != "S1999")
+        assert states["S1999"] is not base.states["S1999"]
+
+    @pytest.mark.benchmark
+    def test_single_state_edit_is_fast_on_large_workflow(self):
+        """Run with --run-benchmarks."""
+        session = WorkflowSession()
+        start = time.perf_counter()
+        session.update(_chain(2000))
+        full = time.perf_counter() - start
+
+        start = time.perf_counter()
+        analysis = session.update(_chain(2000, {1999: "Missing"}))
+        incremental = time.perf_counter() - start
+
+        assert analysis.revalidated == "S1999"
+        assert incremental < full / 5
@@ -2,9 +2,10 @@
 
 import json
 
+import pytest
 import yaml
 
-from rsf.dsl.parser import load_definition, parse_definition, parse_yaml
+from rsf.dsl.parser import load_definition, parse_definition, parse_yaml, set_parse_cache_enabled
 from rsf.schema.generate import generate_json_schema, write_json_schema
 
 
@@ -63,3 +64,146 @@ class TestJSONSchema:
         assert path.exists()
         schema = json.loads(path.read_text())
         assert "properties" in schema
+
+
+class TestParseCache:
+    WORKFLOW = "StartAt: A\nStates:\n  A:\n    Type: Succeed\n"
+
+    @pytest.fixture(autouse=True)
+    def _parse_cache(self):
+        set_parse_cache_enabled(True)
+
+    def _entries(self, tmp_path):
+        return list((tmp_path / ".rsf" / "cache" / "definitions").glob("*.json"))
+
+    def test_hit_skips_parsing(self, tmp_path, monkeypatch):
+        from rsf.dsl import parser
+
+        workflow = tmp_path / "workflow.yaml"
+        workflow.write_text(self.WORKFLOW)
+        first = load_definition(workflow)
+        assert len(self._entries(tmp_path)) == 1
+
+        monkeypatch.setattr(parser, "load_yaml", lambda path: (_ for _ in ()).throw(AssertionError("parsed")))
+        cached = load_definition(workflow)
+        assert cached == first
+        assert cached is not first
+
+    def test_keyed_on_file_bytes(self, tmp_path):
+        workflow = tmp_path / "workflow.yaml"
+        workflow.write_text(self.WORKFLOW)
+        load_definition(workflow)
+        workflow.write_text(self.WORKFLOW.replace("StartAt: A", "Comment: edited\nStartAt: A"))
+
+        assert load_definition(workflow).comment == "edited"
+        assert len(self._entries(tmp_path)) == 2
+
+    def test_bypass(self, tmp_path):
+        workflow = tmp_path / "workflow.yaml"
+        workflow.write_text(self.WORKFLOW)
+        load_definition(workflow, use_cache=False)
+        set_parse_cache_enabled(False)
+        try:
+            load_definition(workflow)
+        finally:
+            set_parse_cache_enabled(True)
+        assert self._entries(tmp_path) == []
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        workflow = tmp_path / "workflow.yaml"
+        workflow.write_text(self.WORKFLOW)
+        load_definition(workflow)
+        self._entries(tmp_path)[0].write_bytes(b"not json")
+
+        assert load_definition(workflow).start_at == "A"
+
+    def test_entries_are_json(self, tmp_path):
+        workflow = tmp_path / "workflow.yaml"
+        workflow.write_text(self.WORKFLOW)
+        load_definition(workflow)
+
+        entry = json.loads(self._entries(tmp_path)[0].read_text())
+        assert entry == {"StartAt": "A", "States": {"A": {"Type": "Succeed"}}}
+
+    def test_cli_no_cache_flag(self, tmp_path):
+        from typer.testing import CliRunner
+
+        from rsf.cli.main import app
+
+        workflow = tmp_path / "workflow.yaml"
+        workflow.write_text('rsf_version: "1.0"\n' + self.WORKFLOW)
+        result = CliRunner().invoke(app, ["--no-cache", "test", str(workflow)])
+        assert result.exit_code == 0, result.output
+        assert self._entries(tmp_path) == []
+
+        set_parse_cache_enabled(True)  # each real CLI run is a fresh process
+        CliRunner().invoke(app, ["test", str(workflow)])
+        assert len(self._entries(tmp_path)) == 1
+
+
+class TestLazyDefinition:
+    DATA = {
+        "StartAt": "Fan",
+        "States": {
+            "Fan": {
+                "Type": "Parallel",
+                "Branches": [{"StartAt": "X", "States": {"X": {"Type": "Task", "End": True}}}],
+                "Next": "Done",
+            },
+            "Done": {"Type": "Succeed"},
+            "Broken": {"Type": "Task", "Retry": [{"ErrorEquals": ["E"], "MaxAttempts": -1}], "End": True},
+        },
+    }
+
+    def test_states_validated_on_access(self):
+        from rsf.dsl import LazyStates, ParallelState
+
+        definition = parse_definition(self.DATA, lazy=True)
+        assert isinstance(definition.states, LazyStates)
+        assert list(definition.states) == ["Fan", "Done", "Broken"]
+        assert type(dict.__getitem__(definition.states, "Fan")) is dict
+
+        fan = definition.states["Fan"]
+        assert isinstance(fan, ParallelState)
+        assert definition.states["Fan"] is fan
+        # Nested branches are lazy too
+        assert isinstance(fan.branches[0].states, LazyStates)
+        assert type(dict.__getitem__(definition.states, "Done")) is dict
+
+    def test_invalid_state_raises_on_access_and_validate_all(self):
+        import pytest
+        from pydantic import ValidationError
+
+        definition = parse_definition(self.DATA, lazy=True)
+        assert definition.states["Done"].type == "Succeed"
+        with pytest.raises(ValidationError):
+            definition.states["Broken"]
+        with pytest.raises(ValidationError):
+            definition.validate_all()
+
+    def test_validate_all_matches_eager(self):
+        data = {**self.DATA, "States": {k: v for k, v in self.DATA["States"].items() if k != "Broken"}}
+        lazy = parse_definition(data, lazy=True).validate_all()
+        eager = parse_definition(data)
+        assert lazy == eager
+        assert lazy.model_dump(by_alias=True, exclude_none=True) == eager.model_dump(by_alias=True, exclude_none=True)
+
+    def test_dump_validates_pending_states(self):
+        data = {**self.DATA, "States": {k: v for k, v in self.DATA["States"].items() if k != "Broken"}}
+        lazy = parse_definition(data, lazy=True)
+        assert lazy.model_dump_json(by_alias=True) == parse_definition(data).model_dump_json(by_alias=True)
+
+    def test_lazy_load_skips_cache_write(self, tmp_path):
+        workflow = tmp_path / "workflow.yaml"
+        workflow.write_text(yaml.dump(self.DATA))
+        definition = load_definition(workflow, lazy=True)
+        assert definition.start_at == "Fan"
+        assert not (tmp_path / ".rsf").exists()
+
+    def test_large_definition_defers_all_work(self):
+        states = {f"S{i}": {"Type": "Task", "Next": f"S{i + 1}"} for i in range(5000)}
+        states["S5000"] = {"Type": "Succeed"}
+        definition = parse_definition({"StartAt": "S0", "States": states}, lazy=True)
+        assert definition.states["S2500"].next == "S2501"
+        pending = [name for name in definition.states if type(dict.__getitem__(definition.states, name)) is dict]
+        assert len(pending) == 5000
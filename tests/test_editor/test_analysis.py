@@ -0,0 +1,153 @@
+"""Tests for off-loop editor analysis: worker pool, content-hash cache, debounce and latest-wins."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+from starlette.testclient import TestClient
+
+from rsf.editor import analysis
+from rsf.editor.analysis import AnalysisPool, IncrementalAnalyzer, analyze_yaml
+from rsf.editor.server import create_app
+
+VALID_YAML = """\
+rsf_version: "1.0"
+StartAt: S1
+States:
+  S1:
+    Type: Task
+    Next: Done
+  Done:
+    Type: Succeed
+"""
+
+OTHER_YAML = VALID_YAML.replace("S1", "First")
+
+
+class TestAnalyzeYaml:
+    def test_valid(self):
+        result = analyze_yaml(VALID_YAML)
+        assert result.ast["StartAt"] == "S1"
+        assert result.errors == []
+
+    def test_yaml_syntax_error(self):
+        result = analyze_yaml(":\n  invalid: [unclosed")
+        assert result.ast is None
+        assert result.errors[0]["message"].startswith("YAML syntax error")
+        assert result.errors[0]["line"] is not None
+
+    def test_errors_carry_positions(self):
+        result = analyze_yaml(VALID_YAML.replace("Next: Done", "Next: Missing"))
+        missing = next(err for err in result.errors if err["path"] == "States.S1.Next")
+        assert (missing["line"], missing["column"]) == (6, 5)
+
+
+class TestIncrementalAnalyzer:
+    def test_single_state_edit_splices_ast(self):
+        analyzer = IncrementalAnalyzer()
+        first = analyzer(VALID_YAML)
+        edited = VALID_YAML.replace("    Type: Task\n", "    Type: Task\n    Comment: edited\n")
+        second = analyzer(edited)
+        assert second.ast == analyze_yaml(edited).ast
+        assert second.ast["States"]["Done"] is first.ast["States"]["Done"]
+        assert "Comment" not in first.ast["States"]["S1"]
+
+
+class TestAnalysisPool:
+    @pytest.mark.asyncio
+    async def test_cached_by_content(self):
+        pool = AnalysisPool(max_workers=1)
+        first = await pool.analyze(VALID_YAML)
+        second = await pool.analyze(VALID_YAML)
+        assert second is first
+        assert pool.analyzed == 1
+        await pool.analyze(OTHER_YAML)
+        assert pool.analyzed == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_job(self):
+        pool = AnalysisPool(max_workers=2)
+        results = await asyncio.gather(*(pool.analyze(VALID_YAML) for _ in range(5)))
+        assert all(result is results[0] for result in results)
+        assert pool.analyzed == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self):
+        pool = AnalysisPool(max_workers=1, cache_size=1)
+        await pool.analyze(VALID_YAML)
+        await pool.analyze(OTHER_YAML)
+        await pool.analyze(VALID_YAML)
+        assert pool.analyzed == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_keeps_shared_job(self, monkeypatch):
+        release = threading.Event()
+        real = analysis.analyze_yaml
+
+        def slow(yaml_content):
+            release.wait(5)
+            return real(yaml_content)
+
+        monkeypatch.setattr(analysis, "analyze_yaml", slow)
+        pool = AnalysisPool(max_workers=1)
+        cancelled = asyncio.create_task(pool.analyze(VALID_YAML))
+        kept = asyncio.create_task(pool.analyze(VALID_YAML))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        release.set()
+        result = await kept
+        assert result.errors == []
+        assert cancelled.cancelled()
+        pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_abandoned_job_dropped_before_it_starts(self, monkeypatch):
+        release = threading.Event()
+        real = analysis.analyze_yaml
+
+        def slow(yaml_content):
+            release.wait(5)
+            return real(yaml_content)
+
+        monkeypatch.setattr(analysis, "analyze_yaml", slow)
+        pool = AnalysisPool(max_workers=1)
+        busy = asyncio.create_task(pool.analyze(VALID_YAML))
+        queued = asyncio.create_task(pool.analyze(OTHER_YAML))
+        await asyncio.sleep(0.01)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await busy
+        assert pool.analyzed == 1
+        pool.shutdown()
+
+
+class TestLatestWins:
+    def test_burst_of_parses_answers_only_the_latest(self):
+        client = TestClient(create_app(parse_debounce=0.3))
+        with client.websocket_connect("/ws") as ws:
+            ws.send_json({"type": "parse", "yaml": OTHER_YAML})
+            ws.send_json({"type": "parse", "yaml": VALID_YAML})
+            ws.send_json({"type": "get_schema"})
+            # Non-analysis messages are not held up by a pending parse
+            assert ws.receive_json()["type"] == "schema"
+            parsed = ws.receive_json()
+            ws.send_json({"type": "validate", "yaml": VALID_YAML})
+            validated = ws.receive_json()
+
+        assert parsed["type"] == "parsed"
+        assert parsed["yaml"] == VALID_YAML
+        # The superseded parse never produced a response
+        assert validated["type"] == "validated"
+        assert client.app.state.analysis_pool.analyzed == 1
+
+    def test_identical_buffers_across_connections_analyzed_once(self):
+        client = TestClient(create_app(parse_debounce=0))
+        for _ in range(3):
+            with client.websocket_connect("/ws") as ws:
+                ws.send_json({"type": "parse", "yaml": VALID_YAML})
+                assert ws.receive_json()["errors"] == []
+        assert client.app.state.analysis_pool.analyzed == 1
@@ -0,0 +1,148 @@
+"""Tests for AST delta responses on the editor WebSocket."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from starlette.testclient import TestClient
+
+from rsf.editor import websocket as editor_websocket
+from rsf.editor.delta import apply_ast_patch, ast_patch
+from rsf.editor.server import create_app
+
+
+def _ast(**states) -> dict:
+    return {"StartAt": "A", "States": states}
+
+
+def _workflow(size: int, edited: int | None = None) -> str:
+    lines = ['rsf_version: "1.0"', "StartAt: S0", "States:"]
+    for i in range(size):
+        lines += [
+            f"  S{i}:",
+            "    Type: Task",
+            f"    Comment: {'edited' if i == edited else f'step {i}'}",
+            f"    Next: {f'S{i + 1}' if i + 1 < size else 'Done'}",
+            "    Retry:",
+            "      - ErrorEquals: [States.TaskFailed]",
+            "        MaxAttempts: 3",
+        ]
+    lines += ["  Done:", "    Type: Succeed"]
+    return "\n".join(lines) + "\n"
+
+
+class TestAstPatch:
+    def test_replace_single_state(self):
+        old = _ast(A={"Type": "Pass", "Next": "B"}, B={"Type": "Succeed"}, C={"Type": "Succeed"})
+        new = _ast(A={"Type": "Pass", "Next": "C"}, B={"Type": "Succeed"}, C={"Type": "Succeed"})
+        assert ast_patch(old, new) == [{"op": "replace", "path": "/States/A", "value": {"Type": "Pass", "Next": "C"}}]
+
+    def test_add_remove_and_top_level(self):
+        unchanged = {f"U{i}": {"Type": "Succeed"} for i in range(4)}
+        old = _ast(A={"Type": "Pass", "Next": "B"}, B={"Type": "Succeed"}, C={"Type": "Succeed"}, **unchanged)
+        new = {"StartAt": "C", "States": {"A": old["States"]["A"], "C": {"Type": "Succeed"}, **unchanged}}
+        new["States"]["D"] = {"Type": "Fail"}
+        ops = ast_patch(old, new)
+        assert ops == [
+            {"op": "replace", "path": "/StartAt", "value": "C"},
+            {"op": "remove", "path": "/States/B"},
+            {"op": "add", "path": "/States/D", "value": {"Type": "Fail"}},
+        ]
+        assert apply_ast_patch(old, ops) == new
+        assert list(apply_ast_patch(old, ops)["States"]) == ["A", "C", "U0", "U1", "U2", "U3", "D"]
+
+    def test_reorder_needs_full_ast(self):
+        old = _ast(A={"Type": "Succeed"}, B={"Type": "Succeed"}, C={"Type": "Succeed"})
+        new = _ast(B={"Type": "Succeed"}, A={"Type": "Succeed"}, C={"Type": "Succeed"})
+        assert ast_patch(old, new) is None
+
+    def test_insert_in_the_middle_needs_full_ast(self):
+        old = _ast(A={"Type": "Succeed"}, C={"Type": "Succeed"}, D={"Type": "Succeed"})
+        new = _ast(A={"Type": "Succeed"}, B={"Type": "Succeed"}, C={"Type": "Succeed"}, D={"Type": "Succeed"})
+        assert ast_patch(old, new) is None
+
+    def test_mass_change_needs_full_ast(self):
+        old = _ast(A={"Type": "Pass"}, B={"Type": "Pass"}, C={"Type": "Pass"}, D={"Type": "Pass"})
+        new = _ast(A={"Type": "Task"}, B={"Type": "Task"}, C={"Type": "Task"}, D={"Type": "Pass"})
+        assert ast_patch(old, new) is None
+
+    def test_pointer_escaping(self):
+        old = _ast(**{"a/b~c": {"Type": "Pass"}, "x": {"Type": "Pass"}, "y": {"Type": "Pass"}})
+        new = _ast(**{"a/b~c": {"Type": "Succeed"}, "x": {"Type": "Pass"}, "y": {"Type": "Pass"}})
+        ops = ast_patch(old, new)
+        assert ops[0]["path"] == "/States/a~1b~0c"
+        assert apply_ast_patch(old, ops) == new
+
+    def test_apply_does_not_mutate(self):
+        old = _ast(A={"Type": "Pass"}, B={"Type": "Pass"}, C={"Type": "Pass"})
+        snapshot = json.dumps(old)
+        apply_ast_patch(old, [{"op": "remove", "path": "/States/B"}])
+        assert json.dumps(old) == snapshot
+
+
+class TestDeltaMessages:
+    @pytest.fixture
+    def client(self):
+        return TestClient(create_app(parse_debounce=0))
+
+    def test_first_parse_full_then_delta(self, client):
+        with client.websocket_connect("/ws") as ws:
+            ws.send_json({"type": "parse", "yaml": _workflow(3)})
+            full = ws.receive_json()
+            ws.send_json({"type": "parse", "yaml": _workflow(3, edited=1)})
+            delta = ws.receive_json()
+
+        assert full["type"] == "parsed"
+        assert full["version"] == 1
+        assert delta["type"] == "parsed_delta"
+        assert (delta["base_version"], delta["version"]) == (1, 2)
+        assert [op["path"] for op in delta["patch"]] == ["/States/S1"]
+        assert "yaml" not in delta
+        assert apply_ast_patch(full["ast"], delta["patch"])["States"]["S1"]["Comment"] == "edited"
+
+    def test_invalid_yaml_keeps_base(self, client):
+        with client.websocket_connect("/ws") as ws:
+            ws.send_json({"type": "parse", "yaml": _workflow(3)})
+            ws.receive_json()
+            ws.send_json({"type": "parse", "yaml": "StartAt: [unclosed"})
+            broken = ws.receive_json()
+            ws.send_json({"type": "parse", "yaml": _workflow(3, edited=0)})
+            delta = ws.receive_json()
+
+        assert broken["type"] == "parsed"
+        assert broken["ast"] is None
+        assert delta["type"] == "parsed_delta"
+        assert delta["base_version"] == 1
+
+    def test_client_requested_resync(self, client):
+        with client.websocket_connect("/ws") as ws:
+            ws.send_json({"type": "parse", "yaml": _workflow(3)})
+            ws.receive_json()
+            ws.send_json({"type": "parse", "yaml": _workflow(3, edited=2), "full": True})
+            resync = ws.receive_json()
+
+        assert resync["type"] == "parsed"
+        assert resync["version"] == 2
+        assert resync["ast"]["States"]["S2"]["Comment"] == "edited"
+
+    def test_periodic_full_resync(self, client, monkeypatch):
+        monkeypatch.setattr(editor_websocket, "FULL_RESYNC_EVERY", 2)
+        types = []
+        with client.websocket_connect("/ws") as ws:
+            for edited in (None, 0, 1, 2, 0):
+                ws.send_json({"type": "parse", "yaml": _workflow(3, edited=edited)})
+                types.append(ws.receive_json()["type"])
+
+        assert types == ["parsed", "parsed_delta", "parsed_delta", "parsed", "parsed_delta"]
+
+    def test_bytes_per_edit_2000_states(self, client):
+        """A one-state edit on a 2,000-state workflow ships a few hundred bytes, not the whole AST."""
+        with client.websocket_connect("/ws") as ws:
+            ws.send_json({"type": "parse", "yaml": _workflow(2000)})
+            full = ws.receive_text()
+            ws.send_json({"type": "parse", "yaml": _workflow(2000, edited=1000)})
+            delta = ws.receive_text()
+
+        assert len(full) > 500_000
+        assert len(delta) < 1_000
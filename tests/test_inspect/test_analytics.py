@@ -0,0 +1,307 @@
+"""Tests for per-state analytics (latency sketches, incremental aggregation)."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from rsf.inspect.analytics import AnalyticsEngine, LatencySketch, StateAnalytics
+from rsf.inspect.cache import ExecutionCache
+from rsf.inspect.client import LambdaInspectClient
+from rsf.inspect.index import ExecutionIndex
+from rsf.inspect.models import (
+    ExecutionDetail,
+    ExecutionListResponse,
+    ExecutionStatus,
+    ExecutionSummary,
+    HistoryEvent,
+)
+from rsf.inspect.server import create_app
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _event(event_id: int, event_type: str, state: str, ms: int, **details) -> HistoryEvent:
+    return HistoryEvent(
+        event_id=event_id,
+        timestamp=_T0 + timedelta(milliseconds=ms),
+        event_type=event_type,
+        details={"stateName": state, **details},
+    )
+
+
+def _history(validate_ms: int = 100, charge_ms: int = 300, failed: bool = False) -> list[HistoryEvent]:
+    end = "StateFailed" if failed else "StateSucceeded"
+    return [
+        _event(1, "StateEntered", "Validate", 0),
+        _event(2, "StateSucceeded", "Validate", validate_ms),
+        _event(3, "StateEntered", "Charge", validate_ms),
+        _event(4, "StateEntered", "Charge", validate_ms + 50, retryAttempt=1),
+        _event(5, end, "Charge", validate_ms + charge_ms),
+    ]
+
+
+def _detail(execution_id: str, history: list[HistoryEvent] | None = None) -> ExecutionDetail:
+    return ExecutionDetail(
+        execution_id=execution_id,
+        status=ExecutionStatus.SUCCEEDED,
+        function_name="fn",
+        start_time=_T0,
+        history=history if history is not None else _history(),
+    )
+
+
+def _summary(n: int, status: ExecutionStatus = ExecutionStatus.SUCCEEDED) -> ExecutionSummary:
+    return ExecutionSummary(
+        execution_id=f"exec-{n:03d}",
+        status=status,
+        function_name="fn",
+        start_time=_T0 + timedelta(minutes=n),
+    )
+
+
+def _client(summaries: list[ExecutionSummary]) -> MagicMock:
+    client = MagicMock(spec=LambdaInspectClient)
+    client.function_name = "fn"
+    client.list_executions = AsyncMock(return_value=ExecutionListResponse(executions=summaries))
+    client.get_execution = AsyncMock(side_effect=lambda execution_id: _detail(execution_id))
+    return client
+
+
+def _raise(exc: Exception) -> None:
+    raise exc
+
+
+class TestLatencySketch:
+    def test_quantiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(4, 1.5) for _ in range(20_000)]
+        sketch = LatencySketch()
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        for q in (0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+
+    def test_size_does_not_grow_with_count(self):
+        sketch = LatencySketch()
+        for i in range(100_000):
+            sketch.add(10 + i % 1000)
+        # log(1010 / 10) / log(gamma) buckets, whatever the count
+        assert len(sketch.buckets) < 240
+        assert sketch.count == 100_000
+
+    def test_histogram_and_round_trip(self):
+        sketch = LatencySketch()
+        for value in (0, 1, 10, 100, 1000):
+            sketch.add(value)
+        histogram = sketch.histogram(bins=4)
+        assert sum(b["count"] for b in histogram) == 5
+        assert histogram[-1]["le"] == pytest.approx(1000)
+
+        restored = LatencySketch.from_dict(sketch.to_dict())
+        assert restored.quantile(0.5) == sketch.quantile(0.5)
+        assert restored.count == 5
+        assert LatencySketch().quantile(0.5) is None
+        assert LatencySketch().histogram() == []
+
+    def test_merge(self):
+        a, b = LatencySketch(), LatencySketch()
+        for value in range(1, 51):
+            a.add(value)
+        for value in range(51, 101):
+            b.add(value)
+        a.merge(b)
+        assert a.count == 100
+        assert a.max == 100
+        assert a.quantile(0.5) == pytest.approx(50, rel=0.02)
+
+
+class TestStateAnalytics:
+    def test_durations_failures_and_retries(self):
+        analytics = StateAnalytics()
+        analytics.add_history(_history(validate_ms=100, charge_ms=300))
+        analytics.add_history(_history(validate_ms=200, charge_ms=500, failed=True))
+        report = analytics.report()
+
+        assert report["executions"] == 2
+        validate = report["states"]["Validate"]
+        assert validate["visits"] == 2
+        assert validate["duration_ms"]["min"] == 100
+        assert validate["duration_ms"]["max"] == 200
+        charge = report["states"]["Charge"]
+        assert charge["visits"] == 2
+        assert charge["failures"] == 1
+        assert charge["error_rate"] == 0.5
+        assert charge["retries"] == 2
+        # Entered -> left, across the retry
+        assert charge["duration_ms"]["max"] == 500
+
+    def test_round_trip(self):
+        analytics = StateAnalytics()
+        analytics.add_history(_history())
+        assert StateAnalytics.from_dict(analytics.to_dict()).report() == analytics.report()
+
+
+class TestAnalyticsEngine:
+    @pytest.mark.asyncio
+    async def test_incremental_without_index(self):
+        client = _client([_summary(2), _summary(1), _summary(3, ExecutionStatus.RUNNING)])
+        cache = ExecutionCache()
+        engine = AnalyticsEngine(client, cache=cache)
+
+        assert await engine.refresh() == 2
+        assert await engine.refresh() == 0
+        assert engine.analytics.executions == 2
+        assert client.get_execution.await_count == 2
+        assert cache.get("fn", "exec-001") is not None
+
+    @pytest.mark.asyncio
+    async def test_without_index_pages_back_only_to_the_mark(self):
+        summaries = [_summary(n) for n in range(10, 0, -1)]  # newest first
+        pages = {None: ExecutionListResponse(executions=summaries[:5], next_token="5")}
+        pages["5"] = ExecutionListResponse(executions=summaries[5:])
+        client = _client([])
+        client.list_executions = AsyncMock(side_effect=lambda max_items, next_token: pages[next_token])
+        engine = AnalyticsEngine(client)
+
+        assert await engine.refresh(limit=3) == 3  # the newest three
+        assert client.list_executions.await_count == 1
+
+        new = [_summary(n) for n in range(15, 10, -1)]
+        pages[None] = ExecutionListResponse(executions=new + summaries[:2], next_token="2")
+        client.list_executions.reset_mock()
+        client.get_execution.reset_mock()
+        assert await engine.refresh(limit=3) == 3  # the oldest three since the mark
+        assert [call.args[0] for call in client.get_execution.await_args_list] == ["exec-011", "exec-012", "exec-013"]
+        assert await engine.refresh(limit=3) == 2
+        assert await engine.refresh(limit=3) == 0
+        assert client.list_executions.await_count == 3
+        assert engine.analytics.executions == 8
+        assert engine._at_mark == {"exec-015"}
+
+    @pytest.mark.asyncio
+    async def test_background_refresh(self):
+        engine = AnalyticsEngine(_client([_summary(1), _summary(2)]))
+        engine.start_refresh(10)
+        assert engine.refreshing
+        engine.start_refresh(10)  # one at a time
+        await engine._task
+        assert not engine.refreshing
+        assert engine.analytics.executions == 2
+
+        engine.client.list_executions = AsyncMock(side_effect=RuntimeError("throttled"))
+        engine.start_refresh(10)
+        assert await engine._task == 0  # logged, not raised
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_persisted_in_index(self, tmp_path):
+        path = tmp_path / "index.db"
+        index = ExecutionIndex(path)
+        index.upsert("fn", [_summary(n) for n in range(1, 6)] + [_summary(6, ExecutionStatus.RUNNING)])
+        client = _client([])
+
+        engine = AnalyticsEngine(client, index=index)
+        assert await engine.refresh(limit=3) == 3
+        assert index.unanalyzed("fn", 10) == ["exec-002", "exec-001"]
+        index.close()
+
+        index = ExecutionIndex(path)
+        engine = AnalyticsEngine(client, index=index)
+        assert engine.analytics.executions == 3
+        assert await engine.refresh() == 2
+        assert await engine.refresh() == 0
+        assert engine.analytics.executions == 5
+        assert client.get_execution.await_count == 5
+        index.close()
+
+    @pytest.mark.asyncio
+    async def test_partial_refresh_is_kept(self, tmp_path):
+        index = ExecutionIndex(tmp_path / "index.db")
+        index.upsert("fn", [_summary(n) for n in range(1, 4)])
+        client = _client([])
+        client.get_execution = AsyncMock(side_effect=[_detail("exec-003"), asyncio.CancelledError()])
+
+        engine = AnalyticsEngine(client, index=index)
+        with pytest.raises(asyncio.CancelledError):
+            await engine.refresh()
+        assert index.load_analytics("fn")["executions"] == 1
+        assert index.unanalyzed("fn", 10) == ["exec-002", "exec-001"]
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_skipped_with_index(self, tmp_path):
+        index = ExecutionIndex(tmp_path / "index.db")
+        index.upsert("fn", [_summary(n) for n in range(1, 5)])
+        client = _client([])
+        expired = RuntimeError("ResourceNotFoundException")
+        client.get_execution = AsyncMock(
+            side_effect=lambda execution_id: _raise(expired) if execution_id == "exec-003" else _detail(execution_id)
+        )
+
+        engine = AnalyticsEngine(client, index=index)
+        assert await engine.refresh() == 3
+        assert index.unanalyzed("fn", 10) == []
+        assert await engine.refresh() == 0
+        assert client.get_execution.await_count == 4  # not asked for again
+        assert index.load_analytics("fn")["executions"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_skipped_without_index(self):
+        client = _client([_summary(2), _summary(1)])
+        expired = RuntimeError("ResourceNotFoundException")
+        client.get_execution = AsyncMock(
+            side_effect=lambda execution_id: _raise(expired) if execution_id == "exec-002" else _detail(execution_id)
+        )
+
+        engine = AnalyticsEngine(client)
+        assert await engine.refresh() == 1
+        assert await engine.refresh() == 0  # the mark moved past exec-002
+        assert client.get_execution.await_count == 2
+
+        client.list_executions.return_value = ExecutionListResponse(executions=[_summary(3), _summary(2), _summary(1)])
+        assert await engine.refresh() == 1
+        assert engine.analytics.executions == 2
+
+    def test_index_created_before_analytics_is_migrated(self, tmp_path):
+        path = tmp_path / "index.db"
+        ExecutionIndex(path).close()
+        conn = sqlite3.connect(path)
+        conn.execute("ALTER TABLE executions DROP COLUMN analyzed")
+        conn.close()
+
+        index = ExecutionIndex(path)
+        index.upsert("fn", [_summary(1)])
+        assert index.unanalyzed("fn", 10) == ["exec-001"]
+
+
+class TestAnalyticsEndpoint:
+    @pytest.mark.asyncio
+    async def test_reports_per_state(self):
+        client = _client([_summary(1), _summary(2)])
+        app = create_app()
+        app.state.inspect_client = client
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            first = await c.get("/api/inspect/analytics")
+            (engine,) = app.state.analytics_engines.values()
+            await engine._task
+            second = await c.get("/api/inspect/analytics", params={"limit": 10})
+            await engine._task
+            invalid = await c.get("/api/inspect/analytics", params={"limit": -1})
+
+        assert first.json() == {"executions": 0, "states": {}, "refreshing": True}
+        body = second.json()
+        assert body["executions"] == 2
+        assert set(body["states"]) == {"Validate", "Charge"}
+        assert body["states"]["Charge"]["duration_ms"]["p50"] == pytest.approx(300, rel=0.01)
+        assert client.get_execution.await_count == 2
+        assert invalid.status_code == 422
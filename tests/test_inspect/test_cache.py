@@ -0,0 +1,142 @@
+"""Tests for the inspector execution cache (memory LRU + SQLite store)."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from rsf.inspect.cache import ExecutionCache, ExecutionStore
+from rsf.inspect.client import LambdaInspectClient
+from rsf.inspect.models import ExecutionDetail, ExecutionStatus, HistoryEvent
+from rsf.inspect.server import create_app
+
+
+def _detail(execution_id: str = "exec-001", status: ExecutionStatus = ExecutionStatus.SUCCEEDED) -> ExecutionDetail:
+    return ExecutionDetail(
+        execution_id=execution_id,
+        status=status,
+        function_name="test-func",
+        start_time=datetime.fromtimestamp(1700000000, tz=timezone.utc),
+        history=[HistoryEvent(event_id=1, timestamp=1700000001, event_type="StepStarted")],
+    )
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestExecutionCache:
+    def test_terminal_entries_never_expire(self):
+        clock = _Clock()
+        cache = ExecutionCache(running_ttl=2.0, clock=clock)
+        entry = cache.put("fn", "exec-001", _detail())
+        clock.now = 10_000
+        assert cache.get("fn", "exec-001") is entry
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_running_entries_expire(self):
+        clock = _Clock()
+        cache = ExecutionCache(running_ttl=2.0, clock=clock)
+        cache.put("fn", "exec-001", _detail(status=ExecutionStatus.RUNNING))
+        clock.now = 1.0
+        assert cache.get("fn", "exec-001") is not None
+        clock.now = 2.5
+        assert cache.get("fn", "exec-001") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ExecutionCache(max_entries=2)
+        cache.put("fn", "a", _detail("a"))
+        cache.put("fn", "b", _detail("b"))
+        cache.get("fn", "a")
+        cache.put("fn", "c", _detail("c"))
+        assert cache.get("fn", "b") is None
+        assert cache.get("fn", "a") is not None
+
+    def test_keyed_by_function(self):
+        cache = ExecutionCache()
+        cache.put("fn-1", "exec-001", _detail())
+        assert cache.get("fn-2", "exec-001") is None
+
+    def test_bodies_serialized_once(self):
+        entry = ExecutionCache().put("fn", "exec-001", _detail())
+        assert entry.body("detail") is entry.body("detail")
+        assert json.loads(entry.body("info")).get("history") is None
+        assert json.loads(entry.body("history"))["events"][0]["event_type"] == "StepStarted"
+
+    def test_store_keeps_terminal_details_across_instances(self, tmp_path):
+        path = tmp_path / "cache" / "inspect.db"
+        first = ExecutionCache(store=ExecutionStore(path))
+        first.put("fn", "done", _detail("done"))
+        first.put("fn", "running", _detail("running", ExecutionStatus.RUNNING))
+        first.store.close()
+
+        second = ExecutionCache(store=ExecutionStore(path))
+        entry = second.get("fn", "done")
+        assert entry is not None
+        assert entry.detail == _detail("done")
+        assert second.get("fn", "running") is None
+        assert len(second.store) == 1
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock(spec=LambdaInspectClient)
+    client.get_execution = AsyncMock()
+    return client
+
+
+def _app(mock_client, **kwargs):
+    application = create_app(**kwargs)
+    application.state.inspect_client = mock_client
+    return application
+
+
+class TestCachedEndpoints:
+    @pytest.mark.asyncio
+    async def test_terminal_execution_fetched_once(self, mock_client):
+        mock_client.get_execution.return_value = _detail()
+        transport = ASGITransport(app=_app(mock_client))
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            detail = await c.get("/api/inspect/execution/exec-001")
+            history = await c.get("/api/inspect/execution/exec-001/history")
+            again = await c.get("/api/inspect/execution/exec-001")
+
+        assert mock_client.get_execution.await_count == 1
+        assert detail.json() == again.json() == json.loads(_detail().model_dump_json())
+        assert detail.headers["content-type"] == "application/json"
+        assert history.json()["events"][0]["event_id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_running_execution_refetched_after_ttl(self, mock_client):
+        mock_client.get_execution.return_value = _detail(status=ExecutionStatus.RUNNING)
+        application = _app(mock_client)
+        application.state.execution_cache.running_ttl = 0
+        transport = ASGITransport(app=application)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            await c.get("/api/inspect/execution/exec-001")
+            await c.get("/api/inspect/execution/exec-001")
+
+        assert mock_client.get_execution.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_restart(self, mock_client, tmp_path):
+        mock_client.get_execution.return_value = _detail()
+        path = tmp_path / "inspect.db"
+        for _ in range(2):
+            transport = ASGITransport(
+                app=_app(mock_client, function_name="fn", region_name="us-east-1", cache_path=path)
+            )
+            async with AsyncClient(transport=transport, base_url="http://test") as c:
+                resp = await c.get("/api/inspect/execution/exec-001")
+            assert resp.json()["status"] == "SUCCEEDED"
+
+        assert mock_client.get_execution.await_count == 1
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
-
-from rsf.inspect.client import LambdaInspectClient, TokenBucketRateLimiter
+from botocore.utils import parse_timestamp
+
+from rsf.inspect.client import (
+    ClientPool,
+    LambdaInspectClient,
+    Priority,
+    TokenBucketRateLimiter,
+    function_key,
+    prioritized,
+)
 from rsf.inspect.models import ExecutionStatus
 
 
@@ -16,6 +26,22 @@ from rsf.inspect.models import ExecutionStatus
 # TokenBucketRateLimiter
 # -----------------------------------------------------------------------
 
+_real_sleep = asyncio.sleep
+
+
+class _FakeClock:
+    """Stands in for time.monotonic and asyncio.sleep: sleeping advances the clock instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        await _real_sleep(0)
+
 
 class TestTokenBucketRateLimiter:
     @pytest.mark.asyncio
@@ -77,6 +103,51 @@ class TestTokenBucketRateLimiter:
         elapsed = time.monotonic() - start
         assert elapsed >= 0.1  # At least some delay
 
+    @pytest.mark.asyncio
+    async def test_higher_priority_served_first(self):
+        """Queued interactive requests overtake queued background ones."""
+        limiter = TokenBucketRateLimiter(rate=50.0, capacity=1.0)
+        await limiter.acquire()
+        order: list[str] = []
+
+        async def request(name: str, priority: Priority) -> None:
+            await limiter.acquire(priority)
+            order.append(name)
+
+        background = [asyncio.create_task(request(f"bulk-{i}", Priority.BACKGROUND)) for i in range(2)]
+        await asyncio.sleep(0)
+        poll = asyncio.create_task(request("poll", Priority.POLL))
+        interactive = asyncio.create_task(request("view", Priority.INTERACTIVE))
+        await asyncio.gather(*background, poll, interactive)
+
+        assert order == ["view", "poll", "bulk-0", "bulk-1"]
+        lanes = limiter.stats()["lanes"]
+        assert lanes["background"]["granted"] == 2
+        assert lanes["background"]["wait_seconds_max"] >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_prioritized_context_sets_default_lane(self):
+        limiter = TokenBucketRateLimiter(rate=1000.0, capacity=10.0)
+        with prioritized(Priority.POLL):
+            await limiter.acquire()
+        await limiter.acquire()
+        lanes = limiter.stats()["lanes"]
+        assert (lanes["poll"]["granted"], lanes["interactive"]["granted"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_consume_token(self, monkeypatch):
+        clock = _FakeClock()
+        monkeypatch.setattr("rsf.inspect.client.time", clock)
+        monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+        limiter = TokenBucketRateLimiter(rate=20.0, capacity=1.0)
+        await limiter.acquire()
+        cancelled = asyncio.create_task(limiter.acquire())
+        await _real_sleep(0)
+        cancelled.cancel()
+        await limiter.acquire()
+        assert clock.now == pytest.approx(0.05)  # one refill period, not two
+        assert limiter.stats()["lanes"]["interactive"]["queued"] == 0
+
 
 # -----------------------------------------------------------------------
 # LambdaInspectClient
@@ -211,6 +282,34 @@ class TestLambdaInspectClient:
         assert detail.history[0].event_type == "StepStarted"
         assert detail.history[1].event_type == "StepSucceeded"
 
+    def test_parse_detail_botocore_timestamps(self, mock_boto3_client, no_wait_limiter):
+        """Timestamps as botocore parses them (dateutil tzinfos) are accepted."""
+        client = LambdaInspectClient("my-func", rate_limiter=no_wait_limiter)
+        detail = client._parse_detail(
+            {
+                "DurableExecution": {
+                    "ExecutionId": "exec-001",
+                    "Status": "SUCCEEDED",
+                    "StartTime": parse_timestamp("2024-01-01T00:00:00Z"),
+                    "EndTime": parse_timestamp("2024-01-01T00:01:00Z"),
+                    "Events": [
+                        {
+                            "EventId": 1,
+                            "Timestamp": parse_timestamp("2024-01-01T00:00:01Z"),
+                            "EventType": "StepStarted",
+                        },
+                        {"EventId": 2, "Timestamp": parse_timestamp(1704067202), "EventType": "StepSucceeded"},
+                    ],
+                }
+            }
+        )
+
+        assert detail.start_time == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert [evt.timestamp for evt in detail.history] == [
+            datetime(2024, 1, 1, 0, 0, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 0, 0, 2, tzinfo=timezone.utc),
+        ]
+
     @pytest.mark.asyncio
     async def test_get_execution_with_error(self, mock_boto3_client, no_wait_limiter):
         """get_execution parses error fields."""
@@ -288,3 +387,139 @@ class TestLambdaInspectClient:
         await client.close()
 
         mock_boto3_client.close.assert_called_once()
+
+
+class TestRequestCoalescing:
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_reads_share_one_call(self, mock_boto3_client, no_wait_limiter):
+        release = threading.Event()
+
+        def slow_get(**kwargs):
+            release.wait(5)
+            return {"DurableExecution": {"ExecutionId": kwargs["ExecutionId"], "Status": "RUNNING"}}
+
+        mock_boto3_client.get_durable_execution.side_effect = slow_get
+        client = LambdaInspectClient("my-func", rate_limiter=no_wait_limiter)
+        client._client = mock_boto3_client
+
+        calls = [asyncio.create_task(client.get_execution("exec-001")) for _ in range(5)]
+        other = asyncio.create_task(client.get_execution("exec-002"))
+        await asyncio.sleep(0.05)
+        release.set()
+        details = await asyncio.gather(*calls, other)
+
+        assert [d.execution_id for d in details] == ["exec-001"] * 5 + ["exec-002"]
+        assert mock_boto3_client.get_durable_execution.call_count == 2
+        stats = client.stats()
+        assert (stats["upstream_calls"], stats["coalesced"], stats["in_flight"]) == (2, 4, 0)
+
+    @pytest.mark.asyncio
+    async def test_coalescing_never_joins_a_less_urgent_lane(self, mock_boto3_client, no_wait_limiter):
+        release = threading.Event()
+
+        def slow_get(**kwargs):
+            release.wait(5)
+            return {"DurableExecution": {"ExecutionId": kwargs["ExecutionId"], "Status": "RUNNING"}}
+
+        mock_boto3_client.get_durable_execution.side_effect = slow_get
+        client = LambdaInspectClient("my-func", rate_limiter=no_wait_limiter)
+        client._client = mock_boto3_client
+
+        with prioritized(Priority.BACKGROUND):
+            background = asyncio.create_task(client.get_execution("exec-001"))
+        await asyncio.sleep(0)
+        view = asyncio.create_task(client.get_execution("exec-001"))  # does not wait behind background work
+        await asyncio.sleep(0)
+        with prioritized(Priority.POLL):
+            poll = asyncio.create_task(client.get_execution("exec-001"))  # joins the interactive call
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(background, view, poll)
+
+        assert mock_boto3_client.get_durable_execution.call_count == 2
+        assert (client.stats()["coalesced"], client.stats()["in_flight"]) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_invocations_are_never_coalesced(self, mock_boto3_client, no_wait_limiter):
+        mock_boto3_client.invoke.return_value = {"StatusCode": 202}
+        client = LambdaInspectClient("my-func", rate_limiter=no_wait_limiter)
+        client._client = mock_boto3_client
+
+        await asyncio.gather(*(client.invoke_execution({"x": 1}) for _ in range(3)))
+
+        assert mock_boto3_client.invoke.call_count == 3
+
+
+# -----------------------------------------------------------------------
+# ClientPool
+# -----------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("function_name", "expected"),
+    [
+        ("orders", "orders"),
+        ("arn:aws:lambda:us-east-2:123456789:function:orders", "orders"),
+        ("arn:aws:lambda:us-east-2:123456789:function:orders:live", "orders"),
+    ],
+)
+def test_function_key(function_name, expected):
+    assert function_key(function_name) == expected
+
+
+class TestClientPool:
+    def test_clients_share_connections_threads_and_limiter(self, mock_boto3_client):
+        pool = ClientPool(["arn:aws:lambda:us-east-2:123456789:function:orders", "payments"], max_connections=4)
+        assert pool.names == ["orders", "payments"]
+        assert "orders" in pool and "missing" not in pool
+
+        orders, payments = pool.get("orders"), pool.get("payments")
+
+        assert pool.get("orders") is orders
+        assert orders.function_name == "arn:aws:lambda:us-east-2:123456789:function:orders"
+        assert orders._client is payments._client is mock_boto3_client
+        assert orders._executor is payments._executor
+        assert orders._executor._max_workers == 4
+        assert orders._limiter is payments._limiter is pool.rate_limiter
+        with pytest.raises(KeyError):
+            pool.get("missing")
+
+    def test_boto_client_created_once_with_pool_config(self):
+        with patch("rsf.inspect.client.boto3") as mock_boto3:
+            pool = ClientPool(["orders", "payments"], region_name="us-east-2", max_connections=8)
+            pool.get("orders")
+            pool.get("payments")
+
+        mock_boto3.client.assert_called_once()
+        kwargs = mock_boto3.client.call_args.kwargs
+        assert kwargs["region_name"] == "us-east-2"
+        assert kwargs["config"].max_pool_connections == 8
+
+    @pytest.mark.asyncio
+    async def test_calls_run_in_pool_threads(self, mock_boto3_client, no_wait_limiter):
+        threads = []
+
+        def get_execution(**kwargs):
+            threads.append(threading.current_thread().name)
+            return {"DurableExecution": {"ExecutionId": kwargs["ExecutionId"], "Status": "RUNNING"}}
+
+        mock_boto3_client.get_durable_execution.side_effect = get_execution
+        pool = ClientPool(["orders"], rate_limiter=no_wait_limiter)
+
+        await pool.get("orders").get_execution("exec-001")
+
+        assert threads[0].startswith("rsf-inspect")
+        assert pool.stats()["clients"]["orders"]["upstream_calls"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_shared_client_once(self, mock_boto3_client):
+        pool = ClientPool(["orders", "payments"])
+        await pool.get("orders").close()
+        await pool.get("payments").close()
+        mock_boto3_client.close.assert_not_called()
+
+        await pool.close()
+
+        mock_boto3_client.close.assert_called_once()
+        assert pool._executor is None
@@ -0,0 +1,215 @@
+"""Tests for streaming bulk export (JSON Lines / Parquet, checkpoint and resume)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from rsf.inspect.client import LambdaInspectClient
+from rsf.inspect.export import CHECKPOINT_NAME, Exporter, export_row
+from rsf.inspect.models import (
+    ExecutionDetail,
+    ExecutionError,
+    ExecutionListResponse,
+    ExecutionStatus,
+    ExecutionSummary,
+    HistoryEvent,
+)
+
+_NOW = datetime(2026, 1, 8, tzinfo=timezone.utc)
+
+
+def _summary(n: int) -> ExecutionSummary:
+    return ExecutionSummary(
+        execution_id=f"exec-{n:03d}",
+        status=ExecutionStatus.FAILED if n % 2 else ExecutionStatus.SUCCEEDED,
+        function_name="fn",
+        start_time=_NOW - timedelta(hours=n),
+    )
+
+
+def _detail(execution_id: str) -> ExecutionDetail:
+    return ExecutionDetail(
+        execution_id=execution_id,
+        status=ExecutionStatus.FAILED,
+        function_name="fn",
+        start_time=_NOW,
+        end_time=_NOW + timedelta(seconds=3),
+        input_payload={"order_id": execution_id},
+        error=ExecutionError(error="Boom", cause="card declined"),
+        history=[HistoryEvent(event_id=1, timestamp=_NOW, event_type="StateEntered", details={"stateName": "A"})],
+    )
+
+
+def _client(executions: int, page_size: int = 3) -> MagicMock:
+    """Client listing ``executions`` executions newest first, ``page_size`` per page."""
+    summaries = [_summary(n) for n in range(1, executions + 1)]
+    client = MagicMock(spec=LambdaInspectClient)
+    client.function_name = "fn"
+
+    async def list_executions(status=None, max_items=50, next_token=None):
+        matching = [s for s in summaries if status is None or s.status == status]
+        start = int(next_token or 0)
+        end = start + page_size
+        return ExecutionListResponse(
+            executions=matching[start:end],
+            next_token=str(end) if end < len(matching) else None,
+        )
+
+    client.list_executions = AsyncMock(side_effect=list_executions)
+    client.get_execution = AsyncMock(side_effect=_detail)
+    return client
+
+
+async def _run(exporter: Exporter):
+    return [(p.exported, p.parts, p.done) async for p in exporter.run()]
+
+
+def _read_jsonl(out) -> list[dict]:
+    parts = sorted(out.glob("executions-*.jsonl"))
+    return [json.loads(line) for part in parts for line in part.read_text().splitlines()]
+
+
+def test_export_row():
+    row = export_row(_detail("exec-001"))
+    assert row["start_time"] == "2026-01-08T00:00:00Z"
+    assert row["error"] == "Boom"
+    assert row["cause"] == "card declined"
+    assert row["event_count"] == 1
+    assert row["history"][0]["details"] == {"stateName": "A"}
+    json.dumps(row)
+
+
+class TestExporter:
+    @pytest.mark.asyncio
+    async def test_jsonl_parts_and_checkpoint(self, tmp_path):
+        out = tmp_path / "export"
+        reports = await _run(Exporter(_client(10), out, part_size=4))
+
+        # Parts end on page boundaries: 6 + 4 rows
+        assert reports[-1] == (10, 2, True)
+        assert sorted(p.name for p in out.iterdir()) == [
+            CHECKPOINT_NAME,
+            "executions-00000.jsonl",
+            "executions-00001.jsonl",
+        ]
+        assert len((out / "executions-00000.jsonl").read_text().splitlines()) == 6
+        rows = _read_jsonl(out)
+        assert [row["execution_id"] for row in rows] == [f"exec-{n:03d}" for n in range(1, 11)]
+        assert rows[0]["input"] == {"order_id": "exec-001"}
+        checkpoint = json.loads((out / CHECKPOINT_NAME).read_text())
+        assert checkpoint["done"] is True
+        assert checkpoint["exported"] == 10
+
+    @pytest.mark.asyncio
+    async def test_status_and_since(self, tmp_path):
+        client = _client(10)
+        exporter = Exporter(client, tmp_path, status=ExecutionStatus.FAILED, since=_NOW - timedelta(hours=6))
+        await _run(exporter)
+
+        assert [row["execution_id"] for row in _read_jsonl(tmp_path)] == ["exec-001", "exec-003", "exec-005"]
+        # Stops at the first page reaching back before --since
+        assert client.list_executions.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self, tmp_path):
+        client = _client(12, page_size=12)
+        in_flight = peak = 0
+
+        async def get_execution(execution_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _detail(execution_id)
+
+        client.get_execution = AsyncMock(side_effect=get_execution)
+        await _run(Exporter(client, tmp_path, concurrency=4))
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_resumes_after_last_completed_part(self, tmp_path):
+        client = _client(10)
+        calls = 0
+
+        async def flaky(execution_id):
+            nonlocal calls
+            calls += 1
+            if calls == 8:
+                raise asyncio.CancelledError  # interrupted
+            return _detail(execution_id)
+
+        client.get_execution = AsyncMock(side_effect=flaky)
+        with pytest.raises(asyncio.CancelledError):
+            await _run(Exporter(client, tmp_path, part_size=6))
+        # The first part (two pages) completed; the second was discarded
+        assert [p.name for p in tmp_path.glob("executions-*")] == ["executions-00000.jsonl"]
+
+        client = _client(10)
+        exporter = Exporter(client, tmp_path, part_size=6)
+        assert exporter.resumed
+        reports = await _run(exporter)
+        assert reports[-1] == (10, 2, True)
+        assert [row["execution_id"] for row in _read_jsonl(tmp_path)] == [f"exec-{n:03d}" for n in range(1, 11)]
+        assert [call.args[0] for call in client.get_execution.await_args_list][0] == "exec-007"
+        assert not list(tmp_path.glob("*.tmp"))
+
+        # Finished exports are not repeated
+        client = _client(10)
+        assert await _run(Exporter(client, tmp_path)) == [(10, 2, True)]
+        client.list_executions.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_skipped(self, tmp_path):
+        def get_execution(execution_id):
+            if execution_id in ("exec-002", "exec-008"):
+                raise RuntimeError("ResourceNotFoundException")
+            return _detail(execution_id)
+
+        client = _client(10)
+        client.get_execution = AsyncMock(side_effect=get_execution)
+        exporter = Exporter(client, tmp_path, part_size=6)
+        progress = [p async for p in exporter.run()]
+
+        assert (progress[-1].exported, progress[-1].skipped, progress[-1].done) == (8, 2, True)
+        rows = _read_jsonl(tmp_path)
+        assert [row["execution_id"] for row in rows] == [f"exec-{n:03d}" for n in range(1, 11) if n not in (2, 8)]
+        assert json.loads((tmp_path / CHECKPOINT_NAME).read_text())["skipped"] == 2
+        # The finished export reports the same totals
+        (final,) = [p async for p in Exporter(_client(10), tmp_path).run()]
+        assert (final.exported, final.skipped) == (8, 2)
+
+    def test_resume_with_different_options_rejected(self, tmp_path):
+        asyncio.run(_run(Exporter(_client(2), tmp_path)))
+        with pytest.raises(ValueError, match="new output directory"):
+            Exporter(_client(2), tmp_path, status=ExecutionStatus.FAILED)
+
+    def test_invalid_options(self, tmp_path):
+        with pytest.raises(ValueError):
+            Exporter(_client(1), tmp_path, fmt="csv")
+        with pytest.raises(ValueError):
+            Exporter(_client(1), tmp_path, concurrency=0)
+
+    def test_parquet_requires_pyarrow(self, tmp_path, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+        with pytest.raises(ImportError, match="rsf\\[export\\]"):
+            Exporter(_client(1), tmp_path, fmt="parquet")
+
+    @pytest.mark.asyncio
+    async def test_parquet(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        await _run(Exporter(_client(5), tmp_path, fmt="parquet", part_size=3))
+
+        tables = [pq.read_table(part) for part in sorted(tmp_path.glob("executions-*.parquet"))]
+        assert [t.num_rows for t in tables] == [3, 2]
+        row = tables[0].to_pylist()[0]
+        assert row["execution_id"] == "exec-001"
+        assert json.loads(row["input"]) == {"order_id": "exec-001"}
+        assert row["end_time"] == _NOW + timedelta(seconds=3)
@@ -0,0 +1,113 @@
+"""Tests for the shared SSE poller hub."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from rsf.inspect.cache import CachedExecution
+from rsf.inspect.hub import StreamHub
+from rsf.inspect.models import ExecutionDetail, ExecutionStatus, HistoryEvent
+
+_real_sleep = asyncio.sleep
+
+
+def _entry(events: int, status: ExecutionStatus = ExecutionStatus.RUNNING) -> CachedExecution:
+    return CachedExecution(
+        ExecutionDetail(
+            execution_id="exec-001",
+            status=status,
+            function_name="test-func",
+            start_time=datetime.fromtimestamp(1700000000, tz=timezone.utc),
+            history=[
+                HistoryEvent(event_id=i, timestamp=1700000000 + i, event_type="StepStarted")
+                for i in range(1, events + 1)
+            ],
+        )
+    )
+
+
+class _Execution:
+    """Scripted fetch(): returns the next snapshot on every call, then repeats the last."""
+
+    def __init__(self, *snapshots: CachedExecution) -> None:
+        self.snapshots = list(snapshots)
+        self.calls = 0
+        self.intervals: list[float] = []
+
+    async def fetch(self, fresh: bool) -> CachedExecution:
+        self.calls += 1
+        return self.snapshots[min(self.calls - 1, len(self.snapshots) - 1)]
+
+    async def sleep(self, delay: float) -> None:
+        self.intervals.append(delay)
+        await _real_sleep(0)
+
+
+async def _drain(hub: StreamHub, execution: _Execution) -> list[dict[str, str]]:
+    async with hub.subscribe("exec-001", execution.fetch) as subscription:
+        return [event async for update in subscription for event in update.events]
+
+
+class TestStreamHub:
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_poller(self):
+        execution = _Execution(_entry(1), _entry(1), _entry(2, ExecutionStatus.SUCCEEDED))
+        hub = StreamHub()
+        with patch("rsf.inspect.hub.asyncio.sleep", execution.sleep):
+            streams = await asyncio.gather(*(_drain(hub, execution) for _ in range(10)))
+
+        assert execution.calls == 3
+        for events in streams:
+            assert [event["event"] for event in events] == ["execution_info", "history_update"]
+            assert [evt["event_id"] for evt in json.loads(events[1]["data"])] == [2]
+        assert hub.active("exec-001") == 0
+
+    @pytest.mark.asyncio
+    async def test_adaptive_interval(self):
+        idle = [_entry(1)] * 4
+        execution = _Execution(*idle, _entry(2), _entry(2), _entry(2, ExecutionStatus.SUCCEEDED))
+        hub = StreamHub(min_interval=1.0, max_interval=4.0)
+        with patch("rsf.inspect.hub.asyncio.sleep", execution.sleep):
+            await _drain(hub, execution)
+
+        # Backs off while idle, drops back after the new event
+        assert execution.intervals == [1.0, 2.0, 4.0, 4.0, 1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_poller_stops_when_last_subscriber_leaves(self):
+        execution = _Execution(_entry(1))
+        hub = StreamHub(min_interval=0.01, max_interval=0.01)
+        async with hub.subscribe("exec-001", execution.fetch):
+            async with hub.subscribe("exec-001", execution.fetch) as second:
+                assert second.snapshot.detail.history[0].event_id == 1
+                assert hub.active("exec-001") == 2
+            await _real_sleep(0.05)
+            assert hub.active("exec-001") == 1
+        calls = execution.calls
+        await _real_sleep(0.05)
+        assert hub.active("exec-001") == 0
+        assert execution.calls == calls
+
+    @pytest.mark.asyncio
+    async def test_terminal_execution_has_no_poller(self):
+        execution = _Execution(_entry(2, ExecutionStatus.FAILED))
+        hub = StreamHub()
+        assert await _drain(hub, execution) == []
+        assert execution.calls == 1
+        assert hub.active("exec-001") == 0
+
+    @pytest.mark.asyncio
+    async def test_initial_fetch_error_reaches_subscriber(self):
+        async def fetch(fresh: bool) -> CachedExecution:
+            raise RuntimeError("boom")
+
+        hub = StreamHub()
+        with pytest.raises(RuntimeError):
+            async with hub.subscribe("exec-001", fetch):
+                pass
+        assert hub.active("exec-001") == 0
@@ -0,0 +1,323 @@
+"""Tests for the local execution index and its background indexer."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from rsf.inspect.client import LambdaInspectClient
+from rsf.inspect.index import ExecutionIndex, ExecutionIndexer
+from rsf.inspect.models import (
+    ExecutionError,
+    ExecutionDetail,
+    ExecutionListResponse,
+    ExecutionStatus,
+    ExecutionSummary,
+)
+from rsf.inspect.server import create_app
+
+_T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _summary(n: int, status: ExecutionStatus = ExecutionStatus.SUCCEEDED, name: str | None = None) -> ExecutionSummary:
+    return ExecutionSummary(
+        execution_id=f"exec-{n:03d}",
+        name=name or f"order-{n}",
+        status=status,
+        function_name="fn",
+        start_time=_T0 + timedelta(minutes=n),
+        end_time=None if status == ExecutionStatus.RUNNING else _T0 + timedelta(minutes=n, seconds=30),
+    )
+
+
+def _detail(summary: ExecutionSummary, **kwargs) -> ExecutionDetail:
+    return ExecutionDetail(**summary.model_dump(), **kwargs)
+
+
+class _FakeApi:
+    """list_executions() over a newest-first list, paged by integer NextTokens."""
+
+    def __init__(self, summaries: list[ExecutionSummary], page_size: int = 2) -> None:
+        self.summaries = summaries
+        self.page_size = page_size
+        self.pages = 0
+        self.fail_after: int | None = None
+        self.details: dict[str, ExecutionDetail] = {}
+
+    async def list_executions(self, status=None, max_items=50, next_token=None) -> ExecutionListResponse:
+        if self.fail_after is not None and self.pages >= self.fail_after:
+            raise RuntimeError("throttled")
+        self.pages += 1
+        ordered = sorted(self.summaries, key=lambda s: s.start_time, reverse=True)
+        start = int(next_token or 0)
+        end = start + self.page_size
+        return ExecutionListResponse(
+            executions=ordered[start:end],
+            next_token=str(end) if end < len(ordered) else None,
+        )
+
+    async def get_execution(self, execution_id: str) -> ExecutionDetail:
+        if execution_id in self.details:
+            return self.details[execution_id]
+        summary = next(s for s in self.summaries if s.execution_id == execution_id)
+        return _detail(summary)
+
+
+def _indexer(api: _FakeApi, index: ExecutionIndex, details: bool = False) -> ExecutionIndexer:
+    client = MagicMock(spec=LambdaInspectClient)
+    client.function_name = "fn"
+    client.list_executions = AsyncMock(side_effect=api.list_executions)
+    client.get_execution = AsyncMock(side_effect=api.get_execution)
+    return ExecutionIndexer(client, index, details=details)
+
+
+class TestExecutionIndexQuery:
+    @pytest.fixture
+    def index(self):
+        index = ExecutionIndex()
+        index.upsert(
+            "fn",
+            [
+                _summary(1),
+                _summary(2, ExecutionStatus.FAILED),
+                _summary(3, ExecutionStatus.FAILED, name="refund-3"),
+                _summary(4, ExecutionStatus.RUNNING),
+            ],
+        )
+        index.upsert("other-fn", [_summary(5, ExecutionStatus.FAILED)])
+        return index
+
+    def _ids(self, result) -> list[str]:
+        return [summary.execution_id for summary in result[0]]
+
+    def test_newest_first_by_default(self, index):
+        assert self._ids(index.query("fn")) == ["exec-004", "exec-003", "exec-002", "exec-001"]
+
+    def test_status_and_time_filters(self, index):
+        failed = index.query("fn", status=ExecutionStatus.FAILED)
+        assert self._ids(failed) == ["exec-003", "exec-002"]
+        window = index.query("fn", since=_T0 + timedelta(minutes=2), until=_T0 + timedelta(minutes=4))
+        assert self._ids(window) == ["exec-003", "exec-002"]
+
+    def test_sort_and_pagination(self, index):
+        page, next_offset = index.query("fn", sort="name", descending=False, limit=3)
+        assert [s.name for s in page] == ["order-1", "order-2", "order-4"]
+        assert next_offset == 3
+        page, next_offset = index.query("fn", sort="name", descending=False, limit=3, offset=next_offset)
+        assert [s.name for s in page] == ["refund-3"]
+        assert next_offset is None
+
+    def test_full_text_search(self, index):
+        assert self._ids(index.query("fn", text="refund*")) == ["exec-003"]
+        assert self._ids(index.query("fn", text="order-2 OR refund*")) == []
+        assert self._ids(index.query("fn", text='"order 2" OR refund*')) == ["exec-003", "exec-002"]
+
+    def test_invalid_search_syntax_is_a_phrase(self, index):
+        assert self._ids(index.query("fn", text="exec-001")) == ["exec-001"]
+        assert self._ids(index.query("fn", text='"unbalanced')) == []
+
+    def test_details_are_searchable(self, index):
+        summary = _summary(2, ExecutionStatus.FAILED)
+        detail = _detail(
+            summary,
+            input_payload={"customer_id": "X", "amount": 10},
+            error=ExecutionError(error="PaymentDeclined", cause="card expired"),
+        )
+        index.add_details("fn", "exec-002", detail)
+
+        assert self._ids(index.query("fn", inputs={"customer_id": "X"})) == ["exec-002"]
+        assert self._ids(index.query("fn", inputs={"amount": "10"})) == ["exec-002"]
+        assert self._ids(index.query("fn", inputs={"customer_id": "Y"})) == []
+        assert self._ids(index.query("fn", text="PaymentDeclined")) == ["exec-002"]
+        assert self._ids(index.query("fn", text="expired")) == ["exec-002"]
+        assert "exec-002" not in index.missing_details("fn")
+
+    def test_unknown_sort_key(self, index):
+        with pytest.raises(ValueError):
+            index.query("fn", sort="input")  # type: ignore[arg-type]
+
+    def test_upsert_counts_only_changes(self, index):
+        assert index.upsert("fn", [_summary(1), _summary(2, ExecutionStatus.FAILED)]) == 0
+        assert index.upsert("fn", [_summary(4, ExecutionStatus.SUCCEEDED)]) == 1
+        assert index.running("fn") == []
+
+
+class TestExecutionIndexer:
+    @pytest.mark.asyncio
+    async def test_full_sync_resumes_after_interruption(self, tmp_path):
+        api = _FakeApi([_summary(n) for n in range(1, 8)])
+        path = tmp_path / "index.db"
+
+        index = ExecutionIndex(path)
+        api.fail_after = 2
+        with pytest.raises(RuntimeError):
+            await _indexer(api, index).sync_once()
+        assert len(index) == 4
+        assert index.sync_state("fn") == ("4", False)
+        index.close()
+
+        index = ExecutionIndex(path)
+        api.fail_after = None
+        await _indexer(api, index).sync_once()
+        assert api.pages == 4  # two before the failure, two to finish
+        assert len(index) == 7
+        assert index.sync_state("fn") == (None, True)
+
+    @pytest.mark.asyncio
+    async def test_refresh_stops_at_first_unchanged_page(self):
+        api = _FakeApi([_summary(n) for n in range(1, 11)])
+        index = ExecutionIndex()
+        await _indexer(api, index).sync_once()
+
+        api.pages = 0
+        api.summaries.append(_summary(11))
+        assert await _indexer(api, index).sync_once() == 1
+        assert api.pages == 2
+        assert len(index) == 11
+
+    @pytest.mark.asyncio
+    async def test_refresh_updates_running_executions_beyond_read_pages(self):
+        api = _FakeApi([_summary(1, ExecutionStatus.RUNNING)] + [_summary(n) for n in range(2, 8)])
+        index = ExecutionIndex()
+        await _indexer(api, index).sync_once()
+        assert index.running("fn") == ["exec-001"]
+
+        api.summaries[0] = _summary(1, ExecutionStatus.FAILED)
+        await _indexer(api, index).sync_once()
+        assert index.running("fn") == []
+        failed, _ = index.query("fn", status=ExecutionStatus.FAILED)
+        assert [s.execution_id for s in failed] == ["exec-001"]
+
+    @pytest.mark.asyncio
+    async def test_details_fetched_for_terminal_executions(self):
+        api = _FakeApi([_summary(1), _summary(2, ExecutionStatus.RUNNING)])
+        api.details["exec-001"] = _detail(_summary(1), input_payload={"customer_id": "X"})
+        index = ExecutionIndex()
+        indexer = _indexer(api, index, details=True)
+        await indexer.sync_once()
+
+        assert indexer.client.get_execution.await_count == 1
+        found, _ = index.query("fn", inputs={"customer_id": "X"})
+        assert [s.execution_id for s in found] == ["exec-001"]
+
+    @pytest.mark.asyncio
+    async def test_failed_detail_fetch_is_skipped(self):
+        api = _FakeApi([_summary(n) for n in range(3)])
+        index = ExecutionIndex()
+        indexer = _indexer(api, index, details=True)
+        fetch = indexer.client.get_execution.side_effect
+
+        async def get_execution(execution_id: str) -> ExecutionDetail:
+            if execution_id == "exec-002":
+                raise RuntimeError("ResourceNotFoundException")
+            return await fetch(execution_id)
+
+        indexer.client.get_execution.side_effect = get_execution
+        await indexer.sync_once()
+        await indexer.sync_once()
+
+        calls = [call.args[0] for call in indexer.client.get_execution.await_args_list]
+        assert calls == ["exec-002", "exec-001", "exec-000"]
+        assert index.missing_details("fn") == []
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock(spec=LambdaInspectClient)
+    client.function_name = "fn"
+    client.list_executions = AsyncMock(return_value=ExecutionListResponse(executions=[_summary(9)]))
+    return client
+
+
+def _app(mock_client, index: ExecutionIndex | None):
+    application = create_app()
+    application.state.inspect_client = mock_client
+    application.state.execution_index = index
+    return application
+
+
+class TestIndexedEndpoint:
+    @pytest.mark.asyncio
+    async def test_search_served_from_index(self, mock_client):
+        index = ExecutionIndex()
+        index.upsert(
+            "fn", [_summary(n, ExecutionStatus.FAILED if n % 2 else ExecutionStatus.SUCCEEDED) for n in range(1, 6)]
+        )
+        index.save_sync_state("fn", None, complete=True)
+        transport = ASGITransport(app=_app(mock_client, index))
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            first = await c.get(
+                "/api/inspect/executions",
+                params={"status": "FAILED", "sort": "start_time", "order": "asc", "max_items": 2},
+            )
+            second = await c.get(
+                "/api/inspect/executions",
+                params={"status": "FAILED", "order": "asc", "max_items": 2, "next_token": first.json()["next_token"]},
+            )
+            search = await c.get("/api/inspect/executions", params={"q": "order-4"})
+
+        mock_client.list_executions.assert_not_called()
+        assert [e["execution_id"] for e in first.json()["executions"]] == ["exec-001", "exec-003"]
+        assert first.json()["next_token"] == "idx:2"
+        assert [e["execution_id"] for e in second.json()["executions"]] == ["exec-005"]
+        assert second.json()["next_token"] is None
+        assert [e["execution_id"] for e in search.json()["executions"]] == ["exec-004"]
+
+    @pytest.mark.asyncio
+    async def test_plain_listing_uses_api_until_index_complete(self, mock_client):
+        index = ExecutionIndex()
+        index.upsert("fn", [_summary(1)])
+        transport = ASGITransport(app=_app(mock_client, index))
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            resp = await c.get("/api/inspect/executions")
+
+        assert [e["execution_id"] for e in resp.json()["executions"]] == ["exec-009"]
+
+    @pytest.mark.asyncio
+    async def test_lambda_token_keeps_paging_the_api_after_sync(self, mock_client):
+        index = ExecutionIndex()
+        index.upsert("fn", [_summary(n) for n in range(1, 4)])
+        index.save_sync_state("fn", None, complete=True)
+        transport = ASGITransport(app=_app(mock_client, index))
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            from_api = await c.get("/api/inspect/executions", params={"next_token": "lambda-token"})
+            from_index = await c.get("/api/inspect/executions", params={"max_items": 2})
+            next_page = await c.get(
+                "/api/inspect/executions", params={"max_items": 2, "next_token": from_index.json()["next_token"]}
+            )
+
+        assert [e["execution_id"] for e in from_api.json()["executions"]] == ["exec-009"]
+        assert mock_client.list_executions.await_args.kwargs["next_token"] == "lambda-token"
+        assert [e["execution_id"] for e in next_page.json()["executions"]] == ["exec-001"]
+        assert mock_client.list_executions.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_bad_requests(self, mock_client):
+        transport = ASGITransport(app=_app(mock_client, None))
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            no_index = await c.get("/api/inspect/executions", params={"q": "order"})
+        assert no_index.status_code == 400
+
+        transport = ASGITransport(app=_app(mock_client, ExecutionIndex()))
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            bad_sort = await c.get("/api/inspect/executions", params={"sort": "input"})
+            bad_input = await c.get("/api/inspect/executions", params={"input": "customer_id"})
+            bad_token = await c.get("/api/inspect/executions", params={"q": "x", "next_token": "abc"})
+            bad_offset = await c.get("/api/inspect/executions", params={"q": "x", "next_token": "idx:abc"})
+        assert bad_sort.status_code == 422
+        assert bad_input.status_code == 400
+        assert bad_token.status_code == 400
+        assert bad_offset.status_code == 400
+
+    def test_indexer_runs_with_the_app(self, tmp_path):
+        application = create_app(function_name="fn", region_name="us-east-1", index_path=tmp_path / "index.db")
+        assert isinstance(application.state.indexer, ExecutionIndexer)
+        application.state.indexer.start = MagicMock()
+        application.state.indexer.stop = AsyncMock()
+        with TestClient(application):
+            application.state.indexer.start.assert_called_once()
+        application.state.indexer.stop.assert_awaited_once()
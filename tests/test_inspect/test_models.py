@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 import pytest
+from botocore.utils import parse_timestamp
 
 from rsf.inspect.models import (
     TERMINAL_STATUSES,
@@ -14,7 +18,10 @@ from rsf.inspect.models import (
     ExecutionStatus,
     ExecutionSummary,
     HistoryEvent,
+    dump_history_json,
     normalize_timestamp,
+    normalize_timestamps,
+    parse_history,
 )
 
 
@@ -242,6 +249,131 @@ class TestHistoryEvent:
         assert evt.timestamp.tzinfo == timezone.utc
 
 
+# -----------------------------------------------------------------------
+# Bulk history parsing and serialization
+# -----------------------------------------------------------------------
+
+
+def _raw_events(count: int) -> list[dict]:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "EventId": i + 1,
+            "Timestamp": start + timedelta(milliseconds=i),
+            "EventType": "StepSucceeded" if i % 2 else "StepStarted",
+            "SubType": "Step",
+            "Details": {"stateName": f"S{i // 2}", "output": {"step": i}},
+        }
+        for i in range(count)
+    ]
+
+
+def _parse_per_event(events: list[dict]) -> list[HistoryEvent]:
+    """The one-model-per-event parse that parse_history replaces."""
+    return [
+        HistoryEvent(
+            event_id=evt.get("EventId", 0),
+            timestamp=normalize_timestamp(evt.get("Timestamp", 0)),
+            event_type=evt.get("EventType", ""),
+            sub_type=evt.get("SubType"),
+            details=evt.get("Details", {}),
+        )
+        for evt in events
+    ]
+
+
+class TestNormalizeTimestamps:
+    def test_matches_normalize_timestamp(self):
+        values = [
+            0,
+            1700000000.5,
+            datetime(2025, 6, 15, 12, 0),
+            datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc),
+            datetime(2025, 6, 15, 14, 0, tzinfo=timezone(timedelta(hours=2))),
+            datetime(2025, 6, 15, 14, 0, tzinfo=ZoneInfo("Europe/Berlin")),
+            datetime(2025, 1, 15, 13, 0, tzinfo=ZoneInfo("Europe/Berlin")),
+            "2025-06-15T12:00:00+00:00",
+        ]
+        result = normalize_timestamps(values)
+        assert result == [normalize_timestamp(value) for value in values]
+        assert all(dt.tzinfo is timezone.utc for dt in result)
+
+    def test_utc_values_pass_through(self):
+        value = datetime(2025, 6, 15, tzinfo=timezone.utc)
+        assert normalize_timestamps([value])[0] is value
+
+    def test_invalid_raises(self):
+        with pytest.raises(TypeError):
+            normalize_timestamps([[1, 2, 3]])
+
+    def test_botocore_timestamps(self):
+        """botocore's dateutil tzinfos (tzlocal, tzoffset) are unhashable; they must still normalize."""
+        values = [
+            parse_timestamp("2024-01-01T00:00:00Z"),
+            parse_timestamp(1700000000),
+            parse_timestamp("2024-01-01T02:00:00+02:00"),
+            parse_timestamp("2024-01-01T00:00:01Z"),
+        ]
+        assert normalize_timestamps(values) == [normalize_timestamp(value) for value in values]
+
+
+class TestParseHistory:
+    def test_matches_per_event_parse(self):
+        raw = _raw_events(20) + [{"EventId": 21, "Timestamp": 1700000000, "EventType": "Log", "Details": None}]
+        assert parse_history(raw) == _parse_per_event(raw[:-1]) + [
+            HistoryEvent(event_id=21, timestamp=1700000000, event_type="Log")
+        ]
+
+    def test_botocore_timestamps(self):
+        raw = [
+            {"EventId": 1, "Timestamp": parse_timestamp("2024-01-01T00:00:00Z"), "EventType": "StepStarted"},
+            {"EventId": 2, "Timestamp": parse_timestamp("2024-01-01T02:00:01+02:00"), "EventType": "StepSucceeded"},
+        ]
+        history = parse_history(raw)
+        assert [evt.timestamp for evt in history] == [
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 1, 0, 0, 1, tzinfo=timezone.utc),
+        ]
+
+    def test_invalid_event_raises(self):
+        with pytest.raises(ValueError):
+            parse_history([{"EventId": "not-a-number", "Timestamp": 0}])
+
+    def test_dump_matches_model_dump(self):
+        history = parse_history(_raw_events(20))
+        assert json.loads(dump_history_json(history)) == [evt.model_dump(mode="json") for evt in history]
+
+
+@pytest.mark.benchmark
+class TestHistoryBenchmarks:
+    """Parse and serialize budgets for long histories, against the per-event path (run with --run-benchmarks)."""
+
+    N = 50_000
+
+    @staticmethod
+    def _seconds(fn) -> float:
+        best = float("inf")
+        for _ in range(2):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def test_parse_time(self):
+        raw = _raw_events(self.N)
+        assert len(parse_history(raw)) == self.N
+        bulk = self._seconds(lambda: parse_history(raw))
+        per_event = self._seconds(lambda: _parse_per_event(raw))
+        # On par with the per-event parse: no faster without pausing the GC, which a parser must not do
+        assert bulk < per_event * 1.5
+
+    def test_serialize_time(self):
+        history = parse_history(_raw_events(self.N))
+        direct = self._seconds(lambda: dump_history_json(history))
+        via_dicts = self._seconds(lambda: json.dumps([evt.model_dump(mode="json") for evt in history]).encode())
+        assert direct < via_dicts / 2
+
+
 # -----------------------------------------------------------------------
 # ExecutionListResponse
 # -----------------------------------------------------------------------
@@ -0,0 +1,252 @@
+"""Tests for bulk redrive (concurrency, rate, journal, payload patch)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from rsf.inspect.client import LambdaInspectClient
+from rsf.inspect.models import ExecutionDetail, ExecutionListResponse, ExecutionStatus, ExecutionSummary
+from rsf.inspect.redrive import RedriveJournal, Redriver, merge_patch, parse_rate
+from rsf.inspect.server import create_app
+
+_NOW = datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def _summary(n: int, hours_ago: float) -> ExecutionSummary:
+    return ExecutionSummary(
+        execution_id=f"exec-{n:03d}",
+        status=ExecutionStatus.FAILED,
+        function_name="fn",
+        start_time=_NOW - timedelta(hours=hours_ago),
+    )
+
+
+def _client(status: ExecutionStatus = ExecutionStatus.FAILED) -> MagicMock:
+    client = MagicMock(spec=LambdaInspectClient)
+    client.function_name = "fn"
+
+    async def get_execution(execution_id: str) -> ExecutionDetail:
+        return ExecutionDetail(
+            execution_id=execution_id,
+            status=status,
+            function_name="fn",
+            start_time=_NOW,
+            input_payload={"order_id": execution_id, "mode": "normal"},
+        )
+
+    client.get_execution = AsyncMock(side_effect=get_execution)
+    client.invoke_execution = AsyncMock(
+        side_effect=lambda payload: {"StatusCode": 202, "ResponseMetadata": {"RequestId": f"req-{payload['order_id']}"}}
+    )
+    return client
+
+
+async def _collect(redriver: Redriver, ids: list[str]):
+    return [progress.to_dict() async for progress in redriver.run(ids)]
+
+
+class TestRedriver:
+    @pytest.mark.asyncio
+    async def test_redrives_with_original_payload(self):
+        client = _client()
+        reports = await _collect(Redriver(client), ["exec-001", "exec-002"])
+
+        assert reports[-1] | {"outcome": None} == {
+            "total": 2,
+            "succeeded": 2,
+            "failed": 0,
+            "skipped": 0,
+            "outcome": None,
+        }
+        payloads = sorted(call.args[0]["order_id"] for call in client.invoke_execution.await_args_list)
+        assert payloads == ["exec-001", "exec-002"]
+
+    @pytest.mark.asyncio
+    async def test_patch_applied(self):
+        client = _client()
+        await _collect(Redriver(client, patch={"mode": "redrive", "order_id": None, "extra": {"a": 1}}), ["exec-001"])
+        assert client.invoke_execution.await_args.args[0] == {"mode": "redrive", "extra": {"a": 1}}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self):
+        client = _client()
+        in_flight = peak = 0
+
+        async def invoke(payload):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"StatusCode": 202}
+
+        client.invoke_execution = AsyncMock(side_effect=invoke)
+        reports = await _collect(Redriver(client, concurrency=3), [f"exec-{n}" for n in range(12)])
+        assert peak == 3
+        assert reports[-1]["succeeded"] == 12
+
+    @pytest.mark.asyncio
+    async def test_rate_limited(self):
+        client = _client()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await _collect(Redriver(client, concurrency=10, rate=50.0), [f"exec-{n}" for n in range(6)])
+        # One token up front, then one every 20 ms
+        assert loop.time() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_failures_are_reported(self):
+        client = _client(status=ExecutionStatus.RUNNING)
+        reports = await _collect(Redriver(client), ["exec-001"])
+        assert reports[-1]["failed"] == 1
+        assert reports[-1]["outcome"]["error"] == "Execution is RUNNING"
+        client.invoke_execution.assert_not_called()
+
+        client = _client()
+        client.invoke_execution = AsyncMock(side_effect=RuntimeError("TooManyRequestsException"))
+        reports = await _collect(Redriver(client), ["exec-001"])
+        assert reports[-1]["outcome"]["ok"] is False
+        assert reports[-1]["outcome"]["error"] == "TooManyRequestsException"
+
+    @pytest.mark.asyncio
+    async def test_journal_resumes(self, tmp_path):
+        path = tmp_path / "redrive.jsonl"
+        client = _client()
+        client.invoke_execution = AsyncMock(
+            side_effect=[{"StatusCode": 202}, RuntimeError("throttled"), {"StatusCode": 202}]
+        )
+        await _collect(Redriver(client, concurrency=1, journal=RedriveJournal(path)), ["a", "b", "c"])
+        assert len(path.read_text().splitlines()) == 3
+
+        client = _client()
+        reports = await _collect(Redriver(client, journal=RedriveJournal(path)), ["a", "b", "c"])
+        assert reports[0]["skipped"] == 2
+        assert reports[-1] | {"outcome": None} == {
+            "total": 3,
+            "succeeded": 1,
+            "failed": 0,
+            "skipped": 2,
+            "outcome": None,
+        }
+        assert [call.args[0] for call in client.get_execution.await_args_list] == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_journal_records_outcomes_the_consumer_never_saw(self, tmp_path):
+        path = tmp_path / "redrive.jsonl"
+        client = _client()
+        ids = [f"exec-{n}" for n in range(10)]
+        progress = Redriver(client, concurrency=5, journal=RedriveJournal(path)).run(ids)
+        await anext(progress)
+        await asyncio.sleep(0.05)  # workers keep going while the consumer is busy
+        await progress.aclose()
+
+        journal = RedriveJournal(path)
+        assert client.invoke_execution.await_count == len(journal) == 10
+
+    @pytest.mark.parametrize("ids", [["a"], ["a", "b", "c", "d"]])
+    @pytest.mark.asyncio
+    async def test_journal_write_failure_is_raised(self, tmp_path, ids):
+        journal = RedriveJournal(tmp_path / "redrive.jsonl")
+        journal.record = MagicMock(side_effect=OSError(28, "No space left on device"))
+        reports = []
+
+        async def consume():
+            async for progress in Redriver(_client(), concurrency=2, journal=journal).run(ids):
+                reports.append(progress.to_dict())
+
+        with pytest.raises(OSError, match="No space left"):
+            await asyncio.wait_for(consume(), timeout=5)
+        # The outcome whose record failed is still reported
+        assert reports[0]["outcome"]["ok"] is True
+
+    @pytest.mark.asyncio
+    async def test_select_by_time_window(self):
+        client = _client()
+        pages = [
+            ExecutionListResponse(executions=[_summary(5, 0.5), _summary(4, 1.5)], next_token="2"),
+            ExecutionListResponse(executions=[_summary(3, 2.5), _summary(2, 3.5)], next_token="4"),
+            ExecutionListResponse(executions=[_summary(1, 4.5)]),
+        ]
+        client.list_executions = AsyncMock(side_effect=pages)
+
+        selected = await Redriver(client).select(
+            ExecutionStatus.FAILED, since=_NOW - timedelta(hours=3), until=_NOW - timedelta(hours=1)
+        )
+        assert selected == ["exec-003", "exec-004"]
+        assert client.list_executions.await_count == 2
+        assert client.list_executions.await_args_list[0].kwargs["status"] == ExecutionStatus.FAILED
+
+
+def test_merge_patch():
+    assert merge_patch({"a": 1, "b": {"c": 2, "d": 3}}, {"b": {"c": None, "e": 4}, "f": [1]}) == {
+        "a": 1,
+        "b": {"d": 3, "e": 4},
+        "f": [1],
+    }
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("3/s", 3.0), ("120/min", 2.0), ("1.5", 1.5), ("3600/h", 1.0)],
+)
+def test_parse_rate(value, expected):
+    assert parse_rate(value) == expected
+
+
+@pytest.mark.parametrize("value", ["fast", "3/week", "0/s", "-1/s"])
+def test_parse_rate_invalid(value):
+    with pytest.raises(ValueError):
+        parse_rate(value)
+
+
+class TestRedriveEndpoint:
+    @pytest.mark.asyncio
+    async def test_streams_progress(self):
+        app = create_app()
+        app.state.inspect_client = _client()
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            async with c.stream(
+                "POST",
+                "/api/inspect/redrive",
+                json={"execution_ids": ["exec-001", "exec-002"], "concurrency": 2, "patch": {"mode": "redrive"}},
+            ) as resp:
+                assert resp.status_code == 200
+                lines = [line async for line in resp.aiter_lines()]
+
+        events = [line.removeprefix("event: ").strip() for line in lines if line.startswith("event:")]
+        data = [json.loads(line.removeprefix("data: ")) for line in lines if line.startswith("data:")]
+        assert events == ["selected", "progress", "progress", "done"]
+        assert data[0] == {"execution_ids": ["exec-001", "exec-002"]}
+        assert data[-1] == {"total": 2, "succeeded": 2, "failed": 0, "skipped": 0}
+
+    @pytest.mark.asyncio
+    async def test_dry_run_selects_only(self):
+        client = _client()
+        client.list_executions = AsyncMock(return_value=ExecutionListResponse(executions=[_summary(1, 1)]))
+        app = create_app()
+        app.state.inspect_client = client
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            async with c.stream("POST", "/api/inspect/redrive", json={"dry_run": True}) as resp:
+                raw = "\n".join([line async for line in resp.aiter_lines()])
+
+        assert "event: selected" in raw
+        assert "exec-001" in raw
+        assert "event: progress" not in raw
+        client.invoke_execution.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_request(self):
+        app = create_app()
+        app.state.inspect_client = _client()
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            resp = await c.post("/api/inspect/redrive", json={"concurrency": 0})
+        assert resp.status_code == 422
@@ -319,7 +319,7 @@ class TestSSEStream:
         mock_client.get_execution = mock_get_execution
 
         # Patch asyncio.sleep to avoid real waiting.
-        with patch("rsf.inspect.router.asyncio.sleep", new_callable=AsyncMock):
+        with patch("rsf.inspect.hub.asyncio.sleep", new_callable=AsyncMock):
             transport = ASGITransport(app=app)
             async with AsyncClient(transport=transport, base_url="http://test") as c:
                 async with c.stream("GET", "/api/inspect/execution/exec-001/stream") as resp:
@@ -354,3 +354,107 @@ class TestSSEStream:
         assert "event: execution_info" in raw
         # No history event because there are no events.
         assert "event: history" not in raw
+
+
+# -----------------------------------------------------------------------
+# GET /api/inspect/stats
+# -----------------------------------------------------------------------
+
+
+class TestStats:
+    @pytest.mark.asyncio
+    async def test_stats_without_client(self):
+        transport = ASGITransport(app=create_app())
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            resp = await c.get("/api/inspect/stats")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["client"] is None
+        assert data["cache"] == {"entries": 0, "hits": 0, "misses": 0}
+        assert data["streams"] == {"pollers": 0, "subscribers": 0, "polls": 0}
+
+    @pytest.mark.asyncio
+    async def test_stats_report_lanes_and_cache(self):
+        with patch("rsf.inspect.client.boto3") as mock_boto3:
+            mock_boto3.client.return_value.get_durable_execution.return_value = {
+                "DurableExecution": {"ExecutionId": "exec-001", "Status": "SUCCEEDED"}
+            }
+            application = create_app(function_name="test-func")
+            transport = ASGITransport(app=application)
+            async with AsyncClient(transport=transport, base_url="http://test") as c:
+                await c.get("/api/inspect/execution/exec-001")
+                await c.get("/api/inspect/execution/exec-001")
+                data = (await c.get("/api/inspect/stats")).json()
+
+        assert data["client"]["upstream_calls"] == 1
+        assert data["client"]["rate_limiter"]["lanes"]["interactive"]["granted"] == 1
+        assert set(data["client"]["rate_limiter"]["lanes"]) == {"interactive", "poll", "background"}
+        assert (data["cache"]["hits"], data["cache"]["misses"]) == (1, 1)
+
+
+# -----------------------------------------------------------------------
+# Multi-function inspector
+# -----------------------------------------------------------------------
+
+
+class TestMultiFunction:
+    @pytest.fixture
+    def multi_app(self):
+        with patch("rsf.inspect.client.boto3"):
+            application = create_app(functions=["arn:aws:lambda:us-east-2:123456789:function:orders", "payments"])
+        pool = application.state.client_pool
+        for name in pool.names:
+            client = MagicMock(spec=LambdaInspectClient)
+            client.function_name = pool.functions[name]
+            client.list_executions = AsyncMock(return_value=ExecutionListResponse(executions=[_make_summary(name)]))
+            client.get_execution = AsyncMock(
+                return_value=_make_detail(f"exec-{name}", status=ExecutionStatus.SUCCEEDED)
+            )
+            pool._clients[name] = client
+        return application
+
+    def test_pool_built_from_functions(self):
+        with patch("rsf.inspect.client.boto3"):
+            application = create_app(function_name="orders", functions=["payments", "orders"])
+        pool = application.state.client_pool
+        assert pool.names == ["orders", "payments"]
+        assert application.state.inspect_client is pool.get("orders")
+
+    @pytest.mark.asyncio
+    async def test_lists_functions(self, multi_app):
+        transport = ASGITransport(app=multi_app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            resp = await c.get("/api/inspect/functions")
+
+        assert resp.json() == {
+            "functions": [
+                {"name": "orders", "function_name": "arn:aws:lambda:us-east-2:123456789:function:orders"},
+                {"name": "payments", "function_name": "payments"},
+            ]
+        }
+
+    @pytest.mark.asyncio
+    async def test_routes_by_function(self, multi_app):
+        transport = ASGITransport(app=multi_app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            orders = await c.get("/api/inspect/orders/executions")
+            payments = await c.get("/api/inspect/payments/executions")
+            missing = await c.get("/api/inspect/shipping/executions")
+
+        assert orders.json()["executions"][0]["execution_id"] == "orders"
+        assert payments.json()["executions"][0]["execution_id"] == "payments"
+        assert missing.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_function(self, multi_app):
+        pool = multi_app.state.client_pool
+        transport = ASGITransport(app=multi_app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            for _ in range(2):
+                await c.get("/api/inspect/orders/execution/exec-1")
+                await c.get("/api/inspect/payments/execution/exec-1")
+
+        assert pool.get("orders").get_execution.await_count == 1
+        assert pool.get("payments").get_execution.await_count == 1
+        assert multi_app.state.execution_cache.get("payments", "exec-1") is not None
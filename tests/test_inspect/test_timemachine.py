@@ -0,0 +1,180 @@
+"""Tests for the server-side time machine (keyframed snapshots and diffs)."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from rsf.inspect.client import LambdaInspectClient
+from rsf.inspect.models import ExecutionDetail, ExecutionStatus, HistoryEvent
+from rsf.inspect.server import create_app
+from rsf.inspect.timemachine import Timeline, diff_values
+
+
+def _event(event_id: int, event_type: str, state: str | None, second: int, **details) -> HistoryEvent:
+    if state is not None:
+        details["stateName"] = state
+    return HistoryEvent(
+        event_id=event_id,
+        timestamp=datetime(2025, 1, 1, 0, 0, second, tzinfo=timezone.utc),
+        event_type=event_type,
+        details=details,
+    )
+
+
+def _history() -> list[HistoryEvent]:
+    return [
+        _event(1, "StateEntered", "A", 0, input='{"order": {"id": 1}}'),
+        _event(2, "StateSucceeded", "A", 5, output={"order": {"id": 1, "total": 10}}),
+        _event(3, "StateEntered", "B", 6),
+        _event(4, "ExecutionLog", None, 7),
+        _event(5, "StateFailed", "B", 8, error={"Error": "Boom"}),
+    ]
+
+
+def _long_history(events: int) -> list[HistoryEvent]:
+    history = []
+    for i in range(events):
+        state = f"S{i // 2}"
+        if i % 2 == 0:
+            history.append(_event(i + 1, "StateEntered", state, i % 60, input={"step": i}))
+        else:
+            history.append(_event(i + 1, "StateSucceeded", state, i % 60, output={"step": i}))
+    return history
+
+
+class TestTimeline:
+    def test_overlays_follow_events(self):
+        timeline = Timeline(_history())
+        assert len(timeline) == 5
+
+        first = timeline.snapshot(0)
+        assert first["timestamp"] == "2025-01-01T00:00:00Z"
+        assert first["nodes"]["A"]["status"] == "running"
+        assert first["nodes"]["A"]["input"] == {"order": {"id": 1}}
+        assert "B" not in first["nodes"]
+
+        second = timeline.snapshot(1)
+        assert second["nodes"]["A"]["status"] == "succeeded"
+        assert second["nodes"]["A"]["duration_ms"] == 5000
+
+        last = timeline.snapshot(4)
+        assert last["nodes"]["B"]["status"] == "failed"
+        assert last["nodes"]["B"]["error"] == '{"Error": "Boom"}'
+        assert last["transitions"] == {"A": {"B": "2025-01-01T00:00:06Z"}}
+
+    def test_events_without_state_repeat_the_previous_snapshot(self):
+        timeline = Timeline(_history())
+        assert timeline.snapshot(3)["nodes"] == timeline.snapshot(2)["nodes"]
+
+    @pytest.mark.parametrize("interval", [1, 2, 3, 64])
+    def test_keyframe_interval_does_not_change_snapshots(self, interval):
+        history = _long_history(40)
+        reference = Timeline(history, keyframe_interval=1)
+        timeline = Timeline(history, keyframe_interval=interval)
+        for at in range(len(history)):
+            assert timeline.snapshot(at) == reference.snapshot(at)
+
+    def test_window_matches_snapshots(self):
+        timeline = Timeline(_long_history(30), keyframe_interval=8)
+        window = timeline.window(5, 10)
+        assert [snapshot["index"] for snapshot in window] == list(range(5, 15))
+        assert window == [timeline.snapshot(at) for at in range(5, 15)]
+        assert len(timeline.window(25, 10)) == 5
+
+    def test_out_of_range(self):
+        with pytest.raises(IndexError):
+            Timeline(_history()).snapshot(5)
+
+    def test_diff(self):
+        diff = Timeline(_history()).diff(0, 4)
+        assert diff["nodes"]["A"] == [
+            {"path": "duration_ms", "type": "added", "new_value": 5000},
+            {"path": "exited_at", "type": "added", "new_value": "2025-01-01T00:00:05Z"},
+            {"path": "output.order.id", "type": "added", "new_value": 1},
+            {"path": "output.order.total", "type": "added", "new_value": 10},
+            {"path": "status", "type": "changed", "old_value": "running", "new_value": "succeeded"},
+        ]
+        status = {"path": "status", "type": "changed", "old_value": "pending", "new_value": "failed"}
+        assert status in diff["nodes"]["B"]
+        assert diff["transitions"] == [{"source": "A", "target": "B", "timestamp": "2025-01-01T00:00:06Z"}]
+        assert Timeline(_history()).diff(2, 3)["nodes"] == {}
+
+    def test_diff_values(self):
+        changes = diff_values(
+            {"order": {"id": 1, "items": [1]}, "gone": True},
+            {"order": {"id": 2, "items": [1], "total": 3}},
+        )
+        assert changes == [
+            {"path": "gone", "type": "removed", "old_value": True},
+            {"path": "order.id", "type": "changed", "old_value": 1, "new_value": 2},
+            {"path": "order.total", "type": "added", "new_value": 3},
+        ]
+
+    def test_payloads_are_shared_not_copied(self):
+        timeline = Timeline(_long_history(200), keyframe_interval=16)
+        a = timeline.snapshot(100)["nodes"]["S0"]
+        b = timeline.snapshot(150)["nodes"]["S0"]
+        assert a is b
+
+    def test_bodies_memoized(self):
+        timeline = Timeline(_history())
+        assert timeline.snapshot_body(2) is timeline.snapshot_body(2)
+        assert timeline.diff_body(0, 4) is timeline.diff_body(0, 4)
+
+
+def _detail(history: list[HistoryEvent]) -> ExecutionDetail:
+    return ExecutionDetail(
+        execution_id="exec-001",
+        status=ExecutionStatus.FAILED,
+        function_name="test-func",
+        start_time=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        history=history,
+    )
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock(spec=LambdaInspectClient)
+    client.get_execution = AsyncMock(return_value=_detail(_history()))
+    return client
+
+
+@pytest.fixture
+def app(mock_client):
+    application = create_app()
+    application.state.inspect_client = mock_client
+    return application
+
+
+class TestTimeMachineEndpoints:
+    @pytest.mark.asyncio
+    async def test_snapshot_window_and_diff(self, app, mock_client):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            snapshot = await c.get("/api/inspect/execution/exec-001/snapshot", params={"at": 1})
+            window = await c.get("/api/inspect/execution/exec-001/snapshots", params={"start": 3, "count": 50})
+            diff = await c.get("/api/inspect/execution/exec-001/diff", params={"from": 0, "to": 2})
+
+        assert snapshot.status_code == 200
+        assert snapshot.json()["nodes"]["A"]["status"] == "succeeded"
+        assert window.json()["event_count"] == 5
+        assert [s["index"] for s in window.json()["snapshots"]] == [3, 4]
+        assert diff.json()["transitions"][0]["target"] == "B"
+        # One fetch and one replay for all three
+        assert mock_client.get_execution.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_out_of_range_is_404(self, app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as c:
+            snapshot = await c.get("/api/inspect/execution/exec-001/snapshot", params={"at": 5})
+            diff = await c.get("/api/inspect/execution/exec-001/diff", params={"from": 0, "to": 9})
+            negative = await c.get("/api/inspect/execution/exec-001/snapshot", params={"at": -1})
+
+        assert snapshot.status_code == 404
+        assert diff.status_code == 404
+        assert negative.status_code == 422
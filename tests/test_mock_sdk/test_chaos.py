@@ -3,13 +3,23 @@
 API matches real SDK: context.step(func, name=None)
 """
 
+import random
+import time
+
 import pytest
 
 from rsf.testing.chaos import (
     ChaosFixture,
     ChaosThrottleError,
     ChaosTimeoutError,
+    FixedLatency,
+    HistogramLatency,
+    LognormalLatency,
+    UniformLatency,
+    latency_percentiles,
+    parse_latency_spec,
 )
+from rsf.testing.clock import VirtualClock
 from tests.mock_sdk import MockDurableContext
 
 
@@ -118,3 +128,91 @@ class TestChaosInjection:
         chaos = ChaosFixture()
         with pytest.raises(ValueError, match="Invalid failure_type"):
             chaos.inject_failure("State", "invalid_type")
+
+
+class TestLatencyInjection:
+    """Test ChaosFixture latency injection."""
+
+    def test_fixed_latency_advances_virtual_clock(self):
+        clock = VirtualClock()
+        chaos = ChaosFixture(clock=clock)
+        chaos.inject_failure("Slow", "latency", latency=2.5)
+        ctx = chaos.patch(MockDurableContext())
+
+        result = ctx.step(lambda _sc: {"ok": True}, "Slow")
+
+        assert result == {"ok": True}  # handler still runs
+        assert clock.elapsed == 2.5
+
+    def test_real_sleep_mode(self):
+        chaos = ChaosFixture()
+        chaos.inject_failure("Slow", "latency", latency=FixedLatency(0.02))
+        ctx = chaos.patch(MockDurableContext())
+
+        start = time.monotonic()
+        ctx.step(lambda _sc: None, "Slow")
+        assert time.monotonic() - start >= 0.02
+
+    def test_probability_is_seeded(self):
+        def injected(seed):
+            clock = VirtualClock()
+            chaos = ChaosFixture(clock=clock, seed=seed)
+            chaos.inject_failure("Flaky", "latency", latency=1.0, probability=0.3)
+            ctx = chaos.patch(MockDurableContext())
+            for _ in range(200):
+                ctx.step(lambda _sc: None, "Flaky")
+            return clock.elapsed
+
+        assert injected(1) == injected(1)
+        assert 20 < injected(1) < 100
+
+    def test_latency_requires_distribution(self):
+        with pytest.raises(ValueError, match="requires a latency"):
+            ChaosFixture().inject_failure("State", "latency")
+
+    def test_invalid_probability_raises(self):
+        with pytest.raises(ValueError, match="probability"):
+            ChaosFixture().inject_failure("State", "exception", probability=1.5)
+
+    def test_lognormal_from_percentiles(self):
+        dist = LognormalLatency.from_percentiles(p99=2.0, p50=0.2)
+        rng = random.Random(0)
+        samples = sorted(dist.sample(rng) for _ in range(5000))
+        assert 0.15 < samples[2500] < 0.25
+        assert 1.5 < samples[4950] < 2.7
+
+    def test_histogram_from_file(self, tmp_path):
+        hist = tmp_path / "latency.json"
+        hist.write_text("[[0.1, 9], [5.0, 1]]")
+        dist = HistogramLatency.from_file(hist)
+        rng = random.Random(0)
+        assert {dist.sample(rng) for _ in range(200)} == {0.1, 5.0}
+
+        text = tmp_path / "latency.txt"
+        text.write_text("# seconds count\n0.25 3\n0.5\n")
+        assert HistogramLatency.from_file(text).values == (0.25, 0.5)
+
+
+class TestParseLatencySpec:
+    def test_forms(self):
+        assert parse_latency_spec("2s") == (FixedLatency(2.0), 1.0)
+        assert parse_latency_spec("fixed=150ms,prob=0.25") == (FixedLatency(0.15), 0.25)
+        assert parse_latency_spec("uniform=100ms..1s") == (UniformLatency(0.1, 1.0), 1.0)
+        dist, _ = parse_latency_spec("p99=2s")
+        assert isinstance(dist, LognormalLatency)
+
+    def test_invalid_specs(self):
+        with pytest.raises(ValueError, match="Invalid duration"):
+            parse_latency_spec("p99=soon")
+        with pytest.raises(ValueError, match="Unknown latency option"):
+            parse_latency_spec("fixed=1s,bogus=2")
+        with pytest.raises(ValueError, match="LOW..HIGH"):
+            parse_latency_spec("uniform=1s")
+
+
+def test_latency_percentiles():
+    stats = latency_percentiles([float(v) for v in range(1, 101)])
+    assert stats["p50"] == 50
+    assert stats["p99"] == 99
+    assert stats["max"] == 100
+    assert latency_percentiles([]) == {}
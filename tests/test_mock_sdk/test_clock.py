@@ -0,0 +1,109 @@
+"""Tests for the virtual clock used by local execution and MockDurableContext."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from rsf.dsl.errors import RetryPolicy
+from rsf.testing.clock import VirtualClock, declared_latency, retry_delay, simulated_latency
+from tests.mock_sdk import Duration, MockDurableContext
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _policy(**kwargs) -> RetryPolicy:
+    return RetryPolicy.model_validate({"ErrorEquals": ["States.ALL"], **kwargs})
+
+
+class TestVirtualClock:
+    def test_advance_moves_elapsed_and_now(self):
+        clock = VirtualClock(start=START)
+        clock.advance(3600)
+        assert clock.elapsed == 3600
+        assert clock.now() == datetime(2026, 1, 1, 1, tzinfo=timezone.utc)
+
+    def test_negative_advance_rejected(self):
+        with pytest.raises(ValueError, match="negative"):
+            VirtualClock().advance(-1)
+
+    def test_sleep_until_future_and_past(self):
+        clock = VirtualClock(start=START)
+        clock.sleep_until(datetime(2026, 1, 1, 0, 10, tzinfo=timezone.utc))
+        assert clock.elapsed == 600
+        clock.sleep_until(START)  # already in the past: no-op
+        assert clock.elapsed == 600
+
+    def test_rewind_cannot_go_forward(self):
+        clock = VirtualClock()
+        clock.advance(5)
+        clock.rewind(2)
+        assert clock.elapsed == 2
+        with pytest.raises(ValueError):
+            clock.rewind(10)
+
+
+class TestRetryDelay:
+    def test_exponential_backoff(self):
+        policy = _policy(IntervalSeconds=2, BackoffRate=3.0)
+        assert [retry_delay(policy, n) for n in range(3)] == [2.0, 6.0, 18.0]
+
+    def test_max_delay_caps_backoff(self):
+        policy = _policy(IntervalSeconds=10, BackoffRate=10.0, MaxDelaySeconds=60)
+        assert retry_delay(policy, 3) == 60.0
+
+    def test_full_jitter_is_bounded_and_seeded(self):
+        policy = _policy(IntervalSeconds=10, JitterStrategy="FULL")
+        first = [retry_delay(policy, n, VirtualClock(seed=7).random) for n in range(3)]
+        second = [retry_delay(policy, n, VirtualClock(seed=7).random) for n in range(3)]
+        assert first == second
+        assert all(0 <= d <= 10 * 2**n for n, d in enumerate(first))
+
+
+class TestSimulatedLatency:
+    def test_decorator_declares_latency(self):
+        @simulated_latency(1.5)
+        def handler(event):
+            return event
+
+        assert declared_latency(handler) == 1.5
+        assert handler({"a": 1}) == {"a": 1}
+        assert declared_latency(lambda e: e) == 0.0
+
+
+class TestMockContextClock:
+    def test_wait_advances_clock(self):
+        clock = VirtualClock(start=START)
+        ctx = MockDurableContext(clock=clock)
+        ctx.wait(Duration.from_hours(2), "Hold")
+        ctx.wait("2026-01-01T05:00:00Z", "Until")
+        assert clock.elapsed == 5 * 3600
+        assert [c.sim_time for c in ctx.calls] == [7200, 18000]
+
+    def test_step_latency_override(self):
+        clock = VirtualClock()
+        ctx = MockDurableContext(clock=clock)
+        ctx.override_latency("Slow", 4)
+        ctx.step(lambda _sc: None, "Slow")
+        ctx.step(lambda _sc: None, "Fast")
+        assert clock.elapsed == 4
+
+    def test_parallel_branches_take_slowest_branch_time(self):
+        clock = VirtualClock()
+        ctx = MockDurableContext(clock=clock)
+
+        def branch(seconds):
+            return lambda bctx: bctx.wait(Duration(seconds=seconds), f"Wait{seconds}")
+
+        ctx.parallel([branch(10), branch(30), branch(20)], "Fanout")
+        assert clock.elapsed == 30
+
+    def test_map_items_take_slowest_item_time(self):
+        clock = VirtualClock()
+        ctx = MockDurableContext(clock=clock)
+        ctx.map([5, 50, 1], lambda ictx, item, idx, _all: ictx.wait(Duration(seconds=item)), "Each")
+        assert clock.elapsed == 50
+
+    def test_no_clock_keeps_existing_behavior(self):
+        ctx = MockDurableContext()
+        ctx.wait(Duration(seconds=100), "Wait")
+        assert ctx.calls[0].sim_time is None
@@ -0,0 +1,231 @@
+"""Tests for LocalDurableContext and its checkpoint stores."""
+
+import inspect
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from rsf.testing.clock import VirtualClock
+from rsf.testing.local_context import (
+    BatchResult,
+    LocalDurableContext,
+    LocalStepContext,
+    MemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from tests.mock_sdk import Duration
+
+# Documented SDK context signatures: method -> parameter names (excluding self)
+SDK_SIGNATURES = {
+    "step": ["func", "name", "config"],
+    "wait": ["duration", "name"],
+    "parallel": ["functions", "name", "config"],
+    "map": ["inputs", "func", "name", "config"],
+}
+
+
+class TestSdkParity:
+    @pytest.mark.parametrize("method, params", SDK_SIGNATURES.items())
+    def test_signature_matches_sdk(self, method, params):
+        signature = inspect.signature(getattr(LocalDurableContext, method))
+        names = [p for p in signature.parameters if p != "self"]
+        assert names == params
+        # Only the leading positional arguments are required, as in the SDK
+        required = [p.name for p in signature.parameters.values() if p.default is inspect.Parameter.empty]
+        assert required == ["self", *params[: len(params) - (2 if "config" in params else 1)]]
+
+    @pytest.mark.parametrize("method", SDK_SIGNATURES)
+    def test_signature_matches_installed_sdk(self, method):
+        sdk = pytest.importorskip("aws_durable_execution_sdk_python")
+        expected = [p for p in inspect.signature(getattr(sdk.DurableContext, method)).parameters if p != "self"]
+        actual = [p for p in inspect.signature(getattr(LocalDurableContext, method)).parameters if p != "self"]
+        assert actual[: len(expected)] == expected
+
+    def test_step_receives_step_context_with_logger(self):
+        seen = []
+        LocalDurableContext().step(lambda sc: seen.append(sc))
+        assert isinstance(seen[0], LocalStepContext)
+        assert seen[0].logger is not None
+
+
+class TestOperations:
+    def test_step_and_wait_are_recorded(self):
+        ctx = LocalDurableContext()
+        assert ctx.step(lambda _sc: {"ok": True}, "Work") == {"ok": True}
+        ctx.wait(Duration(seconds=5), "Pause")
+
+        assert [(c.operation, c.name) for c in ctx.calls] == [("step", "Work"), ("wait", "Pause")]
+        assert ctx.calls[0].result == {"ok": True}
+
+    def test_step_failure_is_recorded_and_raised(self):
+        ctx = LocalDurableContext()
+        with pytest.raises(ValueError, match="boom"):
+            ctx.step(lambda _sc: (_ for _ in ()).throw(ValueError("boom")), "Bad")
+        assert ctx.calls[0].error == "ValueError: boom"
+
+    def test_override_step(self):
+        ctx = LocalDurableContext()
+        ctx.override_step("Work", {"mocked": True})
+        assert ctx.step(lambda _sc: {"real": True}, "Work") == {"mocked": True}
+
+    def test_parallel_returns_results_in_order(self):
+        ctx = LocalDurableContext()
+        result = ctx.parallel([lambda c: c.step(lambda _sc: "a", "A"), lambda c: "b"], "Fan")
+        assert isinstance(result, BatchResult)
+        assert result.get_results() == ["a", "b"]
+        assert {c.name for c in ctx.calls} == {"A", "Fan"}
+
+    def test_map_passes_items_without_copying(self):
+        items = [{"id": i} for i in range(5)]
+        seen = []
+        LocalDurableContext().map(items, lambda c, item, i, all_items: seen.append((i, item, all_items)))
+        assert all(item is items[i] and all_items is items for i, item, all_items in seen)
+
+    def test_map_runs_items_concurrently(self):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def item_fn(ctx, item, index, items):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return item * 2
+
+        result = LocalDurableContext().map(list(range(16)), item_fn, "Double", SimpleNamespace(max_concurrency=4))
+
+        assert result.get_results() == [i * 2 for i in range(16)]
+        assert 1 < peak[0] <= 4
+
+    def test_map_raises_lowest_index_failure(self):
+        def item_fn(ctx, item, index, items):
+            if item in (3, 7):
+                raise RuntimeError(f"item {item}")
+            return item
+
+        with pytest.raises(RuntimeError, match="item 3"):
+            LocalDurableContext(max_concurrency=4).map(list(range(10)), item_fn)
+
+    def test_invalid_max_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            LocalDurableContext(max_concurrency=0)
+
+
+class TestSimulatedTime:
+    def test_parallel_branches_take_longest_branch(self):
+        clock = VirtualClock()
+        ctx = LocalDurableContext(clock=clock)
+        ctx.parallel([lambda c: c.wait(Duration(seconds=5)), lambda c: c.wait(Duration(seconds=10))])
+        assert clock.elapsed == 10
+
+    def test_map_respects_concurrency_limit(self):
+        clock = VirtualClock()
+        ctx = LocalDurableContext(clock=clock)
+        ctx.map([10] * 4, lambda c, item, i, items: c.wait(item), config=SimpleNamespace(max_concurrency=2))
+        assert clock.elapsed == 20
+
+    def test_branch_records_have_global_sim_time(self):
+        clock = VirtualClock()
+        ctx = LocalDurableContext(clock=clock)
+        ctx.wait(100, "First")
+        ctx.parallel([lambda c: c.wait(5, "Inner")])
+        inner = next(ctx.store.records(name="Inner"))
+        assert inner.sim_time == 105
+
+
+class TestCheckpointStores:
+    def test_memory_retention_limit(self):
+        store = MemoryCheckpointStore(max_records=10)
+        ctx = LocalDurableContext(store=store, max_concurrency=1)
+        ctx.map(list(range(1000)), lambda c, item, i, items: c.step(lambda _sc: item, "Item"))
+
+        assert len(store) == 10
+        assert store.total == 1001
+        assert ctx.calls[-1].operation == "map"
+
+    def test_record_branches_false_keeps_only_parent(self):
+        ctx = LocalDurableContext(record_branches=False)
+        ctx.map([1, 2, 3], lambda c, item, i, items: c.step(lambda _sc: item, "Item"), "Items")
+        assert [(c.operation, c.name) for c in ctx.calls] == [("map", "Items")]
+
+    def test_sqlite_store_round_trip(self, tmp_path):
+        store = SQLiteCheckpointStore(tmp_path / "run.db")
+        ctx = LocalDurableContext(store=store)
+        ctx.step(lambda _sc: {"n": 1}, "Work")
+        ctx.wait(Duration(seconds=30), "Pause")
+        store.close()
+
+        reopened = SQLiteCheckpointStore(tmp_path / "run.db")
+        records = list(reopened.records())
+        assert [(r.operation, r.name) for r in records] == [("step", "Work"), ("wait", "Pause")]
+        assert records[0].result == {"n": 1}
+        assert records[1].duration == 30
+        assert list(reopened.records(operation="wait"))[0].name == "Pause"
+        reopened.close()
+
+    def test_sqlite_retention_limit(self):
+        store = SQLiteCheckpointStore(max_records=5)
+        ctx = LocalDurableContext(store=store, max_concurrency=1)
+        ctx.map(list(range(2500)), lambda c, item, i, items: c.step(lambda _sc: item, "Item"))
+
+        assert len(store) == 5
+        assert len(list(store.records())) == 5
+        rows = store._conn.execute("SELECT COUNT(*) FROM operations").fetchone()[0]
+        assert rows <= 5 + SQLiteCheckpointStore._PRUNE_EVERY
+
+    def test_large_map_with_bounded_store(self):
+        store = MemoryCheckpointStore(max_records=100)
+        ctx = LocalDurableContext(store=store, record_branches=False)
+        items = list(range(100_000))
+        result = ctx.map(items, lambda c, item, i, all_items: item + 1, "Big", SimpleNamespace(max_concurrency=8))
+        assert result.get_results()[-1] == 100_000
+        assert len(store) == 1
+
+
+MAP_WORKFLOW = """\
+rsf_version: "1.0"
+StartAt: ProcessAll
+States:
+  ProcessAll:
+    Type: Map
+    ItemsPath: $.items
+    MaxConcurrency: 4
+    ItemProcessor:
+      StartAt: Square
+      States:
+        Square:
+          Type: Task
+          End: true
+    End: true
+"""
+
+
+def test_runs_generated_orchestrator(tmp_path):
+    import re
+
+    from rsf.codegen.generator import render_orchestrator
+    from rsf.codegen.state_mappers import map_states
+    from rsf.dsl.parser import load_definition
+    from rsf.registry import clear, state
+    from rsf.testing.replay import load_orchestrator
+
+    clear()
+    dsl_path = tmp_path / "workflow.yaml"
+    dsl_path.write_text(MAP_WORKFLOW)
+    definition = load_definition(dsl_path)
+    code = render_orchestrator(definition, map_states(definition), dsl_path)
+    orchestrator = tmp_path / "orchestrator.py"
+    orchestrator.write_text(re.sub(r"^import handlers\.\w+\n", "", code, flags=re.MULTILINE))
+    state("Square")(lambda data: data * data)
+    try:
+        ctx = LocalDurableContext()
+        result = load_orchestrator(orchestrator)({"items": [1, 2, 3]}, ctx)
+    finally:
+        clear()
+
+    assert result == [1, 4, 9]
+    assert [c.name for c in ctx.store.records(operation="map")] == ["ProcessAll"]
@@ -0,0 +1,111 @@
+"""Tests for per-state profiling of local workflow runs."""
+
+from io import StringIO
+
+import pytest
+from rich.console import Console
+
+from rsf.cli.test_cmd import LocalRunner
+from rsf.dsl.parser import parse_definition
+from rsf.testing.profiling import StateProfiler
+
+
+def _busy_handler_workflow(tmp_path):
+    handlers_dir = tmp_path / "handlers"
+    handlers_dir.mkdir()
+    (handlers_dir / "crunch.py").write_text(
+        "def _hot_loop(n):\n"
+        "    return sum(i * i for i in range(n))\n"
+        "\n"
+        "def crunch(event):\n"
+        "    blob = [str(i) for i in range(2000)]\n"
+        "    return {'total': _hot_loop(20000), 'size': len(blob)}\n"
+    )
+    return parse_definition(
+        {
+            "StartAt": "Crunch",
+            "States": {
+                "Crunch": {"Type": "Task", "Next": "Done"},
+                "Done": {"Type": "Succeed"},
+            },
+        }
+    )
+
+
+class TestStateProfiler:
+    def test_invalid_mode_rejected(self):
+        with pytest.raises(ValueError, match="Invalid profile mode"):
+            StateProfiler("gpu")
+
+    def test_cpu_attributed_to_handler_and_engine(self, tmp_path):
+        profiler = StateProfiler("cpu")
+        runner = LocalRunner(
+            definition=_busy_handler_workflow(tmp_path),
+            workflow_dir=tmp_path,
+            console=Console(file=StringIO()),
+            profiler=profiler,
+        )
+        with profiler:
+            assert runner.run({}).success
+
+        crunch = profiler.states["Crunch"]
+        assert crunch.transitions == 1
+        assert crunch.handler_cpu_ms > 0
+        assert crunch.engine_cpu_ms >= 0
+        assert any("_hot_loop" in label or "genexpr" in label for label, _ in profiler.top_functions("Crunch"))
+
+        collapsed = profiler.cpu_collapsed()
+        assert any(stack.startswith("Crunch;handler;") and "crunch" in stack for stack in collapsed)
+        assert all(weight > 0 for weight in collapsed.values())
+
+    def test_mem_tracks_peak_and_writes_files(self, tmp_path):
+        profiler = StateProfiler("both")
+        runner = LocalRunner(
+            definition=_busy_handler_workflow(tmp_path),
+            workflow_dir=tmp_path,
+            console=Console(file=StringIO()),
+            profiler=profiler,
+        )
+        with profiler:
+            runner.run({})
+
+        assert profiler.states["Crunch"].peak_bytes > 10_000
+
+        written = profiler.write_collapsed(tmp_path / "out" / "prof")
+        assert [p.name for p in written] == ["prof.cpu.collapsed", "prof.mem.collapsed"]
+        for path in written:
+            for line in path.read_text().splitlines():
+                stack, weight = line.rsplit(" ", 1)
+                assert stack and int(weight) > 0
+
+    def test_net_live_blocks_ignore_freed_allocations(self, tmp_path):
+        """Blocks allocated and freed inside a handler do not count; retained ones do."""
+        handlers_dir = tmp_path / "handlers"
+        handlers_dir.mkdir()
+        (handlers_dir / "churn.py").write_text(
+            "def churn(event):\n    for _ in range(50):\n        [object() for _ in range(1000)]\n    return {}\n"
+        )
+        (handlers_dir / "keep.py").write_text(
+            "KEPT = []\n\ndef keep(event):\n    KEPT.extend(object() for _ in range(5000))\n    return {}\n"
+        )
+        definition = parse_definition(
+            {
+                "StartAt": "Churn",
+                "States": {
+                    "Churn": {"Type": "Task", "Next": "Keep"},
+                    "Keep": {"Type": "Task", "End": True},
+                },
+            }
+        )
+        profiler = StateProfiler("mem")
+        runner = LocalRunner(
+            definition=definition,
+            workflow_dir=tmp_path,
+            console=Console(file=StringIO()),
+            profiler=profiler,
+        )
+        with profiler:
+            assert runner.run({}).success
+
+        assert profiler.states["Churn"].net_live_blocks_per_transition < 1000
+        assert profiler.states["Keep"].net_live_blocks_per_transition >= 5000
@@ -0,0 +1,105 @@
+"""Tests for the rsf pytest plugin (rsf_workflow / rsf_runner fixtures)."""
+
+import textwrap
+
+import pytest
+
+from rsf.registry import clear, get_handler, registered_states, state
+from rsf.testing.local_context import LocalDurableContext
+from rsf.testing.pytest_plugin import RsfSessionCache
+
+pytest_plugins = ["pytester"]
+
+WORKFLOW = """\
+rsf_version: "1.0"
+StartAt: Greet
+States:
+  Greet:
+    Type: Task
+    End: true
+"""
+
+HANDLER = """\
+from rsf.registry import state
+
+
+@state("Greet")
+def greet(event):
+    return {"greeting": "hello " + event.get("name", "world")}
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    wf = tmp_path / "project" / "workflow.yaml"
+    (wf.parent / "handlers").mkdir(parents=True)
+    wf.write_text(WORKFLOW)
+    (wf.parent / "handlers" / "greet.py").write_text(HANDLER)
+    return wf
+
+
+@pytest.fixture
+def cache(tmp_path):
+    clear()
+    generated = tmp_path / "generated"
+    generated.mkdir()
+    yield RsfSessionCache(generated)
+    clear()
+
+
+class TestRsfSessionCache:
+    def test_definition_cached_by_content_hash(self, cache, project, tmp_path):
+        first = cache.workflow(project)
+        assert cache.workflow(project) is first
+
+        twin = tmp_path / "twin.yaml"
+        twin.write_text(WORKFLOW)
+        assert cache.workflow(twin).definition is first.definition
+
+        project.write_text(WORKFLOW.replace("End: true", "End: true\n    Comment: changed"))
+        assert cache.workflow(project).definition is not first.definition
+
+    def test_handlers_imported_once_and_registry_untouched(self, cache, project):
+        state("Other")(lambda event: event)
+        bundle = cache.workflow(project)
+
+        assert set(bundle.handlers) == {"Greet"}
+        assert registered_states() == frozenset({"Other"})  # import did not leak
+
+        bundle.register_handlers()
+        assert get_handler("Greet") is bundle.handlers["Greet"]
+        clear()
+        bundle.register_handlers()  # restored from cache after a registry reset
+        assert get_handler("Greet")({"name": "rsf"}) == {"greeting": "hello rsf"}
+
+    def test_orchestrator_generated_once(self, cache, project):
+        bundle = cache.workflow(project)
+        handler = bundle.orchestrator()
+        assert bundle.orchestrator() is handler
+        assert len(list(cache.generated_dir.glob("orchestrator_*.py"))) == 1
+
+        bundle.register_handlers()
+        assert handler({"name": "ctx"}, LocalDurableContext()) == {"greeting": "hello ctx"}
+
+
+def test_fixtures_in_a_pytest_session(pytester, project):
+    pytester.makeconftest('pytest_plugins = ["rsf.testing.pytest_plugin"]')
+    pytester.makepyfile(
+        textwrap.dedent(
+            f"""
+            import pytest
+
+            WORKFLOW = {str(project)!r}
+
+            @pytest.mark.parametrize("name", ["a", "b", "c"])
+            def test_runner(rsf_workflow, rsf_runner, name):
+                bundle = rsf_workflow(WORKFLOW)
+                assert bundle is rsf_workflow(WORKFLOW)
+                result = rsf_runner(WORKFLOW).run({{"name": name}})
+                assert result.success, result.error
+                assert result.final_output == {{"greeting": "hello " + name}}
+            """
+        )
+    )
+    result = pytester.runpytest_inprocess("-p", "no:cacheprovider", "-p", "no:asyncio")
+    result.assert_outcomes(passed=3)
@@ -0,0 +1,114 @@
+"""Tests for the durable replay cost simulator."""
+
+import re
+
+import pytest
+
+from rsf.codegen.generator import render_orchestrator
+from rsf.codegen.state_mappers import map_states
+from rsf.dsl.parser import load_definition
+from rsf.registry import clear, clear_startup_hooks, state
+from rsf.testing.clock import VirtualClock
+from rsf.testing.replay import ReplaySimulator, load_orchestrator
+
+WORKFLOW = """\
+rsf_version: "1.0"
+StartAt: Fetch
+States:
+  Fetch:
+    Type: Task
+    Next: Pause
+  Pause:
+    Type: Wait
+    Seconds: 3600
+    Next: Enrich
+  Enrich:
+    Type: Task
+    Next: Done
+  Done:
+    Type: Succeed
+"""
+
+
+@pytest.fixture
+def lambda_handler(tmp_path):
+    clear()
+    clear_startup_hooks()
+    dsl_path = tmp_path / "workflow.yaml"
+    dsl_path.write_text(WORKFLOW)
+    definition = load_definition(dsl_path)
+    code = render_orchestrator(definition, map_states(definition), dsl_path)
+    code = re.sub(r"^import handlers\.\w+\n", "", code, flags=re.MULTILINE)
+    orchestrator = tmp_path / "orchestrator.py"
+    orchestrator.write_text(code)
+
+    calls = []
+    state("Fetch")(lambda data: calls.append("Fetch") or {**data, "payload": "x" * 100})
+    state("Enrich")(lambda data: calls.append("Enrich") or {**data, "enriched": True})
+    yield load_orchestrator(orchestrator), calls
+    clear()
+    clear_startup_hooks()
+
+
+class TestReplaySimulator:
+    def test_suspends_on_wait_and_replays(self, lambda_handler):
+        handler, calls = lambda_handler
+        sim = ReplaySimulator(suspend_on={"wait"}, clock=VirtualClock())
+
+        result = sim.run(handler, {"id": 1})
+
+        assert result["enriched"] is True
+        assert calls == ["Fetch", "Enrich"]  # handlers never re-run on replay
+        assert sim.invocations == 2
+        report = sim.report()
+        assert report.states["Fetch"].executions == 1
+        assert report.states["Fetch"].replays == 1
+        assert report.states["Fetch"].bytes_deserialized == report.states["Fetch"].bytes_checkpointed
+        assert report.states["Enrich"].replays == 0
+        assert sim.clock.elapsed == 3600
+
+    def test_suspend_on_every_step_counts_all_replays(self, lambda_handler):
+        handler, calls = lambda_handler
+        sim = ReplaySimulator()
+
+        sim.run(handler, {"id": 1})
+
+        report = sim.report()
+        # Fetch, Pause, Enrich each end an invocation; the final one completes
+        assert report.invocations == 4
+        assert report.states["Fetch"].replays == 3
+        assert report.states["Pause"].replays == 2
+        assert report.states["Enrich"].replays == 1
+        assert report.total_replays == 6
+        assert report.total_bytes_deserialized > 300
+        assert "Fetch" in str(report)
+        assert report.to_dict()["invocations"] == 4
+
+    def test_failed_step_is_replayed_as_error(self):
+        sim = ReplaySimulator()
+        attempts = []
+
+        def handler(event, ctx):
+            try:
+                ctx.step(lambda _sc: attempts.append(1) or (_ for _ in ()).throw(ValueError("boom")), "Flaky")
+            except ValueError as exc:
+                return {"caught": str(exc)}
+
+        assert sim.run(handler, {}) == {"caught": "boom"}
+        assert len(attempts) == 1
+        assert sim.report().states["Flaky"].replays == 1
+
+    def test_non_deterministic_replay_detected(self):
+        sim = ReplaySimulator()
+        names = iter(["A", "B"])
+
+        def handler(event, ctx):
+            ctx.step(lambda _sc: 1, next(names))
+            return {}
+
+        with pytest.raises(RuntimeError, match="Non-deterministic"):
+            sim.run(handler, {})
+
+    def test_unknown_suspend_operation_rejected(self):
+        with pytest.raises(ValueError, match="Unknown suspend"):
+            ReplaySimulator(suspend_on={"sleep"})
@@ -0,0 +1,107 @@
+"""Tests for trace sinks and delta-encoded payload storage."""
+
+import json
+from io import StringIO
+
+import pytest
+
+from rsf.testing.trace import (
+    JsonlTraceSink,
+    MultiTraceSink,
+    PayloadLog,
+    RingBufferTraceSink,
+    apply_delta,
+    diff_payload,
+)
+
+
+class TestJsonlTraceSink:
+    def test_buffers_until_flush(self):
+        stream = StringIO()
+        sink = JsonlTraceSink(stream, buffer_size=3)
+        sink.emit({"from": "A"})
+        sink.emit({"from": "B"})
+        assert stream.getvalue() == ""
+
+        sink.emit({"from": "C"})
+        assert [json.loads(line)["from"] for line in stream.getvalue().splitlines()] == ["A", "B", "C"]
+
+    def test_file_target_is_closed(self, tmp_path):
+        path = tmp_path / "out" / "trace.jsonl"
+        with JsonlTraceSink(path) as sink:
+            sink.emit({"from": "A", "to": None})
+        assert path.read_text() == '{"from":"A","to":null}\n'
+
+    def test_invalid_buffer_size(self):
+        with pytest.raises(ValueError, match="buffer_size"):
+            JsonlTraceSink(StringIO(), buffer_size=0)
+
+
+class TestRingBufferTraceSink:
+    def test_keeps_last_records(self, tmp_path):
+        sink = RingBufferTraceSink(capacity=2)
+        for i in range(5):
+            sink.emit({"i": i})
+        assert [r["i"] for r in sink.records] == [3, 4]
+        assert sink.dropped == 3
+
+        path = tmp_path / "tail.jsonl"
+        sink.write_jsonl(path)
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_multi_sink_fans_out(self):
+        a, b = RingBufferTraceSink(), RingBufferTraceSink()
+        MultiTraceSink([a, b]).emit({"from": "A"})
+        assert a.total == b.total == 1
+
+
+class TestPayloadDeltas:
+    @pytest.mark.parametrize(
+        "old, new",
+        [
+            ({"a": 1, "b": {"c": 2}}, {"a": 1, "b": {"c": 3, "d": [1]}}),
+            ({"a": 1, "gone": True}, {"a": 1}),
+            ({"items": [1, 2]}, {"items": [1, 2, 3]}),
+            ({"items": [1, 2]}, {"items": [2]}),
+            ({"a": 1}, [1, 2]),
+            (None, {"a": 1}),
+        ],
+    )
+    def test_round_trip(self, old, new):
+        assert apply_delta(old, diff_payload(old, new)) == new
+
+    def test_equal_payloads_have_no_delta(self):
+        assert diff_payload({"a": [1, 2]}, {"a": [1, 2]}) is None
+
+    def test_delta_only_holds_changes(self):
+        big = {"blob": "x" * 10_000, "counter": 1}
+        delta = diff_payload(big, {**big, "counter": 2})
+        assert "blob" not in delta.changed
+
+    def test_base_is_not_mutated(self):
+        old = {"a": {"b": 1}}
+        apply_delta(old, diff_payload(old, {"a": {"b": 2}}))
+        assert old == {"a": {"b": 1}}
+
+
+class TestPayloadLog:
+    def test_get_reconstructs_every_entry(self):
+        log = PayloadLog(keyframe_interval=4)
+        values = [{"i": i, "seen": list(range(i))} for i in range(10)]
+        for value in values:
+            log.append(value)
+        assert [log.get(i) for i in range(len(log))] == values
+
+    def test_later_mutation_does_not_leak(self):
+        log = PayloadLog()
+        data = {"items": [1]}
+        index = log.append(data)
+        data["items"].append(2)
+        log.append(data)
+        assert log.get(index) == {"items": [1]}
+        log.get(1)["items"].clear()
+        assert log.get(1) == {"items": [1, 2]}
+
+    def test_out_of_range(self):
+        with pytest.raises(IndexError):
+            PayloadLog().get(0)
@@ -13,6 +13,7 @@ from rsf.registry import (
     registered_states,
     startup,
     state,
+    unregister,
 )
 
 
@@ -143,6 +144,25 @@ class TestClear:
         clear()
         assert len(get_startup_hooks()) == 1
 
+    def test_unregister_single_handler(self):
+        @state("A")
+        def a(data):
+            return data
+
+        @state("B")
+        def b(data):
+            return data
+
+        unregister("A")
+        unregister("Missing")  # no-op
+        assert registered_states() == frozenset({"B"})
+
+        @state("A")
+        def a2(data):
+            return data
+
+        assert get_handler("A") is a2
+
 
 class TestDiscoverHandlers:
     def test_discover_imports_py_files(self, tmp_path):
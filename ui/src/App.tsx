@@ -21,7 +21,7 @@ import { Inspector } from './components/Inspector';
 import { ValidationOverlay } from './components/ValidationOverlay';
 import { InspectorApp } from './inspector/InspectorApp';
 
-import type { WSResponse, ParsedResponse } from './types';
+import type { WSResponse, WSMessage, ParsedResponse } from './types';
 
 type AppRoute = 'editor' | 'inspector';
 
@@ -59,13 +59,34 @@ function EditorApp() {
   const isDirty = yamlContent !== savedYaml;
 
   const handleParsedRef = useRef<((r: ParsedResponse) => void) | null>(null);
+  const sendRef = useRef<((m: WSMessage) => void) | null>(null);
 
   const handleMessage = useCallback(
     (response: WSResponse) => {
       switch (response.type) {
         case 'parsed':
+          if (response.ast && response.version !== undefined) {
+            useFlowStore.getState().setAstBase(response.ast, response.version);
+          }
           handleParsedRef.current?.(response);
           break;
+        case 'parsed_delta': {
+          const { applyAstDelta, yamlContent: currentYaml } = useFlowStore.getState();
+          const ast = applyAstDelta(response);
+          if (ast === null) {
+            // Missed a version: ask for the whole AST again
+            sendRef.current?.({ type: 'parse', yaml: currentYaml, full: true });
+            break;
+          }
+          handleParsedRef.current?.({
+            type: 'parsed',
+            ast,
+            yaml: currentYaml,
+            errors: response.errors,
+            version: response.version,
+          });
+          break;
+        }
         case 'validated':
           useFlowStore.setState({ validationErrors: response.errors });
           break;
@@ -98,6 +119,10 @@ function EditorApp() {
     onClose: () => setConnected(false),
   });
 
+  useEffect(() => {
+    sendRef.current = send;
+  }, [send]);
+
   const { handleParsedResponse } = useYamlToGraphSync({ send });
 
   useEffect(() => {
@@ -2,6 +2,7 @@
  * ExecutionList - Left panel showing executions with filter and search.
  *
  * Features:
+ * - Function picker when the inspector serves several functions
  * - Status filter dropdown (ALL, RUNNING, SUCCEEDED, FAILED, TIMED_OUT, STOPPED)
  * - Text search by execution name
  * - Color-coded status icons
@@ -11,6 +12,7 @@
 import { useCallback, useEffect } from 'react';
 import { useInspectStore } from '../store/inspectStore';
 import type { ExecutionStatus, StatusFilter } from './types';
+import { fetchFunctions, inspectUrl } from './api';
 
 const STATUS_COLORS: Record<ExecutionStatus, string> = {
   RUNNING: '#3498db',
@@ -51,6 +53,10 @@ function formatTime(iso: string): string {
 }
 
 export function ExecutionList() {
+  const functionName = useInspectStore((s) => s.functionName);
+  const functions = useInspectStore((s) => s.functions);
+  const setFunctions = useInspectStore((s) => s.setFunctions);
+  const selectFunction = useInspectStore((s) => s.selectFunction);
   const executions = useInspectStore((s) => s.executions);
   const statusFilter = useInspectStore((s) => s.statusFilter);
   const searchQuery = useInspectStore((s) => s.searchQuery);
@@ -63,7 +69,22 @@ export function ExecutionList() {
   const setLoading = useInspectStore((s) => s.setLoading);
   const selectExecution = useInspectStore((s) => s.selectExecution);
 
+  // A multi-function inspector lists its functions; start with the first
+  useEffect(() => {
+    fetchFunctions()
+      .then((list) => {
+        const names = list.map((fn) => fn.name);
+        setFunctions(names);
+        const current = useInspectStore.getState().functionName;
+        if (names.length > 0 && !names.includes(current)) {
+          selectFunction(names[0]);
+        }
+      })
+      .catch((err) => console.error('Failed to fetch functions:', err));
+  }, [setFunctions, selectFunction]);
+
   const fetchExecutions = useCallback(async () => {
+    if (functions.length > 0 && !functionName) return;
     setLoading(true);
     try {
       const params = new URLSearchParams();
@@ -71,7 +92,7 @@ export function ExecutionList() {
         params.set('status', statusFilter);
       }
       params.set('max_items', '50');
-      const resp = await fetch(`/api/inspect/executions?${params}`);
+      const resp = await fetch(inspectUrl(functionName, `/executions?${params}`));
       if (resp.ok) {
         const data = await resp.json();
         setExecutions(data.executions, data.next_token);
@@ -81,7 +102,7 @@ export function ExecutionList() {
     } finally {
       setLoading(false);
     }
-  }, [statusFilter, setExecutions, setLoading]);
+  }, [functionName, functions, statusFilter, setExecutions, setLoading]);
 
   useEffect(() => {
     fetchExecutions();
@@ -101,6 +122,20 @@ export function ExecutionList() {
     <div className="execution-list">
       <div className="pane-header">Executions</div>
       <div className="execution-list-controls">
+        {functions.length > 0 && (
+          <select
+            className="execution-filter execution-function"
+            value={functionName}
+            onChange={(e) => selectFunction(e.target.value)}
+            title="Function"
+          >
+            {functions.map((name) => (
+              <option key={name} value={name}>
+                {name}
+              </option>
+            ))}
+          </select>
+        )}
         <select
           className="execution-filter"
           value={statusFilter}
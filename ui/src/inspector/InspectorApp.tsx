@@ -13,21 +13,19 @@ import { InspectorGraph } from './InspectorGraph';
 import { EventTimeline } from './EventTimeline';
 import { StateDetailPanel } from './StateDetailPanel';
 import { TimelineScrubber } from './TimelineScrubber';
-import { buildSnapshots } from './timeMachine';
+import { useSnapshotWindow } from './useSnapshotWindow';
 import { ReplayModal } from './ReplayModal';
 import type { ExecutionDetail, HistoryEvent } from './types';
 
 export function InspectorApp() {
+  const functionName = useInspectStore((s) => s.functionName);
   const selectedExecutionId = useInspectStore((s) => s.selectedExecutionId);
   const executionDetail = useInspectStore((s) => s.executionDetail);
   const setExecutionDetail = useInspectStore((s) => s.setExecutionDetail);
   const setEvents = useInspectStore((s) => s.setEvents);
   const appendEvents = useInspectStore((s) => s.appendEvents);
-  const setSnapshots = useInspectStore((s) => s.setSnapshots);
   const setPlaybackIndex = useInspectStore((s) => s.setPlaybackIndex);
   const isLive = useInspectStore((s) => s.isLive);
-  const nodes = useInspectStore((s) => s.nodes);
-  const edges = useInspectStore((s) => s.edges);
 
   const handleExecutionInfo = useCallback(
     (detail: Omit<ExecutionDetail, 'history'>) => {
@@ -39,36 +37,34 @@ export function InspectorApp() {
   const handleHistory = useCallback(
     (events: HistoryEvent[]) => {
       setEvents(events);
-      const snaps = buildSnapshots(events, nodes, edges);
-      setSnapshots(snaps);
       if (isLive) {
-        setPlaybackIndex(snaps.length - 1);
+        setPlaybackIndex(events.length - 1);
       }
     },
-    [setEvents, setSnapshots, setPlaybackIndex, isLive, nodes, edges],
+    [setEvents, setPlaybackIndex, isLive],
   );
 
   const handleHistoryUpdate = useCallback(
     (events: HistoryEvent[]) => {
       appendEvents(events);
-      // Rebuild snapshots with full event list
-      const allEvents = useInspectStore.getState().events;
-      const snaps = buildSnapshots(allEvents, nodes, edges);
-      setSnapshots(snaps);
       if (isLive) {
-        setPlaybackIndex(snaps.length - 1);
+        setPlaybackIndex(useInspectStore.getState().events.length - 1);
       }
     },
-    [appendEvents, setSnapshots, setPlaybackIndex, isLive, nodes, edges],
+    [appendEvents, setPlaybackIndex, isLive],
   );
 
   useSSE({
     executionId: selectedExecutionId,
+    functionName,
     onExecutionInfo: handleExecutionInfo,
     onHistory: handleHistory,
     onHistoryUpdate: handleHistoryUpdate,
   });
 
+  // Snapshots are computed server-side and loaded around the playback position
+  useSnapshotWindow(selectedExecutionId);
+
   return (
     <div className="app">
       <header className="app-header">
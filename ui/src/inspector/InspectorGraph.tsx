@@ -18,7 +18,7 @@ import {
 } from '@xyflow/react';
 import '@xyflow/react/dist/style.css';
 
-import { useInspectStore, type InspectNode } from '../store/inspectStore';
+import { useInspectStore, snapshotAt, type InspectNode } from '../store/inspectStore';
 import { InspectorNode } from './InspectorNode';
 import { InspectorEdge } from './InspectorEdge';
 
@@ -40,14 +40,12 @@ const edgeTypes: EdgeTypes = {
 export function InspectorGraph() {
   const nodes = useInspectStore((s) => s.nodes);
   const edges = useInspectStore((s) => s.edges);
-  const snapshots = useInspectStore((s) => s.snapshots);
-  const playbackIndex = useInspectStore((s) => s.playbackIndex);
+  const snap = useInspectStore((s) => snapshotAt(s, s.playbackIndex));
   const selectNode = useInspectStore((s) => s.selectNode);
 
   // Apply overlay data from current snapshot to nodes
   const overlaidNodes = useMemo(() => {
-    if (playbackIndex < 0 || playbackIndex >= snapshots.length) return nodes;
-    const snap = snapshots[playbackIndex];
+    if (!snap) return nodes;
     return nodes.map((node) => {
       const overlay = snap.nodeOverlays[node.id];
       if (overlay) {
@@ -58,12 +56,11 @@ export function InspectorGraph() {
       }
       return node;
     });
-  }, [nodes, snapshots, playbackIndex]);
+  }, [nodes, snap]);
 
   // Apply overlay data from current snapshot to edges
   const overlaidEdges = useMemo(() => {
-    if (playbackIndex < 0 || playbackIndex >= snapshots.length) return edges;
-    const snap = snapshots[playbackIndex];
+    if (!snap) return edges;
     return edges.map((edge) => {
       const overlay = snap.edgeOverlays[edge.id];
       if (overlay) {
@@ -74,7 +71,7 @@ export function InspectorGraph() {
       }
       return edge;
     });
-  }, [edges, snapshots, playbackIndex]);
+  }, [edges, snap]);
 
   const handlePaneClick = useCallback(() => {
     selectNode(null);
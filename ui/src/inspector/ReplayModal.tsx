@@ -11,9 +11,11 @@
 import { useState, useEffect } from 'react';
 import { useInspectStore } from '../store/inspectStore';
 import type { ReplayResponse } from './types';
+import { inspectUrl } from './api';
 
 export function ReplayModal() {
   const detail = useInspectStore((s) => s.executionDetail);
+  const functionName = useInspectStore((s) => s.functionName);
   const isOpen = useInspectStore((s) => s.replayModalOpen);
   const loading = useInspectStore((s) => s.replayLoading);
   const error = useInspectStore((s) => s.replayError);
@@ -56,7 +58,7 @@ export function ReplayModal() {
     try {
       const payload = JSON.parse(payloadText);
       const resp = await fetch(
-        `/api/inspect/execution/${encodeURIComponent(detail.execution_id)}/replay`,
+        inspectUrl(functionName, `/execution/${encodeURIComponent(detail.execution_id)}/replay`),
         {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
@@ -8,7 +8,7 @@
  */
 
 import { useMemo } from 'react';
-import { useInspectStore } from '../store/inspectStore';
+import { useInspectStore, snapshotAt } from '../store/inspectStore';
 import { JsonDiff } from './JsonDiff';
 import type { NodeOverlay } from './types';
 
@@ -26,23 +26,21 @@ function JsonBlock({ label, data }: { label: string; data: Record<string, unknow
 
 export function StateDetailPanel() {
   const selectedNodeId = useInspectStore((s) => s.selectedNodeId);
-  const snapshots = useInspectStore((s) => s.snapshots);
-  const playbackIndex = useInspectStore((s) => s.playbackIndex);
+  const snap = useInspectStore((s) => snapshotAt(s, s.playbackIndex));
+  const prevSnap = useInspectStore((s) => snapshotAt(s, s.playbackIndex - 1));
   const executionDetail = useInspectStore((s) => s.executionDetail);
 
   // Get overlay data for the selected node from the current snapshot
   const overlay: NodeOverlay | null = useMemo(() => {
-    if (!selectedNodeId || playbackIndex < 0 || playbackIndex >= snapshots.length)
-      return null;
-    return snapshots[playbackIndex].nodeOverlays[selectedNodeId] ?? null;
-  }, [selectedNodeId, playbackIndex, snapshots]);
+    if (!selectedNodeId || !snap) return null;
+    return snap.nodeOverlays[selectedNodeId] ?? null;
+  }, [selectedNodeId, snap]);
 
   // Get previous snapshot overlay for diff
   const prevOverlay: NodeOverlay | null = useMemo(() => {
-    if (!selectedNodeId || playbackIndex <= 0 || playbackIndex >= snapshots.length)
-      return null;
-    return snapshots[playbackIndex - 1].nodeOverlays[selectedNodeId] ?? null;
-  }, [selectedNodeId, playbackIndex, snapshots]);
+    if (!selectedNodeId || !prevSnap) return null;
+    return prevSnap.nodeOverlays[selectedNodeId] ?? null;
+  }, [selectedNodeId, prevSnap]);
 
   // Determine if we should show a diff (data changed between consecutive snapshots)
   const showDiff = useMemo(() => {
@@ -1,8 +1,8 @@
 /**
  * TimelineScrubber - Slider for time machine playback.
  *
- * Allows scrubbing through precomputed TransitionSnapshots.
- * O(1) graph updates - just indexes into the snapshots array.
+ * Scrubs through the history events; the graph shows the snapshot at the
+ * playback position, loaded on demand (see useSnapshotWindow).
  */
 
 import { useCallback } from 'react';
@@ -22,7 +22,7 @@ function formatTimestamp(iso: string): string {
 }
 
 export function TimelineScrubber() {
-  const snapshots = useInspectStore((s) => s.snapshots);
+  const events = useInspectStore((s) => s.events);
   const playbackIndex = useInspectStore((s) => s.playbackIndex);
   const isLive = useInspectStore((s) => s.isLive);
   const setPlaybackIndex = useInspectStore((s) => s.setPlaybackIndex);
@@ -39,31 +39,31 @@ export function TimelineScrubber() {
 
   const handleGoLive = useCallback(() => {
     setIsLive(true);
-    if (snapshots.length > 0) {
-      setPlaybackIndex(snapshots.length - 1);
+    if (events.length > 0) {
+      setPlaybackIndex(events.length - 1);
     }
-  }, [setIsLive, setPlaybackIndex, snapshots]);
+  }, [setIsLive, setPlaybackIndex, events]);
 
-  if (snapshots.length === 0) return null;
+  if (events.length === 0) return null;
 
-  const currentSnap = snapshots[playbackIndex] ?? snapshots[snapshots.length - 1];
+  const currentEvent = events[playbackIndex] ?? events[events.length - 1];
 
   return (
     <div className="timeline-scrubber">
       <div className="scrubber-controls">
         <span className="scrubber-label">
-          Event {playbackIndex + 1} / {snapshots.length}
+          Event {playbackIndex + 1} / {events.length}
         </span>
         <input
           type="range"
           className="scrubber-slider"
           min={0}
-          max={snapshots.length - 1}
+          max={events.length - 1}
           value={playbackIndex >= 0 ? playbackIndex : 0}
           onChange={handleChange}
         />
         <span className="scrubber-timestamp">
-          {currentSnap ? formatTimestamp(currentSnap.timestamp) : '--'}
+          {currentEvent ? formatTimestamp(currentEvent.timestamp) : '--'}
         </span>
         <button
           className={`scrubber-live-btn ${isLive ? 'active' : ''}`}
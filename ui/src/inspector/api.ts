@@ -0,0 +1,29 @@
+/**
+ * Inspector API URLs.
+ *
+ * A single-function inspector serves its endpoints under /api/inspect; a
+ * multi-function inspector (rsf inspect --all) serves each function's under
+ * /api/inspect/{function}. An empty function name means the former.
+ */
+
+export function inspectUrl(functionName: string, path: string, baseUrl = ''): string {
+  const prefix = functionName ? `/api/inspect/${encodeURIComponent(functionName)}` : '/api/inspect';
+  return `${baseUrl}${prefix}${path}`;
+}
+
+export interface InspectFunction {
+  name: string;
+  function_name: string;
+}
+
+/**
+ * Functions served by a multi-function inspector (empty for a single-function one).
+ */
+export async function fetchFunctions(baseUrl = ''): Promise<InspectFunction[]> {
+  const resp = await fetch(`${baseUrl}/api/inspect/functions`);
+  if (!resp.ok) {
+    return [];
+  }
+  const data = (await resp.json()) as { functions: InspectFunction[] };
+  return data.functions;
+}
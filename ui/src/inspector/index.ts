@@ -14,4 +14,7 @@ export { TimelineScrubber } from './TimelineScrubber';
 export { JsonDiff } from './JsonDiff';
 export { ReplayModal } from './ReplayModal';
 export { useSSE } from './useSSE';
-export { buildSnapshots } from './timeMachine';
+export { useSnapshotWindow } from './useSnapshotWindow';
+export { buildSnapshots, toTransitionSnapshot, fetchSnapshotWindow } from './timeMachine';
+export { inspectUrl, fetchFunctions } from './api';
+export type { InspectFunction } from './api';
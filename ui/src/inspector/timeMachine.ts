@@ -1,21 +1,28 @@
 /**
- * Time machine - Precomputed TransitionSnapshots for O(1) scrubbing.
+ * Time machine - TransitionSnapshots for scrubbing through an execution.
  *
- * Given a list of history events, precomputes a snapshot at each event
- * representing the full graph state (all node and edge overlays) at that
- * point in time. The TimelineScrubber indexes into this array for instant
- * rendering without recomputation.
+ * The inspector server replays the history once and serves keyframed
+ * snapshots (rsf.inspect.timemachine); the UI fetches a window of them
+ * around the playback position with fetchSnapshotWindow() and converts
+ * them with toTransitionSnapshot(). buildSnapshots() computes the same
+ * overlays locally for a whole event list.
  */
 
 import type { InspectNode, InspectEdge } from '../store/inspectStore';
+import { inspectUrl } from './api';
 import type {
   HistoryEvent,
   TransitionSnapshot,
   NodeOverlay,
   EdgeOverlay,
   NodeOverlayStatus,
+  ServerSnapshot,
+  SnapshotWindowResponse,
 } from './types';
 
+/** Snapshots fetched per window */
+export const SNAPSHOT_WINDOW_SIZE = 100;
+
 /** Default node overlay (pending, no data) */
 function defaultNodeOverlay(): NodeOverlay {
   return {
@@ -203,3 +210,67 @@ function tryParseJson(value: string): Record<string, unknown> {
     return { raw: value };
   }
 }
+
+/**
+ * Convert a server snapshot into the overlays of the rendered graph.
+ *
+ * Nodes the snapshot does not mention are pending; an edge is traversed
+ * if the snapshot records a transition from its source to its target.
+ */
+export function toTransitionSnapshot(
+  snapshot: ServerSnapshot,
+  nodes: InspectNode[],
+  edges: InspectEdge[],
+): TransitionSnapshot {
+  const nodeOverlays: Record<string, NodeOverlay> = {};
+  for (const node of nodes) {
+    const overlay = snapshot.nodes[node.id];
+    nodeOverlays[node.id] = overlay
+      ? {
+          status: overlay.status,
+          enteredAt: overlay.entered_at,
+          exitedAt: overlay.exited_at,
+          durationMs: overlay.duration_ms,
+          input: overlay.input,
+          output: overlay.output,
+          error: overlay.error,
+          retryAttempt: overlay.retry_attempt,
+        }
+      : defaultNodeOverlay();
+  }
+
+  const edgeOverlays: Record<string, EdgeOverlay> = {};
+  for (const edge of edges) {
+    const timestamp = snapshot.transitions[edge.source]?.[edge.target];
+    edgeOverlays[edge.id] = timestamp
+      ? { traversed: true, timestamp }
+      : defaultEdgeOverlay();
+  }
+
+  return {
+    eventIndex: snapshot.index,
+    timestamp: snapshot.timestamp,
+    nodeOverlays,
+    edgeOverlays,
+  };
+}
+
+/**
+ * Fetch consecutive snapshots starting at event index `start`.
+ */
+export async function fetchSnapshotWindow(
+  executionId: string,
+  start: number,
+  count: number = SNAPSHOT_WINDOW_SIZE,
+  baseUrl = '',
+  functionName = '',
+): Promise<SnapshotWindowResponse> {
+  const params = new URLSearchParams({ start: String(start), count: String(count) });
+  const resp = await fetch(
+    inspectUrl(functionName, `/execution/${encodeURIComponent(executionId)}/snapshots?${params}`, baseUrl),
+  );
+  if (!resp.ok) {
+    throw new Error(`Failed to load snapshots: HTTP ${resp.status}`);
+  }
+  return (await resp.json()) as SnapshotWindowResponse;
+}
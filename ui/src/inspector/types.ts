@@ -97,6 +97,35 @@ export interface TransitionSnapshot {
   edgeOverlays: Record<string, EdgeOverlay>;
 }
 
+/** Node overlay as served by the time machine endpoints (snake_case) */
+export interface ServerNodeOverlay {
+  status: NodeOverlayStatus;
+  entered_at: string | null;
+  exited_at: string | null;
+  duration_ms: number | null;
+  input: Record<string, unknown> | null;
+  output: Record<string, unknown> | null;
+  error: string | null;
+  retry_attempt: number;
+}
+
+/** Graph state after one event, from GET /execution/{id}/snapshot(s) */
+export interface ServerSnapshot {
+  index: number;
+  timestamp: string;
+  /** Only states touched so far; the rest are pending */
+  nodes: Record<string, ServerNodeOverlay>;
+  /** source state -> target state -> time of the transition */
+  transitions: Record<string, Record<string, string>>;
+}
+
+/** Response from GET /execution/{id}/snapshots */
+export interface SnapshotWindowResponse {
+  event_count: number;
+  start: number;
+  snapshots: ServerSnapshot[];
+}
+
 /** Status filter options for execution list */
 export type StatusFilter = ExecutionStatus | 'ALL';
 
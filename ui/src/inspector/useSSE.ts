@@ -8,9 +8,11 @@
 import { useEffect, useRef, useCallback } from 'react';
 import type { ExecutionDetail, HistoryEvent } from './types';
 import { TERMINAL_STATUSES } from './types';
+import { inspectUrl } from './api';
 
 interface UseSSEOptions {
   executionId: string | null;
+  functionName?: string;
   baseUrl?: string;
   onExecutionInfo: (detail: Omit<ExecutionDetail, 'history'>) => void;
   onHistory: (events: HistoryEvent[]) => void;
@@ -20,6 +22,7 @@ interface UseSSEOptions {
 
 export function useSSE({
   executionId,
+  functionName = '',
   baseUrl = '',
   onExecutionInfo,
   onHistory,
@@ -42,7 +45,7 @@ export function useSSE({
       return;
     }
 
-    const url = `${baseUrl}/api/inspect/execution/${encodeURIComponent(executionId)}/stream`;
+    const url = inspectUrl(functionName, `/execution/${encodeURIComponent(executionId)}/stream`, baseUrl);
     const source = new EventSource(url);
     sourceRef.current = source;
 
@@ -84,7 +87,7 @@ export function useSSE({
       close();
       document.removeEventListener('visibilitychange', handleVisibility);
     };
-  }, [executionId, baseUrl, onExecutionInfo, onHistory, onHistoryUpdate, onError, close]);
+  }, [executionId, functionName, baseUrl, onExecutionInfo, onHistory, onHistoryUpdate, onError, close]);
 
   return { close };
 }
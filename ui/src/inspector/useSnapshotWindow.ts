@@ -0,0 +1,64 @@
+/**
+ * Snapshot window hook for the time machine.
+ *
+ * Keeps a window of server-computed snapshots loaded around the playback
+ * position (and the one before it, for the state diff). A new window is
+ * fetched when playback leaves the loaded one, and refreshed when new
+ * history events arrive while the window reaches the end of the history,
+ * or when the graph changes.
+ */
+
+import { useEffect, useRef } from 'react';
+import { useInspectStore } from '../store/inspectStore';
+import {
+  fetchSnapshotWindow,
+  toTransitionSnapshot,
+  SNAPSHOT_WINDOW_SIZE,
+} from './timeMachine';
+
+export function useSnapshotWindow(executionId: string | null, baseUrl = '') {
+  const functionName = useInspectStore((s) => s.functionName);
+  const playbackIndex = useInspectStore((s) => s.playbackIndex);
+  const eventCount = useInspectStore((s) => s.events.length);
+  const snapshotStart = useInspectStore((s) => s.snapshotStart);
+  const loaded = useInspectStore((s) => s.snapshots.length);
+  const nodes = useInspectStore((s) => s.nodes);
+  const edges = useInspectStore((s) => s.edges);
+  const setSnapshotWindow = useInspectStore((s) => s.setSnapshotWindow);
+  const requestRef = useRef(0);
+  const loadedCountRef = useRef(0);
+  const graphRef = useRef<{ nodes: unknown; edges: unknown } | null>(null);
+
+  useEffect(() => {
+    loadedCountRef.current = 0;
+  }, [executionId]);
+
+  useEffect(() => {
+    if (!executionId || playbackIndex < 0 || eventCount === 0) return;
+
+    const first = Math.max(0, playbackIndex - 1);
+    const inWindow = first >= snapshotStart && playbackIndex < snapshotStart + loaded;
+    const reachesEnd = snapshotStart + loaded >= loadedCountRef.current;
+    const grown = eventCount > loadedCountRef.current && reachesEnd;
+    const graphChanged = graphRef.current?.nodes !== nodes || graphRef.current?.edges !== edges;
+    if (inWindow && !grown && !graphChanged) return;
+
+    const start = Math.max(0, Math.min(playbackIndex - SNAPSHOT_WINDOW_SIZE / 2, eventCount - SNAPSHOT_WINDOW_SIZE));
+    const request = ++requestRef.current;
+    fetchSnapshotWindow(executionId, start, SNAPSHOT_WINDOW_SIZE, baseUrl, functionName)
+      .then((page) => {
+        if (request !== requestRef.current) return;
+        loadedCountRef.current = page.event_count;
+        graphRef.current = { nodes, edges };
+        setSnapshotWindow(
+          page.start,
+          page.snapshots.map((snap) => toTransitionSnapshot(snap, nodes, edges)),
+        );
+      })
+      .catch((err) => {
+        if (request === requestRef.current) {
+          console.error(err);
+        }
+      });
+  }, [executionId, functionName, baseUrl, playbackIndex, eventCount, snapshotStart, loaded, nodes, edges, setSnapshotWindow]);
+}
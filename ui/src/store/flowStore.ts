@@ -3,6 +3,10 @@
  *
  * Manages nodes, edges, YAML content, validation errors, and sync state.
  * Uses immer for immutable state updates.
+ *
+ * astBase/astVersion track the AST the backend believes this client holds,
+ * so parsed_delta messages can be applied on arrival. They are separate from
+ * lastAst, which is only updated once the graph has been re-rendered.
  */
 
 import { create } from 'zustand';
@@ -21,7 +25,9 @@ import type {
   FlowEdge,
   ValidationError,
   SyncSource,
+  ParsedDeltaResponse,
 } from '../types';
+import { applyAstPatch } from '../sync/applyAstPatch';
 
 /**
  * Required field validation specs per state type.
@@ -82,6 +88,10 @@ interface FlowState {
   syncSource: SyncSource;
   needsLayout: boolean;
   lastAst: Record<string, unknown> | null;
+  /** Latest AST received from the backend (full or patched), the base for the next delta. */
+  astBase: Record<string, unknown> | null;
+  /** Backend version of astBase; 0 before the first full AST. */
+  astVersion: number;
   /** YAML content as of the last save or file load. Used to compute isDirty. */
   savedYaml: string;
   /** The file path currently being edited. */
@@ -113,6 +123,13 @@ interface FlowState {
   setSyncSource: (source: SyncSource) => void;
   setNeedsLayout: (needs: boolean) => void;
   setLastAst: (ast: Record<string, unknown> | null) => void;
+  /** Records a full AST from the backend as the base for later deltas. */
+  setAstBase: (ast: Record<string, unknown>, version: number) => void;
+  /**
+   * Applies a parsed_delta to astBase and returns the new AST, or null if the
+   * delta was computed against a different version (request a full resync).
+   */
+  applyAstDelta: (delta: ParsedDeltaResponse) => Record<string, unknown> | null;
   /** Sets savedYaml to the current yamlContent (marks state as clean). */
   markSaved: () => void;
   /** Sets the file path being edited. */
@@ -120,7 +137,7 @@ interface FlowState {
 }
 
 export const useFlowStore = create<FlowState>()(
-  immer((set) => ({
+  immer((set, get) => ({
     nodes: [],
     edges: [],
     yamlContent: '',
@@ -133,6 +150,8 @@ export const useFlowStore = create<FlowState>()(
     syncSource: null,
     needsLayout: false,
     lastAst: null,
+    astBase: null,
+    astVersion: 0,
     savedYaml: '',
     filePath: null,
 
@@ -303,6 +322,14 @@ export const useFlowStore = create<FlowState>()(
     setSyncSource: (source) => set({ syncSource: source }),
     setNeedsLayout: (needs) => set({ needsLayout: needs }),
     setLastAst: (ast) => set({ lastAst: ast }),
+    setAstBase: (ast, version) => set({ astBase: ast, astVersion: version }),
+    applyAstDelta: (delta) => {
+      const { astBase, astVersion } = get();
+      if (!astBase || astVersion !== delta.base_version) return null;
+      const ast = applyAstPatch(astBase, delta.patch);
+      set({ astBase: ast, astVersion: delta.version });
+      return ast;
+    },
     markSaved: () =>
       set((state) => {
         state.savedYaml = state.yamlContent;
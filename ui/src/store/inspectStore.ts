@@ -40,8 +40,9 @@ export interface InspectEdge extends Edge {
 }
 
 interface InspectState {
-  // Execution list
+  // Execution list (functionName is '' unless the inspector serves several functions)
   functionName: string;
+  functions: string[];
   executions: ExecutionSummary[];
   nextToken: string | null;
   statusFilter: StatusFilter;
@@ -59,8 +60,9 @@ interface InspectState {
   nodeOverlays: Record<string, NodeOverlay>;
   edgeOverlays: Record<string, EdgeOverlay>;
 
-  // Time machine
+  // Time machine: a window of snapshots, snapshots[i] is event snapshotStart + i
   snapshots: TransitionSnapshot[];
+  snapshotStart: number;
   playbackIndex: number;
   isLive: boolean;
 
@@ -75,6 +77,8 @@ interface InspectState {
 
   // Actions
   setFunctionName: (name: string) => void;
+  setFunctions: (functions: string[]) => void;
+  selectFunction: (name: string) => void;
   setExecutions: (executions: ExecutionSummary[], nextToken: string | null) => void;
   appendExecutions: (executions: ExecutionSummary[], nextToken: string | null) => void;
   setStatusFilter: (filter: StatusFilter) => void;
@@ -91,6 +95,7 @@ interface InspectState {
   setEdgeOverlays: (overlays: Record<string, EdgeOverlay>) => void;
 
   setSnapshots: (snapshots: TransitionSnapshot[]) => void;
+  setSnapshotWindow: (start: number, snapshots: TransitionSnapshot[]) => void;
   setPlaybackIndex: (index: number) => void;
   setIsLive: (live: boolean) => void;
 
@@ -107,6 +112,7 @@ interface InspectState {
 
 const initialState = {
   functionName: '',
+  functions: [] as string[],
   executions: [],
   nextToken: null,
   statusFilter: 'ALL' as StatusFilter,
@@ -120,6 +126,7 @@ const initialState = {
   nodeOverlays: {},
   edgeOverlays: {},
   snapshots: [],
+  snapshotStart: 0,
   playbackIndex: -1,
   isLive: true,
   selectedNodeId: null,
@@ -134,6 +141,24 @@ export const useInspectStore = create<InspectState>()(
     ...initialState,
 
     setFunctionName: (name) => set({ functionName: name }),
+    setFunctions: (functions) => set({ functions }),
+
+    selectFunction: (name) =>
+      set((state) => {
+        state.functionName = name;
+        state.executions = [];
+        state.nextToken = null;
+        state.selectedExecutionId = null;
+        state.executionDetail = null;
+        state.events = [];
+        state.snapshots = [];
+        state.snapshotStart = 0;
+        state.playbackIndex = -1;
+        state.isLive = true;
+        state.nodeOverlays = {};
+        state.edgeOverlays = {};
+        state.selectedNodeId = null;
+      }),
 
     setExecutions: (executions, nextToken) =>
       set({ executions, nextToken }),
@@ -154,6 +179,7 @@ export const useInspectStore = create<InspectState>()(
         state.executionDetail = null;
         state.events = [];
         state.snapshots = [];
+        state.snapshotStart = 0;
         state.playbackIndex = -1;
         state.isLive = true;
         state.nodeOverlays = {};
@@ -175,7 +201,8 @@ export const useInspectStore = create<InspectState>()(
     setNodeOverlays: (overlays) => set({ nodeOverlays: overlays }),
     setEdgeOverlays: (overlays) => set({ edgeOverlays: overlays }),
 
-    setSnapshots: (snapshots) => set({ snapshots }),
+    setSnapshots: (snapshots) => set({ snapshots, snapshotStart: 0 }),
+    setSnapshotWindow: (start, snapshots) => set({ snapshots, snapshotStart: start }),
     setPlaybackIndex: (index) => set({ playbackIndex: index }),
     setIsLive: (live) => set({ isLive: live }),
 
@@ -194,3 +221,13 @@ export const useInspectStore = create<InspectState>()(
     reset: () => set(initialState),
   })),
 );
+
+/**
+ * Snapshot at an event index, or null if it is outside the loaded window.
+ */
+export function snapshotAt(
+  state: Pick<InspectState, 'snapshots' | 'snapshotStart'>,
+  index: number,
+): TransitionSnapshot | null {
+  return state.snapshots[index - state.snapshotStart] ?? null;
+}
@@ -0,0 +1,42 @@
+/**
+ * Applies AST deltas (parsed_delta messages) from the backend.
+ *
+ * Operations replace, add or remove a top-level key ("/StartAt") or a single
+ * state ("/States/Name"); paths are JSON Pointers, so "~1" and "~0" in a
+ * state name stand for "/" and "~". The backend only sends a delta when
+ * removing and appending keys reproduces its key order, so plain object
+ * insertion is enough here.
+ */
+
+import type { AstPatchOp } from '../types';
+
+function unescapePointer(part: string): string {
+  return part.replace(/~1/g, '/').replace(/~0/g, '~');
+}
+
+/**
+ * Return a new AST with the patch applied. The input AST is not mutated
+ * (it may be frozen by immer).
+ */
+export function applyAstPatch(
+  ast: Record<string, unknown>,
+  patch: AstPatchOp[],
+): Record<string, unknown> {
+  const result: Record<string, unknown> = { ...ast };
+  if (patch.some((op) => op.path.startsWith('/States/'))) {
+    result.States = { ...(ast.States as Record<string, unknown>) };
+  }
+
+  for (const op of patch) {
+    const parts = op.path.split('/').slice(1).map(unescapePointer);
+    const target =
+      parts.length === 2 ? (result.States as Record<string, unknown>) : result;
+    const key = parts[parts.length - 1];
+    if (op.op === 'remove') {
+      delete target[key];
+    } else {
+      target[key] = op.value;
+    }
+  }
+  return result;
+}
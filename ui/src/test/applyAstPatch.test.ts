@@ -0,0 +1,40 @@
+import { describe, it, expect } from 'vitest';
+import { applyAstPatch } from '../sync/applyAstPatch';
+
+describe('applyAstPatch', () => {
+  const ast = {
+    StartAt: 'A',
+    States: {
+      A: { Type: 'Task', Next: 'B' },
+      B: { Type: 'Succeed' },
+      C: { Type: 'Succeed' },
+    },
+  };
+
+  it('replaces, removes and appends states', () => {
+    const result = applyAstPatch(ast, [
+      { op: 'replace', path: '/StartAt', value: 'C' },
+      { op: 'remove', path: '/States/B' },
+      { op: 'add', path: '/States/D', value: { Type: 'Fail' } },
+    ]);
+
+    expect(result.StartAt).toBe('C');
+    expect(Object.keys(result.States as object)).toEqual(['A', 'C', 'D']);
+    expect((result.States as Record<string, unknown>).D).toEqual({ Type: 'Fail' });
+  });
+
+  it('unescapes JSON Pointer segments', () => {
+    const result = applyAstPatch(ast, [
+      { op: 'add', path: '/States/a~1b~0c', value: { Type: 'Pass' } },
+    ]);
+    expect(Object.keys(result.States as object)).toContain('a/b~c');
+  });
+
+  it('does not mutate a frozen input', () => {
+    const frozen = Object.freeze({ ...ast, States: Object.freeze({ ...ast.States }) });
+    const result = applyAstPatch(frozen, [{ op: 'remove', path: '/States/A' }]);
+
+    expect(Object.keys(frozen.States)).toEqual(['A', 'B', 'C']);
+    expect(Object.keys(result.States as object)).toEqual(['B', 'C']);
+  });
+});
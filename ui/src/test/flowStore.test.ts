@@ -18,6 +18,8 @@ function resetStore() {
     syncSource: null,
     needsLayout: false,
     lastAst: null,
+    astBase: null,
+    astVersion: 0,
     collapseBlocked: null,
     savedYaml: '',
     filePath: null,
@@ -173,6 +175,52 @@ describe('useFlowStore', () => {
     });
   });
 
+  describe('applyAstDelta', () => {
+    const base = { StartAt: 'A', States: { A: { Type: 'Task', Next: 'B' }, B: { Type: 'Succeed' } } };
+
+    it('patches the AST when the base version matches', () => {
+      useFlowStore.getState().setAstBase(base, 1);
+      const ast = useFlowStore.getState().applyAstDelta({
+        type: 'parsed_delta',
+        version: 2,
+        base_version: 1,
+        patch: [{ op: 'replace', path: '/States/A', value: { Type: 'Pass', Next: 'B' } }],
+        errors: [],
+      });
+
+      expect(ast).toEqual({ StartAt: 'A', States: { A: { Type: 'Pass', Next: 'B' }, B: { Type: 'Succeed' } } });
+      expect(useFlowStore.getState().astBase).toEqual(ast);
+      expect(useFlowStore.getState().astVersion).toBe(2);
+      expect(base.States.A.Type).toBe('Task');
+    });
+
+    it('returns null and keeps the base on a version mismatch', () => {
+      useFlowStore.getState().setAstBase(base, 3);
+      const ast = useFlowStore.getState().applyAstDelta({
+        type: 'parsed_delta',
+        version: 6,
+        base_version: 5,
+        patch: [{ op: 'remove', path: '/States/B' }],
+        errors: [],
+      });
+
+      expect(ast).toBeNull();
+      expect(useFlowStore.getState().astBase).toEqual(base);
+      expect(useFlowStore.getState().astVersion).toBe(3);
+    });
+
+    it('returns null before any full AST', () => {
+      const ast = useFlowStore.getState().applyAstDelta({
+        type: 'parsed_delta',
+        version: 1,
+        base_version: 0,
+        patch: [],
+        errors: [],
+      });
+      expect(ast).toBeNull();
+    });
+  });
+
   describe('addState', () => {
     it('appends a node and sets needsLayout', () => {
       useFlowStore.getState().setNodes([makeFlowNode('A')]);
@@ -1,5 +1,5 @@
 import { describe, it, expect, beforeEach } from 'vitest';
-import { useInspectStore } from '../store/inspectStore';
+import { useInspectStore, snapshotAt } from '../store/inspectStore';
 import type { ExecutionSummary } from '../inspector/types';
 
 /**
@@ -32,12 +32,30 @@ describe('useInspectStore', () => {
       expect(state.nodeOverlays).toEqual({});
       expect(state.edgeOverlays).toEqual({});
       expect(state.snapshots).toEqual([]);
+      expect(state.snapshotStart).toBe(0);
       expect(state.playbackIndex).toBe(-1);
       expect(state.isLive).toBe(true);
       expect(state.selectedNodeId).toBeNull();
     });
   });
 
+  describe('snapshot window', () => {
+    it('indexes snapshots by event index', () => {
+      const snap = (eventIndex: number) => ({
+        eventIndex,
+        timestamp: '2025-01-01T00:00:00Z',
+        nodeOverlays: {},
+        edgeOverlays: {},
+      });
+      useInspectStore.getState().setSnapshotWindow(100, [snap(100), snap(101)]);
+
+      const state = useInspectStore.getState();
+      expect(snapshotAt(state, 101)?.eventIndex).toBe(101);
+      expect(snapshotAt(state, 99)).toBeNull();
+      expect(snapshotAt(state, 102)).toBeNull();
+    });
+  });
+
   describe('setExecutions', () => {
     it('sets executions and nextToken', () => {
       const mockExecutions: ExecutionSummary[] = [
@@ -183,6 +201,36 @@ describe('useInspectStore', () => {
     });
   });
 
+  describe('selectFunction', () => {
+    it('switches function and clears the execution list and selection', () => {
+      const store = useInspectStore.getState();
+      store.setFunctions(['orders', 'payments']);
+      store.setExecutions(
+        [
+          {
+            execution_id: 'exec-1',
+            name: 'test-exec',
+            status: 'RUNNING',
+            function_name: 'orders',
+            start_time: '2025-01-01T00:00:00Z',
+            end_time: null,
+          },
+        ],
+        'tok',
+      );
+      store.selectExecution('exec-1');
+
+      useInspectStore.getState().selectFunction('payments');
+
+      const state = useInspectStore.getState();
+      expect(state.functionName).toBe('payments');
+      expect(state.functions).toEqual(['orders', 'payments']);
+      expect(state.executions).toEqual([]);
+      expect(state.nextToken).toBeNull();
+      expect(state.selectedExecutionId).toBeNull();
+    });
+  });
+
   describe('setStatusFilter', () => {
     it('updates the status filter', () => {
       useInspectStore.getState().setStatusFilter('FAILED');
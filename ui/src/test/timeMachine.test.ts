@@ -1,5 +1,5 @@
 import { describe, it, expect } from 'vitest';
-import { buildSnapshots } from '../inspector/timeMachine';
+import { buildSnapshots, toTransitionSnapshot } from '../inspector/timeMachine';
 import type { InspectNode, InspectEdge } from '../store/inspectStore';
 import type { HistoryEvent } from '../inspector/types';
 
@@ -193,3 +193,38 @@ describe('buildSnapshots', () => {
     expect(snapshots[1].timestamp).toBe('2025-01-01T00:00:05Z');
   });
 });
+
+describe('toTransitionSnapshot', () => {
+  it('maps server overlays and transitions onto the graph', () => {
+    const nodes = [makeNode('A'), makeNode('B'), makeNode('C')];
+    const edges = [makeEdge('A', 'B'), makeEdge('B', 'C')];
+    const snap = toTransitionSnapshot(
+      {
+        index: 2,
+        timestamp: '2025-01-01T00:00:06Z',
+        nodes: {
+          A: {
+            status: 'succeeded',
+            entered_at: '2025-01-01T00:00:00Z',
+            exited_at: '2025-01-01T00:00:05Z',
+            duration_ms: 5000,
+            input: null,
+            output: { result: 42 },
+            error: null,
+            retry_attempt: 0,
+          },
+        },
+        transitions: { A: { B: '2025-01-01T00:00:06Z' } },
+      },
+      nodes,
+      edges,
+    );
+
+    expect(snap.eventIndex).toBe(2);
+    expect(snap.nodeOverlays['A'].durationMs).toBe(5000);
+    expect(snap.nodeOverlays['A'].output).toEqual({ result: 42 });
+    expect(snap.nodeOverlays['C'].status).toBe('pending');
+    expect(snap.edgeOverlays['e-A-B']).toEqual({ traversed: true, timestamp: '2025-01-01T00:00:06Z' });
+    expect(snap.edgeOverlays['e-B-C'].traversed).toBe(false);
+  });
+});
@@ -45,6 +45,9 @@ export interface ValidationError {
   message: string;
   path: string;
   severity: 'error' | 'warning';
+  /** 1-based position in the YAML buffer, when the backend could locate the path */
+  line?: number | null;
+  column?: number | null;
 }
 
 /** Parsed AST from the backend */
@@ -53,6 +56,25 @@ export interface ParsedResponse {
   ast: Record<string, unknown> | null;
   yaml: string;
   errors: ValidationError[];
+  /** AST version on this connection; absent when ast is null */
+  version?: number;
+}
+
+/** One JSON-Patch style operation on a top-level key or a single state */
+export interface AstPatchOp {
+  op: 'add' | 'remove' | 'replace';
+  /** JSON Pointer, e.g. "/StartAt" or "/States/Validate" */
+  path: string;
+  value?: unknown;
+}
+
+/** Changes to the AST since base_version */
+export interface ParsedDeltaResponse {
+  type: 'parsed_delta';
+  version: number;
+  base_version: number;
+  patch: AstPatchOp[];
+  errors: ValidationError[];
 }
 
 /** Validation-only response */
@@ -89,6 +111,7 @@ export interface ErrorResponse {
 /** All possible WebSocket response types */
 export type WSResponse =
   | ParsedResponse
+  | ParsedDeltaResponse
   | ValidatedResponse
   | FileLoadedResponse
   | FileSavedResponse
@@ -99,6 +122,8 @@ export type WSResponse =
 export interface ParseMessage {
   type: 'parse';
   yaml: string;
+  /** Ask for the full AST instead of a delta (resync) */
+  full?: boolean;
 }
 
 export interface ValidateMessage {